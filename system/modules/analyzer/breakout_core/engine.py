@@ -1,5 +1,6 @@
 from __future__ import annotations
 import os
+import time
 import pandas as pd
 import numpy as np
 from dataclasses import dataclass, asdict
@@ -17,50 +18,44 @@ from logic.entry_logic import EntryDetector, EntryResult
 from logic.price_tracking_logic import PriceTracker, TradeExecution
 from logic.result_logic import ResultProcessor
 from logic.loss_logic import LossManager, StopLossConfig
+from logic.bar_index_logic import BarIndex, BarWindow
 
+try:
+    from ..worker_budget import inner_worker_budget, MIN_RANGES_FOR_PARALLEL
+except ImportError:
+    # breakout_core imported as a top-level package (analyzer root on sys.path)
+    from worker_budget import inner_worker_budget, MIN_RANGES_FOR_PARALLEL
 
-def _process_single_range(
-    df: pd.DataFrame,
-    R: SlotRange,
-    rp: RunParams,
-    config_manager: ConfigManager,
-    instrument_manager: InstrumentManager,
-    utility_manager: UtilityManager,
-    entry_detector: EntryDetector,
-    price_tracker: PriceTracker,
-    result_processor: ResultProcessor,
-    time_manager: TimeManager,
-    streamS1: str,
-    streamS2: str,
-    inst: str,
-    ticksz: float,
-    debug: bool
-) -> Optional[Dict[str, object]]:
-    """
-    Process a single range - thread-safe, no shared state
-    
-    Args:
-        df: Full market data DataFrame
-        R: SlotRange to process
-        rp: Run parameters
-        config_manager: Configuration manager
-        instrument_manager: Instrument manager
-        utility_manager: Utility manager
-        entry_detector: Entry detector
-        price_tracker: Price tracker
-        result_processor: Result processor
-        time_manager: Time manager
-        streamS1: Stream tag for S1
-        streamS2: Stream tag for S2
-        inst: Instrument code
-        ticksz: Tick size
-        debug: Debug flag
-        
-    Returns:
-        Result row dictionary or None (if NoTrade and write_no_trade_rows=False)
-    """
-    sess = R.session
-    stream = streamS1 if sess == "S1" else streamS2
+# BarIndex of the DataFrame a parallel worker process is serving (built once per worker, not per range)
+_worker_bar_index: Optional[BarIndex] = None
+
+
+def _get_worker_bar_index(df: pd.DataFrame) -> BarIndex:
+    """Return the cached BarIndex for df, rebuilding it when the worker is handed a new DataFrame"""
+    global _worker_bar_index
+    if _worker_bar_index is None or _worker_bar_index.df is not df:
+        _worker_bar_index = BarIndex.from_dataframe(df)
+    return _worker_bar_index
+
+
+def _add_timing(timings: Optional[Dict[str, float]], phase: str, start: float) -> None:
+    """Accumulate the seconds since start under phase (no-op when not timing)"""
+    if timings is not None:
+        timings[phase] = timings.get(phase, 0.0) + (time.perf_counter() - start)
+
+
+@dataclass
+class RangeEntry:
+    """Entry detection outcome of one slot range (independent of the exit parameters)"""
+    R: SlotRange
+    time_label: str
+    stream: str
+    day_bars: BarWindow
+    entry: EntryResult
+
+
+def _valid_time_label(R: SlotRange, debug: bool) -> Optional[str]:
+    """The range's end label when it is a valid HH:MM slot time, else None"""
     time_label = R.end_label
     
     # Validate end_label - ensure it exists and is not empty
@@ -88,66 +83,111 @@ def _process_single_range(
         if debug:
             print(f"WARNING: Invalid time_label format '{time_label}' for range {R.date} {R.session}, skipping")
         return None
+    return time_label
+
+
+def detect_range_entry(
+    R: SlotRange,
+    utility_manager: UtilityManager,
+    entry_detector: EntryDetector,
+    streamS1: str,
+    streamS2: str,
+    ticksz: float,
+    debug: bool,
+    bar_index: BarIndex,
+    timings: Optional[Dict[str, float]] = None
+) -> Optional[RangeEntry]:
+    """
+    Entry half of _process_single_range: breakout levels and entry detection on the
+    24 hours after the range end. None when the range's end label is invalid.
+    """
+    time_label = _valid_time_label(R, debug)
+    if time_label is None:
+        return None
+    stream = streamS1 if R.session == "S1" else streamS2
     
-    # Get data for trade execution (24 hours) and MFE calculation (O(log n) via searchsorted)
-    ts_values = pd.to_datetime(df["timestamp"]).values.astype("datetime64[ns]")
-    end_ts_ns = np.datetime64(R.end_ts)
-    start_idx = int(np.searchsorted(ts_values, end_ts_ns, side="left"))
+    # Get data for trade execution (24 hours) - O(log n) via searchsorted
     end_24h = R.end_ts + pd.Timedelta(hours=24)
-    end_idx_24h = int(np.searchsorted(ts_values, np.datetime64(end_24h), side="left"))
-    day_df = df.iloc[start_idx:end_idx_24h]
-    
-    # For MFE calculation, we need data until next day same slot (or 02:00/08:00 for time mode)
-    # Calculate MFE end time
-    if time_label or (rp.target_mode == "time" and sess):
-        from logic.config_logic import ConfigManager
-        if R.date.weekday() == 4:  # Friday
-            mfe_end_date = R.date + pd.Timedelta(days=ConfigManager.FRIDAY_TO_MONDAY_DAYS)  # Friday to Monday
-        else:
-            mfe_end_date = R.date + pd.Timedelta(days=1)  # Regular day
-        
-        if rp.target_mode == "time":
-            # Time mode: S1→02:00, S2→08:00 next day
-            time_str = time_manager.slot_starts.get(sess, "02:00")
-            hour_part, minute_part = map(int, time_str.split(":"))
-        else:
-            hour_part = int(time_label.split(":")[0])
-            minute_part = int(time_label.split(":")[1])
-        # Slot times are Chicago trading hours (e.g., 07:30 = 7:30 AM Chicago time)
-        # Create MFE end time directly in Chicago time
-        if mfe_end_date.tz is not None:
-            # Timezone-aware: create timestamp in same timezone (Chicago)
-            mfe_end_time = mfe_end_date.replace(
-                hour=hour_part,
-                minute=minute_part,
-                second=0
-            )
-        else:
-            # Naive timestamp (shouldn't happen, but handle it)
-            mfe_end_time = mfe_end_date.replace(
-                hour=hour_part,
-                minute=minute_part,
-                second=0
-            )
-        
-        # Get extended data for MFE calculation (O(log n) via searchsorted)
-        end_idx_mfe = int(np.searchsorted(ts_values, np.datetime64(mfe_end_time), side="left"))
-        mfe_df = df.iloc[start_idx:end_idx_mfe]
-    else:
-        mfe_df = day_df
-    
-    # Use base target only (no levels)
-    target_pts = instrument_manager.get_base_target(inst)
+    day_bars = bar_index.window(R.end_ts, end_24h)
     
     brk_long = utility_manager.round_to_tick(R.range_high + ticksz, ticksz)
     brk_short = utility_manager.round_to_tick(R.range_low - ticksz, ticksz)
     
     # Use entry detection logic
-    entry_result = entry_detector.detect_entry(day_df, R, brk_long, brk_short, R.freeze_close, R.end_ts)
+    phase_start = time.perf_counter() if timings is not None else 0.0
+    entry_result = entry_detector.detect_entry(day_bars.frame, R, brk_long, brk_short, R.freeze_close, R.end_ts,
+                                               bars=day_bars)
+    _add_timing(timings, "entry_detection", phase_start)
+    return RangeEntry(R, time_label, stream, day_bars, entry_result)
+
+
+def _mfe_window(R: SlotRange, time_label: str, target_mode: str, time_manager: TimeManager,
+                bar_index: BarIndex, day_bars: BarWindow) -> BarWindow:
+    """Bars for the MFE calculation: until next day same slot (or 02:00/08:00 for time mode)"""
+    sess = R.session
+    if not (time_label or (target_mode == "time" and sess)):
+        return day_bars
+    if R.date.weekday() == 4:  # Friday
+        mfe_end_date = R.date + pd.Timedelta(days=ConfigManager.FRIDAY_TO_MONDAY_DAYS)  # Friday to Monday
+    else:
+        mfe_end_date = R.date + pd.Timedelta(days=1)  # Regular day
+    
+    if target_mode == "time":
+        # Time mode: S1→02:00, S2→08:00 next day
+        time_str = time_manager.slot_starts.get(sess, "02:00")
+        hour_part, minute_part = map(int, time_str.split(":"))
+    else:
+        hour_part = int(time_label.split(":")[0])
+        minute_part = int(time_label.split(":")[1])
+    # Slot times are Chicago trading hours (e.g., 07:30 = 7:30 AM Chicago time)
+    # Create MFE end time directly in Chicago time (same wall-clock replace for naive timestamps)
+    mfe_end_time = mfe_end_date.replace(
+        hour=hour_part,
+        minute=minute_part,
+        second=0
+    )
+    
+    # Get extended data for MFE calculation (O(log n) via searchsorted)
+    return bar_index.window(R.end_ts, mfe_end_time)
+
+
+def execute_range_exit(
+    range_entry: RangeEntry,
+    target_pts: float,
+    target_mode: str,
+    execution_kernel: str,
+    write_no_trade_rows: bool,
+    entry_detector: EntryDetector,
+    price_tracker: PriceTracker,
+    result_processor: ResultProcessor,
+    time_manager: TimeManager,
+    inst: str,
+    debug: bool,
+    bar_index: BarIndex,
+    timings: Optional[Dict[str, float]] = None
+) -> Optional[Dict[str, object]]:
+    """
+    Exit half of _process_single_range: target, stop loss, trade execution and the
+    result row for one set of exit parameters.
+    
+    Args:
+        range_entry: Output of detect_range_entry
+        target_pts: Target in points (the instrument's base target in run_strategy)
+        target_mode / execution_kernel / write_no_trade_rows: As in RunParams
+        entry_detector: Supplies the stop loss calculation (its StopLossConfig)
+        
+    Returns:
+        Result row dictionary or None (no entry, or NoTrade with write_no_trade_rows=False)
+    """
+    R = range_entry.R
+    sess = R.session
+    time_label = range_entry.time_label
+    stream = range_entry.stream
+    entry_result = range_entry.entry
     
     if entry_result.entry_direction is None or entry_result.entry_direction == "NoTrade":
         # NoTrade - create NoTrade entry if enabled
-        if entry_result.entry_direction == "NoTrade" and rp.write_no_trade_rows:
+        if entry_result.entry_direction == "NoTrade" and write_no_trade_rows:
             return result_processor.create_result_row(
                 R.date, time_label, target_pts, 0.0, "NA", "NoTrade", R.range_size, 
                 stream, inst, sess, 0.0,
@@ -158,6 +198,8 @@ def _process_single_range(
             )
         return None
     
+    mfe_bars = _mfe_window(R, time_label, target_mode, time_manager, bar_index, range_entry.day_bars)
+    
     entry_dir = entry_result.entry_direction
     entry_px = entry_result.entry_price
     entry_time = entry_result.entry_time
@@ -167,14 +209,16 @@ def _process_single_range(
     initial_sl = entry_detector.calculate_stop_loss(entry_px, entry_dir, target_pts, inst, R.range_size, R.range_high, R.range_low)
     
     # Calculate expiry time (session-based 02:00/08:00 for time mode)
-    expiry_time = time_manager.get_expiry_time(R.date, time_label, sess, rp.target_mode)
+    expiry_time = time_manager.get_expiry_time(R.date, time_label, sess, target_mode)
     
     # Execute trade with integrated MFE and break even logic
+    phase_start = time.perf_counter() if timings is not None else 0.0
     trade_execution = price_tracker.execute_trade(
-        mfe_df, entry_time, entry_px, entry_dir,
+        mfe_bars.frame, entry_time, entry_px, entry_dir,
         target_level, initial_sl, expiry_time,
         target_pts, inst, time_label, R.date, debug,
-        target_mode=rp.target_mode, session=sess
+        target_mode=target_mode, session=sess,
+        execution_kernel=execution_kernel, bars=mfe_bars
     )
     
     # Calculate profit using the integrated logic
@@ -184,6 +228,7 @@ def _process_single_range(
         trade_execution.t1_triggered, 
         target_pts, inst, trade_execution.target_hit,
     )
+    _add_timing(timings, "execute_trade", phase_start)
     
     if debug:
         try:
@@ -206,6 +251,66 @@ def _process_single_range(
     )
 
 
+def _process_single_range(
+    df: pd.DataFrame,
+    R: SlotRange,
+    rp: RunParams,
+    config_manager: ConfigManager,
+    instrument_manager: InstrumentManager,
+    utility_manager: UtilityManager,
+    entry_detector: EntryDetector,
+    price_tracker: PriceTracker,
+    result_processor: ResultProcessor,
+    time_manager: TimeManager,
+    streamS1: str,
+    streamS2: str,
+    inst: str,
+    ticksz: float,
+    debug: bool,
+    bar_index: Optional[BarIndex] = None,
+    timings: Optional[Dict[str, float]] = None
+) -> Optional[Dict[str, object]]:
+    """
+    Process a single range - thread-safe, no shared state
+    
+    Args:
+        df: Full market data DataFrame
+        R: SlotRange to process
+        rp: Run parameters
+        config_manager: Configuration manager
+        instrument_manager: Instrument manager
+        utility_manager: Utility manager
+        entry_detector: Entry detector
+        price_tracker: Price tracker
+        result_processor: Result processor
+        time_manager: Time manager
+        streamS1: Stream tag for S1
+        streamS2: Stream tag for S2
+        inst: Instrument code
+        ticksz: Tick size
+        debug: Debug flag
+        bar_index: Per-run BarIndex over df (built from df when not supplied)
+        timings: Per-phase seconds to accumulate entry_detection / execute_trade into
+        
+    Returns:
+        Result row dictionary or None (if NoTrade and write_no_trade_rows=False)
+    """
+    if bar_index is None:
+        bar_index = BarIndex.from_dataframe(df)
+    
+    range_entry = detect_range_entry(R, utility_manager, entry_detector, streamS1, streamS2, ticksz,
+                                     debug, bar_index, timings)
+    if range_entry is None:
+        return None
+    
+    # Use base target only (no levels)
+    return execute_range_exit(
+        range_entry, instrument_manager.get_base_target(inst), rp.target_mode, rp.execution_kernel,
+        rp.write_no_trade_rows, entry_detector, price_tracker, result_processor, time_manager,
+        inst, debug, bar_index, timings
+    )
+
+
 def _process_single_range_dict(
     df: pd.DataFrame,
     range_dict: Dict,
@@ -221,7 +326,8 @@ def _process_single_range_dict(
     streamS2: str,
     inst: str,
     ticksz: float,
-    debug: bool
+    debug: bool,
+    bar_index: Optional[BarIndex] = None
 ) -> Optional[Dict[str, object]]:
     """
     Wrapper that converts dict back to SlotRange for parallel processing
@@ -255,15 +361,19 @@ def _process_single_range_dict(
         freeze_close=range_dict['freeze_close']
     )
     
+    if bar_index is None:
+        bar_index = _get_worker_bar_index(df)
+    
     return _process_single_range(
         df, R, rp, config_manager, instrument_manager, utility_manager,
         entry_detector, price_tracker, result_processor, time_manager,
-        streamS1, streamS2, inst, ticksz, debug
+        streamS1, streamS2, inst, ticksz, debug, bar_index
     )
 
 
 def _add_no_trade_by_market_close(results_df: pd.DataFrame, ranges, rp, debug: bool,
-                                  instrument_manager: InstrumentManager) -> pd.DataFrame:
+                                  instrument_manager: InstrumentManager,
+                                  target_pts: Optional[float] = None) -> pd.DataFrame:
     """
     Add NoTrade entries for days with no entries by market close
     
@@ -272,6 +382,7 @@ def _add_no_trade_by_market_close(results_df: pd.DataFrame, ranges, rp, debug: b
         ranges: List of range objects
         rp: Run parameters
         debug: Debug flag
+        target_pts: Target written on the rows (default: the instrument's base target)
         
     Returns:
         Updated results DataFrame with no-trade entries
@@ -279,6 +390,10 @@ def _add_no_trade_by_market_close(results_df: pd.DataFrame, ranges, rp, debug: b
     if results_df.empty:
         return results_df
     
+    if target_pts is None:
+        # Use base target only (no levels)
+        target_pts = instrument_manager.get_base_target(rp.instrument)
+    
     # Get all range combinations (date + session + time)
     range_combinations = set()
     for R in ranges:
@@ -313,9 +428,6 @@ def _add_no_trade_by_market_close(results_df: pd.DataFrame, ranges, rp, debug: b
             stream = f"{rp.instrument.upper()}{'1' if sess == 'S1' else '2'}"
             time_label = R.end_label
             
-            # Use base target only (no levels)
-            target_pts = instrument_manager.get_base_target(rp.instrument)
-            
             if rp.write_no_trade_rows:
                 no_trade_row = {
                     "Date": R.date.date().isoformat(),
@@ -368,7 +480,55 @@ def _add_no_trade_by_market_close(results_df: pd.DataFrame, ranges, rp, debug: b
 
 
 
-def run_strategy(df: pd.DataFrame, rp: RunParams, debug: bool = False, show_progress: bool = True) -> pd.DataFrame:
+def _assemble_results(rows: List[Dict[str, object]], ranges, rp: RunParams, debug: bool,
+                      result_processor: ResultProcessor, instrument_manager: InstrumentManager,
+                      target_pts: Optional[float] = None) -> pd.DataFrame:
+    """
+    Result rows (in range order) -> final results DataFrame: processed, NoTrade rows
+    added for ranges without an entry by market close, sorted by Date and Time
+    
+    Args:
+        target_pts: Target of the NoTrade rows (default: the instrument's base target)
+    """
+    results_df = result_processor.process_results(rows)
+    
+    # Recreate _sortTime from Time column for proper sorting (process_results drops it, vectorized)
+    if not results_df.empty and "Time" in results_df.columns:
+        time_parts = results_df["Time"].astype(str).str.split(":", expand=True)
+        h = pd.to_numeric(time_parts[0], errors="coerce").fillna(-1).astype(int)
+        m = pd.to_numeric(time_parts[1], errors="coerce").fillna(-1).astype(int) if 1 in time_parts.columns else 0
+        valid = (h >= 0) & (h <= 23) & (m >= 0) & (m <= 59)
+        results_df["_sortTime"] = np.where(valid, h * 100 + m, 0)
+    
+    # Ensure Date is datetime for proper sorting (process_results converts it back to string)
+    if not results_df.empty and "Date" in results_df.columns:
+        results_df["Date"] = pd.to_datetime(results_df["Date"])
+    
+    # Add no-trade entries for days with no entries by market close
+    results_df = _add_no_trade_by_market_close(results_df, ranges, rp, debug, instrument_manager,
+                                              target_pts)
+    
+    # Final sort by Date and Time (earliest first)
+    if not results_df.empty and "Date" in results_df.columns and "_sortTime" in results_df.columns:
+        # Ensure Date is datetime for sorting
+        if not pd.api.types.is_datetime64_any_dtype(results_df["Date"]):
+            results_df["Date"] = pd.to_datetime(results_df["Date"])
+        
+        results_df = results_df.sort_values(['Date', '_sortTime'], ascending=[True, True]).reset_index(drop=True)
+        
+        # Drop _sortTime column before returning
+        if "_sortTime" in results_df.columns:
+            results_df = results_df.drop(columns=["_sortTime"])
+        
+        # Convert Date back to string format for display
+        if pd.api.types.is_datetime64_any_dtype(results_df["Date"]):
+            results_df["Date"] = results_df["Date"].dt.strftime("%Y-%m-%d")
+    
+    return results_df
+
+
+def run_strategy(df: pd.DataFrame, rp: RunParams, debug: bool = False, show_progress: bool = True,
+                 timings: Optional[Dict[str, float]] = None) -> pd.DataFrame:
     """
     Run the breakout trading strategy using modular logic components
     
@@ -377,6 +537,10 @@ def run_strategy(df: pd.DataFrame, rp: RunParams, debug: bool = False, show_prog
         rp: Run parameters (instrument, sessions, slots, trade days, etc.)
         debug: Enable debug output for detailed logging
         show_progress: Show progress logging (default: True for backward compatibility)
+        timings: Optional dict that receives wall-clock seconds per phase (prepare,
+            range_building, bar_index, range_processing, result_assembly; plus
+            entry_detection and execute_trade, both inside range_processing, when the
+            ranges are processed sequentially). Used by the stage benchmark.
         
     Returns:
         DataFrame with trade results (Date, Time, Target, Peak, Direction, Result, Range, Stream, Instrument, Session, Profit)
@@ -390,6 +554,8 @@ def run_strategy(df: pd.DataFrame, rp: RunParams, debug: bool = False, show_prog
     def log(msg):
         print(msg, file=sys.stderr, flush=True)
     
+    phase_start = time.perf_counter()
+    
     if debug:
         log(f"\n{'='*70}")
         log(f"RUN_STRATEGY CALLED")
@@ -488,9 +654,13 @@ def run_strategy(df: pd.DataFrame, rp: RunParams, debug: bool = False, show_prog
         print(f"DEBUG: Enabled slots: {rp.enabled_slots}")
         print(f"DEBUG: Trade days: {rp.trade_days}")
 
+    _add_timing(timings, "prepare", phase_start)
+    
     if debug:
         log("Building slot ranges...")
+    phase_start = time.perf_counter()
     ranges = range_detector.build_slot_ranges(df, rp, debug)
+    _add_timing(timings, "range_building", phase_start)
     
     if debug:
         log(f"\n{'='*70}")
@@ -520,37 +690,43 @@ def run_strategy(df: pd.DataFrame, rp: RunParams, debug: bool = False, show_prog
         log(f"Processing {len(ranges)} ranges...")
         log(f"{'='*70}\n")
     
+    # Parse timestamps and extract OHLC arrays once per run (shared by every range)
+    phase_start = time.perf_counter()
+    bar_index = BarIndex.from_dataframe(df)
+    _add_timing(timings, "bar_index", phase_start)
+    processing_start = time.perf_counter()
+    
     # Determine if we should use parallel processing
-    # Disabled: inner parallelism causes high CPU/memory (N instruments × M workers).
-    # Sequential processing uses 1 process per instrument (outer level only).
-    use_parallel = False  # was: len(ranges) > 25 and not debug
+    # Inner range workers come out of the process-wide worker budget shared with the
+    # outer per-instrument fan-out, so N instruments x M workers stays bounded.
+    inner_workers = inner_worker_budget()
+    use_parallel = inner_workers > 1 and len(ranges) > MIN_RANGES_FOR_PARALLEL and not debug
     
     if use_parallel:
         try:
             # Import parallel processor (located in modules/analyzer/parallel_processor.py)
-            import sys
-            from pathlib import Path
-            # Add analyzer root to path for parallel_processor import
-            analyzer_root = Path(__file__).parent.parent
-            if str(analyzer_root) not in sys.path:
-                sys.path.insert(0, str(analyzer_root))
             from parallel_processor import ParallelProcessor
             
             if debug:
                 print(f"Using parallel processing for {len(ranges)} ranges...")
-            use_shm = os.environ.get("ANALYZER_USE_SHARED_MEMORY", "").lower() in ("1", "true", "yes")
-            processor = ParallelProcessor(enable_parallel=True, use_shared_memory=use_shm)
+            # Shared memory maps the bars once per instrument instead of pickling them per chunk
+            use_shm = os.environ.get("ANALYZER_USE_SHARED_MEMORY", "1").lower() not in ("0", "false", "no")
+            processor = ParallelProcessor(
+                max_workers=min(inner_workers, len(ranges)),
+                enable_parallel=True,
+                use_shared_memory=use_shm
+            )
             
             # Convert SlotRange objects to dicts for parallel processor
-            # Convert timestamps to ISO strings for serialization
+            # Timestamps are passed as-is (picklable, and keep the America/Chicago timezone)
             range_dicts = []
             for R in ranges:
                 range_dict = {
-                    'date': R.date.isoformat() if isinstance(R.date, pd.Timestamp) else str(R.date),
+                    'date': R.date,
                     'session': R.session,
                     'end_label': R.end_label,
-                    'start_ts': R.start_ts.isoformat() if isinstance(R.start_ts, pd.Timestamp) else str(R.start_ts),
-                    'end_ts': R.end_ts.isoformat() if isinstance(R.end_ts, pd.Timestamp) else str(R.end_ts),
+                    'start_ts': R.start_ts,
+                    'end_ts': R.end_ts,
                     'range_high': float(R.range_high),
                     'range_low': float(R.range_low),
                     'range_size': float(R.range_size),
@@ -558,9 +734,9 @@ def run_strategy(df: pd.DataFrame, rp: RunParams, debug: bool = False, show_prog
                 }
                 range_dicts.append(range_dict)
             
-            # Process ranges in parallel
+            # Process ranges in parallel (workers build their own BarIndex once)
             results = processor.process_dataframe_parallel(
-                df, range_dicts, _process_single_range_dict,
+                bar_index.df, range_dicts, _process_single_range_dict,
                 rp, config_manager, instrument_manager, utility_manager,
                 entry_detector, price_tracker, result_processor, time_manager,
                 streamS1, streamS2, inst, ticksz, debug
@@ -654,7 +830,7 @@ def run_strategy(df: pd.DataFrame, rp: RunParams, debug: bool = False, show_prog
             result = _process_single_range(
                 df, R, rp, config_manager, instrument_manager, utility_manager,
                 entry_detector, price_tracker, result_processor, time_manager,
-                streamS1, streamS2, inst, ticksz, debug
+                streamS1, streamS2, inst, ticksz, debug, bar_index, timings
             )
             
             if result is not None:
@@ -705,42 +881,16 @@ def run_strategy(df: pd.DataFrame, rp: RunParams, debug: bool = False, show_prog
             
             log(f"{'#'*70}\n")
 
+    _add_timing(timings, "range_processing", processing_start)
+    
     # End performance monitoring
     total_time = debug_manager.end_timer()
     
     # Process and return results
-    results_df = result_processor.process_results(rows)
-    
-    # Recreate _sortTime from Time column for proper sorting (process_results drops it, vectorized)
-    if not results_df.empty and "Time" in results_df.columns:
-        time_parts = results_df["Time"].astype(str).str.split(":", expand=True)
-        h = pd.to_numeric(time_parts[0], errors="coerce").fillna(-1).astype(int)
-        m = pd.to_numeric(time_parts[1], errors="coerce").fillna(-1).astype(int) if 1 in time_parts.columns else 0
-        valid = (h >= 0) & (h <= 23) & (m >= 0) & (m <= 59)
-        results_df["_sortTime"] = np.where(valid, h * 100 + m, 0)
-    
-    # Ensure Date is datetime for proper sorting (process_results converts it back to string)
-    if not results_df.empty and "Date" in results_df.columns:
-        results_df["Date"] = pd.to_datetime(results_df["Date"])
+    phase_start = time.perf_counter()
+    results_df = _assemble_results(rows, ranges, rp, debug, result_processor, instrument_manager)
     
-    # Add no-trade entries for days with no entries by market close
-    results_df = _add_no_trade_by_market_close(results_df, ranges, rp, debug, instrument_manager)
-    
-    # Final sort by Date and Time (earliest first)
-    if not results_df.empty and "Date" in results_df.columns and "_sortTime" in results_df.columns:
-        # Ensure Date is datetime for sorting
-        if not pd.api.types.is_datetime64_any_dtype(results_df["Date"]):
-            results_df["Date"] = pd.to_datetime(results_df["Date"])
-        
-        results_df = results_df.sort_values(['Date', '_sortTime'], ascending=[True, True]).reset_index(drop=True)
-        
-        # Drop _sortTime column before returning
-        if "_sortTime" in results_df.columns:
-            results_df = results_df.drop(columns=["_sortTime"])
-        
-        # Convert Date back to string format for display
-        if pd.api.types.is_datetime64_any_dtype(results_df["Date"]):
-            results_df["Date"] = results_df["Date"].dt.strftime("%Y-%m-%d")
+    _add_timing(timings, "result_assembly", phase_start)
     
     # Print performance summary if debug enabled
     if debug:
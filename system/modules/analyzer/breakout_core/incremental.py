@@ -0,0 +1,203 @@
+"""
+Incremental analyzer runs
+
+A full run rebuilds and re-simulates every slot range of the instrument's history, but
+between two pipeline runs only the newest bars change. A range dated D only reads bars
+from its session start up to its MFE end / expiry, which is at most D + 3 days at the
+slot time (Friday -> Monday), so once the data extends past that its row is final.
+
+State per instrument ({state_dir}/{instrument}.json):
+- data_end: timestamp of the last bar analyzed
+- bars: row count and content hash of every bar up to data_end
+- params: the RunParams the rows were computed with
+- streams: last result date per stream
+- window: hash of every result row dated within SETTLE_DAYS of data_end (rows that may
+  still change)
+
+Next run, when params and every bar up to the previous data_end are unchanged, only the
+ranges dated from (previous data_end - SETTLE_DAYS) on are rebuilt and re-simulated (on the
+bars of that window), and only rows that are new or differ from the stored window are
+returned. Any other change (no state, params changed, older bars changed or removed) falls
+back to a full run that returns every row.
+
+The merger upserts on (Date, Time, Session, Instrument, Stream), so emitting just the
+changed rows leaves the merged history identical to a full run.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import date as Date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from logic.config_logic import RunParams
+from .engine import run_strategy
+
+STATE_VERSION = 1
+
+# Ranges dated within this many days of the last bar can still change (MFE/expiry run to
+# the next trading day's slot, Friday -> Monday = 3 days)
+SETTLE_DAYS = 4
+
+ROW_KEY = ["Date", "Time", "Session", "Instrument", "Stream"]
+
+_BAR_COLUMNS = ["timestamp", "open", "high", "low", "close"]
+
+
+def params_key(rp: RunParams) -> str:
+    """Stable text of the run parameters (results are only reusable for identical params)"""
+    return json.dumps(rp.model_dump(mode="json"), sort_keys=True)
+
+
+def bars_fingerprint(bars: pd.DataFrame) -> Dict[str, object]:
+    """Row count and order-independent content hash of bars"""
+    if bars.empty:
+        return {"rows": 0, "hash": "0"}
+    hashed = pd.util.hash_pandas_object(bars[_BAR_COLUMNS], index=False).to_numpy(dtype=np.uint64)
+    return {"rows": int(len(bars)), "hash": str(int(hashed.sum(dtype=np.uint64)))}
+
+
+def _keyed_row_hashes(results: pd.DataFrame) -> List[Tuple[str, str]]:
+    """(row key, content hash) of every result row, in row order"""
+    if results.empty:
+        return []
+    columns = sorted(results.columns)
+    hashed = pd.util.hash_pandas_object(results[columns].astype(str), index=False).to_numpy(dtype=np.uint64)
+    keys = results[[c for c in ROW_KEY if c in results.columns]].astype(str).agg("|".join, axis=1)
+    return list(zip(keys, (str(int(h)) for h in hashed)))
+
+
+def row_hashes(results: pd.DataFrame) -> Dict[str, str]:
+    """Result row key -> content hash"""
+    return dict(_keyed_row_hashes(results))
+
+
+@dataclass
+class IncrementalRun:
+    """
+    Outcome of run_strategy_incremental.
+
+    rows: result rows to emit (all rows for a full run, new/changed rows otherwise)
+    mode: "full" or "incremental"
+    reason: why a full run was needed ("" for incremental runs)
+    window_start: first date recomputed (None for full runs)
+    """
+    rows: pd.DataFrame
+    mode: str
+    reason: str = ""
+    window_start: Optional[Date] = None
+    state_path: Optional[Path] = None
+    _state: Dict = field(default_factory=dict, repr=False)
+
+    def commit(self) -> None:
+        """Persist the new watermark; call only once the rows have been written"""
+        if self.state_path is None:
+            return
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._state, f, separators=(",", ":"))
+        os.replace(tmp_path, self.state_path)
+
+
+def load_state(state_path: Path) -> Optional[Dict]:
+    try:
+        with open(state_path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return state if isinstance(state, dict) and state.get("version") == STATE_VERSION else None
+
+
+def _full_run_reason(state: Optional[Dict], bars: pd.DataFrame, rp: RunParams) -> str:
+    if state is None:
+        return "no previous state"
+    if state.get("params") != params_key(rp):
+        return "run parameters changed"
+    previous_end = pd.Timestamp(state["data_end"])
+    if bars["timestamp"].iloc[-1] < previous_end:
+        return "data ends before the previous run"
+    if bars_fingerprint(bars[bars["timestamp"] <= previous_end]) != state.get("bars"):
+        return "bars before the previous data end changed"
+    return ""
+
+
+def run_strategy_incremental(
+    df: pd.DataFrame,
+    rp: RunParams,
+    state_dir: Path,
+    debug: bool = False,
+    run: Callable[..., pd.DataFrame] = run_strategy,
+) -> IncrementalRun:
+    """
+    Run the strategy on the part of the history that can have changed since the last run.
+
+    Args:
+        df: Full market data (same input as run_strategy)
+        rp: Run parameters
+        state_dir: Folder of the per-instrument watermark files
+        debug: Passed to run_strategy
+        run: Strategy runner (run_strategy)
+
+    Returns:
+        IncrementalRun; call commit() after writing its rows
+    """
+    inst = rp.instrument.upper()
+    state_path = Path(state_dir) / f"{inst}.json"
+    bars = df[df["instrument"].str.upper() == inst]
+    if bars.empty:
+        return IncrementalRun(rows=run(df, rp, debug=debug), mode="full", reason="no bars")
+    bars = bars.sort_values("timestamp", kind="stable")
+
+    state = load_state(state_path)
+    reason = _full_run_reason(state, bars, rp)
+
+    if reason:
+        window_start = None
+        results = run(df, rp, debug=debug)
+    else:
+        window_start = pd.Timestamp(state["data_end"]).date() - timedelta(days=SETTLE_DAYS)
+        # Bars from the day before: bars from 23:00 belong to the next day's session
+        first_bar = pd.Timestamp(window_start - timedelta(days=1))
+        tz = bars["timestamp"].dt.tz
+        if tz is not None:
+            first_bar = first_bar.tz_localize(tz)
+        results = run(bars[bars["timestamp"] >= first_bar], rp, debug=debug)
+        if not results.empty:
+            results = results[pd.to_datetime(results["Date"]).dt.date >= window_start].reset_index(drop=True)
+
+    data_end = bars["timestamp"].iloc[-1]
+    keep_from = data_end.date() - timedelta(days=SETTLE_DAYS)
+    if results.empty:
+        open_window = results
+    else:
+        open_window = results[pd.to_datetime(results["Date"]).dt.date >= keep_from]
+    if reason:
+        rows = results
+    else:
+        previous = state.get("window", {})
+        changed = np.array([previous.get(key) != value for key, value in _keyed_row_hashes(results)], dtype=bool)
+        rows = results[changed].reset_index(drop=True) if len(results) else results
+
+    streams = dict((state or {}).get("streams", {}))
+    if not results.empty and "Stream" in results.columns:
+        for stream, last_date in results.groupby("Stream")["Date"].max().items():
+            streams[str(stream)] = max(str(last_date), streams.get(str(stream), ""))
+
+    new_state = {
+        "version": STATE_VERSION,
+        "instrument": inst,
+        "params": params_key(rp),
+        "data_end": data_end.isoformat(),
+        "bars": bars_fingerprint(bars),
+        "streams": streams,
+        "window": row_hashes(open_window),
+    }
+    return IncrementalRun(rows=rows, mode="incremental" if not reason else "full", reason=reason,
+                          window_start=window_start, state_path=state_path, _state=new_state)
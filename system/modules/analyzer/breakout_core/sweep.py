@@ -0,0 +1,324 @@
+"""
+Batched parameter sweeps
+
+Running run_strategy once per parameter set repeats the expensive work for every
+variant: filtering and sorting the bars, building the BarIndex, building the slot
+ranges and detecting each range's entry. None of that depends on the exit parameters.
+
+run_sweep evaluates a grid of variants in one pass per instrument:
+
+- bars are filtered/sorted and indexed once per instrument
+- slot ranges are built once per distinct (enabled_sessions, enabled_slots, trade_days)
+- entries are detected once per distinct range (shared by every variant that has it)
+- exits are executed once per distinct (range, exit key), the exit key being
+  (target_mode, execution_kernel, target points, stop loss multiplier)
+
+Exits run through the ParallelProcessor under the same worker budget as run_strategy.
+Each variant's rows are assembled exactly as run_strategy assembles them, so a variant
+with the base target and the default stop loss returns run_strategy's results.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+from logic.config_logic import ConfigManager, RunParams
+from logic.entry_logic import EntryDetector
+from logic.instrument_logic import InstrumentManager
+from logic.loss_logic import StopLossConfig
+from logic.price_tracking_logic import PriceTracker
+from logic.range_logic import RangeDetector, SlotRange
+from logic.result_logic import ResultProcessor
+from logic.time_logic import TimeManager
+from logic.utility_logic import UtilityManager
+from logic.validation_logic import ValidationManager
+from logic.debug_logic import DebugManager
+from logic.bar_index_logic import BarIndex
+from .engine import (
+    _assemble_results,
+    _get_worker_bar_index,
+    detect_range_entry,
+    execute_range_exit,
+)
+
+# (target_mode, execution_kernel, target_pts, stop loss multiplier)
+ExitKey = Tuple[str, str, float, float]
+
+
+@dataclass
+class SweepVariant:
+    """
+    One parameter set of a sweep
+
+    Args:
+        params: Run parameters (instrument, sessions, slots, trade days, target mode, kernel, ...)
+        target_level: Index into the instrument's target ladder (0 = base target, as run_strategy)
+        stop_loss: Stop loss configuration (only initial_multiplier affects the simulation)
+        variant_id: Result key (generated from the position in the grid when empty)
+    """
+    params: RunParams
+    target_level: int = 0
+    stop_loss: Optional[StopLossConfig] = None
+    variant_id: str = ""
+
+
+VariantGrid = Union[Sequence[Union[SweepVariant, RunParams]], Mapping[str, Union[SweepVariant, RunParams]]]
+
+
+def _normalize_variants(variants: VariantGrid) -> List[SweepVariant]:
+    """SweepVariants with unique ids (mapping keys take precedence over variant_id)"""
+    if isinstance(variants, Mapping):
+        items = list(variants.items())
+    else:
+        items = [(None, v) for v in variants]
+
+    normalized: List[SweepVariant] = []
+    for position, (key, variant) in enumerate(items):
+        if isinstance(variant, RunParams):
+            variant = SweepVariant(params=variant)
+        elif not isinstance(variant, SweepVariant):
+            raise TypeError(f"Sweep variants must be SweepVariant or RunParams, got {type(variant).__name__}")
+        variant_id = str(key) if key is not None else (variant.variant_id or f"v{position:03d}")
+        normalized.append(SweepVariant(variant.params, variant.target_level, variant.stop_loss, variant_id))
+
+    ids = [v.variant_id for v in normalized]
+    duplicates = sorted({i for i in ids if ids.count(i) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate sweep variant ids: {duplicates}")
+    return normalized
+
+
+def _range_key(rp: RunParams) -> str:
+    """Parameters that decide which slot ranges are built"""
+    slots = {sess: sorted(rp.enabled_slots.get(sess, [])) for sess in sorted(rp.enabled_slots)}
+    return repr((sorted(rp.enabled_sessions), slots, sorted(rp.trade_days)))
+
+
+def _range_identity(R: SlotRange) -> Tuple:
+    return (R.date, R.session, R.end_label, R.start_ts, R.end_ts,
+            R.range_high, R.range_low, R.range_size, R.freeze_close)
+
+
+def _range_to_dict(R: SlotRange) -> Dict:
+    return {
+        'date': R.date,
+        'session': R.session,
+        'end_label': R.end_label,
+        'start_ts': R.start_ts,
+        'end_ts': R.end_ts,
+        'range_high': float(R.range_high),
+        'range_low': float(R.range_low),
+        'range_size': float(R.range_size),
+        'freeze_close': float(R.freeze_close)
+    }
+
+
+def _evaluate_range(
+    R: SlotRange,
+    exits: Sequence[ExitKey],
+    entry_detectors: Dict[float, EntryDetector],
+    utility_manager: UtilityManager,
+    price_tracker: PriceTracker,
+    result_processor: ResultProcessor,
+    time_manager: TimeManager,
+    streamS1: str,
+    streamS2: str,
+    inst: str,
+    ticksz: float,
+    debug: bool,
+    bar_index: BarIndex
+) -> List[Optional[Dict[str, object]]]:
+    """Detect the range's entry once, then one result row (or None) per exit key"""
+    # Entry detection does not depend on the stop loss config: any detector will do
+    range_entry = detect_range_entry(R, utility_manager, next(iter(entry_detectors.values())),
+                                     streamS1, streamS2, ticksz, debug, bar_index)
+    if range_entry is None:
+        return [None] * len(exits)
+
+    # NoTrade rows are always produced here; variants with write_no_trade_rows=False drop them
+    return [
+        execute_range_exit(range_entry, target_pts, target_mode, execution_kernel, True,
+                           entry_detectors[multiplier], price_tracker, result_processor, time_manager,
+                           inst, debug, bar_index)
+        for target_mode, execution_kernel, target_pts, multiplier in exits
+    ]
+
+
+def _evaluate_range_dict(df: pd.DataFrame, item: Dict, *args) -> List[Optional[Dict[str, object]]]:
+    """ParallelProcessor entry point: rebuild the SlotRange and evaluate its exits (module-level for picklability)"""
+    R = SlotRange(**item['range'])
+    return _evaluate_range(R, item['exits'], *args, _get_worker_bar_index(df))
+
+
+def run_sweep(df: pd.DataFrame, variants: VariantGrid, max_workers: Optional[int] = None,
+              debug: bool = False) -> pd.DataFrame:
+    """
+    Run a grid of parameter variants over the same bars
+
+    Args:
+        df: Market data DataFrame (as for run_strategy; may hold several instruments)
+        variants: SweepVariants or RunParams, as a sequence or as a mapping variant id -> variant
+        max_workers: Range workers (default: the inner worker budget, as run_strategy)
+        debug: Debug flag (forces sequential processing)
+
+    Returns:
+        Long-format DataFrame: variant_id followed by run_strategy's result columns, the
+        variants in grid order and each variant's rows in run_strategy order
+    """
+    grid = _normalize_variants(variants)
+
+    config_manager = ConfigManager()
+    utility_manager = UtilityManager()
+    validation_manager = ValidationManager()
+    instrument_manager = InstrumentManager()
+    time_manager = TimeManager()
+    range_detector = RangeDetector(config_manager.get_slot_config())
+    price_tracker = PriceTracker(debug_manager=DebugManager(debug),
+                                 instrument_manager=instrument_manager,
+                                 config_manager=config_manager)
+    result_processor = ResultProcessor(instrument_manager=instrument_manager)
+
+    validation_result = validation_manager.validate_dataframe(df)
+    if not validation_result.is_valid:
+        raise ValueError(f"Data validation failed: {validation_result.errors}")
+
+    # Resolve every variant's exit key up front so a bad grid fails before any work
+    exit_keys: Dict[str, ExitKey] = {}
+    for variant in grid:
+        rp = variant.params
+        validation_result = validation_manager.validate_run_params(rp)
+        if not validation_result.is_valid:
+            raise ValueError(f"Parameter validation failed for variant '{variant.variant_id}': {validation_result.errors}")
+        ladder = instrument_manager.get_target_ladder(rp.instrument)
+        if not 0 <= variant.target_level < len(ladder):
+            raise ValueError(f"Variant '{variant.variant_id}': target_level {variant.target_level} outside "
+                             f"the {rp.instrument} target ladder ({len(ladder)} levels)")
+        multiplier = float((variant.stop_loss or StopLossConfig()).initial_multiplier)
+        exit_keys[variant.variant_id] = (rp.target_mode, rp.execution_kernel,
+                                         float(ladder[variant.target_level]), multiplier)
+
+    results: Dict[str, pd.DataFrame] = {}
+    instruments = list(dict.fromkeys(v.params.instrument for v in grid))
+    for inst in instruments:
+        inst_variants = [v for v in grid if v.params.instrument == inst]
+        results.update(_run_instrument_sweep(
+            df, inst, inst_variants, exit_keys, max_workers, debug,
+            config_manager, utility_manager, instrument_manager, time_manager,
+            range_detector, price_tracker, result_processor
+        ))
+
+    frames = []
+    for variant in grid:
+        frame = results[variant.variant_id]
+        frame.insert(0, "variant_id", variant.variant_id)
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
+
+
+def _run_instrument_sweep(
+    df: pd.DataFrame,
+    inst: str,
+    variants: List[SweepVariant],
+    exit_keys: Dict[str, ExitKey],
+    max_workers: Optional[int],
+    debug: bool,
+    config_manager: ConfigManager,
+    utility_manager: UtilityManager,
+    instrument_manager: InstrumentManager,
+    time_manager: TimeManager,
+    range_detector: RangeDetector,
+    price_tracker: PriceTracker,
+    result_processor: ResultProcessor
+) -> Dict[str, pd.DataFrame]:
+    """Results per variant id of the variants of one instrument"""
+    empty = {v.variant_id: pd.DataFrame(columns=["Date","Time","EntryTime","ExitTime","EntryPrice","ExitPrice","StopLoss","Target","Peak","Direction","Result","Range","Stream","Instrument","Session","Profit"])
+             for v in variants}
+    if 'instrument' not in df.columns:
+        return empty
+    bars = df[df["instrument"].str.upper() == inst.upper()].copy()
+    bars = bars.sort_values("timestamp").reset_index(drop=True)
+    if bars.empty:
+        return empty
+
+    ticksz = instrument_manager.get_tick_size(inst)
+    streamS1 = instrument_manager.get_stream_tag(inst, "S1")
+    streamS2 = instrument_manager.get_stream_tag(inst, "S2")
+
+    # Slot ranges once per distinct range parameters
+    ranges_by_key: Dict[str, List[SlotRange]] = {}
+    for variant in variants:
+        key = _range_key(variant.params)
+        if key not in ranges_by_key:
+            ranges_by_key[key] = range_detector.build_slot_ranges(bars, variant.params, debug)
+
+    # Distinct ranges (in first-seen order) and the exit keys each one is needed for
+    unique_ranges: Dict[Tuple, SlotRange] = {}
+    range_exits: Dict[Tuple, List[ExitKey]] = {}
+    for variant in variants:
+        exit_key = exit_keys[variant.variant_id]
+        for R in ranges_by_key[_range_key(variant.params)]:
+            identity = _range_identity(R)
+            unique_ranges.setdefault(identity, R)
+            exits = range_exits.setdefault(identity, [])
+            if exit_key not in exits:
+                exits.append(exit_key)
+
+    entry_detectors = {
+        multiplier: EntryDetector(loss_config=StopLossConfig(initial_multiplier=multiplier),
+                                  config_manager=config_manager, instrument_manager=instrument_manager)
+        for multiplier in sorted({exit_keys[v.variant_id][3] for v in variants})
+    }
+
+    bar_index = BarIndex.from_dataframe(bars)
+    identities = list(unique_ranges)
+    args = (entry_detectors, utility_manager, price_tracker, result_processor, time_manager,
+            streamS1, streamS2, inst, ticksz, debug)
+
+    from worker_budget import inner_worker_budget, MIN_RANGES_FOR_PARALLEL
+    workers = max_workers if max_workers is not None else inner_worker_budget()
+    use_parallel = workers > 1 and len(identities) > MIN_RANGES_FOR_PARALLEL and not debug
+    evaluated = None
+    if use_parallel:
+        try:
+            from parallel_processor import ParallelProcessor
+            use_shm = os.environ.get("ANALYZER_USE_SHARED_MEMORY", "1").lower() not in ("0", "false", "no")
+            processor = ParallelProcessor(
+                max_workers=min(workers, len(identities)),
+                enable_parallel=True,
+                use_shared_memory=use_shm
+            )
+            items = [{'range': _range_to_dict(unique_ranges[i]), 'exits': range_exits[i]} for i in identities]
+            evaluated = processor.process_dataframe_parallel(bar_index.df, items, _evaluate_range_dict, *args)
+        except ImportError:
+            evaluated = None
+    if evaluated is None:
+        evaluated = [_evaluate_range(unique_ranges[i], range_exits[i], *args, bar_index) for i in identities]
+
+    # (range identity, exit key) -> row; a failed worker item yields no rows, as in run_strategy
+    rows_by_exit: Dict[Tuple[Tuple, ExitKey], Optional[Dict[str, object]]] = {}
+    for identity, rows in zip(identities, evaluated):
+        for exit_key, row in zip(range_exits[identity], rows or []):
+            rows_by_exit[(identity, exit_key)] = row
+
+    results: Dict[str, pd.DataFrame] = {}
+    for variant in variants:
+        rp = variant.params
+        exit_key = exit_keys[variant.variant_id]
+        ranges = ranges_by_key[_range_key(rp)]
+        rows: List[Dict[str, object]] = []
+        for R in ranges:
+            row = rows_by_exit.get((_range_identity(R), exit_key))
+            if row is None or (row["Result"] == "NoTrade" and not rp.write_no_trade_rows):
+                continue
+            # Rows are shared between variants; process_results must not see the same dict twice
+            rows.append(dict(row))
+        if not ranges:
+            results[variant.variant_id] = empty[variant.variant_id]
+            continue
+        results[variant.variant_id] = _assemble_results(rows, ranges, rp, debug, result_processor,
+                                                        instrument_manager, target_pts=exit_key[2])
+    return results
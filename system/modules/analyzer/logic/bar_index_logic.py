@@ -0,0 +1,130 @@
+"""
+Bar Index Logic Module
+Per-run, array-backed view of an instrument's bars
+
+run_strategy builds one BarIndex per run so range processing never re-parses the
+timestamp column or filters the full DataFrame. Every window lookup is an
+O(log n) searchsorted on a shared int64 nanosecond array, and windows share the
+underlying arrays (no copies).
+"""
+
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+def timestamp_to_ns(ts) -> int:
+    """
+    Convert a timestamp to the int64 nanosecond key used by BarIndex
+
+    Timezone-aware timestamps map to UTC nanoseconds (same as the column),
+    naive timestamps map to their wall-clock nanoseconds.
+    """
+    return int(pd.Timestamp(ts).value)
+
+
+@dataclass
+class BarIndex:
+    """Sorted bars with precomputed timestamp/OHLC arrays"""
+    df: pd.DataFrame  # Bars sorted by timestamp with a 0..n-1 RangeIndex
+    ts_ns: np.ndarray  # int64 nanoseconds (UTC for tz-aware data)
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> "BarIndex":
+        """
+        Build a BarIndex from a bar DataFrame
+
+        Args:
+            df: DataFrame with timestamp, open, high, low, close columns
+                (run_strategy passes it already sorted with a reset index)
+
+        Returns:
+            BarIndex sharing the DataFrame's rows
+        """
+        timestamps = pd.DatetimeIndex(pd.to_datetime(df["timestamp"]))
+        if len(timestamps) > 1 and not timestamps.is_monotonic_increasing:
+            order = np.argsort(timestamps.asi8, kind="stable")
+            df = df.iloc[order].reset_index(drop=True)
+            timestamps = timestamps[order]
+        elif not isinstance(df.index, pd.RangeIndex) or df.index.start != 0:
+            df = df.reset_index(drop=True)
+
+        return cls(
+            df=df,
+            ts_ns=timestamps.as_unit("ns").asi8,
+            open=df["open"].to_numpy(dtype=float),
+            high=df["high"].to_numpy(dtype=float),
+            low=df["low"].to_numpy(dtype=float),
+            close=df["close"].to_numpy(dtype=float),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ts_ns)
+
+    def locate(self, ts, side: str = "left") -> int:
+        """Row position of ts in the sorted timestamp array (np.searchsorted semantics)"""
+        return int(np.searchsorted(self.ts_ns, timestamp_to_ns(ts), side=side))
+
+    def window(self, start_ts, end_ts=None) -> "BarWindow":
+        """Bars with start_ts <= timestamp < end_ts (open-ended when end_ts is None)"""
+        start = self.locate(start_ts)
+        stop = len(self) if end_ts is None else max(start, self.locate(end_ts))
+        return BarWindow(self, start, stop)
+
+
+@dataclass
+class BarWindow:
+    """Contiguous [start, stop) slice of a BarIndex; arrays are views, not copies"""
+    index: BarIndex
+    start: int
+    stop: int
+    _frame: Optional[pd.DataFrame] = field(default=None, repr=False)
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """DataFrame rows of this window (positional slice of the run DataFrame)"""
+        if self._frame is None:
+            self._frame = self.index.df.iloc[self.start:self.stop]
+        return self._frame
+
+    @property
+    def ts_ns(self) -> np.ndarray:
+        return self.index.ts_ns[self.start:self.stop]
+
+    @property
+    def open(self) -> np.ndarray:
+        return self.index.open[self.start:self.stop]
+
+    @property
+    def high(self) -> np.ndarray:
+        return self.index.high[self.start:self.stop]
+
+    @property
+    def low(self) -> np.ndarray:
+        return self.index.low[self.start:self.stop]
+
+    @property
+    def close(self) -> np.ndarray:
+        return self.index.close[self.start:self.stop]
+
+    def locate(self, ts, side: str = "left") -> int:
+        """Position of ts relative to the start of this window"""
+        return int(np.searchsorted(self.ts_ns, timestamp_to_ns(ts), side=side))
+
+    def sub_window(self, start_ts, end_ts=None) -> "BarWindow":
+        """Bars of this window with start_ts <= timestamp < end_ts"""
+        start = self.start + self.locate(start_ts)
+        stop = self.stop if end_ts is None else max(start, self.start + self.locate(end_ts))
+        return BarWindow(self.index, start, stop)
+
+    def timestamp_at(self, i: int) -> pd.Timestamp:
+        """Original timestamp (with timezone) of the i-th bar of this window"""
+        return self.frame["timestamp"].iloc[i]
@@ -19,6 +19,7 @@ class RunParams(BaseModel):
     write_no_trade_rows: bool = True  # Always show NoTrade entries by default
     target: float = 50.0  # Default target for NQ
     target_mode: Literal["fixed", "time"] = "fixed"  # "fixed" = price target exit; "time" = exit at 02:00 (S1) / 08:00 (S2)
+    execution_kernel: Literal["loop", "vectorized"] = "loop"  # "loop" = bar-by-bar scan; "vectorized" = array scan to first decisive bar
 
 class ConfigManager:
     """Handles configuration management and validation"""
@@ -3,6 +3,7 @@ Entry Logic Module
 Handles trade entry detection and validation
 """
 
+import numpy as np
 import pandas as pd
 import logging
 import sys
@@ -10,6 +11,7 @@ from typing import Optional, Tuple
 from dataclasses import dataclass
 from .loss_logic import LossManager, StopLossConfig
 from .config_logic import ConfigManager
+from .bar_index_logic import BarWindow
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +45,8 @@ class EntryDetector:
     
     def detect_entry(self, df: pd.DataFrame, range_result, 
                     brk_long: float, brk_short: float,
-                    freeze_close: float, end_ts: pd.Timestamp) -> EntryResult:
+                    freeze_close: float, end_ts: pd.Timestamp,
+                    bars: Optional[BarWindow] = None) -> EntryResult:
         """
         Detect trade entry using simple breakout detection
         
@@ -54,6 +57,8 @@ class EntryDetector:
             brk_short: Short breakout level
             freeze_close: Freeze close price
             end_ts: Range end timestamp
+            bars: Optional BarWindow over the same rows as df (sorted); breakouts are then
+                found with array scans instead of DataFrame filtering
             
         Returns:
             EntryResult object with entry details
@@ -77,6 +82,9 @@ class EntryDetector:
             elif immediate_short:
                 return EntryResult("Short", brk_short, end_ts_pd, True, end_ts_pd)
             
+            if bars is not None:
+                return self._detect_breakout_from_bars(bars, brk_long, brk_short, end_ts_pd)
+            
             # Get data after range period (including after market close for detection)
             # Ensure timestamp column is pandas Timestamp type for comparison
             if len(df) > 0 and 'timestamp' in df.columns:
@@ -89,17 +97,7 @@ class EntryDetector:
             if post.empty:
                 return EntryResult("NoTrade", None, None, False, None)
             
-            # Define market close time (configurable via ConfigManager) for the same day as the slot
-            # CRITICAL: Create market_close timestamp properly preserving timezone
-            market_close_time_str = self.config_manager.get_market_close_time()  # e.g., "16:00"
-            market_close_hour, market_close_minute = map(int, market_close_time_str.split(":"))
-            if end_ts_pd.tz is not None:
-                # Timezone-aware: create market close timestamp in same timezone
-                date_str = end_ts_pd.strftime('%Y-%m-%d')
-                market_close = pd.Timestamp(f"{date_str} {market_close_hour:02d}:{market_close_minute:02d}:00", tz=end_ts_pd.tz)
-            else:
-                # Naive timestamp: use replace directly
-                market_close = end_ts_pd.replace(hour=market_close_hour, minute=market_close_minute, second=0, microsecond=0)
+            market_close = self._get_market_close(end_ts_pd)
             
             # Find first breakout after range period
             long_breakout = post[post["high"] >= brk_long]
@@ -108,30 +106,7 @@ class EntryDetector:
             long_time = long_breakout["timestamp"].min() if not long_breakout.empty else None
             short_time = short_breakout["timestamp"].min() if not short_breakout.empty else None
             
-            # Check if breakouts happened after market close
-            long_after_close = long_time is not None and long_time > market_close
-            short_after_close = short_time is not None and short_time > market_close
-            
-            # Filter out breakouts that happened after market close
-            valid_long_time = long_time if not long_after_close else None
-            valid_short_time = short_time if not short_after_close else None
-            
-            # DEBUG: Log entry detection details for troubleshooting (when debug enabled)
-            # Note: Detailed debug output can be enabled via debug parameter in EntryDetector
-            # This debug block has been removed - use debug logging instead of hardcoded date checks
-            
-            # If no valid breakouts before market close, return NoTrade
-            if valid_long_time is None and valid_short_time is None:
-                return EntryResult("NoTrade", None, None, False, None)
-            
-            # First valid breakout wins (only considering those before market close)
-            if valid_long_time is not None and (valid_short_time is None or valid_long_time < valid_short_time):
-                return EntryResult("Long", brk_long, valid_long_time, False, valid_long_time)
-            elif valid_short_time is not None and (valid_long_time is None or valid_short_time < valid_long_time):
-                return EntryResult("Short", brk_short, valid_short_time, False, valid_short_time)
-            else:
-                # No valid breakouts found - this is NoTrade
-                return EntryResult("NoTrade", None, None, False, None)
+            return self._resolve_breakout(long_time, short_time, market_close, brk_long, brk_short)
                 
         except Exception as e:
             error_msg = f"Error detecting entry: {e}"
@@ -139,6 +114,80 @@ class EntryDetector:
             print(error_msg, file=sys.stderr, flush=True)
             return EntryResult(None, None, None, False, None)
     
+    def _get_market_close(self, end_ts_pd: pd.Timestamp) -> pd.Timestamp:
+        """Market close (configurable via ConfigManager) on the same day as the slot"""
+        # CRITICAL: Create market_close timestamp properly preserving timezone
+        market_close_time_str = self.config_manager.get_market_close_time()  # e.g., "16:00"
+        market_close_hour, market_close_minute = map(int, market_close_time_str.split(":"))
+        if end_ts_pd.tz is not None:
+            # Timezone-aware: create market close timestamp in same timezone
+            date_str = end_ts_pd.strftime('%Y-%m-%d')
+            return pd.Timestamp(f"{date_str} {market_close_hour:02d}:{market_close_minute:02d}:00", tz=end_ts_pd.tz)
+        # Naive timestamp: use replace directly
+        return end_ts_pd.replace(hour=market_close_hour, minute=market_close_minute, second=0, microsecond=0)
+    
+    def _detect_breakout_from_bars(self, bars: BarWindow, brk_long: float, brk_short: float,
+                                   end_ts_pd: pd.Timestamp) -> EntryResult:
+        """
+        Array-backed equivalent of the DataFrame breakout scan in detect_entry
+        
+        Bars are sorted, so the first bar at/after end_ts that crosses a level is also the
+        earliest breakout timestamp.
+        """
+        post_start = bars.locate(end_ts_pd)
+        if post_start >= len(bars):
+            return EntryResult("NoTrade", None, None, False, None)
+        
+        market_close = self._get_market_close(end_ts_pd)
+        
+        long_hits = np.flatnonzero(bars.high[post_start:] >= brk_long)
+        short_hits = np.flatnonzero(bars.low[post_start:] <= brk_short)
+        
+        long_time = bars.timestamp_at(post_start + int(long_hits[0])) if len(long_hits) > 0 else None
+        short_time = bars.timestamp_at(post_start + int(short_hits[0])) if len(short_hits) > 0 else None
+        
+        return self._resolve_breakout(long_time, short_time, market_close, brk_long, brk_short)
+    
+    def _resolve_breakout(self, long_time: Optional[pd.Timestamp], short_time: Optional[pd.Timestamp],
+                          market_close: pd.Timestamp, brk_long: float, brk_short: float) -> EntryResult:
+        """
+        Pick the entry from the first long/short breakout times
+        
+        Args:
+            long_time: First long breakout time (None if none)
+            short_time: First short breakout time (None if none)
+            market_close: Market close for the slot day
+            brk_long: Long breakout level
+            brk_short: Short breakout level
+            
+        Returns:
+            EntryResult for the first valid breakout, or NoTrade
+        """
+        # Check if breakouts happened after market close
+        long_after_close = long_time is not None and long_time > market_close
+        short_after_close = short_time is not None and short_time > market_close
+        
+        # Filter out breakouts that happened after market close
+        valid_long_time = long_time if not long_after_close else None
+        valid_short_time = short_time if not short_after_close else None
+        
+        # DEBUG: Log entry detection details for troubleshooting (when debug enabled)
+        # Note: Detailed debug output can be enabled via debug parameter in EntryDetector
+        # This debug block has been removed - use debug logging instead of hardcoded date checks
+        
+        # If no valid breakouts before market close, return NoTrade
+        if valid_long_time is None and valid_short_time is None:
+            return EntryResult("NoTrade", None, None, False, None)
+        
+        # First valid breakout wins (only considering those before market close)
+        if valid_long_time is not None and (valid_short_time is None or valid_long_time < valid_short_time):
+            return EntryResult("Long", brk_long, valid_long_time, False, valid_long_time)
+        elif valid_short_time is not None and (valid_long_time is None or valid_short_time < valid_long_time):
+            return EntryResult("Short", brk_short, valid_short_time, False, valid_short_time)
+        else:
+            # No valid breakouts found - this is NoTrade
+            return EntryResult("NoTrade", None, None, False, None)
+    
     def _handle_dual_immediate_entry(self, freeze_close: float, 
                                    brk_long: float, brk_short: float,
                                    end_ts_pd: pd.Timestamp) -> EntryResult:
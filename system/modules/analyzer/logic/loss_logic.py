@@ -42,7 +42,7 @@ class LossResult:
 @dataclass
 class StopLossConfig:
     """Configuration for stop loss management"""
-    initial_multiplier: float = 3.0  # 3x target as initial stop
+    initial_multiplier: float = ConfigManager.STOP_LOSS_MAX_MULTIPLIER  # 3x target as initial stop
     t1_adjustment: str = "break_even"  # "break_even" or "partial"
     max_loss_per_trade: float = 100.0  # Maximum loss per trade
     max_daily_loss: float = 500.0  # Maximum daily loss
@@ -71,7 +71,8 @@ class LossManager:
         """
         Calculate initial stop loss price
         
-        Stop loss = min(range_size, 3 * target_pts) in points
+        Stop loss = min(range_size, initial_multiplier * target_pts) in points
+        (initial_multiplier from StopLossConfig, 3 by default).
         Then converted to price based on direction.
         
         Args:
@@ -86,8 +87,8 @@ class LossManager:
         Returns:
             Initial stop loss price
         """
-        # Calculate stop loss in points: min(range_size, max_multiplier * target_pts)
-        max_sl_points = ConfigManager.STOP_LOSS_MAX_MULTIPLIER * target_pts
+        # Calculate stop loss in points: min(range_size, initial_multiplier * target_pts)
+        max_sl_points = self.config.initial_multiplier * target_pts
         
         if range_size is None:
             # Fallback to 3x target if no range size provided
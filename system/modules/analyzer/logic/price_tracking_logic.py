@@ -20,6 +20,7 @@ from datetime import datetime
 from .debug_logic import DebugManager, DebugInfo
 from .instrument_logic import InstrumentManager
 from .config_logic import ConfigManager
+from .bar_index_logic import BarWindow, timestamp_to_ns
 
 logger = logging.getLogger(__name__)
 
@@ -85,7 +86,9 @@ class PriceTracker:
                      stop_loss: float, expiry_time: pd.Timestamp,
                      target_pts: float, instrument: str = "ES",
                      time_label: str = None, date: pd.Timestamp = None, debug: bool = False,
-                     target_mode: str = "fixed", session: str = None) -> TradeExecution:
+                     target_mode: str = "fixed", session: str = None,
+                     execution_kernel: str = "loop",
+                     bars: Optional[BarWindow] = None) -> TradeExecution:
         """
         Execute trade with integrated MFE calculation and break even logic
         
@@ -104,6 +107,10 @@ class PriceTracker:
             debug: Debug flag
             target_mode: "fixed" = exit on price target; "time" = exit at 02:00 (S1) / 08:00 (S2) only
             session: Session (S1 or S2) - required for time mode MFE/expiry
+            execution_kernel: "loop" = evaluate every bar after entry; "vectorized" = locate the
+                first decisive bar with array scans and resolve only that bar (identical results)
+            bars: Optional BarWindow over the same rows as df (sorted); time slicing then uses
+                searchsorted on the shared timestamp array instead of DataFrame filtering
             
         Returns:
             TradeExecution object with all details
@@ -146,7 +153,12 @@ class PriceTracker:
                 
             
             # Get bars after entry time (including after market close for detection)
-            after = df[df["timestamp"] >= entry_time]
+            if bars is not None:
+                after_bars = bars.sub_window(entry_time)
+                after = after_bars.frame
+            else:
+                after_bars = None
+                after = df[df["timestamp"] >= entry_time]
             
             # Define market close time (configurable via ConfigManager)
             # CRITICAL: Create market_close timestamp properly preserving timezone
@@ -193,11 +205,11 @@ class PriceTracker:
             # Get bars for MFE calculation (until next day same slot or original stop hit)
             if mfe_end_time:
                 # Check if data extends to MFE end time
-                data_end_time = df['timestamp'].max()
+                data_end_time = df['timestamp'].iloc[-1] if bars is not None else df['timestamp'].max()
                 if data_end_time < mfe_end_time:
                     # Data doesn't extend to MFE end time - use all available data
                     # This is expected behavior when data doesn't extend to exact minute boundaries
-                    mfe_bars = df[(df["timestamp"] >= entry_time)]
+                    mfe_bars = after if bars is not None else df[(df["timestamp"] >= entry_time)]
                     # Log MFE data gap warnings to stderr for immediate visibility
                     import sys
                     time_diff = (mfe_end_time - data_end_time).total_seconds() / 60
@@ -210,6 +222,9 @@ class PriceTracker:
                     else:
                         # Larger gap (>5 minutes) - warning level
                         print(f"WARNING: MFE: Data ends {time_diff:.1f} min before expected end time (using available data)", file=sys.stderr, flush=True)
+                elif bars is not None:
+                    # Data extends to MFE end time - slice the sorted window
+                    mfe_bars = bars.sub_window(entry_time, mfe_end_time).frame
                 else:
                     # Data extends to MFE end time - use normal filtering
                     mfe_bars = df[(df["timestamp"] >= entry_time) & (df["timestamp"] < mfe_end_time)]
@@ -252,8 +267,12 @@ class PriceTracker:
             t1_triggered_previous_bar = False
             
             # Calculate maximum favorable movement across after bars (vectorized)
-            after_highs = after["high"].values.astype(float)
-            after_lows = after["low"].values.astype(float)
+            if after_bars is not None:
+                after_highs = after_bars.high
+                after_lows = after_bars.low
+            else:
+                after_highs = after["high"].values.astype(float)
+                after_lows = after["low"].values.astype(float)
             if direction == "Long":
                 max_favorable_execution = float(np.max(after_highs - entry_price)) if len(after_highs) > 0 else 0.0
             else:
@@ -267,12 +286,37 @@ class PriceTracker:
                 print(f"   Target Hit: {max_favorable_execution >= target_pts}")
             
             # Pre-extract arrays for main execution loop (avoid iterrows overhead)
-            after_opens = after["open"].values.astype(float)
-            after_closes = after["close"].values.astype(float)
+            if after_bars is not None:
+                after_opens = after_bars.open
+                after_closes = after_bars.close
+            else:
+                after_opens = after["open"].values.astype(float)
+                after_closes = after["close"].values.astype(float)
             after_timestamps = after["timestamp"].values
             
+            # Vectorized kernel: jump straight to the first bar that can end the trade and
+            # restore the T1 / stop state the loop would have reached by then
+            first_bar_idx = 0
+            if execution_kernel == "vectorized":
+                if after_bars is not None:
+                    expired_mask = after_bars.ts_ns >= timestamp_to_ns(expiry_time)
+                else:
+                    expired_mask = (after["timestamp"] >= expiry_time).to_numpy(dtype=bool)
+                first_bar_idx, t1_idx = self._vectorized_first_decisive_bar(
+                    after_highs, after_lows, after_closes, expired_mask,
+                    entry_price, direction, target_pts, stop_loss, t1_threshold,
+                    instrument, target_mode
+                )
+                if t1_idx < first_bar_idx:
+                    t1_triggered = True
+                    current_stop_loss = self._adjust_stop_loss_t1(
+                        entry_price, direction, target_pts, instrument
+                    )
+                    stop_loss_adjusted = True
+                    t1_triggered_previous_bar = True
+            
             # Now process trade execution using the regular after bars (index-based loop)
-            for i in range(len(after)):
+            for i in range(first_bar_idx, len(after)):
                 bar = after.iloc[i]
                 high, low = after_highs[i], after_lows[i]
                 open_price = after_opens[i]
@@ -1079,6 +1123,62 @@ class PriceTracker:
         
         return max_favorable, peak_time, peak_price
     
+    def _vectorized_first_decisive_bar(self, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray,
+                                       expired_mask: np.ndarray, entry_price: float, direction: str,
+                                       target_pts: float, stop_loss: float, t1_threshold: float,
+                                       instrument: str, target_mode: str) -> Tuple[int, int]:
+        """
+        Vectorized scan for the execution loop. Returns (first_decisive_idx, t1_idx).
+        
+        first_decisive_idx is the first bar on which the bar-by-bar loop would return:
+        a target/stop resolution under _simulate_intra_bar_execution (same close-distance
+        tie-break, same T1 same-bar protection) or a bar at/after expiry. t1_idx is the first
+        bar whose favorable movement reaches the T1 threshold. Both are len(highs) when absent.
+        """
+        n = len(highs)
+        if n == 0:
+            return 0, 0
+        
+        if direction == "Long":
+            favorable = highs - entry_price
+            target_level = entry_price + target_pts
+            target_possible = highs >= target_level
+        else:
+            favorable = entry_price - lows
+            target_level = entry_price - target_pts
+            target_possible = lows <= target_level
+        
+        t1_hits = np.flatnonzero(favorable >= t1_threshold)
+        t1_idx = int(t1_hits[0]) if len(t1_hits) > 0 else n
+        
+        # Stop level in force on each bar: original stop before T1, break-even stop from T1 on
+        stop_levels = np.full(n, float(stop_loss))
+        if t1_idx < n:
+            stop_levels[t1_idx:] = self._adjust_stop_loss_t1(entry_price, direction, target_pts, instrument)
+        if direction == "Long":
+            stop_possible = lows <= stop_levels
+        else:
+            stop_possible = highs >= stop_levels
+        
+        # Close-distance rule when both levels are inside the bar (ties favor STOP)
+        target_closer = np.abs(closes - target_level) < np.abs(closes - stop_levels)
+        target_first = target_possible & (~stop_possible | target_closer)
+        stop_first = stop_possible & (~target_possible | ~target_closer)
+        
+        # T1 protection: stop is not checked on the bar where T1 triggers
+        if t1_idx < n and stop_possible[t1_idx]:
+            target_first[t1_idx] = target_possible[t1_idx]
+            stop_first[t1_idx] = False
+        
+        # Time mode never exits on the price target
+        decisive = stop_first | expired_mask
+        if target_mode != "time":
+            decisive = decisive | target_first
+        
+        decisive_hits = np.flatnonzero(decisive)
+        first_idx = int(decisive_hits[0]) if len(decisive_hits) > 0 else n
+        return first_idx, t1_idx
+    
     def _vectorized_be_stop_check(self, bars_df: pd.DataFrame, current_stop_loss: float,
                                   direction: str) -> Tuple[bool, Optional[pd.Timestamp]]:
         """Vectorized check: did BE stop get hit? Returns (hit, first_hit_time)."""
@@ -224,6 +224,102 @@ class RangeDetector:
         
         return range_result.range_size >= min_range_size
     
+    def _slot_window(self, date: pd.Timestamp, time_label: str, session: str,
+                     tz_aware: bool) -> Tuple[pd.Timestamp, pd.Timestamp]:
+        """Range window [start_ts, end_ts) of a slot, built exactly as calculate_range builds it"""
+        start_h, start_m = map(int, self.slot_start.get(session, "02:00").split(":"))
+        end_h, end_m = map(int, time_label.split(":"))
+        date_str = date.strftime("%Y-%m-%d")
+        tz = pytz.timezone("America/Chicago") if tz_aware else None
+        start_ts = pd.Timestamp(f"{date_str} {start_h:02d}:{start_m:02d}:00", tz=tz)
+        end_ts = pd.Timestamp(f"{date_str} {end_h:02d}:{end_m:02d}:00", tz=tz)
+        return start_ts, end_ts
+
+    def _build_ranges_batched(self, df: pd.DataFrame,
+                              candidates: List[Tuple[pd.Timestamp, str, str]]) -> List[SlotRange]:
+        """
+        SlotRanges of many (date, session, slot) candidates in one pass over the bars.
+
+        Same result as calling calculate_range per candidate: window bounds come from a
+        binary search on the sorted timestamps, high/low/last-close from one reduceat over
+        all windows. freeze_close is the close of the window's last row in df order, as
+        range_data.iloc[-1] is.
+        """
+        n = len(df)
+        if n == 0:
+            return []
+        timestamps = pd.DatetimeIndex(df["timestamp"])
+        tz_aware = timestamps.tz is not None
+        ts_ns = timestamps.as_unit("ns").asi8  # UTC instants when tz-aware, wall time when naive
+
+        windows = []  # (candidate index, start_ts, end_ts)
+        fallback = {}  # candidate index -> RangeResult/None from calculate_range
+        for i, (date, sess, time_label) in enumerate(candidates):
+            if time_label not in self.slot_ends.get(sess, []):
+                fallback[i] = None
+                continue
+            try:
+                start_ts, end_ts = self._slot_window(date, time_label, sess, tz_aware)
+            except Exception:
+                # e.g. nonexistent local time: let calculate_range report it the usual way
+                fallback[i] = self.calculate_range(df, date, time_label, sess)
+                continue
+            windows.append((i, start_ts, end_ts))
+
+        stats = {}
+        if windows:
+            if bool(np.all(ts_ns[1:] >= ts_ns[:-1])):
+                order = np.arange(n)
+            else:
+                order = np.argsort(ts_ns, kind="stable")
+            ts_sorted = ts_ns[order]
+            starts = np.array([w[1].value for w in windows], dtype=np.int64)
+            ends = np.array([w[2].value for w in windows], dtype=np.int64)
+            lo = np.searchsorted(ts_sorted, starts, side="left")
+            hi = np.searchsorted(ts_sorted, ends, side="left")
+            nonempty = np.flatnonzero(hi > lo)
+            if len(nonempty):
+                # Interleaved [lo0, hi0, lo1, hi1, ...]: even reduceat slots are the windows
+                # (a trailing sentinel keeps hi == n a valid index)
+                bounds = np.empty(2 * len(nonempty), dtype=np.intp)
+                bounds[0::2] = lo[nonempty]
+                bounds[1::2] = hi[nonempty]
+                highs = np.append(df["high"].to_numpy(dtype=np.float64)[order], np.nan)
+                lows = np.append(df["low"].to_numpy(dtype=np.float64)[order], np.nan)
+                positions = np.append(order, -1)
+                range_highs = np.fmax.reduceat(highs, bounds)[0::2]
+                range_lows = np.fmin.reduceat(lows, bounds)[0::2]
+                last_rows = np.maximum.reduceat(positions, bounds)[0::2]
+                closes = df["close"]
+                for k, w in enumerate(nonempty):
+                    stats[windows[w][0]] = (float(range_highs[k]), float(range_lows[k]),
+                                            float(closes.iloc[last_rows[k]]), windows[w][1], windows[w][2])
+
+        ranges = []
+        for i, (date, sess, time_label) in enumerate(candidates):
+            if i in fallback:
+                result = fallback[i]
+                if result is None:
+                    continue
+                range_high, range_low = result.range_high, result.range_low
+                freeze_close, start_ts, end_ts = result.freeze_close, result.start_time, result.end_time
+            elif i in stats:
+                range_high, range_low, freeze_close, start_ts, end_ts = stats[i]
+            else:
+                continue  # No bars in the window
+            ranges.append(SlotRange(
+                date=date,
+                session=sess,
+                end_label=time_label,
+                start_ts=start_ts,
+                end_ts=end_ts,
+                range_high=range_high,
+                range_low=range_low,
+                range_size=range_high - range_low,
+                freeze_close=freeze_close
+            ))
+        return ranges
+
     def build_slot_ranges(self, df: pd.DataFrame, rp, debug: bool = False) -> List[SlotRange]:
         """
         Build slot ranges for all enabled sessions and time slots
@@ -265,6 +361,7 @@ class RangeDetector:
         
         dates_processed = 0
         dates_skipped_not_trading_day = 0
+        candidates: List[Tuple[pd.Timestamp, str, str]] = []  # (date, session, slot) in output order
         
         total_dates = len(unique_dates)
         import sys
@@ -329,6 +426,11 @@ class RangeDetector:
                             print(f"    Skipping slot {time_label} (not enabled)", file=sys.stderr, flush=True)
                         continue
                     
+                    if not debug:
+                        # Computed together after the loop (one pass over the sorted bars)
+                        candidates.append((date, sess, time_label))
+                        continue
+                    
                     if debug and dates_processed <= 3:
                         print(f"    Calculating range for {date_str} {sess} {time_label}...", file=sys.stderr, flush=True)
                     
@@ -368,6 +470,9 @@ class RangeDetector:
                     
                     # Range calculated
         
+        if candidates:
+            ranges = self._build_ranges_batched(df, candidates)
+        
         def _log(msg):
             print(msg, file=sys.stderr, flush=True)
         if debug or len(ranges) == 0:
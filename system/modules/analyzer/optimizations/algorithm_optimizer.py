@@ -9,6 +9,8 @@ Purpose:
 - Measure Analyzer wall-clock performance
 - Compare runs across datasets or configurations
 - Profile result aggregation cost
+- Per-phase timings reported by run_strategy (see stage_benchmark.py for the
+  synthetic-data suite with a regression baseline)
 
 Hard rules:
 - All trading logic must come from run_strategy
@@ -72,7 +74,8 @@ class AnalyzerBenchmark:
 
         # --- Analyzer execution ---
         start_analyzer = time.perf_counter()
-        results_df = run_strategy(df, rp, debug=debug)
+        phase_times: Dict[str, float] = {}
+        results_df = run_strategy(df, rp, debug=debug, timings=phase_times)
         analyzer_elapsed = time.perf_counter() - start_analyzer
 
         self.stats.analyzer_time += analyzer_elapsed
@@ -92,6 +95,7 @@ class AnalyzerBenchmark:
             "analyzer_time_sec": analyzer_elapsed,
             "aggregation_time_sec": agg_elapsed,
             "total_time_sec": analyzer_elapsed + agg_elapsed,
+            "phase_times_sec": phase_times,
             "rows_processed": len(df),
             "trades_generated": len(results_df),
             "summary": summary,
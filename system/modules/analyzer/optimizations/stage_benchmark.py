@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Stage Benchmark
+
+Per-phase timing of run_strategy on deterministic synthetic bars, with a JSONL
+baseline and a regression gate.
+
+AnalyzerBenchmark times run_strategy as a whole; this suite reads the phase timers
+run_strategy fills in (prepare, range_building, bar_index, range_processing with
+entry_detection / execute_trade, result_assembly), so a regression points at a stage.
+
+Usage:
+    python optimizations/stage_benchmark.py                       # run, compare to baseline
+    python optimizations/stage_benchmark.py --record              # run and append to baseline
+    python optimizations/stage_benchmark.py --case es_1y --threshold 0.3
+
+Exit code 1 when a phase is slower than its baseline by more than the threshold
+(and by more than --min-seconds, to ignore noise on sub-millisecond phases).
+
+Hard rules (as for the benchmark module):
+- All trading logic comes from run_strategy; ranges are processed sequentially
+  (ANALYZER_INNER_WORKERS=1) so entry/execute timings are collected and comparable
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+# Add analyzer root to PYTHONPATH
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from breakout_core.engine import run_strategy
+from logic.config_logic import RunParams
+from optimizations.synthetic_bars import generate_bars
+from worker_budget import INNER_WORKERS_ENV
+
+DEFAULT_BASELINE_FILE = ROOT / "optimizations" / "stage_benchmark_baseline.jsonl"
+DEFAULT_THRESHOLD = 0.25  # 25% slower fails
+DEFAULT_MIN_SECONDS = 0.05
+
+PHASES = (
+    "prepare",
+    "range_building",
+    "bar_index",
+    "range_processing",
+    "entry_detection",
+    "execute_trade",
+    "result_assembly",
+)
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    name: str
+    instruments: Tuple[str, ...] = ("ES",)
+    years: float = 1.0
+    regime: str = "normal"
+    seed: int = 0
+    start: str = "2024-01-02"
+
+
+DEFAULT_CASES: Dict[str, BenchmarkCase] = {
+    case.name: case for case in (
+        BenchmarkCase("es_1y", ("ES",), 1.0, "normal"),
+        BenchmarkCase("es_nq_cl_6m_mixed", ("ES", "NQ", "CL"), 0.5, "mixed"),
+        BenchmarkCase("es_3y_volatile", ("ES",), 3.0, "volatile"),
+    )
+}
+
+
+@dataclass
+class CaseResult:
+    case: str
+    phases: Dict[str, float]
+    total_sec: float
+    bars: int
+    result_rows: int
+    results_hash: str
+    repeats: int
+    recorded_at: str = ""
+    python: str = field(default_factory=platform.python_version)
+    machine: str = field(default_factory=platform.node)
+
+
+def _results_hash(results: Sequence[pd.DataFrame]) -> str:
+    """Content hash of the results (a change means behaviour changed, not just speed)"""
+    digest = hashlib.sha1()
+    for df in results:
+        digest.update(pd.util.hash_pandas_object(df.astype(str), index=False).to_numpy().tobytes())
+    return digest.hexdigest()[:16]
+
+
+def run_case(case: BenchmarkCase, repeats: int = 3) -> CaseResult:
+    """
+    Run a case `repeats` times; each phase keeps its fastest time (least noisy).
+
+    The synthetic bars are generated once, outside the timed region.
+    """
+    bars = generate_bars(case.instruments, start=case.start, years=case.years,
+                         regime=case.regime, seed=case.seed)
+    best: Dict[str, float] = {}
+    best_total = float("inf")
+    results: List[pd.DataFrame] = []
+    previous_inner = os.environ.get(INNER_WORKERS_ENV)
+    os.environ[INNER_WORKERS_ENV] = "1"
+    try:
+        for _ in range(max(1, repeats)):
+            timings: Dict[str, float] = {}
+            results = []
+            start = time.perf_counter()
+            for inst in case.instruments:
+                results.append(run_strategy(bars, RunParams(instrument=inst), show_progress=False,
+                                            timings=timings))
+            best_total = min(best_total, time.perf_counter() - start)
+            for phase, seconds in timings.items():
+                best[phase] = min(best.get(phase, float("inf")), seconds)
+    finally:
+        if previous_inner is None:
+            os.environ.pop(INNER_WORKERS_ENV, None)
+        else:
+            os.environ[INNER_WORKERS_ENV] = previous_inner
+
+    return CaseResult(
+        case=case.name,
+        phases={phase: round(best[phase], 6) for phase in PHASES if phase in best},
+        total_sec=round(best_total, 6),
+        bars=len(bars),
+        result_rows=sum(len(df) for df in results),
+        results_hash=_results_hash(results),
+        repeats=max(1, repeats),
+    )
+
+
+def load_baseline(path: Path) -> Dict[str, Dict]:
+    """Latest baseline record per case name"""
+    baseline: Dict[str, Dict] = {}
+    if not path.exists():
+        return baseline
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(record, dict) and record.get("case"):
+                baseline[record["case"]] = record
+    return baseline
+
+
+def record_result(result: CaseResult, path: Path) -> None:
+    """Append a result to the baseline file"""
+    result.recorded_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(asdict(result)) + "\n")
+
+
+def find_regressions(result: CaseResult, baseline: Optional[Dict], threshold: float = DEFAULT_THRESHOLD,
+                     min_seconds: float = DEFAULT_MIN_SECONDS) -> List[str]:
+    """
+    Phases slower than the baseline by more than threshold (fraction) and min_seconds.
+
+    Returns:
+        One message per regressed phase (empty when none or no baseline)
+    """
+    if not baseline:
+        return []
+    regressions = []
+    current = dict(result.phases, total=result.total_sec)
+    previous = dict(baseline.get("phases", {}), total=baseline.get("total_sec"))
+    for phase, seconds in current.items():
+        before = previous.get(phase)
+        if not before:
+            continue
+        if seconds - before > min_seconds and seconds > before * (1 + threshold):
+            regressions.append(
+                f"{result.case}.{phase}: {seconds:.3f}s vs baseline {before:.3f}s "
+                f"(+{(seconds / before - 1) * 100:.0f}%)"
+            )
+    return regressions
+
+
+def _print_result(result: CaseResult, baseline: Optional[Dict]) -> None:
+    previous = (baseline or {}).get("phases", {})
+    print(f"\n{result.case}: {result.bars:,} bars, {result.result_rows:,} rows, "
+          f"total {result.total_sec:.3f}s (best of {result.repeats})")
+    for phase, seconds in result.phases.items():
+        before = previous.get(phase)
+        delta = f"  ({(seconds / before - 1) * 100:+.0f}% vs baseline)" if before else ""
+        print(f"  {phase:<18} {seconds:8.3f}s{delta}")
+    if baseline and baseline.get("results_hash") not in (None, result.results_hash):
+        print(f"  NOTE: results differ from the baseline run ({baseline['results_hash']} -> {result.results_hash})")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Per-phase analyzer benchmark on synthetic bars")
+    parser.add_argument("--case", action="append", choices=sorted(DEFAULT_CASES),
+                        help="Case to run (repeatable; default: all)")
+    parser.add_argument("--repeats", type=int, default=3, help="Runs per case (fastest kept)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_FILE, help="Baseline JSONL file")
+    parser.add_argument("--record", action="store_true", help="Append the results to the baseline (skipped when a phase regressed)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown per phase as a fraction (0.25 = 25%%)")
+    parser.add_argument("--min-seconds", type=float, default=DEFAULT_MIN_SECONDS,
+                        help="Ignore slowdowns smaller than this many seconds")
+    args = parser.parse_args(argv)
+
+    baseline = load_baseline(args.baseline)
+    regressions: List[str] = []
+    results: List[CaseResult] = []
+    for name in args.case or list(DEFAULT_CASES):
+        result = run_case(DEFAULT_CASES[name], repeats=args.repeats)
+        _print_result(result, baseline.get(name))
+        regressions.extend(find_regressions(result, baseline.get(name), args.threshold, args.min_seconds))
+        results.append(result)
+
+    if regressions:
+        print("\nREGRESSIONS:")
+        for message in regressions:
+            print(f"  {message}")
+        # A regressed run must not become the baseline it is compared against next time
+        if args.record:
+            print(f"\nNot recording results to {args.baseline}")
+        return 1
+    if args.record:
+        for result in results:
+            record_result(result, args.baseline)
+        print(f"\nRecorded results to {args.baseline}")
+    elif not baseline:
+        print(f"\nNo baseline at {args.baseline} (run with --record to create one)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""
+Synthetic Bar Generator
+
+Deterministic 1-minute OHLC bars in the analyzer's input format (timestamp in
+America/Chicago, open, high, low, close, instrument) for benchmarking without
+production data.
+
+- One CME session per weekday: 17:00 the previous evening to 16:00 (1380 bars)
+- Random walk on the instrument's tick grid; the same (instrument, seed) always
+  produces the same bars
+- Volatility regime: per-bar close-to-close move in ticks (calm / normal / volatile),
+  or "mixed" to switch regimes day by day
+
+Hard rules (as for the benchmark module):
+- Only produces input data; all trading logic stays in run_strategy
+"""
+
+import zlib
+from typing import Dict, Iterable, Sequence
+
+import numpy as np
+import pandas as pd
+import pytz
+
+from logic.instrument_logic import InstrumentManager
+
+CHICAGO_TZ = pytz.timezone("America/Chicago")
+
+# Per-bar close-to-close standard deviation, in ticks
+VOLATILITY_REGIMES: Dict[str, float] = {
+    "calm": 2.0,
+    "normal": 6.0,
+    "volatile": 16.0,
+}
+MIXED_REGIME = "mixed"
+
+# Starting price per instrument (anything else starts at 1000)
+START_PRICES: Dict[str, float] = {
+    "ES": 4500.0, "NQ": 15500.0, "YM": 35000.0, "RTY": 2000.0,
+    "CL": 75.0, "NG": 3.0, "GC": 2000.0,
+}
+
+SESSION_BARS = 23 * 60  # 17:00 -> 16:00
+TRADING_DAYS_PER_YEAR = 252
+
+
+def _instrument_seed(instrument: str, seed: int) -> int:
+    """Stable per-instrument seed (str hash() is randomized per process)"""
+    return (zlib.crc32(instrument.upper().encode("utf-8")) + seed * 1_000_003) % (2 ** 32)
+
+
+def trading_days(start: str, years: float) -> pd.DatetimeIndex:
+    """Weekdays from start covering `years` of trading (252 days per year, at least one)"""
+    n_days = max(1, int(round(years * TRADING_DAYS_PER_YEAR)))
+    return pd.bdate_range(start, periods=n_days)
+
+
+def _day_sigmas(n_days: int, regime: str, rng: np.random.Generator) -> np.ndarray:
+    if regime == MIXED_REGIME:
+        levels = np.array(list(VOLATILITY_REGIMES.values()))
+        return levels[rng.integers(0, len(levels), n_days)]
+    if regime not in VOLATILITY_REGIMES:
+        raise ValueError(f"Unknown volatility regime '{regime}' "
+                         f"(expected one of {sorted(VOLATILITY_REGIMES) + [MIXED_REGIME]})")
+    return np.full(n_days, VOLATILITY_REGIMES[regime])
+
+
+def generate_instrument_bars(instrument: str, start: str = "2024-01-02", years: float = 1.0,
+                             regime: str = "normal", seed: int = 0) -> pd.DataFrame:
+    """
+    1-minute bars of one instrument.
+
+    Args:
+        instrument: Instrument code (tick size from InstrumentManager)
+        start: First trading day (YYYY-MM-DD)
+        years: Length in trading years (fractions allowed)
+        regime: Volatility regime name or "mixed"
+        seed: Seed; same arguments -> identical bars
+
+    Returns:
+        DataFrame with timestamp (America/Chicago), open, high, low, close, instrument
+    """
+    inst = instrument.upper()
+    tick = InstrumentManager().get_tick_size(inst)
+    rng = np.random.default_rng(_instrument_seed(inst, seed))
+    days = trading_days(start, years)
+    sigmas = _day_sigmas(len(days), regime, rng)
+
+    # Session open (previous evening 17:00 Chicago) per trading day, then minute offsets
+    session_opens = pd.DatetimeIndex([
+        CHICAGO_TZ.localize((day - pd.Timedelta(days=1)).to_pydatetime().replace(hour=17)) for day in days
+    ])
+    # Timedelta arithmetic rather than asi8 offsets: the index unit (ns/us) depends on the pandas version
+    minutes = pd.to_timedelta(np.tile(np.arange(SESSION_BARS), len(days)), unit="min")
+    timestamps = (session_opens.tz_convert("UTC").repeat(SESSION_BARS) + minutes).tz_convert(CHICAGO_TZ)
+
+    n = len(timestamps)
+    per_bar_sigma = np.repeat(sigmas, SESSION_BARS)
+    steps = np.round(rng.normal(0.0, 1.0, n) * per_bar_sigma)
+    start_ticks = np.round(START_PRICES.get(inst, 1000.0) / tick)
+    close_ticks = start_ticks + np.cumsum(steps)
+    # Keep prices positive: reflect the walk off a floor of 10% of the start price
+    floor = max(1.0, np.round(start_ticks * 0.1))
+    close_ticks = np.where(close_ticks < floor, 2 * floor - close_ticks, close_ticks)
+    open_ticks = np.concatenate([[start_ticks], close_ticks[:-1]])
+    wick_up = np.round(np.abs(rng.normal(0.0, 1.0, n)) * per_bar_sigma / 2)
+    wick_down = np.round(np.abs(rng.normal(0.0, 1.0, n)) * per_bar_sigma / 2)
+    high_ticks = np.maximum(open_ticks, close_ticks) + wick_up
+    low_ticks = np.maximum(np.minimum(open_ticks, close_ticks) - wick_down, 1.0)
+
+    return pd.DataFrame({
+        "timestamp": timestamps,
+        "open": open_ticks * tick,
+        "high": high_ticks * tick,
+        "low": low_ticks * tick,
+        "close": close_ticks * tick,
+        "instrument": inst,
+    })
+
+
+def generate_bars(instruments: Sequence[str] = ("ES",), start: str = "2024-01-02", years: float = 1.0,
+                  regime: str = "normal", seed: int = 0) -> pd.DataFrame:
+    """1-minute bars of several instruments, concatenated (see generate_instrument_bars)"""
+    frames: Iterable[pd.DataFrame] = (
+        generate_instrument_bars(inst, start=start, years=years, regime=regime, seed=seed)
+        for inst in instruments
+    )
+    return pd.concat(list(frames), ignore_index=True)
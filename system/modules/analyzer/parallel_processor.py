@@ -23,6 +23,12 @@ import os
 import uuid
 from functools import partial
 
+try:
+    from .worker_budget import inner_worker_budget
+except ImportError:
+    # Imported as a top-level module (analyzer root on sys.path)
+    from worker_budget import inner_worker_budget
+
 try:
     from multiprocessing import shared_memory
     SHARED_MEMORY_AVAILABLE = True
@@ -30,7 +36,8 @@ except ImportError:
     SHARED_MEMORY_AVAILABLE = False
 
 
-def _build_df_from_shared_memory(shm_name: str, n_rows: int, instrument: str) -> pd.DataFrame:
+def _build_df_from_shared_memory(shm_name: str, n_rows: int, instrument: str,
+                                 tz: Optional[Any] = None) -> pd.DataFrame:
     """
     Build DataFrame from shared memory block. Module-level for picklability.
     Worker keeps shm attached for the duration of chunk processing.
@@ -47,7 +54,11 @@ def _build_df_from_shared_memory(shm_name: str, n_rows: int, instrument: str) ->
         l_arr = np.ndarray((n_rows,), dtype=np.float64, buffer=shm.buf, offset=offset)
         offset += n_rows * 8
         c_arr = np.ndarray((n_rows,), dtype=np.float64, buffer=shm.buf, offset=offset)
-        timestamp = pd.to_datetime(ts_arr.copy(), unit="ns")
+        if tz is not None:
+            # Timestamps are stored as UTC nanoseconds; restore the original timezone
+            timestamp = pd.to_datetime(ts_arr.copy(), unit="ns", utc=True).tz_convert(tz)
+        else:
+            timestamp = pd.to_datetime(ts_arr.copy(), unit="ns")
         df = pd.DataFrame({
             "timestamp": timestamp,
             "open": o_arr.copy(),
@@ -61,14 +72,31 @@ def _build_df_from_shared_memory(shm_name: str, n_rows: int, instrument: str) ->
         shm.close()
 
 
+# Per-worker-process cache: shm_name -> DataFrame (bars are mapped once per worker, not per chunk)
+_worker_frames: Dict[str, pd.DataFrame] = {}
+
+
+def _get_worker_frame(shm_metadata: Dict) -> pd.DataFrame:
+    """DataFrame for a shared memory block, built on first use in this process"""
+    shm_name = shm_metadata["shm_name"]
+    df = _worker_frames.get(shm_name)
+    if df is None:
+        # A worker only ever serves one block at a time
+        _worker_frames.clear()
+        df = _build_df_from_shared_memory(
+            shm_name,
+            shm_metadata["n_rows"],
+            shm_metadata["instrument"],
+            shm_metadata.get("tz"),
+        )
+        _worker_frames[shm_name] = df
+    return df
+
+
 def _process_chunk_with_shm(shm_metadata: Dict, process_func: Callable, chunk: List[Dict],
                             *args, **kwargs) -> List[Any]:
     """Process chunk using DataFrame built from shared memory. Module-level for picklability."""
-    df = _build_df_from_shared_memory(
-        shm_metadata["shm_name"],
-        shm_metadata["n_rows"],
-        shm_metadata["instrument"],
-    )
+    df = _get_worker_frame(shm_metadata)
     chunk_results = []
     for range_data in chunk:
         try:
@@ -126,6 +154,9 @@ class ParallelProcessor:
         # Cap at 8 workers to avoid overhead
         optimal_workers = min(optimal_workers, 8)
         
+        # Never exceed this process's share of the global worker budget
+        optimal_workers = min(optimal_workers, inner_worker_budget())
+        
         return optimal_workers
     
     def process_ranges_parallel(self, ranges: List[Dict], process_func: Callable, 
@@ -158,24 +189,29 @@ class ParallelProcessor:
         print(f"[CHUNK] Split into {len(range_chunks)} chunks (avg {chunk_size} ranges per chunk)")
         
         # Process chunks in parallel (ProcessPoolExecutor bypasses GIL for CPU-bound work)
+        # Results are kept in chunk order so output matches sequential processing
+        results_by_chunk: List[List[Any]] = [[] for _ in range_chunks]
         with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
             # Submit all chunks
             future_to_chunk = {
-                executor.submit(self._process_chunk, chunk, process_func, *args, **kwargs): chunk
-                for chunk in range_chunks
+                executor.submit(self._process_chunk, chunk, process_func, *args, **kwargs): chunk_idx
+                for chunk_idx, chunk in enumerate(range_chunks)
             }
             
             # Collect results as they complete
             for future in as_completed(future_to_chunk):
-                chunk = future_to_chunk[future]
+                chunk_idx = future_to_chunk[future]
                 try:
-                    chunk_results = future.result()
-                    results.extend(chunk_results)
+                    results_by_chunk[chunk_idx] = future.result()
                 except Exception as exc:
                     print(f"[ERROR] Chunk processing failed: {exc}")
                     # Fall back to sequential processing for this chunk
-                    chunk_results = self._process_chunk(chunk, process_func, *args, **kwargs)
-                    results.extend(chunk_results)
+                    results_by_chunk[chunk_idx] = self._process_chunk(
+                        range_chunks[chunk_idx], process_func, *args, **kwargs
+                    )
+        
+        for chunk_results in results_by_chunk:
+            results.extend(chunk_results)
         
         processing_time = time.time() - start_time
         
@@ -311,6 +347,8 @@ class ParallelProcessor:
         df_prep = self._prepare_dataframe_for_parallel(df)
         n_rows = len(df_prep)
         instrument = str(df_prep["instrument"].iloc[0]) if "instrument" in df_prep.columns and n_rows > 0 else "ES"
+        timestamps = pd.to_datetime(df_prep["timestamp"])
+        tz = timestamps.dt.tz
         
         # Layout: timestamp (int64) + open, high, low, close (float64) = 40 bytes/row
         shm_size = n_rows * 40
@@ -318,7 +356,7 @@ class ParallelProcessor:
         shm = shared_memory.SharedMemory(name=shm_name, create=True, size=shm_size)
         
         try:
-            ts = pd.to_datetime(df_prep["timestamp"]).astype(np.int64)
+            ts = timestamps.dt.as_unit("ns").astype(np.int64)
             np.ndarray((n_rows,), dtype=np.int64, buffer=shm.buf)[:] = ts.values
             offset = n_rows * 8
             np.ndarray((n_rows,), dtype=np.float64, buffer=shm.buf, offset=offset)[:] = df_prep["open"].values
@@ -329,32 +367,37 @@ class ParallelProcessor:
             offset += n_rows * 8
             np.ndarray((n_rows,), dtype=np.float64, buffer=shm.buf, offset=offset)[:] = df_prep["close"].values
             
-            shm_metadata = {"shm_name": shm_name, "n_rows": n_rows, "instrument": instrument}
+            shm_metadata = {"shm_name": shm_name, "n_rows": n_rows, "instrument": instrument, "tz": tz}
             
             chunk_size = max(1, len(ranges) // self.max_workers)
             range_chunks = self._split_into_chunks(ranges, chunk_size)
             
             print(f"[SHARED-MEM] Using shared memory ({n_rows:,} rows, {shm_size/1024/1024:.1f} MB)")
             
-            results = []
+            results_by_chunk: List[List[Any]] = [[] for _ in range_chunks]
             with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
                 future_to_chunk = {
-                    executor.submit(_process_chunk_with_shm, shm_metadata, process_func, chunk, *args, **kwargs): chunk
-                    for chunk in range_chunks
+                    executor.submit(_process_chunk_with_shm, shm_metadata, process_func, chunk, *args, **kwargs): chunk_idx
+                    for chunk_idx, chunk in enumerate(range_chunks)
                 }
                 for future in as_completed(future_to_chunk):
+                    chunk_idx = future_to_chunk[future]
                     try:
-                        chunk_results = future.result()
-                        results.extend(chunk_results)
+                        results_by_chunk[chunk_idx] = future.result()
                     except Exception as exc:
                         print(f"[ERROR] Chunk processing failed: {exc}")
-                        chunk = future_to_chunk[future]
-                        chunk_results = _process_chunk_with_shm(shm_metadata, process_func, chunk, *args, **kwargs)
-                        results.extend(chunk_results)
+                        results_by_chunk[chunk_idx] = _process_chunk_with_shm(
+                            shm_metadata, process_func, range_chunks[chunk_idx], *args, **kwargs
+                        )
         finally:
+            # Drop the frame if a failed chunk was re-run in this process
+            _worker_frames.pop(shm_name, None)
             shm.close()
             shm.unlink()
         
+        results = []
+        for chunk_results in results_by_chunk:
+            results.extend(chunk_results)
         return results
     
     def _prepare_dataframe_for_parallel(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -24,6 +24,7 @@ if qtsw2_root not in sys.path:
 
 from logic.config_logic import RunParams, ConfigManager
 from breakout_core.engine import run_strategy
+from breakout_core.incremental import run_strategy_incremental
 
 def parse_slots(args_slots, sessions):
     # args_slots like ["S1:07:30","S1:08:00","S2:09:30"]
@@ -81,11 +82,41 @@ def _file_in_date_range(file_path: pathlib.Path, start_date, end_date) -> bool:
     except ValueError:
         return True
 
+def _load_from_bar_store(folder: pathlib.Path, instrument: str, years: list = None,
+                         start_date: datetime.date = None, end_date: datetime.date = None):
+    """
+    Load bars from the consolidated per-instrument store (modules.translator.bar_store),
+    syncing it with the day files first. Returns None when the store cannot be used,
+    so the caller falls back to reading the day files.
+    """
+    try:
+        from modules.translator.bar_store import BarStore
+        store = BarStore(folder, instrument)
+        outcome = store.sync()
+        if outcome == "empty":
+            return None
+        # Same date filter semantics as the day-file path: applied only when both bounds are given
+        if not (start_date and end_date):
+            start_date = end_date = None
+        df = store.read(years=years, start_date=start_date, end_date=end_date)
+    except Exception as e:
+        print(f"[LOAD] Bar store unavailable ({e}), reading day files", file=sys.stderr, flush=True)
+        return None
+    print(f"[LOAD] Bar store {instrument.upper()} ({outcome}): {len(df):,} rows", file=sys.stderr, flush=True)
+    if df.empty:
+        raise SystemExit(f"No CSV/Parquet files found under {folder}")
+    return df
+
 def load_folder(folder: str, instrument: str = None, years: list = None,
-                start_date: datetime.date = None, end_date: datetime.date = None) -> pd.DataFrame:
+                start_date: datetime.date = None, end_date: datetime.date = None,
+                use_bar_store: bool = True) -> pd.DataFrame:
     p = pathlib.Path(folder)
     if not p.exists() or not p.is_dir():
         raise SystemExit(f"Folder not found: {folder}")
+    if use_bar_store and instrument and (p / instrument.upper() / "1m").exists():
+        df = _load_from_bar_store(p, instrument, years, start_date, end_date)
+        if df is not None:
+            return df
     parts = []
     # Recursively search for parquet files in subdirectories
     # Translator outputs files in structure like: {folder}/{instrument}/1m/YYYY/MM/{instrument}_1m_{date}.parquet
@@ -207,6 +238,10 @@ def main():
     ap.add_argument("--years", nargs="*", type=int, default=None, help="Filter to specific years (e.g. 2023 2024)")
     ap.add_argument("--start-date", type=str, default=None, help="Start date YYYY-MM-DD (skip files before)")
     ap.add_argument("--end-date", type=str, default=None, help="End date YYYY-MM-DD (skip files after)")
+    ap.add_argument("--execution-kernel", default="loop", choices=["loop","vectorized"], help="Trade execution kernel (default: loop)")
+    ap.add_argument("--no-bar-store", action="store_true", help="Read the translated day files directly instead of the consolidated bar store")
+    ap.add_argument("--incremental", action="store_true", help="Only recompute ranges that are new or may still change since the last incremental run, and write just the new/changed rows")
+    ap.add_argument("--state-dir", default="data/analyzer_state", help="Watermark folder for --incremental (default data/analyzer_state)")
     args = ap.parse_args()
 
     start_date = None
@@ -223,7 +258,7 @@ def main():
             raise SystemExit(f"Invalid --end-date: {args.end_date} (use YYYY-MM-DD)")
 
     df = load_folder(args.folder, instrument=args.instrument, years=args.years,
-                     start_date=start_date, end_date=end_date)
+                     start_date=start_date, end_date=end_date, use_bar_store=not args.no_bar_store)
     
     # Debug output
     if args.debug:
@@ -250,7 +285,8 @@ def main():
         trade_days=[day_map[d] for d in args.days],
         same_bar_priority=args.priority,
         write_setup_rows=args.write_setup,
-        write_no_trade_rows=not args.no_write_notrade  # Default to True, disable with --no-write-notrade
+        write_no_trade_rows=not args.no_write_notrade,  # Default to True, disable with --no-write-notrade
+        execution_kernel=args.execution_kernel
     )
 
 
@@ -303,13 +339,23 @@ def main():
     import time
     strategy_start_time = time.time()
     
+    incremental_run = None
     try:
-        res = run_strategy(df, rp, debug=args.debug)
+        if args.incremental:
+            incremental_run = run_strategy_incremental(df, rp, pathlib.Path(args.state_dir), debug=args.debug)
+            res = incremental_run.rows
+        else:
+            res = run_strategy(df, rp, debug=args.debug)
         strategy_elapsed = time.time() - strategy_start_time
         
         print(f"\n{'='*60}")
         print(f"Strategy execution completed in {strategy_elapsed:.1f} seconds ({strategy_elapsed/60:.1f} minutes)")
         print(f"  Results generated: {len(res)}")
+        if incremental_run is not None:
+            if incremental_run.mode == "incremental":
+                print(f"  Incremental: recomputed from {incremental_run.window_start}, {len(res)} new/changed rows")
+            else:
+                print(f"  Incremental: full run ({incremental_run.reason})")
         print(f"{'='*60}\n")
         
         if args.debug:
@@ -330,6 +376,12 @@ def main():
         print(f"{'='*60}\n")
         raise
 
+    # Incremental run with nothing new: no output file, the merged history is already current
+    if len(res) == 0 and incremental_run is not None and incremental_run.mode == "incremental":
+        print(f"No new or changed rows for {args.instrument} since the last run")
+        incremental_run.commit()
+        return
+
     # Handle empty results
     if len(res) == 0:
         print(f"\n{'='*60}")
@@ -383,6 +435,8 @@ def main():
         # Save empty DataFrame with correct schema
         res.to_parquet(out_path, index=False, compression='snappy')
         print(f"Empty results saved to {out_path}")
+        if incremental_run is not None:
+            incremental_run.commit()
         return
 
     # Calculate statistics
@@ -421,6 +475,8 @@ def main():
     
     # Save as parquet file (for sequential processor compatibility)
     res.to_parquet(out_path, index=False, compression='snappy')
+    if incremental_run is not None:
+        incremental_run.commit()
     
     print(f"Wrote {len(res)} rows to {out_path}")
     
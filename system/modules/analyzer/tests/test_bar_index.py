@@ -0,0 +1,98 @@
+"""
+Unit Tests for BarIndex / BarWindow and the array-backed entry detection path
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from datetime import datetime, timedelta
+import pytz
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from logic.bar_index_logic import BarIndex, timestamp_to_ns
+from logic.entry_logic import EntryDetector
+
+
+CHICAGO_TZ = pytz.timezone("America/Chicago")
+
+
+@pytest.fixture
+def two_day_bars():
+    """Two Chicago trading days of 1-minute bars (07:00-16:59)"""
+    frames = []
+    for day in (2, 3):
+        start = CHICAGO_TZ.localize(datetime(2025, 1, day, 7, 0))
+        timestamps = pd.date_range(start, periods=600, freq="1min")
+        base = 100.0 + np.sin(np.arange(600) / 25.0) * 4
+        frames.append(pd.DataFrame({
+            "timestamp": timestamps,
+            "open": base,
+            "high": base + 0.5,
+            "low": base - 0.5,
+            "close": base + 0.25,
+            "instrument": "ES",
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+class TestBarIndex:
+    """BarIndex construction and window lookups"""
+
+    def test_arrays_match_columns(self, two_day_bars):
+        index = BarIndex.from_dataframe(two_day_bars)
+        assert index.df is two_day_bars
+        assert index.ts_ns.dtype == np.int64
+        assert index.ts_ns[0] == two_day_bars["timestamp"].iloc[0].value
+        np.testing.assert_array_equal(index.high, two_day_bars["high"].to_numpy())
+
+    def test_unsorted_input_is_sorted(self, two_day_bars):
+        shuffled = two_day_bars.sample(frac=1.0, random_state=1)
+        index = BarIndex.from_dataframe(shuffled)
+        assert np.all(np.diff(index.ts_ns) > 0)
+        assert list(index.df.index) == list(range(len(shuffled)))
+
+    def test_window_matches_boolean_filter(self, two_day_bars):
+        index = BarIndex.from_dataframe(two_day_bars)
+        start = CHICAGO_TZ.localize(datetime(2025, 1, 2, 9, 30))
+        end = start + timedelta(hours=24)
+        expected = two_day_bars[(two_day_bars["timestamp"] >= start) & (two_day_bars["timestamp"] < end)]
+        window = index.window(start, end)
+        pd.testing.assert_frame_equal(window.frame, expected)
+        np.testing.assert_array_equal(window.close, expected["close"].to_numpy())
+
+        sub = window.sub_window(start + timedelta(minutes=30))
+        assert sub.start == window.start + 30
+        assert sub.stop == window.stop
+
+    def test_timestamp_to_ns_uses_utc_for_aware(self):
+        aware = CHICAGO_TZ.localize(datetime(2025, 1, 2, 7, 30))
+        assert timestamp_to_ns(aware) == pd.Timestamp("2025-01-02 13:30").value
+
+
+class TestDetectEntryWithBars:
+    """detect_entry must give the same answer with and without a BarWindow"""
+
+    @pytest.mark.parametrize("end_hour,end_minute", [(7, 30), (9, 0), (10, 30), (15, 30)])
+    @pytest.mark.parametrize("offset", [0.75, 1.5, 3.0])
+    def test_parity_with_dataframe_scan(self, two_day_bars, end_hour, end_minute, offset):
+        detector = EntryDetector()
+        index = BarIndex.from_dataframe(two_day_bars)
+        end_ts = CHICAGO_TZ.localize(datetime(2025, 1, 2, end_hour, end_minute))
+        window = index.window(end_ts, end_ts + timedelta(hours=24))
+        freeze_close = float(window.close[0]) if len(window) else 100.0
+        brk_long, brk_short = freeze_close + offset, freeze_close - offset
+
+        expected = detector.detect_entry(window.frame, None, brk_long, brk_short, freeze_close, end_ts)
+        result = detector.detect_entry(window.frame, None, brk_long, brk_short, freeze_close, end_ts, bars=window)
+        assert result == expected
+
+    def test_empty_window_is_no_trade(self, two_day_bars):
+        detector = EntryDetector()
+        index = BarIndex.from_dataframe(two_day_bars)
+        end_ts = CHICAGO_TZ.localize(datetime(2025, 1, 5, 7, 30))
+        window = index.window(end_ts, end_ts + timedelta(hours=24))
+        result = detector.detect_entry(window.frame, None, 101.0, 99.0, 100.0, end_ts, bars=window)
+        assert result.entry_direction == "NoTrade"
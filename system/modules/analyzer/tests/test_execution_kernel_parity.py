@@ -0,0 +1,165 @@
+"""
+Parity tests for the vectorized trade-execution kernel
+
+The "vectorized" kernel must produce bit-identical TradeExecution results to the
+bar-by-bar "loop" kernel. Every field is compared by repr so that value, type and
+timezone differences all count as mismatches.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from dataclasses import asdict
+import pytz
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from logic.price_tracking_logic import PriceTracker
+from logic.debug_logic import DebugManager
+from logic.instrument_logic import InstrumentManager
+from logic.config_logic import ConfigManager, RunParams
+from breakout_core.engine import run_strategy
+
+CHICAGO_TZ = pytz.timezone("America/Chicago")
+
+
+def _random_walk_bars(start: str, minutes: int, seed: int, base: float = 4000.0,
+                      step: float = 1.5) -> pd.DataFrame:
+    """Deterministic 1-minute ES-like bars on a 0.25 tick grid"""
+    rng = np.random.default_rng(seed)
+    timestamps = pd.date_range(start, periods=minutes, freq="1min", tz=CHICAGO_TZ)
+    closes = base + np.round(np.cumsum(rng.normal(0.0, step, minutes)) * 4) / 4
+    opens = np.concatenate([[base], closes[:-1]])
+    wick_up = np.round(np.abs(rng.normal(0.0, step, minutes)) * 4) / 4
+    wick_down = np.round(np.abs(rng.normal(0.0, step, minutes)) * 4) / 4
+    return pd.DataFrame({
+        "timestamp": timestamps,
+        "open": opens,
+        "high": np.maximum(opens, closes) + wick_up,
+        "low": np.minimum(opens, closes) - wick_down,
+        "close": closes,
+        "volume": rng.integers(100, 1000, minutes),
+        "instrument": "ES",
+    })
+
+
+def _assert_identical(loop_result, vectorized_result):
+    loop_fields = asdict(loop_result)
+    vectorized_fields = asdict(vectorized_result)
+    for name, loop_value in loop_fields.items():
+        assert repr(loop_value) == repr(vectorized_fields[name]), \
+            f"{name}: loop={loop_value!r} vectorized={vectorized_fields[name]!r}"
+
+
+class TestExecutionKernelParity:
+    """Diff the loop and vectorized kernels of PriceTracker.execute_trade"""
+
+    @pytest.fixture
+    def price_tracker(self):
+        return PriceTracker(DebugManager(False), InstrumentManager(), ConfigManager())
+
+    def _run_both(self, price_tracker, **kwargs):
+        loop_result = price_tracker.execute_trade(execution_kernel="loop", **kwargs)
+        vectorized_result = price_tracker.execute_trade(execution_kernel="vectorized", **kwargs)
+        _assert_identical(loop_result, vectorized_result)
+        return loop_result
+
+    def test_target_hit_after_t1(self, price_tracker):
+        """Same scenario as the target exit price fix: T1 in bar 2, target in bar 4"""
+        entry_time = pd.Timestamp("2025-01-02 09:00:00", tz=CHICAGO_TZ)
+        entry_price, target_pts = 4000.0, 10.0
+        df = pd.DataFrame({
+            "timestamp": [entry_time + pd.Timedelta(minutes=m) for m in range(4)],
+            "open": [entry_price, entry_price + 2.0, entry_price + 7.0, entry_price + 8.0],
+            "high": [entry_price + 1.0, entry_price + 7.0, entry_price + 8.0, entry_price + 11.0],
+            "low": [entry_price - 1.0, entry_price - 0.5, entry_price + 0.25, entry_price + 7.5],
+            "close": [entry_price + 0.5, entry_price + 6.5, entry_price + 7.5, entry_price + 10.0],
+            "instrument": "ES",
+        })
+        result = self._run_both(
+            price_tracker, df=df, entry_time=entry_time, entry_price=entry_price,
+            direction="Long", target_level=entry_price + target_pts, stop_loss=entry_price - 20.0,
+            expiry_time=entry_time + pd.Timedelta(hours=24), target_pts=target_pts,
+            instrument="ES", time_label="09:00", date=entry_time
+        )
+        assert result.exit_reason == "Win"
+        assert result.t1_triggered is True
+
+    def test_t1_bar_protects_stop(self, price_tracker):
+        """Bar that triggers T1 and also trades through the BE stop must not exit"""
+        entry_time = pd.Timestamp("2025-01-02 09:00:00", tz=CHICAGO_TZ)
+        entry_price, target_pts = 4000.0, 10.0
+        df = pd.DataFrame({
+            "timestamp": [entry_time + pd.Timedelta(minutes=m) for m in range(3)],
+            "open": [entry_price, entry_price, entry_price + 1.0],
+            "high": [entry_price + 1.0, entry_price + 7.0, entry_price + 2.0],
+            "low": [entry_price - 1.0, entry_price - 2.0, entry_price - 3.0],
+            "close": [entry_price, entry_price + 1.0, entry_price - 2.0],
+            "instrument": "ES",
+        })
+        result = self._run_both(
+            price_tracker, df=df, entry_time=entry_time, entry_price=entry_price,
+            direction="Long", target_level=entry_price + target_pts, stop_loss=entry_price - 20.0,
+            expiry_time=entry_time + pd.Timedelta(hours=24), target_pts=target_pts,
+            instrument="ES", time_label="09:00", date=entry_time
+        )
+        assert result.exit_reason == "BE"
+        assert result.exit_time == entry_time + pd.Timedelta(minutes=2)
+
+    @pytest.mark.parametrize("target_mode", ["fixed", "time"])
+    @pytest.mark.parametrize("direction", ["Long", "Short"])
+    @pytest.mark.parametrize("seed", [7, 11, 23])
+    def test_random_walk_sweep(self, price_tracker, seed, direction, target_mode):
+        """Many entries across a multi-day random walk, covering Win/Loss/BE/TIME exits"""
+        df = _random_walk_bars("2025-01-06 00:00", 4 * 1440, seed)
+        config_manager = ConfigManager()
+        target_pts = 10.0
+        results = set()
+        for entry_idx in range(480, 2 * 1440, 37):
+            entry_time = df["timestamp"].iloc[entry_idx]
+            entry_price = float(df["close"].iloc[entry_idx])
+            date = entry_time.normalize()
+            time_label = entry_time.strftime("%H:%M")
+            session = "S1" if entry_time.hour < 9 else "S2"
+            if direction == "Long":
+                target_level, stop_loss = entry_price + target_pts, entry_price - target_pts
+            else:
+                target_level, stop_loss = entry_price - target_pts, entry_price + target_pts
+            days_ahead = config_manager.FRIDAY_TO_MONDAY_DAYS if date.weekday() == 4 else 1
+            expiry_time = (date + pd.Timedelta(days=days_ahead)).replace(
+                hour=entry_time.hour, minute=entry_time.minute
+            ) - pd.Timedelta(minutes=1)
+            result = self._run_both(
+                price_tracker, df=df, entry_time=entry_time, entry_price=entry_price,
+                direction=direction, target_level=target_level, stop_loss=stop_loss,
+                expiry_time=expiry_time, target_pts=target_pts, instrument="ES",
+                time_label=time_label, date=date, target_mode=target_mode, session=session
+            )
+            results.add(result.result_classification)
+        assert len(results) > 1
+
+    def test_open_trade_when_data_ends_before_expiry(self, price_tracker):
+        df = _random_walk_bars("2025-01-06 07:00", 120, seed=3, step=0.25)
+        entry_time = df["timestamp"].iloc[10]
+        entry_price = float(df["close"].iloc[10])
+        self._run_both(
+            price_tracker, df=df, entry_time=entry_time, entry_price=entry_price,
+            direction="Long", target_level=entry_price + 50.0, stop_loss=entry_price - 50.0,
+            expiry_time=pd.Timestamp.now(tz=CHICAGO_TZ) + pd.Timedelta(days=1), target_pts=50.0,
+            instrument="ES", time_label="07:30", date=entry_time.normalize()
+        )
+
+
+class TestRunStrategyKernelParity:
+    """Full run_strategy output must not depend on the execution kernel"""
+
+    @pytest.mark.parametrize("target_mode", ["fixed", "time"])
+    def test_run_strategy_identical(self, target_mode):
+        df = _random_walk_bars("2025-01-06 00:00", 8 * 1440, seed=42)
+        params = dict(instrument="ES", target_mode=target_mode)
+        loop_df = run_strategy(df, RunParams(execution_kernel="loop", **params), show_progress=False)
+        vectorized_df = run_strategy(df, RunParams(execution_kernel="vectorized", **params), show_progress=False)
+        assert not loop_df.empty
+        pd.testing.assert_frame_equal(loop_df, vectorized_df, check_exact=True)
@@ -0,0 +1,101 @@
+"""
+Incremental analyzer runs
+
+Upserting the rows of successive incremental runs (as the merger does) must give the same
+history as one full run over all the data; anything that invalidates older rows must fall
+back to a full run.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytz
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from logic.config_logic import RunParams
+from breakout_core.engine import run_strategy
+from breakout_core.incremental import ROW_KEY, run_strategy_incremental
+
+CHICAGO_TZ = pytz.timezone("America/Chicago")
+
+
+def _session_bars(days, seed: int = 3) -> pd.DataFrame:
+    """00:00-16:00 Chicago 1-minute bars per day, random walk on a 0.25 tick grid"""
+    rng = np.random.default_rng(seed)
+    price = 4000.0
+    parts = []
+    for day in days:
+        timestamps = pd.date_range(pd.Timestamp(day).tz_localize(CHICAGO_TZ), periods=16 * 60, freq="1min")
+        closes = price + np.cumsum(np.round(rng.normal(0.0, 1.5, len(timestamps)) * 4) / 4)
+        price = closes[-1]
+        opens = np.concatenate([[closes[0]], closes[:-1]])
+        parts.append(pd.DataFrame({
+            "timestamp": timestamps,
+            "open": opens,
+            "high": np.maximum(opens, closes) + np.round(np.abs(rng.normal(0.0, 1.0, len(timestamps))) * 4) / 4,
+            "low": np.minimum(opens, closes) - np.round(np.abs(rng.normal(0.0, 1.0, len(timestamps))) * 4) / 4,
+            "close": closes,
+            "instrument": "ES",
+        }))
+    return pd.concat(parts, ignore_index=True)
+
+
+def _until(bars: pd.DataFrame, day) -> pd.DataFrame:
+    return bars[bars["timestamp"] < pd.Timestamp(day).tz_localize(CHICAGO_TZ)].reset_index(drop=True)
+
+
+def _sorted(df: pd.DataFrame) -> pd.DataFrame:
+    return df.sort_values(["Date", "Time", "Session"]).reset_index(drop=True)
+
+
+def test_upserted_incremental_rows_equal_full_run(tmp_path):
+    days = pd.bdate_range("2025-03-03", periods=14)  # Includes Friday -> Monday expiries
+    bars = _session_bars(days)
+    rp = RunParams(instrument="ES")
+
+    first = run_strategy_incremental(_until(bars, days[8]), rp, tmp_path)
+    assert first.mode == "full" and first.reason == "no previous state"
+    first.commit()
+    merged = first.rows
+
+    for end in (days[9], days[10], days[13], days[13] + pd.Timedelta(days=1)):
+        run = run_strategy_incremental(_until(bars, end), rp, tmp_path)
+        assert run.mode == "incremental", run.reason
+        assert len(run.rows) < len(merged)
+        assert pd.to_datetime(run.rows["Date"]).min().date() >= run.window_start
+        run.commit()
+        merged = pd.concat([merged, run.rows], ignore_index=True).drop_duplicates(subset=ROW_KEY, keep="last")
+
+    full = run_strategy(bars, rp, show_progress=False)
+    pd.testing.assert_frame_equal(_sorted(merged)[full.columns], _sorted(full), check_dtype=False)
+
+    # Same data again: nothing new or changed
+    again = run_strategy_incremental(bars, rp, tmp_path)
+    assert again.mode == "incremental" and again.rows.empty
+
+
+def test_changed_history_or_params_fall_back_to_full_run(tmp_path):
+    days = pd.bdate_range("2025-03-03", periods=8)
+    bars = _session_bars(days, seed=5)
+    rp = RunParams(instrument="ES")
+    run_strategy_incremental(_until(bars, days[6]), rp, tmp_path).commit()
+
+    # A re-translated older day
+    revised = bars.copy()
+    revised.loc[100, "high"] += 1.0
+    run = run_strategy_incremental(revised, rp, tmp_path)
+    assert run.mode == "full" and run.reason == "bars before the previous data end changed"
+    full = run_strategy(revised, rp, show_progress=False)
+    pd.testing.assert_frame_equal(_sorted(run.rows), _sorted(full))
+    run.commit()
+
+    # Different slots: stored rows no longer apply
+    narrower = RunParams(instrument="ES", enabled_slots={"S1": ["07:30"], "S2": ["09:30"]})
+    run = run_strategy_incremental(revised, narrower, tmp_path)
+    assert run.mode == "full" and run.reason == "run parameters changed"
+
+    # Uncommitted runs leave the watermark untouched
+    assert run_strategy_incremental(revised, rp, tmp_path).mode == "incremental"
@@ -0,0 +1,72 @@
+"""
+Tests for the global worker budget and parallel range processing in run_strategy
+"""
+
+import pytest
+import pandas as pd
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from worker_budget import (
+    INNER_WORKERS_ENV, WORKER_BUDGET_ENV, inner_worker_budget, split_worker_budget, total_worker_budget
+)
+from parallel_processor import ParallelProcessor
+from logic.config_logic import RunParams
+from breakout_core.engine import run_strategy
+from test_execution_kernel_parity import _random_walk_bars
+
+
+class TestWorkerBudget:
+    """Budget split between the per-instrument and per-range fan-outs"""
+
+    @pytest.mark.parametrize("n_tasks,total,expected", [
+        (7, 24, (7, 3)),
+        (7, 6, (6, 1)),
+        (1, 12, (1, 12)),
+        (3, 1, (1, 1)),
+    ])
+    def test_split_never_exceeds_budget(self, n_tasks, total, expected):
+        outer, inner = split_worker_budget(n_tasks, total=total)
+        assert (outer, inner) == expected
+
+    def test_explicit_outer_workers(self):
+        assert split_worker_budget(7, outer_workers=2, total=12) == (2, 6)
+
+    def test_explicit_outer_workers_clamped_to_budget(self):
+        outer, inner = split_worker_budget(7, outer_workers=8, total=4)
+        assert (outer, inner) == (4, 1)
+        assert outer * inner <= 4
+
+    def test_environment_overrides(self, monkeypatch):
+        monkeypatch.setenv(WORKER_BUDGET_ENV, "10")
+        monkeypatch.delenv(INNER_WORKERS_ENV, raising=False)
+        assert total_worker_budget() == 10
+        assert inner_worker_budget() == 10
+
+        monkeypatch.setenv(INNER_WORKERS_ENV, "3")
+        assert inner_worker_budget() == 3
+        assert ParallelProcessor().max_workers <= 3
+
+        monkeypatch.setenv(INNER_WORKERS_ENV, "not-a-number")
+        assert inner_worker_budget() == 10
+
+
+class TestParallelRunStrategy:
+    """Parallel (shared-memory) range processing must match sequential output exactly"""
+
+    @pytest.mark.parametrize("target_mode", ["fixed", "time"])
+    def test_parallel_matches_sequential(self, monkeypatch, target_mode):
+        df = _random_walk_bars("2025-01-06 00:00", 10 * 1440, seed=5)
+        params = RunParams(instrument="ES", target_mode=target_mode)
+
+        monkeypatch.setenv(INNER_WORKERS_ENV, "1")
+        sequential_df = run_strategy(df, params, show_progress=False)
+
+        monkeypatch.setenv(INNER_WORKERS_ENV, "3")
+        parallel_df = run_strategy(df, params, show_progress=False)
+
+        assert not sequential_df.empty
+        pd.testing.assert_frame_equal(sequential_df, parallel_df, check_exact=True)
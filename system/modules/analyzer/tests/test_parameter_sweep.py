@@ -0,0 +1,85 @@
+"""
+Parameter sweep
+
+Every variant must equal its own run_strategy run (the sweep only shares work), target
+ladder levels and stop loss multipliers must reach the exits, and the parallel path must
+match the sequential one.
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from breakout_core.engine import run_strategy
+from breakout_core.sweep import SweepVariant, run_sweep
+from logic.config_logic import RunParams
+from logic.instrument_logic import InstrumentManager
+from logic.loss_logic import StopLossConfig
+from optimizations.synthetic_bars import generate_bars
+from worker_budget import INNER_WORKERS_ENV
+
+
+@pytest.fixture(scope="module")
+def bars():
+    return generate_bars(("ES", "CL"), years=0.06, regime="mixed", seed=11)
+
+
+def _variant(results: pd.DataFrame, variant_id: str) -> pd.DataFrame:
+    return results[results["variant_id"] == variant_id].drop(columns=["variant_id"]).reset_index(drop=True)
+
+
+def test_run_params_variants_match_run_strategy(bars, monkeypatch):
+    monkeypatch.setenv(INNER_WORKERS_ENV, "1")
+    grid = {
+        "es_base": RunParams(instrument="ES"),
+        "es_no_notrade": RunParams(instrument="ES", write_no_trade_rows=False),
+        "es_s1_0730": RunParams(instrument="ES", enabled_sessions=["S1"], enabled_slots={"S1": ["07:30"]}),
+        "es_time": RunParams(instrument="ES", target_mode="time"),
+        "es_vectorized": RunParams(instrument="ES", execution_kernel="vectorized"),
+        "cl_base": RunParams(instrument="CL"),
+    }
+    results = run_sweep(bars, grid, max_workers=1)
+
+    assert list(dict.fromkeys(results["variant_id"])) == list(grid)
+    for variant_id, rp in grid.items():
+        expected = run_strategy(bars, rp, show_progress=False)
+        pd.testing.assert_frame_equal(_variant(results, variant_id), expected, check_dtype=False)
+
+
+def test_target_levels_and_stop_loss_reach_the_exits(bars):
+    ladder = InstrumentManager().get_target_ladder("ES")
+    rp = RunParams(instrument="ES")
+    results = run_sweep(bars, [
+        SweepVariant(rp, variant_id="base"),
+        SweepVariant(rp, target_level=1, variant_id="level1"),
+        SweepVariant(rp, stop_loss=StopLossConfig(initial_multiplier=1.0), variant_id="tight_sl"),
+    ], max_workers=1)
+
+    base, level1, tight = (_variant(results, v) for v in ("base", "level1", "tight_sl"))
+    assert set(level1["Target"]) == {ladder[1]}
+    assert set(base["Target"]) == {ladder[0]}
+    # Same ranges and entries, different exits
+    assert list(level1["Date"]) == list(base["Date"]) and list(level1["Direction"]) == list(base["Direction"])
+    trades = tight["Result"] != "NoTrade"
+    assert (tight.loc[trades, "StopLoss"] <= ladder[0] + 1e-9).all()
+    assert not tight["Profit"].equals(base["Profit"])
+
+    with pytest.raises(ValueError):
+        run_sweep(bars, [SweepVariant(rp, target_level=len(ladder))])
+    with pytest.raises(ValueError):
+        run_sweep(bars, [SweepVariant(rp, variant_id="a"), SweepVariant(rp, variant_id="a")])
+
+
+def test_parallel_sweep_matches_sequential(bars):
+    grid = [
+        RunParams(instrument="ES"),
+        SweepVariant(RunParams(instrument="ES", target_mode="time"), target_level=2),
+    ]
+    sequential = run_sweep(bars, grid, max_workers=1)
+    parallel = run_sweep(bars, grid, max_workers=2)
+    assert list(dict.fromkeys(sequential["variant_id"])) == ["v000", "v001"]
+    pd.testing.assert_frame_equal(parallel, sequential)
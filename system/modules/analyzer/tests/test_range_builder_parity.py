@@ -0,0 +1,58 @@
+"""
+Batched slot-range construction
+
+build_slot_ranges computes all ranges in one pass over the sorted bars; the result must be
+identical to the per-range calculate_range path (still used in debug mode).
+"""
+
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytz
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from logic.config_logic import ConfigManager, RunParams
+from logic.range_logic import RangeDetector
+from test_execution_kernel_parity import _random_walk_bars
+
+
+def _detector() -> RangeDetector:
+    return RangeDetector(ConfigManager().get_slot_config())
+
+
+def _assert_same_ranges(df: pd.DataFrame, rp: RunParams):
+    batched = _detector().build_slot_ranges(df.copy(), rp)
+    per_range = _detector().build_slot_ranges(df.copy(), rp, debug=True)
+    assert len(batched) == len(per_range) > 0
+    for fast, slow in zip(batched, per_range):
+        assert repr(asdict(fast)) == repr(asdict(slow))
+
+
+def test_batched_ranges_match_per_range_path(capsys):
+    bars = _random_walk_bars("2025-03-02 18:00", 6 * 24 * 60, seed=11)
+    _assert_same_ranges(bars, RunParams(instrument="ES"))
+    _assert_same_ranges(bars, RunParams(instrument="ES", enabled_slots={"S1": ["08:00"], "S2": ["10:30", "11:00"]}))
+
+    # Other timezone object, naive timestamps
+    utc = bars.assign(timestamp=bars["timestamp"].dt.tz_convert(pytz.utc))
+    _assert_same_ranges(utc, RunParams(instrument="ES"))
+    naive = bars.assign(timestamp=bars["timestamp"].dt.tz_localize(None))
+    _assert_same_ranges(naive, RunParams(instrument="ES"))
+
+
+def test_unsorted_duplicated_and_missing_bars(capsys):
+    bars = _random_walk_bars("2025-06-01 18:00", 4 * 24 * 60, seed=12)
+    rng = np.random.default_rng(0)
+    bars.loc[rng.choice(len(bars), 200, replace=False), "high"] = np.nan
+    bars.loc[rng.choice(len(bars), 200, replace=False), "low"] = np.nan
+    # Whole range window without bars
+    bars = bars[~((bars["timestamp"].dt.date == pd.Timestamp("2025-06-03").date())
+                  & (bars["timestamp"].dt.hour.between(2, 8)))]
+    duplicated = pd.concat([bars, bars.sample(300, random_state=1).assign(close=lambda d: d["close"] + 0.25)])
+    shuffled = duplicated.sample(frac=1.0, random_state=2).reset_index(drop=True)
+    _assert_same_ranges(shuffled, RunParams(instrument="ES"))
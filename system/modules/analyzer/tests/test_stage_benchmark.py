@@ -0,0 +1,97 @@
+"""
+Stage benchmark
+
+Synthetic bars must be deterministic and usable by run_strategy; the phase timers must
+not change results; the regression gate flags phases slower than the baseline.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from breakout_core.engine import run_strategy
+from logic.config_logic import RunParams
+from optimizations.stage_benchmark import (
+    BenchmarkCase,
+    find_regressions,
+    load_baseline,
+    main,
+    record_result,
+    run_case,
+)
+from optimizations.synthetic_bars import SESSION_BARS, generate_bars
+
+
+def test_synthetic_bars_are_deterministic_and_valid():
+    bars = generate_bars(("ES", "CL"), years=0.02, regime="mixed", seed=7)
+    assert bars.equals(generate_bars(("ES", "CL"), years=0.02, regime="mixed", seed=7))
+    assert not bars.equals(generate_bars(("ES", "CL"), years=0.02, regime="mixed", seed=8))
+
+    es = bars[bars["instrument"] == "ES"]
+    assert len(es) == 5 * SESSION_BARS
+    assert str(es["timestamp"].dt.tz) == "America/Chicago"
+    assert es["timestamp"].is_monotonic_increasing
+    assert (es["high"] >= es[["open", "close"]].max(axis=1)).all()
+    assert (es["low"] <= es[["open", "close"]].min(axis=1)).all()
+    assert ((es["close"] / 0.25) % 1 == 0).all()  # ES tick grid
+
+    calm = generate_bars(("ES",), years=0.02, regime="calm")
+    volatile = generate_bars(("ES",), years=0.02, regime="volatile")
+    assert calm["close"].diff().std() < volatile["close"].diff().std()
+
+
+def test_phase_timers_do_not_change_results():
+    bars = generate_bars(("ES",), years=0.03, seed=3)
+    rp = RunParams(instrument="ES")
+    timings = {}
+    timed = run_strategy(bars, rp, show_progress=False, timings=timings)
+    pd.testing.assert_frame_equal(timed, run_strategy(bars, rp, show_progress=False))
+    assert {"prepare", "range_building", "bar_index", "range_processing", "result_assembly"} <= set(timings)
+    assert all(seconds >= 0 for seconds in timings.values())
+
+
+def test_regression_gate_against_recorded_baseline(tmp_path):
+    case = BenchmarkCase("tiny", ("ES",), years=0.02)
+    result = run_case(case, repeats=1)
+    assert result.result_rows > 0
+    assert {"entry_detection", "execute_trade"} <= set(result.phases)  # Sequential range processing
+
+    baseline_file = tmp_path / "baseline.jsonl"
+    record_result(result, baseline_file)
+    baseline = load_baseline(baseline_file)["tiny"]
+    assert baseline["results_hash"] == result.results_hash
+    assert find_regressions(result, baseline) == []
+
+    slower = dict(baseline, phases=dict(baseline["phases"]))
+    slower["phases"]["range_building"] = 0.1
+    result.phases["range_building"] = 0.2
+    assert len(find_regressions(result, slower, threshold=0.25, min_seconds=0.05)) == 1
+    # Below the noise floor
+    assert find_regressions(result, slower, threshold=0.25, min_seconds=0.5) == []
+
+
+def test_cli_fails_on_regression(tmp_path, monkeypatch, capsys):
+    import optimizations.stage_benchmark as stage_benchmark
+
+    monkeypatch.setattr(stage_benchmark, "DEFAULT_CASES",
+                        {"tiny": BenchmarkCase("tiny", ("ES",), years=0.02)})
+    baseline_file = tmp_path / "baseline.jsonl"
+    assert main(["--repeats", "1", "--baseline", str(baseline_file), "--record"]) == 0
+
+    # A baseline that was 10x faster on every phase
+    baseline = load_baseline(baseline_file)["tiny"]
+    baseline["phases"] = {phase: seconds / 10 for phase, seconds in baseline["phases"].items()}
+    baseline["total_sec"] /= 10
+    baseline_file.write_text(json.dumps(baseline) + "\n", encoding="utf-8")
+    assert main(["--repeats", "1", "--baseline", str(baseline_file), "--min-seconds", "0"]) == 1
+    assert "REGRESSIONS" in capsys.readouterr().out
+
+
+    # --record keeps the old baseline when the run regressed
+    recorded = baseline_file.read_text(encoding="utf-8")
+    assert main(["--repeats", "1", "--baseline", str(baseline_file), "--min-seconds", "0", "--record"]) == 1
+    assert baseline_file.read_text(encoding="utf-8") == recorded
@@ -0,0 +1,76 @@
+"""
+Worker Budget Module
+
+Process-wide CPU worker budget for the analyzer. The same budget is shared by
+the outer per-instrument fan-out (tools/run_analyzer_parallel.py) and the inner
+per-range fan-out (ParallelProcessor inside run_strategy), so that
+N instruments x M range workers can never exceed it.
+
+The outer runner splits the budget and hands each instrument subprocess its
+share through ANALYZER_INNER_WORKERS. A standalone analyzer run (no outer
+runner) gets the whole budget.
+
+Environment variables:
+    ANALYZER_WORKER_BUDGET: Total worker processes for a whole analyzer run
+                            (default: 75% of CPU cores)
+    ANALYZER_INNER_WORKERS: Range workers available to this process
+                            (set by the outer runner; 1 disables inner parallelism)
+"""
+
+import multiprocessing
+import os
+from typing import Optional, Tuple
+
+WORKER_BUDGET_ENV = "ANALYZER_WORKER_BUDGET"
+INNER_WORKERS_ENV = "ANALYZER_INNER_WORKERS"
+
+# Below this many ranges the pool start-up cost outweighs the speedup
+MIN_RANGES_FOR_PARALLEL = 25
+
+
+def _read_positive_int(name: str) -> Optional[int]:
+    """Read a positive integer environment variable (None when unset or invalid)"""
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return None
+    try:
+        parsed = int(value)
+    except ValueError:
+        return None
+    return parsed if parsed >= 1 else None
+
+
+def default_worker_budget() -> int:
+    """Default total budget: 75% of CPU cores, leaving some free for system operations"""
+    return max(1, int(multiprocessing.cpu_count() * 0.75))
+
+
+def total_worker_budget() -> int:
+    """Total worker processes allowed for a whole analyzer run"""
+    return _read_positive_int(WORKER_BUDGET_ENV) or default_worker_budget()
+
+
+def split_worker_budget(n_tasks: int, outer_workers: Optional[int] = None,
+                        total: Optional[int] = None) -> Tuple[int, int]:
+    """
+    Split the budget between the outer fan-out and each task's inner fan-out
+
+    Args:
+        n_tasks: Number of outer tasks (instruments)
+        outer_workers: Requested outer workers (None = as many as the budget allows)
+        total: Total budget (None = total_worker_budget())
+
+    Returns:
+        Tuple of (outer_workers, inner_workers_per_task) with outer * inner <= total
+    """
+    total = total or total_worker_budget()
+    if outer_workers is None:
+        outer_workers = min(max(1, n_tasks), total)
+    outer_workers = min(max(1, outer_workers), total)
+    inner_workers = max(1, total // outer_workers)
+    return outer_workers, inner_workers
+
+
+def inner_worker_budget() -> int:
+    """Range workers available to this process (its share of the budget, or the whole budget)"""
+    return _read_positive_int(INNER_WORKERS_ENV) or total_worker_budget()
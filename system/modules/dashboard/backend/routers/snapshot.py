@@ -54,7 +54,11 @@ def get_file_counts() -> Dict[str, Any]:
         
         raw_count = len(list(data_raw.glob("*.csv"))) if data_raw.exists() else 0
         translated_count = len(list(data_translated.rglob("*.parquet"))) if data_translated.exists() else 0
-        analyzed_count = len(list(analyzer_runs.rglob("*.parquet"))) if analyzer_runs.exists() else 0
+        from modules.merger.monthly_deltas import is_delta_file
+        analyzed_count = (
+            sum(1 for p in analyzer_runs.rglob("*.parquet") if not is_delta_file(p))
+            if analyzer_runs.exists() else 0
+        )
         
         return {
             "raw_files": raw_count,
@@ -0,0 +1,249 @@
+"""
+Aggregate cube for Master Matrix breakdowns and stream stats.
+
+/breakdown and stream stats only need row counts and profit sums, but computing them
+from the matrix means copying it, normalizing Result / recomputing ProfitDollars row by
+row and re-filtering it on every call. The cube holds those sums once per matrix file:
+
+    (Stream, trade_date, Time, ResultNorm, final_allowed [, dow_full/dow, day_of_month])
+        -> rows, ProfitDollars (contract multiplier 1)
+
+Every breakdown type, filter and stream_include combination is a re-aggregation of the
+cube: the filter dimensions (day of week, day of month, time, final_allowed) are cube
+dimensions, and ProfitDollars is linear in the contract multiplier.
+
+The cube is built when the matrix is saved (save_master_matrix) and stored next to it
+as data/master_matrix/cubes/<matrix file name>. The API serves it from an in-process
+cache keyed like the result caches (matrix_file_id, file_mtime), falling back to the
+stored file and then to building it from the matrix.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+import pandas as pd
+
+from .cache import ResultCache
+from .config import MATRIX_API_CACHE_TTL_SECONDS, MATRIX_API_RESULT_CACHE_BYTES
+from . import statistics
+
+logger = logging.getLogger(__name__)
+
+CUBES_DIR_NAME = "cubes"
+
+# Dimensions carried over from the matrix when present (filters and breakdowns read them)
+_OPTIONAL_DIMENSIONS = ["Time", "dow_full", "dow", "day_of_month"]
+
+# Cells of the served matrix files; keys (matrix_file_id, file_mtime, "cube")
+_cube_cache = ResultCache("aggregate_cube", MATRIX_API_RESULT_CACHE_BYTES, MATRIX_API_CACHE_TTL_SECONDS)
+
+
+class AggregateCube:
+    """Row counts and ProfitDollars sums of a matrix, per stream / date / time / result class."""
+
+    def __init__(self, cells: pd.DataFrame):
+        self.cells = cells
+
+    @classmethod
+    def from_matrix(cls, df: pd.DataFrame) -> "AggregateCube":
+        """
+        Build the cube of a matrix.
+
+        Normalizes like the statistics helpers (_ensure_final_allowed, _normalize_results,
+        _ensure_profit_column, _ensure_profit_dollars_column) without copying the matrix.
+        """
+        n = len(df)
+        index = pd.RangeIndex(n)
+        frame = pd.DataFrame({
+            "Stream": df["Stream"].to_numpy() if "Stream" in df.columns else [None] * n,
+            "trade_date": df["trade_date"].to_numpy() if "trade_date" in df.columns else pd.NaT,
+        }, index=index)
+        for column in _OPTIONAL_DIMENSIONS:
+            if column in df.columns:
+                frame[column] = df[column].to_numpy()
+        frame["ResultNorm"] = (
+            df["Result"].map(statistics._normalize_result).to_numpy() if "Result" in df.columns else ""
+        )
+        frame["final_allowed"] = df["final_allowed"].astype(bool).to_numpy() if "final_allowed" in df.columns else True
+
+        profit = pd.to_numeric(df["Profit"], errors="coerce").fillna(0.0).to_numpy() if "Profit" in df.columns else 0.0
+        if "Instrument" in df.columns:
+            instruments = df["Instrument"]
+            values = {inst: statistics._get_contract_value(inst) for inst in instruments.dropna().unique()}
+            contract_value = instruments.map(values).fillna(50.0).to_numpy()
+        else:
+            contract_value = 50.0
+        frame["ProfitDollars"] = profit * contract_value
+        frame["rows"] = 1
+
+        dimensions = [c for c in frame.columns if c not in ("ProfitDollars", "rows")]
+        cells = (
+            frame.groupby(dimensions, dropna=False, sort=False)
+            .agg(rows=("rows", "sum"), ProfitDollars=("ProfitDollars", "sum"))
+            .reset_index()
+        )
+        # Low-cardinality strings as categories: a small cache entry / stored file
+        for column in ("Stream", "Time", "dow_full", "ResultNorm"):
+            if column in cells.columns and cells[column].dtype == object:
+                cells[column] = cells[column].astype("category")
+        return cls(cells)
+
+    @property
+    def source_rows(self) -> int:
+        """Number of matrix rows in the cube"""
+        return int(self.cells["rows"].sum())
+
+    def select(
+        self,
+        stream_include: Optional[Iterable[str]] = None,
+        contract_multiplier: float = 1.0
+    ) -> pd.DataFrame:
+        """
+        Cells (one row per cell, RangeIndex) as a matrix-like frame: the matrix's column names,
+        ProfitDollars at the given contract multiplier and a rows column with the cell's row count.
+        """
+        cells = self.cells
+        stream_include = list(stream_include or [])
+        if stream_include:
+            cells = cells[cells["Stream"].isin(stream_include)]
+        cells = cells.reset_index(drop=True)
+        for column in cells.columns:
+            if isinstance(cells[column].dtype, pd.CategoricalDtype):
+                cells[column] = cells[column].astype(object)
+        cells["ProfitDollars"] = cells["ProfitDollars"] * contract_multiplier
+        return cells
+
+    def stream_stats(
+        self,
+        include_filtered_executed: bool = True,
+        stream_include: Optional[Iterable[str]] = None,
+        contract_multiplier: float = 1.0
+    ) -> Dict[str, Dict]:
+        """Per-stream statistics, as statistics.calculate_stream_stats on the matrix."""
+        cells = self.select(stream_include, contract_multiplier)
+        cells = cells[cells["Stream"].notna()]
+        allowed = cells["final_allowed"].astype(bool)
+        executed = cells["ResultNorm"].map(statistics._is_executed_trade).astype(bool)
+        sample = executed if include_filtered_executed else executed & allowed
+        rows = cells["rows"]
+
+        totals = pd.DataFrame({
+            "Stream": cells["Stream"],
+            "total_rows": rows,
+            "filtered_rows": rows.where(~allowed, 0),
+            "allowed_rows": rows.where(allowed, 0),
+            "executed_trades": rows.where(sample, 0),
+            "wins": rows.where(sample & (cells["ResultNorm"] == "WIN"), 0),
+            "losses": rows.where(sample & (cells["ResultNorm"] == "LOSS"), 0),
+            "profit": cells["ProfitDollars"].where(sample, 0.0),
+        }).groupby("Stream", sort=False).sum()
+
+        stream_stats: Dict[str, Dict] = {}
+        for stream in sorted(totals.index):
+            t = totals.loc[stream]
+            if t["executed_trades"] == 0:
+                stream_stats[stream] = {
+                    "total_rows": int(t["total_rows"]),
+                    "filtered_rows": int(t["filtered_rows"]),
+                    "allowed_rows": int(t["allowed_rows"]),
+                    "executed_trades": 0,
+                    "wins": 0,
+                    "losses": 0,
+                    "win_rate": 0.0,
+                    "profit": 0.0,
+                }
+                continue
+            wins, losses = int(t["wins"]), int(t["losses"])
+            win_rate = (wins / (wins + losses) * 100) if wins + losses > 0 else 0.0
+            stream_stats[stream] = {
+                "total_rows": int(t["total_rows"]),
+                "filtered_rows": int(t["filtered_rows"]),
+                "allowed_rows": int(t["allowed_rows"]),
+                "executed_trades": int(t["executed_trades"]),
+                "wins": wins,
+                "losses": losses,
+                "win_rate": round(win_rate, 1),
+                "profit": round(float(t["profit"]), 2),
+            }
+        return stream_stats
+
+    def sample_counts(self, stream_include: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """Row counts by category, as the sample_counts of statistics.calculate_summary_stats."""
+        cells = self.select(stream_include)
+        allowed = cells["final_allowed"].astype(bool)
+        executed = cells["ResultNorm"].map(statistics._is_executed_trade).astype(bool)
+        rows = cells["rows"]
+        return {
+            "total_rows": int(rows.sum()),
+            "filtered_rows": int(rows[~allowed].sum()),
+            "allowed_rows": int(rows[allowed].sum()),
+            "executed_trades_total": int(rows[executed].sum()),
+            "executed_trades_allowed": int(rows[executed & allowed].sum()),
+            "executed_trades_filtered": int(rows[executed & ~allowed].sum()),
+            "notrade_total": int(rows[cells["ResultNorm"] == "NOTRADE"].sum()),
+        }
+
+    def save(self, path: Path) -> None:
+        """Write the cube atomically (tmp file + replace)"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.parent / (path.name + ".tmp")
+        self.cells.to_parquet(tmp, index=False)
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "AggregateCube":
+        return cls(pd.read_parquet(path))
+
+
+def cube_file_for(matrix_file: Path) -> Path:
+    """Stored cube of a matrix file (a subdirectory: matrix file globs must not see it)"""
+    return matrix_file.parent / CUBES_DIR_NAME / matrix_file.name
+
+
+def save_matrix_cube(df: pd.DataFrame, matrix_file: Path, file_mtime: Optional[float]) -> AggregateCube:
+    """Build the cube of a just-saved matrix file, store it next to the file and cache it."""
+    cube = AggregateCube.from_matrix(df)
+    cube.save(cube_file_for(matrix_file))
+    _cube_cache.retain_file(matrix_file.name, file_mtime)
+    _cube_cache.put((matrix_file.name, file_mtime, "cube"), cube.cells)
+    logger.info(f"Saved aggregate cube for {matrix_file.name}: {len(cube.cells)} cells from {len(df)} rows")
+    return cube
+
+
+def get_matrix_cube(
+    df: pd.DataFrame,
+    matrix_meta: Dict[str, Any],
+    matrix_dir: Optional[Path] = None
+) -> AggregateCube:
+    """
+    Cube of the matrix resolved by the API (see api._resolve_matrix_source).
+
+    Args:
+        df: The resolved matrix (used only when no cube is cached or stored)
+        matrix_meta: matrix_file_id / file_name, file_mtime and matrix_source of df
+        matrix_dir: Directory of the matrix files (stored cubes live in its cubes/ subdirectory)
+    """
+    file_id = matrix_meta.get("matrix_file_id") or matrix_meta.get("file_name")
+    file_mtime = matrix_meta.get("file_mtime")
+    key = (file_id, file_mtime, "cube")
+    cells = _cube_cache.get(key)
+    if cells is not None:
+        return AggregateCube(cells)
+
+    cube = None
+    if matrix_dir is not None and file_id and matrix_meta.get("matrix_source") == "disk":
+        stored = cube_file_for(Path(matrix_dir) / str(file_id))
+        # A cube older than its matrix file belongs to an overwritten matrix (e.g. a "today" file)
+        if stored.exists() and (file_mtime is None or stored.stat().st_mtime >= file_mtime):
+            try:
+                cube = AggregateCube.load(stored)
+            except Exception as e:
+                logger.warning(f"Could not read aggregate cube {stored}: {e}. Rebuilding from the matrix.")
+    if cube is None:
+        cube = AggregateCube.from_matrix(df)
+        logger.info(f"Built aggregate cube for {file_id}: {len(cube.cells)} cells from {len(df)} rows")
+    # A cube of an older version of this matrix file is never served again
+    _cube_cache.retain_file(file_id, file_mtime)
+    _cube_cache.put(key, cube.cells)
+    return cube
@@ -18,21 +18,29 @@ from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel, Field
 
+from modules.matrix.cache import ResultCache
+from modules.matrix.config import (
+    MATRIX_API_CACHE_TTL_SECONDS,
+    MATRIX_API_DATA_CACHE_BYTES,
+    MATRIX_API_RESULT_CACHE_BYTES,
+)
+
 # Repo root (data/, logs/ live here). api.py is under system/modules/matrix/ -> parents[3].
 QTSW2_ROOT = Path(__file__).resolve().parents[3]
 
 router = APIRouter(prefix="/api/matrix", tags=["matrix"])
 logger = logging.getLogger(__name__)
 
-# Module-level cache for matrix data: key -> (df_full, stats_full, years)
-# Key: (file_path, mtime, stream_include_tuple, contract_multiplier, include_filtered_executed)
-_matrix_data_cache: Dict[Tuple, Tuple[Any, Any, List]] = {}
-_breakdown_cache: Dict[Tuple, Dict] = {}
-_stream_stats_cache: Dict[Tuple, Dict] = {}
+# Module-level result caches (LRU, byte budget + TTL; stats on /api/matrix/performance)
+# Keys start with (matrix_file_id, file_mtime) so entries of an overwritten matrix file are dropped.
+# _matrix_data_cache: key -> (df_full, stats_full, years)
+# Key: (matrix_file_id, file_mtime, stream_include_tuple, contract_multiplier, include_filtered_executed, include_stats)
+_matrix_data_cache = ResultCache("matrix_data", MATRIX_API_DATA_CACHE_BYTES, MATRIX_API_CACHE_TTL_SECONDS)
+_breakdown_cache = ResultCache("breakdown", MATRIX_API_RESULT_CACHE_BYTES, MATRIX_API_CACHE_TTL_SECONDS)
+_stream_stats_cache = ResultCache("stream_stats", MATRIX_API_RESULT_CACHE_BYTES, MATRIX_API_CACHE_TTL_SECONDS)
+_API_CACHES = (_matrix_data_cache, _breakdown_cache, _stream_stats_cache)
 
 # Performance counters for /api/matrix/performance dashboard
-_api_cache_hits: int = 0
-_api_cache_misses: int = 0
 _last_matrix_row_count: Optional[int] = None
 STREAM_FILTERS_CONFIG_PATH = QTSW2_ROOT / "configs" / "stream_filters.json"
 
@@ -42,6 +50,37 @@ def _matrix_data_error_response(status_code: int, message: str) -> JSONResponse:
     return JSONResponse(status_code=status_code, content={"error": message})
 
 
+def _frame_to_records(df, clean: bool = True) -> List[Dict[str, Any]]:
+    """Rows of df as dicts for the records response format (clean=False is faster but keeps inf values)"""
+    import pandas as pd
+
+    records = df.to_dict('records')
+    if clean:
+        # Clean each record (handle NaN, None, etc.)
+        cleaned_records = []
+        for record in records:
+            cleaned = {}
+            for key, value in record.items():
+                if pd.isna(value):
+                    cleaned[key] = None
+                elif isinstance(value, (pd.Timestamp, pd.DatetimeIndex)):
+                    cleaned[key] = value.isoformat() if hasattr(value, 'isoformat') else str(value)
+                elif isinstance(value, (int, float)) and (pd.isna(value) or math.isinf(value)):
+                    cleaned[key] = None
+                else:
+                    cleaned[key] = value
+            cleaned_records.append(cleaned)
+        return cleaned_records
+    # Skip cleaning (faster) - still need to handle datetime serialization
+    for record in records:
+        for key, value in record.items():
+            if isinstance(value, (pd.Timestamp, pd.DatetimeIndex)):
+                record[key] = value.isoformat() if hasattr(value, 'isoformat') else str(value)
+            elif pd.isna(value):
+                record[key] = None
+    return records
+
+
 def _validate_api_trade_date_contract(df, context: str) -> None:
     """Matrix API follows the same strict trade_date contract as timetable generation."""
     from modules.matrix.data_loader import _validate_trade_date_dtype, _validate_trade_date_presence
@@ -117,12 +156,8 @@ def _resolve_matrix_source(file_path: Optional[str] = None):
 
 def _invalidate_matrix_cache():
     """Clear matrix data cache and MatrixState (call after build/resequence)."""
-    global _matrix_data_cache, _breakdown_cache, _stream_stats_cache, _api_cache_hits, _api_cache_misses
-    _matrix_data_cache.clear()
-    _breakdown_cache.clear()
-    _stream_stats_cache.clear()
-    _api_cache_hits = 0
-    _api_cache_misses = 0
+    for cache in _API_CACHES:
+        cache.clear(reset_stats=True)
     try:
         from .matrix_state import invalidate_matrix_state
         invalidate_matrix_state()
@@ -131,6 +166,13 @@ def _invalidate_matrix_cache():
     logger.debug("Matrix data cache invalidated")
 
 
+def _retain_current_matrix_caches(matrix_meta: Dict[str, Any]) -> None:
+    """Drop cached results of older versions of the served matrix file (overwritten in place)."""
+    file_id = matrix_meta.get("matrix_file_id") or matrix_meta.get("file_name")
+    for cache in _API_CACHES:
+        cache.retain_file(file_id, matrix_meta.get("file_mtime"))
+
+
 def _filter_config_to_dict(filter_config: Any, stream_id: str = "") -> Dict[str, Any]:
     """Normalize a filter model/dict for matrix and timetable execution paths."""
     if filter_config is None:
@@ -501,7 +543,7 @@ def get_matrix_freshness(analyzer_runs_dir: str = "data/analyzed"):
 
 
 @router.get("/data")
-def get_matrix_data(file_path: Optional[str] = None, limit: int = 10000, order: str = "newest", essential_columns_only: bool = True, skip_cleaning: bool = False, contract_multiplier: float = 1.0, include_filtered_executed: bool = False, stream_include: Optional[str] = None, nocache: bool = False, start_date: Optional[str] = None, end_date: Optional[str] = None, include_stats: bool = True):
+def get_matrix_data(file_path: Optional[str] = None, limit: int = 10000, order: str = "newest", essential_columns_only: bool = True, skip_cleaning: bool = False, contract_multiplier: float = 1.0, include_filtered_executed: bool = False, stream_include: Optional[str] = None, nocache: bool = False, start_date: Optional[str] = None, end_date: Optional[str] = None, include_stats: bool = True, response_format: str = "records"):
     """Get master matrix data from the most recent file or specified file.
     
     Args:
@@ -517,7 +559,14 @@ def get_matrix_data(file_path: Optional[str] = None, limit: int = 10000, order:
         start_date: Filter to trades on or after this date (YYYY-MM-DD). Reduces payload when set.
         end_date: Filter to trades on or before this date (YYYY-MM-DD). Reduces payload when set.
         include_stats: If False, skip stats calculation for faster load when stats panel not needed (default True).
+        response_format: "records" (list of row dicts, default/compatibility), "columns" (column-oriented
+            JSON: data = {column: values}) or "arrow" (Arrow IPC stream, response metadata in the schema
+            metadata). Columnar formats are encoded per column and ignore skip_cleaning.
     """
+    from modules.matrix.response_encoding import RESPONSE_FORMATS
+    if response_format not in RESPONSE_FORMATS:
+        return _matrix_data_error_response(400, f"Unknown response_format '{response_format}' (expected one of {', '.join(RESPONSE_FORMATS)})")
+
     # Parse stream_include into list
     stream_include_list = None
     if stream_include:
@@ -532,7 +581,7 @@ def get_matrix_data(file_path: Optional[str] = None, limit: int = 10000, order:
     
     logger.info(f"GET /api/matrix/data called with contract_multiplier={contract_multiplier}, include_filtered_executed={include_filtered_executed} (parsed as bool), stream_include={stream_include_list}")
     
-    global _api_cache_hits, _api_cache_misses, _last_matrix_row_count
+    global _last_matrix_row_count
     try:
         import pandas as pd
 
@@ -540,6 +589,8 @@ def get_matrix_data(file_path: Optional[str] = None, limit: int = 10000, order:
             df_resolved, matrix_meta = _resolve_matrix_source(file_path)
         except FileNotFoundError as e:
             return _matrix_data_error_response(404, str(e))
+        if not file_path:
+            _retain_current_matrix_caches(matrix_meta)
 
         matrix_file_id = matrix_meta.get("matrix_file_id") or matrix_meta.get("file_name")
         file_name = matrix_meta.get("file_name") or matrix_file_id
@@ -557,9 +608,9 @@ def get_matrix_data(file_path: Optional[str] = None, limit: int = 10000, order:
         df_full = None
         stats_full = None
         years = []
-        if not nocache and cache_key in _matrix_data_cache:
-            _api_cache_hits += 1
-            df_full, stats_full, years = _matrix_data_cache[cache_key]
+        cached = None if nocache else _matrix_data_cache.get(cache_key)
+        if cached is not None:
+            df_full, stats_full, years = cached
             if not include_stats:
                 stats_full = None
             logger.info(f"Matrix data cache hit for {file_name}")
@@ -635,8 +686,7 @@ def get_matrix_data(file_path: Optional[str] = None, limit: int = 10000, order:
                         years = sorted(year_values, reverse=True)
             
             # Store in cache for subsequent requests
-            _matrix_data_cache[cache_key] = (df_full, stats_full, years)
-            _api_cache_misses += 1
+            _matrix_data_cache.put(cache_key, (df_full, stats_full, years))
             _last_matrix_row_count = len(df_full)
             try:
                 from modules.matrix.instrumentation import log_timing_event
@@ -712,35 +762,9 @@ def get_matrix_data(file_path: Optional[str] = None, limit: int = 10000, order:
         from modules.matrix import statistics
         df = statistics._ensure_profit_dollars_column(df, contract_multiplier=contract_multiplier)
         
-        # Clean data if requested (expensive operation, can be skipped for faster initial load)
-        if not skip_cleaning:
-            # Convert to records and clean values
-            records = df.to_dict('records')
-            # Clean each record (handle NaN, None, etc.)
-            cleaned_records = []
-            for record in records:
-                cleaned = {}
-                for key, value in record.items():
-                    if pd.isna(value):
-                        cleaned[key] = None
-                    elif isinstance(value, (pd.Timestamp, pd.DatetimeIndex)):
-                        cleaned[key] = value.isoformat() if hasattr(value, 'isoformat') else str(value)
-                    elif isinstance(value, (int, float)) and (pd.isna(value) or math.isinf(value)):
-                        cleaned[key] = None
-                    else:
-                        cleaned[key] = value
-                cleaned_records.append(cleaned)
-            records = cleaned_records
-        else:
-            # Skip cleaning - just convert to records (faster)
-            records = df.to_dict('records')
-            # Still need to handle datetime serialization
-            for record in records:
-                for key, value in record.items():
-                    if isinstance(value, (pd.Timestamp, pd.DatetimeIndex)):
-                        record[key] = value.isoformat() if hasattr(value, 'isoformat') else str(value)
-                    elif pd.isna(value):
-                        record[key] = None
+        # Records are built (and cleaned unless skip_cleaning: expensive) only for the records format;
+        # columnar formats are encoded per column below
+        records = _frame_to_records(df, clean=not skip_cleaning) if response_format == "records" else None
         
         # Extract unique streams and instruments from FULL dataset (before limiting)
         # Filter out None values before sorting to avoid comparison errors
@@ -759,7 +783,7 @@ def get_matrix_data(file_path: Optional[str] = None, limit: int = 10000, order:
         response_data = {
             "data": records,
             "total": total_after_date_filter if (start_date or end_date) else len(df_full),
-            "loaded": len(records),
+            "loaded": len(df),
             "file": file_name,
             "matrix_file_id": matrix_file_id,  # Stable file identifier for change detection
             "file_mtime": file_mtime,
@@ -774,11 +798,32 @@ def get_matrix_data(file_path: Optional[str] = None, limit: int = 10000, order:
             "returned_max_trade_date": str(returned_max_trade_date) if returned_max_trade_date is not None else None
         }
         
-        # jsonable_encoder: numpy/datetime in stats_full / records must not break Starlette json.dumps (allow_nan=False).
-        return JSONResponse(
-            content=jsonable_encoder(response_data),
-            media_type="application/json",
+        if response_format == "records":
+            # jsonable_encoder: numpy/datetime in stats_full / records must not break Starlette json.dumps (allow_nan=False).
+            return JSONResponse(
+                content=jsonable_encoder(response_data),
+                media_type="application/json",
+            )
+
+        # Columnar formats: "columns" (JSON) and "arrow" (Arrow IPC stream)
+        from modules.matrix.response_encoding import (
+            ARROW_STREAM_MEDIA_TYPE,
+            frame_to_arrow_ipc,
+            frame_to_columns,
         )
+        del response_data["data"]
+        response_data["format"] = response_format
+        response_data["columns"] = [str(col) for col in df.columns]
+        meta = jsonable_encoder(response_data)
+        if response_format == "arrow":
+            try:
+                body = frame_to_arrow_ipc(df, meta)
+            except ImportError as e:
+                return _matrix_data_error_response(400, str(e))
+            return Response(content=body, media_type=ARROW_STREAM_MEDIA_TYPE)
+        # Column values are already JSON-native: no per-value jsonable_encoder pass
+        meta["data"] = frame_to_columns(df)
+        return JSONResponse(content=meta, media_type="application/json")
     except Exception as e:
         import traceback
         error_detail = str(e)
@@ -815,6 +860,7 @@ def calculate_profit_breakdown(request: BreakdownRequest):
             df_resolved, matrix_meta = _resolve_matrix_source()
         except FileNotFoundError as e:
             raise HTTPException(status_code=404, detail=str(e)) from e
+        _retain_current_matrix_caches(matrix_meta)
 
         file_mtime = matrix_meta.get("file_mtime")
         matrix_file_id = matrix_meta.get("matrix_file_id") or matrix_meta.get("file_name")
@@ -825,41 +871,32 @@ def calculate_profit_breakdown(request: BreakdownRequest):
             sf_serialized = {k: (v.model_dump() if hasattr(v, 'model_dump') else v) for k, v in request.stream_filters.items()}
             sf_hash = hash(json.dumps(sf_serialized, sort_keys=True))
         cache_key = (matrix_file_id, file_mtime, request.breakdown_type, stream_include_tuple, request.contract_multiplier, request.use_filtered, sf_hash)
-        if cache_key in _breakdown_cache:
-            cached = _breakdown_cache[cache_key]
+        cached = _breakdown_cache.get(cache_key)
+        if cached is not None:
             logger.info(f"Breakdown cache hit for {request.breakdown_type}")
             return cached
         
-        df = df_resolved.copy()
-        _validate_api_trade_date_contract(df, "matrix_breakdown")
+        _validate_api_trade_date_contract(df_resolved, "matrix_breakdown")
         
-        if df.empty:
+        if df_resolved.empty:
             raise HTTPException(status_code=404, detail=f"File {matrix_meta.get('file_name')} is empty")
         
-        # Apply stream inclusion filter if specified (before other processing)
-        if request.stream_include and len(request.stream_include) > 0 and 'Stream' in df.columns:
-            original_len = len(df)
-            df = df[df['Stream'].isin(request.stream_include)].copy()
-            logger.info(f"Applied stream_include filter to breakdown: {original_len} -> {len(df)} rows (streams: {request.stream_include})")
+        # Breakdowns re-aggregate the matrix's aggregate cube (built when the matrix was saved)
+        # instead of preparing and filtering the full matrix on every call
+        from modules.matrix.aggregate_cube import get_matrix_cube
+        cube = get_matrix_cube(df_resolved, matrix_meta, QTSW2_ROOT / "data" / "master_matrix")
         
-        # Prepare dataframe
-        from modules.matrix import statistics
-        df = statistics._ensure_final_allowed(df)
-        df = statistics._normalize_results(df)
-        df = statistics._ensure_profit_column(df)
-        df = statistics._ensure_profit_dollars_column(df, contract_multiplier=request.contract_multiplier)
-        df = statistics._ensure_date_column(df)
-        
-        # Apply filters and calculate breakdown via breakdown_service
         if request.use_filtered and request.stream_filters:
             logger.info(f"Applying filters: use_filtered={request.use_filtered}, stream_filters keys={list(request.stream_filters.keys())}")
-        from modules.matrix.breakdown_service import calculate_breakdown
+        from modules.matrix.breakdown_service import calculate_breakdown_from_cube
         stream_filters_dict = dict(request.stream_filters) if request.stream_filters else {}
-        breakdown, total_rows = calculate_breakdown(
-            df,
+        breakdown, total_rows = calculate_breakdown_from_cube(
+            cube,
             request.breakdown_type,
+            stream_include=request.stream_include,
             stream_filters=stream_filters_dict,
-            use_filtered=request.use_filtered
+            use_filtered=request.use_filtered,
+            contract_multiplier=request.contract_multiplier
         )
         
         result = {
@@ -868,7 +905,7 @@ def calculate_profit_breakdown(request: BreakdownRequest):
             "total_rows": total_rows,
             "contract_multiplier": request.contract_multiplier
         }
-        _breakdown_cache[cache_key] = result
+        _breakdown_cache.put(cache_key, result)
         return result
         
     except Exception as e:
@@ -887,38 +924,50 @@ def get_stream_stats(request: StreamStatsRequest):
             df_resolved, matrix_meta = _resolve_matrix_source()
         except FileNotFoundError as e:
             raise HTTPException(status_code=404, detail=str(e)) from e
+        _retain_current_matrix_caches(matrix_meta)
 
         file_mtime = matrix_meta.get("file_mtime")
         matrix_file_id = matrix_meta.get("matrix_file_id") or matrix_meta.get("file_name")
         stats_cache_key = (matrix_file_id, file_mtime, request.stream_id, request.include_filtered_executed, request.contract_multiplier)
-        if stats_cache_key in _stream_stats_cache:
-            cached = _stream_stats_cache[stats_cache_key]
+        cached = _stream_stats_cache.get(stats_cache_key)
+        if cached is not None:
             logger.info(f"Stream stats cache hit for {request.stream_id}")
             return JSONResponse(content=cached, media_type="application/json")
         
-        df = df_resolved.copy()
-        _validate_api_trade_date_contract(df, "matrix_stream_stats")
+        _validate_api_trade_date_contract(df_resolved, "matrix_stream_stats")
         
-        logger.info(f"Loaded full parquet file: {len(df)} total rows")
-        
-        if df.empty:
+        if df_resolved.empty:
             raise HTTPException(status_code=404, detail=f"File {matrix_meta.get('file_name')} is empty")
         
         # Filter to specific stream
-        if 'Stream' not in df.columns:
+        if 'Stream' not in df_resolved.columns:
             raise HTTPException(status_code=400, detail="Stream column not found in data")
         
-        stream_df = df[df['Stream'] == request.stream_id].copy()
-        
-        logger.info(f"Filtered to stream {request.stream_id}: {len(stream_df)} rows (should be full dataset for this stream)")
+        # Counts and profit sums come from the matrix's aggregate cube. The cube has no trade
+        # order, so the order-dependent metrics (drawdown, loss streaks, daily Sharpe/Sortino/Calmar,
+        # PnL distribution) are still computed from the stream's executed trades in the matrix.
+        from modules.matrix.aggregate_cube import get_matrix_cube
+        cube = get_matrix_cube(df_resolved, matrix_meta, QTSW2_ROOT / "data" / "master_matrix")
+        stream_counts = cube.stream_stats(
+            request.include_filtered_executed,
+            stream_include=[request.stream_id],
+            contract_multiplier=request.contract_multiplier
+        ).get(request.stream_id)
         
-        if stream_df.empty:
+        if stream_counts is None:
             return JSONResponse(content={
                 "stream_id": request.stream_id,
                 "stats": None,
                 "message": f"No data found for stream {request.stream_id}"
             }, media_type="application/json")
         
+        stream_df = df_resolved[df_resolved['Stream'] == request.stream_id]
+        if 'Result' in stream_df.columns:
+            executed = stream_df['Result'].map(statistics._normalize_result).map(statistics._is_executed_trade)
+            stream_df = stream_df[executed.astype(bool)]
+        else:
+            stream_df = stream_df.iloc[:0]
+        
         # Prepare dataframe
         df_for_stats = statistics._ensure_final_allowed(stream_df)
         df_for_stats = statistics._normalize_results(df_for_stats)
@@ -929,25 +978,28 @@ def get_stream_stats(request: StreamStatsRequest):
         if "ProfitDollars" in df_for_stats.columns:
             df_for_stats = df_for_stats.drop(columns=["ProfitDollars"])
         
-        # Calculate stats for this stream (this will recalculate ProfitDollars with correct contract values)
-        logger.info(f"Calculating stats for stream {request.stream_id}: {len(stream_df)} rows (full dataset), contract_multiplier={request.contract_multiplier}")
+        logger.info(f"Calculating stats for stream {request.stream_id}: {len(df_for_stats)} executed trades, contract_multiplier={request.contract_multiplier}")
         
         stats = statistics.calculate_summary_stats(
             df_for_stats,
             include_filtered_executed=request.include_filtered_executed,
             contract_multiplier=request.contract_multiplier
         )
+        # The rows above are executed trades only: row counts, wins/losses and total profit from the cube
+        stats["sample_counts"] = cube.sample_counts([request.stream_id])
+        trade_metrics = stats["performance_trade_metrics"]
+        trade_metrics["wins"] = stream_counts["wins"]
+        trade_metrics["losses"] = stream_counts["losses"]
+        trade_metrics["total_profit"] = stream_counts["profit"]
         
-        total_profit = stats.get('performance_trade_metrics', {}).get('total_profit', 'N/A') if stats else 'N/A'
-        executed_trades = stats.get('sample_counts', {}).get('executed_trades_total', 'N/A') if stats else 'N/A'
-        logger.info(f"Calculated stats for stream {request.stream_id}: total_profit={total_profit}, executed_trades={executed_trades}")
+        logger.info(f"Calculated stats for stream {request.stream_id}: total_profit={stream_counts['profit']}, executed_trades={stats['sample_counts']['executed_trades_total']}")
         
         result = {
             "stream_id": request.stream_id,
             "stats": stats,
             "contract_multiplier": request.contract_multiplier
         }
-        _stream_stats_cache[stats_cache_key] = result
+        _stream_stats_cache.put(stats_cache_key, result)
         return JSONResponse(content=result, media_type="application/json")
         
     except HTTPException as e:
@@ -965,9 +1017,8 @@ def get_matrix_performance():
     Aggregates from in-memory counters and timing logs.
     """
     try:
-        # In-memory cache stats
-        total_requests = _api_cache_hits + _api_cache_misses
-        cache_hit_rate = (_api_cache_hits / total_requests * 100) if total_requests > 0 else None
+        # In-memory cache stats (api_cache_* = GET /data result cache)
+        data_cache_stats = _matrix_data_cache.stats()
 
         # Read timing log for recent phases (last 500 lines)
         timing_log = QTSW2_ROOT / "logs" / "matrix_timing.jsonl"
@@ -1031,9 +1082,10 @@ def get_matrix_performance():
             "matrix_save_time_ms": matrix_save_time_ms,
             "matrix_load_time_ms": matrix_load_time_ms,
             "timetable_time_ms": timetable_time_ms,
-            "api_cache_hit_rate": round(cache_hit_rate, 1) if cache_hit_rate is not None else None,
-            "api_cache_hits": _api_cache_hits,
-            "api_cache_misses": _api_cache_misses,
+            "api_cache_hit_rate": data_cache_stats["hit_rate"],
+            "api_cache_hits": data_cache_stats["hits"],
+            "api_cache_misses": data_cache_stats["misses"],
+            "api_caches": {cache.name: cache.stats() for cache in _API_CACHES},
         }
     except Exception as e:
         logger.error(f"Error getting performance metrics: {e}", exc_info=True)
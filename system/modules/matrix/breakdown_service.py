@@ -3,13 +3,19 @@ Breakdown service - profit breakdown calculations by day, dom, time, month, year
 
 Extracted from api.py for maintainability. Each breakdown type returns
 {key: {stream: profit}} format matching frontend worker output.
+
+The API answers breakdowns from the matrix's aggregate cube (aggregate_cube.py):
+the same filters and breakdowns run on cube cells instead of matrix rows.
 """
 
 import logging
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 
 import pandas as pd
 
+if TYPE_CHECKING:
+    from .aggregate_cube import AggregateCube
+
 logger = logging.getLogger(__name__)
 
 DOW_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
@@ -182,19 +188,40 @@ def calculate_breakdown(
     """
     df_filtered = _apply_filters(df, stream_filters, use_filtered)
     total_rows = len(df_filtered)
+    return _breakdown(df_filtered, breakdown_type), total_rows
+
 
+def calculate_breakdown_from_cube(
+    cube: "AggregateCube",
+    breakdown_type: str,
+    stream_include: Optional[List[str]] = None,
+    stream_filters: Optional[Dict[str, Any]] = None,
+    use_filtered: bool = False,
+    contract_multiplier: float = 1.0
+) -> tuple:
+    """
+    Calculate profit breakdown by type from the matrix's aggregate cube.
+    Same result as calculate_breakdown on the prepared matrix (stream_include applied,
+    ProfitDollars at contract_multiplier): the cube cells are filtered and summed instead of rows.
+    Returns (breakdown_dict, total_rows).
+    """
+    cells = cube.select(stream_include=stream_include, contract_multiplier=contract_multiplier)
+    cells_filtered = _apply_filters(cells, stream_filters, use_filtered)
+    total_rows = int(cells_filtered['rows'].sum())
+    return _breakdown(cells_filtered, breakdown_type), total_rows
+
+
+def _breakdown(df: pd.DataFrame, breakdown_type: str) -> Dict:
+    """Breakdown of already filtered rows (or cube cells) by type"""
     if breakdown_type in ['day', 'dow']:
-        breakdown = _breakdown_by_day(df_filtered)
+        return _breakdown_by_day(df)
     elif breakdown_type == 'dom':
-        breakdown = _breakdown_by_dom(df_filtered)
+        return _breakdown_by_dom(df)
     elif breakdown_type == 'time':
-        breakdown = _breakdown_by_time(df_filtered)
+        return _breakdown_by_time(df)
     elif breakdown_type == 'month':
-        breakdown = _breakdown_by_month(df_filtered)
+        return _breakdown_by_month(df)
     elif breakdown_type == 'year':
-        breakdown = _breakdown_by_year(df_filtered)
-    else:
-        logger.warning(f"Unknown breakdown_type: {breakdown_type}")
-        breakdown = {}
-
-    return breakdown, total_rows
+        return _breakdown_by_year(df)
+    logger.warning(f"Unknown breakdown_type: {breakdown_type}")
+    return {}
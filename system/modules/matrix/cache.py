@@ -6,6 +6,10 @@ stream discovery, time normalization, and RS calculations.
 """
 
 import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
 from typing import Dict, Optional, Any, Callable, Tuple, List
 from functools import lru_cache
 from pathlib import Path
@@ -145,6 +149,130 @@ def clear_parquet_files_cache():
     _parquet_files_cache.clear()
 
 
+def estimate_size(value: Any) -> int:
+    """
+    Approximate in-memory size of a cached value in bytes.
+
+    DataFrames/Series use memory_usage(deep=True); dicts, lists and tuples are walked
+    recursively; everything else is sys.getsizeof.
+    """
+    try:
+        import pandas as pd
+        if isinstance(value, pd.DataFrame):
+            return int(value.memory_usage(index=True, deep=True).sum())
+        if isinstance(value, pd.Series):
+            return int(value.memory_usage(index=True, deep=True))
+    except ImportError:
+        pass
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache of API results with a byte budget and TTL.
+
+    Keys are tuples whose first two items identify the matrix file (file id, mtime), so
+    entries of an overwritten matrix file can be dropped with retain_file(). Entries of
+    other matrix files are left to the LRU budget and TTL.
+    """
+
+    def __init__(self, name: str, max_bytes: int, ttl_seconds: Optional[float] = None):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple, Tuple[Any, int, float]]" = OrderedDict()  # key -> (value, size, stored_at)
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Tuple) -> bool:
+        """Pure lookup: no eviction, recency or hit/miss accounting"""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._expired(entry)
+
+    def _expired(self, entry: Tuple[Any, int, float]) -> bool:
+        return self.ttl_seconds is not None and time.monotonic() - entry[2] > self.ttl_seconds
+
+    def _live_entry(self, key: Tuple):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self._expired(entry):
+            self._remove(key)
+            self.evictions += 1
+            return None
+        return entry
+
+    def _remove(self, key: Tuple) -> None:
+        _, size, _ = self._entries.pop(key)
+        self.current_bytes -= size
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        """Cached value (marked most recently used), or None on a miss/expired entry"""
+        with self._lock:
+            entry = self._live_entry(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Tuple, value: Any) -> None:
+        """Store a value, evicting least recently used entries over the byte budget"""
+        size = estimate_size(value)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                logger.info(f"[{self.name}] Not caching {size / 1e6:.1f} MB result (budget {self.max_bytes / 1e6:.1f} MB)")
+                return
+            self._entries[key] = (value, size, time.monotonic())
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes and self._entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def retain_file(self, file_id: Any, file_mtime: Any) -> None:
+        """Drop entries of other versions (mtimes) of a matrix file (the file was overwritten)"""
+        with self._lock:
+            stale = [k for k in self._entries if k[0] == file_id and k[1] != file_mtime]
+            for key in stale:
+                self._remove(key)
+            self.evictions += len(stale)
+
+    def clear(self, reset_stats: bool = False) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+            if reset_stats:
+                self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / total * 100, 1) if total else None,
+            }
+
+
 def clear_all_caches():
     """Clear all caches."""
     clear_time_cache()
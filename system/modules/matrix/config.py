@@ -43,7 +43,15 @@ import os
 _save_json_env = os.environ.get("QTSW2_SAVE_MATRIX_JSON", "").strip().lower()
 SAVE_JSON_ON_BUILD = _save_json_env in ("1", "true", "yes", "on") if _save_json_env else False
 
+# Matrix API result caches (GET /data, POST /breakdown, POST /stream-stats): LRU with a byte
+# budget and TTL per cache. Override the /data budget via env QTSW2_MATRIX_API_CACHE_MB
+_api_cache_mb_env = os.environ.get("QTSW2_MATRIX_API_CACHE_MB", "").strip()
+MATRIX_API_DATA_CACHE_BYTES = int(float(_api_cache_mb_env or 1024) * 1024 * 1024)
+MATRIX_API_RESULT_CACHE_BYTES = 64 * 1024 * 1024  # /breakdown and /stream-stats (small dicts)
+MATRIX_API_CACHE_TTL_SECONDS = 6 * 60 * 60
+
 __all__ = ['SLOT_ENDS', 'ROLLING_WINDOW_SIZE', 'DOM_BLOCKED_DAYS', 'SCF_THRESHOLD', 
            'MATRIX_REPROCESS_TRADING_DAYS', 'MATRIX_CHECKPOINT_FREQUENCY', 'ALLOW_INVALID_DATES_SALVAGE',
-           'CRITICAL_STREAMS', 'SAVE_JSON_ON_BUILD']
+           'CRITICAL_STREAMS', 'SAVE_JSON_ON_BUILD', 'MATRIX_API_DATA_CACHE_BYTES',
+           'MATRIX_API_RESULT_CACHE_BYTES', 'MATRIX_API_CACHE_TTL_SECONDS']
 
@@ -4,6 +4,15 @@ Data loading for Master Matrix.
 This module handles loading trade data from analyzer_runs directory,
 including parallel loading, retry logic, and date filtering.
 
+Date windows and column projections are pushed down into the parquet reader:
+monthly files outside the window are skipped by filename, and the remaining
+files are read with pyarrow filters on Date (row groups are pruned using their
+statistics). apply_date_filters is still applied afterwards, so the pushdown
+only ever removes rows the exact filter would remove.
+
+Months the merger wrote in append mode are read as the monthly file plus its delta
+files, resolved last-writer-wins (modules.merger.monthly_deltas.read_merged).
+
 SINGLE OWNERSHIP: DataLoader is the sole owner of date normalization.
 Canonical internal column name is 'trade_date'. Date normalization happens
 once, immediately after reading analyzer output.
@@ -18,11 +27,25 @@ from typing import List, Optional, Tuple, Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 from .config import ALLOW_INVALID_DATES_SALVAGE
 from .cache import get_cached_parquet_files
+from modules.merger import monthly_deltas
 
 logger = logging.getLogger(__name__)
 
+# Monthly analyzer file name: <stream>_an_<year>_<month>.parquet
+_MONTHLY_FILE_PATTERN = re.compile(r'_an_(\d{4})_(\d{1,2})\.parquet$')
+
+# Columns every load needs, regardless of the requested projection
+_REQUIRED_COLUMNS = ['Date', 'Stream']
+
 
 def _normalize_date_to_trade_date(df: pd.DataFrame, stream_id: str) -> pd.DataFrame:
     """
@@ -230,22 +253,155 @@ def apply_date_filters(
     return df
 
 
+def _date_filter_bounds(
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    specific_date: Optional[str] = None
+) -> Tuple[Optional[pd.Timestamp], Optional[pd.Timestamp], bool]:
+    """
+    Translate apply_date_filters arguments into trade_date bounds.
+    
+    Returns:
+        Tuple of (lower bound (inclusive) or None, upper bound or None,
+        upper_inclusive). specific_date becomes [day, next day).
+    """
+    if specific_date:
+        day = pd.to_datetime(specific_date).normalize()
+        return day, day + pd.Timedelta(days=1), False
+    lower = pd.to_datetime(start_date) if start_date else None
+    upper = pd.to_datetime(end_date) if end_date else None
+    return lower, upper, True
+
+
+def _monthly_file_in_window(
+    file_path: Path,
+    lower: Optional[pd.Timestamp],
+    upper: Optional[pd.Timestamp],
+    upper_inclusive: bool
+) -> bool:
+    """
+    Check whether a monthly file can contain trades inside the date window.
+    
+    Uses only the filename (<stream>_an_<year>_<month>.parquet); the merger
+    partitions files by the month of Date. Files whose name does not match
+    the pattern are always read.
+    """
+    match = _MONTHLY_FILE_PATTERN.search(file_path.name)
+    if not match or (lower is None and upper is None):
+        return True
+    month_start = pd.Timestamp(year=int(match.group(1)), month=int(match.group(2)), day=1)
+    month_end = month_start + pd.offsets.MonthBegin(1)  # exclusive
+    if lower is not None and month_end <= lower:
+        return False
+    if upper is not None and (month_start > upper or (not upper_inclusive and month_start >= upper)):
+        return False
+    return True
+
+
+def _parquet_read_plan(
+    file_path: Path,
+    lower: Optional[pd.Timestamp],
+    upper: Optional[pd.Timestamp],
+    upper_inclusive: bool,
+    columns: Optional[List[str]] = None
+) -> Tuple[Optional[List[str]], Optional[List[Tuple]]]:
+    """
+    Build the column projection and Date predicate for one parquet file.
+    
+    The predicate is only pushed down when Date is stored as a date or a
+    timezone-naive timestamp (what the merger writes); string Dates (legacy)
+    are filtered after normalization only. Predicates are always a superset
+    of the exact apply_date_filters result.
+    
+    Returns:
+        Tuple of (columns to read or None for all, pyarrow filters or None)
+    """
+    if not PYARROW_AVAILABLE or (columns is None and lower is None and upper is None):
+        return columns, None
+    
+    schema = pq.read_schema(file_path)
+    
+    read_columns = None
+    if columns is not None:
+        wanted = list(dict.fromkeys(list(columns) + _REQUIRED_COLUMNS))
+        read_columns = [c for c in wanted if c in schema.names]
+    
+    if 'Date' not in schema.names or (lower is None and upper is None):
+        return read_columns, None
+    
+    date_type = schema.field('Date').type
+    if pa.types.is_timestamp(date_type) and date_type.tz is None:
+        to_scalar = lambda ts: ts
+        exact = True
+    elif pa.types.is_date(date_type):
+        to_scalar = lambda ts: ts.date()
+        exact = False  # Bounds with a time-of-day are rounded outwards to whole days
+    else:
+        return read_columns, None
+    
+    filters = []
+    if lower is not None:
+        filters.append(('Date', '>=', to_scalar(lower)))
+    if upper is not None:
+        if upper_inclusive or (not exact and upper != upper.normalize()):
+            filters.append(('Date', '<=', to_scalar(upper)))
+        else:
+            filters.append(('Date', '<', to_scalar(upper)))
+    return read_columns, filters
+
+
+def _prepare_loaded_frame(
+    df: pd.DataFrame,
+    file_path: Path,
+    stream_id: str,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    specific_date: Optional[str]
+) -> pd.DataFrame:
+    """Fix up Stream, normalize Date to trade_date and apply exact date filters for one file."""
+    # Extract stream info from filename if Stream column missing
+    if 'Stream' not in df.columns or df['Stream'].isna().all():
+        filename_match = re.match(r'^([A-Z]{2})([12])_', file_path.name)
+        if filename_match:
+            instrument = filename_match.group(1).upper()
+            stream_num = filename_match.group(2)
+            df['Stream'] = f"{instrument}{stream_num}"
+            logger.debug(f"  Extracted stream '{df['Stream'].iloc[0]}' from filename: {file_path.name}")
+    
+    # Ensure Stream column matches expected stream_id
+    if 'Stream' not in df.columns or (df['Stream'] != stream_id).any():
+        df = df.copy()  # Only copy if we need to modify
+        df['Stream'] = stream_id
+    
+    # SINGLE OWNERSHIP: Normalize Date to trade_date immediately after reading
+    # This is the ONLY place where date normalization happens
+    df = _normalize_date_to_trade_date(df, stream_id)
+    
+    # Apply date filters using trade_date (already normalized)
+    return apply_date_filters(df, start_date, end_date, specific_date)
+
+
 def load_stream_data(
     stream_id: str,
     analyzer_runs_dir: Path,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
-    specific_date: Optional[str] = None
+    specific_date: Optional[str] = None,
+    columns: Optional[List[str]] = None
 ) -> Tuple[bool, Optional[List[pd.DataFrame]], str]:
     """
     Load a single stream's data from analyzer_runs directory.
     
+    Monthly files outside the date window are skipped by filename, and the
+    window and column projection are pushed down into the parquet reader.
+    
     Args:
         stream_id: Stream ID (e.g., "ES1")
         analyzer_runs_dir: Base directory containing stream subdirectories
         start_date: Start date for filtering (YYYY-MM-DD) or None
         end_date: End date for filtering (YYYY-MM-DD) or None
         specific_date: Specific date to load (YYYY-MM-DD) or None
+        columns: Optional column projection (None = all columns; Date and Stream are always read)
         
     Returns:
         Tuple of (success: bool, stream_trades_list: List[pd.DataFrame], stream_id: str)
@@ -279,39 +435,28 @@ def load_stream_data(
     stream_trades = []
     files_loaded = 0
     files_skipped = 0
+    lower, upper, upper_inclusive = _date_filter_bounds(start_date, end_date, specific_date)
     
     for file_path in parquet_files:
+        # Skip whole monthly files outside the date window without opening them
+        if not _monthly_file_in_window(file_path, lower, upper, upper_inclusive):
+            files_skipped += 1
+            continue
+        
         try:
             # Force fresh read by checking file modification time and clearing pandas cache if needed
             # This ensures we read newly written files even if pandas cached the old version
             file_path.stat()  # Refresh file system metadata
             
-            # Read parquet file fresh (pandas may cache, but stat() ensures we see new files)
-            df = pd.read_parquet(file_path)
+            # Read parquet file fresh with date predicate / column projection pushed down
+            # (plus its delta files when the merger ran in append mode)
+            read_columns, filters = _parquet_read_plan(file_path, lower, upper, upper_inclusive, columns)
+            df = monthly_deltas.read_merged(file_path, columns=read_columns, filters=filters)
             
             if df.empty:
                 continue
             
-            # Extract stream info from filename if Stream column missing
-            if 'Stream' not in df.columns or df['Stream'].isna().all():
-                filename_match = re.match(r'^([A-Z]{2})([12])_', file_path.name)
-                if filename_match:
-                    instrument = filename_match.group(1).upper()
-                    stream_num = filename_match.group(2)
-                    df['Stream'] = f"{instrument}{stream_num}"
-                    logger.debug(f"  Extracted stream '{df['Stream'].iloc[0]}' from filename: {file_path.name}")
-            
-            # Ensure Stream column matches expected stream_id
-            if 'Stream' not in df.columns or (df['Stream'] != stream_id).any():
-                df = df.copy()  # Only copy if we need to modify
-                df['Stream'] = stream_id
-            
-            # SINGLE OWNERSHIP: Normalize Date to trade_date immediately after reading
-            # This is the ONLY place where date normalization happens
-            df = _normalize_date_to_trade_date(df, stream_id)
-            
-            # Apply date filters using trade_date (already normalized)
-            df = apply_date_filters(df, start_date, end_date, specific_date)
+            df = _prepare_loaded_frame(df, file_path, stream_id, start_date, end_date, specific_date)
             
             if not df.empty:
                 stream_trades.append(df)
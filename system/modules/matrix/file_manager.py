@@ -296,6 +296,14 @@ def save_master_matrix(
         source_kind="disk",
     )
 
+    # Aggregate cube behind /breakdown and stream stats: built once per matrix file
+    # (a failure only costs the API a rebuild on first use)
+    try:
+        from .aggregate_cube import save_matrix_cube
+        save_matrix_cube(df, parquet_file, final_mtime)
+    except Exception as e:
+        logger.warning(f"Could not save aggregate cube for {parquet_file.name}: {e}")
+
     # Persist execution timetable from matrix before returning so the saved matrix snapshot
     # and live timetable_current.json stay aligned in one deterministic call path.
     def _persist_timetable_after_save():
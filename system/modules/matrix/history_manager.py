@@ -4,9 +4,16 @@ History manager for Master Matrix sequencer logic.
 This module handles updating rolling histories for time slots.
 The rolling history maintains the last N scores for each time slot,
 used for time change decisions in the sequencer.
+
+build_rolling_histories is the vectorized equivalent of calling
+update_time_slot_history once per day: it precomputes every day's rolling
+sums for a whole stream with NumPy cumulative sums.
 """
 
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
 from .config import ROLLING_WINDOW_SIZE
 
 
@@ -42,5 +49,50 @@ def update_time_slot_history(
         time_slot_histories[time] = time_slot_histories[time][-ROLLING_WINDOW_SIZE:]
 
 
-__all__ = ['update_time_slot_history', 'ROLLING_WINDOW_SIZE']
+def build_rolling_histories(
+    times: List[str],
+    daily_scores: np.ndarray,
+    initial_histories: Optional[Dict[str, List[int]]] = None,
+    window: int = ROLLING_WINDOW_SIZE
+) -> Tuple[np.ndarray, Dict[str, List[int]]]:
+    """
+    Precompute rolling sums for every day and time slot of a stream.
+    
+    Equivalent to calling update_time_slot_history(histories, time, score)
+    for each day in order and recording sum(histories[time]) after each day,
+    but O(days x slots) with running sums instead of O(days x slots x window).
+    
+    Args:
+        times: Time slots (column order of daily_scores)
+        daily_scores: Integer array of shape (n_days, n_times) with each day's score
+        initial_histories: Optional restored histories (e.g. from a checkpoint)
+        window: Rolling window size (default: ROLLING_WINDOW_SIZE)
+        
+    Returns:
+        Tuple of (rolling_sums array of shape (n_days, n_times),
+        final histories dict with the same lists update_time_slot_history would hold)
+    """
+    initial_histories = initial_histories or {}
+    n_days = daily_scores.shape[0]
+    rolling_sums = np.zeros((n_days, len(times)), dtype=np.int64)
+    final_histories: Dict[str, List[int]] = {}
+    
+    for col, time in enumerate(times):
+        initial = list(initial_histories.get(time, []))
+        if n_days == 0:
+            final_histories[time] = initial
+            continue
+        
+        # Running sums over restored history + new scores; a window sum is a cumsum difference
+        series = np.concatenate([np.asarray(initial, dtype=np.int64), daily_scores[:, col].astype(np.int64)])
+        cumsum = np.concatenate([[0], np.cumsum(series)])
+        ends = np.arange(len(initial) + 1, len(series) + 1)
+        starts = np.maximum(ends - window, 0)
+        rolling_sums[:, col] = cumsum[ends] - cumsum[starts]
+        final_histories[time] = series[-window:].tolist()
+    
+    return rolling_sums, final_histories
+
+
+__all__ = ['update_time_slot_history', 'build_rolling_histories', 'ROLLING_WINDOW_SIZE']
 
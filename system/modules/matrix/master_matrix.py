@@ -872,8 +872,8 @@ class MasterMatrix:
             import traceback
             logger.debug(f"Checkpoint creation traceback: {traceback.format_exc()}")
     
-    def _load_all_streams_with_sequencer_for_state(self) -> pd.DataFrame:
-        """Load all streams without sequencer (for state capture)."""
+    def _load_all_streams_with_sequencer_for_state(self, start_date: Optional[str] = None) -> pd.DataFrame:
+        """Load all streams without sequencer (for state capture), optionally only trade_date >= start_date."""
         if not self.streams or len(self.streams) == 0:
             self.streams = stream_manager.discover_streams(self.analyzer_runs_dir)
         
@@ -884,7 +884,7 @@ class MasterMatrix:
         return data_loader.load_all_streams(
             streams=self.streams,
             analyzer_runs_dir=self.analyzer_runs_dir,
-            start_date=None,
+            start_date=start_date,
             end_date=None,
             specific_date=None,
             wait_for_streams=True,
@@ -921,7 +921,8 @@ class MasterMatrix:
         Perform rolling resequence: remove window rows and resequence from checkpoint state.
         
         Behavior:
-        1. Discover all analyzer output from data/analyzed/ (full disk scan)
+        1. Load the latest checkpoint and the analyzer output from shortly before its date
+           (widened until it holds N trading days; no full history scan)
         2. Compute resequence_start_date = today - N trading days
         3. Load existing master matrix
         4. Remove all rows where trade_date >= resequence_start_date
@@ -19,6 +19,82 @@ from .utils import _enforce_trade_date_invariants
 logger = setup_matrix_logger(__name__, console=True, level=logging.INFO)
 
 
+# Calendar days per trading day (5 of 7), plus a margin for holidays, when sizing the load window
+_CALENDAR_DAYS_PER_TRADING_DAY = 7 / 5
+_WINDOW_MARGIN_DAYS = 10
+# Times the load window is doubled before falling back to loading the full history
+_MAX_WINDOW_WIDENINGS = 3
+
+
+def _load_resequence_window(
+    master_matrix_instance,
+    checkpoint_date: Optional[str],
+    resequence_days: int
+) -> Tuple[pd.DataFrame, Optional[str], Optional[str]]:
+    """
+    Load the analyzer rows the resequence needs instead of every stream's full history.
+    
+    The window starts shortly before the checkpoint date, sized to hold resequence_days
+    trading days, and is doubled while it holds fewer trading days than that before the
+    latest analyzer date (trading days are counted from the data, so a window with enough
+    of them gives the same resequence_start_date as the full history). Falls back to the
+    full history when there is no checkpoint date or the widened window is still short.
+    
+    Args:
+        master_matrix_instance: MasterMatrix instance (stream discovery and loading)
+        checkpoint_date: Date of the restored checkpoint (YYYY-MM-DD) or None
+        resequence_days: Number of trading days to resequence
+        
+    Returns:
+        Tuple of (analyzer rows, resequence_start_date or None, latest analyzer date or None)
+        
+    Raises:
+        ValueError: If the loaded data has no valid trade_date column
+    """
+    from .data_loader import _validate_trade_date_dtype
+    
+    span_days = int(resequence_days * _CALENDAR_DAYS_PER_TRADING_DAY) + _WINDOW_MARGIN_DAYS
+    lower_bounds = []
+    if checkpoint_date:
+        anchor = pd.to_datetime(checkpoint_date)
+        lower_bounds = [
+            (anchor - pd.Timedelta(days=span_days * 2 ** i)).strftime('%Y-%m-%d')
+            for i in range(_MAX_WINDOW_WIDENINGS + 1)
+        ]
+    lower_bounds.append(None)  # Full history
+    
+    data = pd.DataFrame()
+    for lower in lower_bounds:
+        data = master_matrix_instance._load_all_streams_with_sequencer_for_state(start_date=lower)
+        if data.empty:
+            continue
+        
+        # DATE OWNERSHIP: DataLoader owns date normalization
+        # Validate that trade_date exists and has correct dtype (no parsing)
+        if 'trade_date' not in data.columns:
+            raise ValueError("No trade_date column found in analyzer data - DataLoader should have normalized dates")
+        _validate_trade_date_dtype(data, "rolling_resequence")
+        
+        latest = data['trade_date'].max()
+        if pd.isna(latest):
+            raise ValueError("Could not determine latest analyzer date")
+        latest_str = pd.to_datetime(latest).strftime('%Y-%m-%d')
+        
+        resequence_start_date = find_trading_days_back(data, latest_str, resequence_days)
+        if resequence_start_date:
+            logger.info(
+                f"Loaded {len(data)} analyzer rows from {lower or 'the start of history'} "
+                f"(checkpoint date {checkpoint_date})"
+            )
+            return data, resequence_start_date, latest_str
+        if lower is not None:
+            logger.info(f"Fewer than {resequence_days} trading days since {lower}, widening the load window")
+        else:
+            return data, None, latest_str
+    
+    return data, None, None
+
+
 def build_master_matrix_rolling_resequence(
     master_matrix_instance,
     resequence_days: int = 40,
@@ -30,7 +106,8 @@ def build_master_matrix_rolling_resequence(
     Perform rolling resequence: remove window rows and resequence from checkpoint state.
     
     Behavior:
-    1. Discover all analyzer output from data/analyzed/ (full disk scan)
+    1. Load the latest checkpoint and the analyzer output from shortly before its date
+       (widened until it holds N trading days; no full history scan)
     2. Compute resequence_start_date = today - N trading days
     3. Load existing master matrix
     4. Remove all rows where trade_date >= resequence_start_date
@@ -75,48 +152,39 @@ def build_master_matrix_rolling_resequence(
         
         logger.info(f"Resequencing last {resequence_days} trading days")
         
-        # Step 1: Discover all analyzer output (full disk scan)
-        logger.info("Discovering analyzer output from disk...")
-        all_analyzer_data = master_matrix_instance._load_all_streams_with_sequencer_for_state()
+        # Step 1: Restore the checkpoint first - its date anchors the analyzer load window
+        checkpoint_mgr = CheckpointManager()
+        latest_checkpoint = checkpoint_mgr.load_latest_checkpoint()
         
-        if all_analyzer_data.empty:
-            error_msg = "No analyzer data found"
+        if not latest_checkpoint:
+            error_msg = (
+                "No checkpoint found. Rolling resequence requires a checkpoint to restore sequencer state. "
+                "RECOVERY: Run a full rebuild first using build_master_matrix() to create the initial checkpoint. "
+                "Checkpoints are created automatically after successful builds."
+            )
             logger.error(error_msg)
             return pd.DataFrame(), {"error": error_msg}
         
-        # Get latest date from analyzer data
-        # DATE OWNERSHIP: DataLoader owns date normalization
-        # Validate that trade_date exists and has correct dtype (no parsing)
-        from .data_loader import _validate_trade_date_dtype, _validate_trade_date_presence
-        
-        if 'trade_date' not in all_analyzer_data.columns:
-            error_msg = "No trade_date column found in analyzer data - DataLoader should have normalized dates"
-            logger.error(error_msg)
-            return pd.DataFrame(), {"error": error_msg}
+        checkpoint_date_str = latest_checkpoint.get('checkpoint_date')
         
-        # Validate trade_date dtype (should already be datetime from DataLoader)
+        # Load analyzer output from shortly before the checkpoint date (not the full history)
+        logger.info("Loading analyzer output for the resequence window...")
         try:
-            _validate_trade_date_dtype(all_analyzer_data, "rolling_resequence")
+            all_analyzer_data, resequence_start_date, latest_analyzer_date_str = _load_resequence_window(
+                master_matrix_instance, checkpoint_date_str, resequence_days
+            )
         except ValueError as e:
-            logger.error(f"Rolling resequence: trade_date validation failed: {e}")
+            logger.error(f"Rolling resequence: {e}")
             return pd.DataFrame(), {"error": str(e)}
         
-        latest_analyzer_date = all_analyzer_data['trade_date'].max()
-        
-        if pd.isna(latest_analyzer_date):
-            error_msg = "Could not determine latest analyzer date"
+        if all_analyzer_data.empty:
+            error_msg = "No analyzer data found"
             logger.error(error_msg)
             return pd.DataFrame(), {"error": error_msg}
         
-        latest_analyzer_date_str = pd.to_datetime(latest_analyzer_date).strftime('%Y-%m-%d')
         logger.info(f"Latest analyzer date: {latest_analyzer_date_str}")
         
-        # Step 2: Compute resequence_start_date = today - N trading days
-        # Use latest analyzer date as "today" reference
-        resequence_start_date = find_trading_days_back(
-            all_analyzer_data, latest_analyzer_date_str, resequence_days
-        )
-        
+        # Step 2: resequence_start_date = latest analyzer date ("today") - N trading days
         if not resequence_start_date:
             error_msg = f"Insufficient history: need {resequence_days} trading days back from {latest_analyzer_date_str}"
             logger.error(error_msg)
@@ -144,6 +212,8 @@ def build_master_matrix_rolling_resequence(
             logger.error(error_msg)
             return pd.DataFrame(), {"error": error_msg}
         
+        from .data_loader import _validate_trade_date_dtype
+        
         # Validate trade_date dtype (should already be datetime)
         try:
             _validate_trade_date_dtype(existing_df, "existing_matrix")
@@ -159,23 +229,7 @@ def build_master_matrix_rolling_resequence(
         
         logger.info(f"Preserved {rows_preserved} historical rows (removed {rows_removed} rows from window)")
         
-        # Step 5: Restore sequencer state from checkpoint immediately before resequence_start_date
-        checkpoint_mgr = CheckpointManager()
-        
-        # Find checkpoint before resequence_start_date
-        # Load latest checkpoint and check if it's before resequence_start_date
-        latest_checkpoint = checkpoint_mgr.load_latest_checkpoint()
-        
-        if not latest_checkpoint:
-            error_msg = (
-                "No checkpoint found. Rolling resequence requires a checkpoint to restore sequencer state. "
-                "RECOVERY: Run a full rebuild first using build_master_matrix() to create the initial checkpoint. "
-                "Checkpoints are created automatically after successful builds."
-            )
-            logger.error(error_msg)
-            return pd.DataFrame(), {"error": error_msg}
-        
-        checkpoint_date_str = latest_checkpoint.get('checkpoint_date')
+        # Step 5: Restore sequencer state (slot histories) from the checkpoint
         if checkpoint_date_str:
             checkpoint_date = pd.to_datetime(checkpoint_date_str)
             if checkpoint_date >= resequence_start_dt:
@@ -192,12 +246,12 @@ def build_master_matrix_rolling_resequence(
         logger.info(f"Restored sequencer state from checkpoint {checkpoint_restore_id}")
         
         # Step 6: Run sequencer forward using analyzer data for dates >= resequence_start_date
+        # The restored state carries the slot histories, so no rows before the window are needed
         logger.info(f"Running sequencer forward for dates >= {resequence_start_date}...")
         
-        # Filter analyzer data to resequence window
-        window_analyzer_data = all_analyzer_data[all_analyzer_data['trade_date'] >= resequence_start_dt].copy()
+        window_data_for_sequencer = all_analyzer_data[all_analyzer_data['trade_date'] >= resequence_start_dt].copy()
         
-        if window_analyzer_data.empty:
+        if window_data_for_sequencer.empty:
             logger.warning("No analyzer data found for resequence window")
             # Still save the preserved historical matrix
             if not historical_df.empty:
@@ -211,37 +265,6 @@ def build_master_matrix_rolling_resequence(
         # Create sequencer callback with restored state
         apply_sequencer = master_matrix_instance._create_sequencer_callback_with_restored_state(restored_states)
         
-        # Apply sequencer logic to window data
-        # Note: sequencer needs full history for state, so we need to load all data but filter output
-        # Actually, we need to load all data up to latest_analyzer_date for sequencer context
-        # But only output rows for the resequence window
-        all_data_for_sequencer = master_matrix_instance._load_all_streams_with_sequencer_for_state()
-        
-        # Filter to dates >= resequence_start_date for sequencer processing
-        # DATE OWNERSHIP: DataLoader should have normalized trade_date
-        if 'trade_date' not in all_data_for_sequencer.columns:
-            error_msg = "No trade_date column in sequencer data - DataLoader should have normalized dates"
-            logger.error(error_msg)
-            return pd.DataFrame(), {"error": error_msg}
-        
-        # Validate trade_date dtype (should already be datetime from DataLoader)
-        try:
-            _validate_trade_date_dtype(all_data_for_sequencer, "sequencer_data")
-        except ValueError as e:
-            logger.error(f"Rolling resequence: Sequencer data trade_date validation failed: {e}")
-            return pd.DataFrame(), {"error": str(e)}
-        window_data_for_sequencer = all_data_for_sequencer[all_data_for_sequencer['trade_date'] >= resequence_start_dt].copy()
-        
-        if window_data_for_sequencer.empty:
-            logger.warning("No data available for sequencer processing")
-            if not historical_df.empty:
-                save_master_matrix(historical_df, output_dir, None, stream_filters=master_matrix_instance.stream_filters)
-            return historical_df, {
-                "message": "No data for sequencer processing",
-                "rows_preserved": rows_preserved,
-                "rows_resequenced": 0
-            }
-        
         # Apply sequencer logic with restored state
         # Sequencer returns tuple (result_df, final_states)
         sequencer_output = apply_sequencer(window_data_for_sequencer, display_year=None)
@@ -0,0 +1,126 @@
+"""
+Columnar encodings of matrix DataFrames for the API.
+
+GET /api/matrix/data used to build one dict per row (df.to_dict('records')), clean every
+value in Python and run jsonable_encoder over the result; for a full multi-year matrix
+that is seconds of CPU and several copies of the data. The encoders here work per column:
+
+- frame_to_columns: column-oriented JSON ({column: [values]}), NaN/NaT/inf -> None and
+  timestamps -> ISO strings done vectorized per column. Values are native Python types,
+  so the result can go straight to json.dumps.
+- frame_to_arrow_ipc: Arrow IPC stream of the frame (non-finite floats -> null,
+  timestamps stay native Arrow timestamps), with response metadata as JSON in the schema
+  metadata under METADATA_KEY.
+
+Values match what the records path returns for the same frame.
+"""
+
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_FORMATS = ("records", "columns", "arrow")
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+METADATA_KEY = b"qtsw2_matrix"
+
+
+def _datetime_column_to_iso(series: pd.Series) -> List[Optional[str]]:
+    """ISO strings as pd.Timestamp.isoformat(), None for NaT"""
+    mask = series.isna().to_numpy()
+    if series.dt.tz is None and not (series.dt.microsecond.any() or series.dt.nanosecond.any()):
+        values = series.dt.strftime("%Y-%m-%dT%H:%M:%S").to_numpy(dtype=object)
+    else:
+        # Sub-second or tz-aware values: isoformat carries the fraction/offset formatting
+        values = np.array([v.isoformat() if not pd.isna(v) else None for v in series], dtype=object)
+    values[mask] = None
+    return values.tolist()
+
+
+def _float_column_to_list(series: pd.Series) -> List[Optional[float]]:
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    out = values.astype(object)
+    out[~np.isfinite(values)] = None
+    return out.tolist()
+
+
+def _object_value(value: Any) -> Any:
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    if isinstance(value, np.generic):
+        return _object_value(value.item())
+    return value
+
+
+def _object_column_to_list(series: pd.Series) -> List[Any]:
+    values = series.to_numpy(dtype=object, na_value=None)
+    if pd.api.types.infer_dtype(series, skipna=True) in ("string", "empty"):
+        return values.tolist()
+    return [_object_value(v) for v in values]
+
+
+def column_to_list(series: pd.Series) -> List[Any]:
+    """One column as JSON-safe native values (None for missing/non-finite)"""
+    dtype = series.dtype
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return _datetime_column_to_iso(series)
+    if isinstance(dtype, pd.CategoricalDtype):
+        return _object_column_to_list(series.astype(object))
+    if pd.api.types.is_bool_dtype(dtype) and not series.isna().any():
+        return series.to_numpy(dtype=bool).tolist()
+    if pd.api.types.is_integer_dtype(dtype) and not series.isna().any():
+        return series.to_numpy(dtype=np.int64).tolist()
+    if pd.api.types.is_float_dtype(dtype):
+        return _float_column_to_list(series)
+    return _object_column_to_list(series)
+
+
+def frame_to_columns(df: pd.DataFrame) -> Dict[str, List[Any]]:
+    """Column-oriented JSON payload of a frame ({column: values}, column order kept)"""
+    return {str(col): column_to_list(df[col]) for col in df.columns}
+
+
+def _arrow_column(series: pd.Series) -> "pa.Array":
+    if pd.api.types.is_float_dtype(series.dtype):
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        return pa.array(values, mask=~np.isfinite(values), type=pa.float64())
+    try:
+        return pa.Array.from_pandas(series)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        # Mixed-type object column: ship the JSON values as strings
+        return pa.array([None if v is None else str(v) for v in column_to_list(series)], type=pa.string())
+
+
+def frame_to_arrow_ipc(df: pd.DataFrame, metadata: Optional[Dict[str, Any]] = None) -> bytes:
+    """
+    Arrow IPC stream bytes of a frame.
+
+    Args:
+        df: Frame to encode (index is not included)
+        metadata: JSON-serializable response metadata, stored in the schema metadata
+
+    Raises:
+        ImportError: pyarrow is not installed
+    """
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required for the Arrow matrix response format")
+    names = [str(col) for col in df.columns]
+    arrays = [_arrow_column(df[col]) for col in df.columns]
+    schema_metadata = {METADATA_KEY: json.dumps(metadata or {}, allow_nan=False).encode("utf-8")}
+    table = pa.Table.from_arrays(arrays, names=names).replace_schema_metadata(schema_metadata)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
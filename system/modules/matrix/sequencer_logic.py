@@ -42,13 +42,14 @@ INVARIANTS:
 
 import logging
 from typing import Dict, List, Optional, Union, Tuple
+import numpy as np
 import pandas as pd
 
 # Import List from typing for type hints (Python 3.8+ compatibility)
 
 from .utils import calculate_time_score, get_session_for_time, time_sort_key
 from .logging_config import setup_matrix_logger
-from .history_manager import update_time_slot_history, ROLLING_WINDOW_SIZE
+from .history_manager import build_rolling_histories, ROLLING_WINDOW_SIZE
 from .trade_selector import select_trade_for_time
 from .config import SLOT_ENDS
 
@@ -183,7 +184,8 @@ def decide_time_change(
     current_sum_after: float,
     time_slot_histories: Dict[str, List[int]],
     selectable_times: List[str],
-    current_session: str
+    current_session: str,
+    rolling_sums: Optional[Dict[str, float]] = None
 ) -> Optional[str]:
     """
     Decide if time should change for the next day based on loss and rolling sums.
@@ -195,9 +197,12 @@ def decide_time_change(
         current_time: Current time slot being used
         current_result: Result at current_time (WIN/LOSS/BE/NoTrade)
         current_sum_after: Rolling sum for current time slot after today
-        time_slot_histories: Dictionary of time slot histories (already updated)
+        time_slot_histories: Time slot histories including today's scores; read (never
+            modified) only when rolling_sums is None
         selectable_times: Non-excluded session slots (merged stream + master exclude_times)
         current_session: Current session (S1 or S2)
+        rolling_sums: Optional precomputed rolling sums per time after today (used instead
+            of summing time_slot_histories; process_stream_daily passes these)
         
     Returns:
         Best other time if change needed, or None if no change
@@ -221,7 +226,10 @@ def decide_time_change(
     # Calculate rolling sums for other selectable times
     other_sums = {}
     for other_time in other_selectable:
-        other_sums[other_time] = sum(time_slot_histories.get(other_time, []))
+        if rolling_sums is not None:
+            other_sums[other_time] = rolling_sums.get(other_time, 0)
+        else:
+            other_sums[other_time] = sum(time_slot_histories.get(other_time, []))
     
     if not other_sums:
         return None
@@ -378,45 +386,60 @@ def process_stream_daily(
     logger.debug(f"Stream {stream_id}: Processing {len(trading_dates)} trading days (from data, not calendar)")
     
     # ============================================================================
-    # DAILY PROCESSING LOOP
+    # CENTRALIZED SCORING (VECTORIZED, ONCE PER STREAM)
     # ============================================================================
-    for date in trading_dates:
-        # OPTIMIZATION: Use boolean indexing instead of copy (faster)
-        date_mask = stream_df['Date_normalized'] == date
-        date_df = stream_df[date_mask]  # Use view, not copy
-        
-        # Time_str already normalized above, no need to do it per-day
-        
-        # ============================================================================
-        # CENTRALIZED DAILY SCORING (ONE BLOCK)
-        # ============================================================================
-        # Score all canonical_times: build results, calculate scores, update histories
-        daily_results = {}  # {time_normalized: result_string}
-        daily_scores = {}   # {time_normalized: score_int}
+    # Result per (day, canonical time): first analyzer row at that slot, else NoTrade
+    n_days = len(trading_dates)
+    row_day_positions = pd.Index(trading_dates).get_indexer(stream_df['Date_normalized'])
+    daily_results_matrix = np.full((n_days, len(canonical_times)), 'NoTrade', dtype=object)
+    slot_mask = stream_df['Time_str'].isin(canonical_times).to_numpy() & (row_day_positions >= 0)
+    if slot_mask.any():
+        slot_rows = stream_df[slot_mask]
+        first_mask = ~slot_rows.duplicated(subset=['Date_normalized', 'Time_str'], keep='first').to_numpy()
+        slot_rows = slot_rows[first_mask]
+        day_positions = row_day_positions[slot_mask][first_mask]
+        time_positions = pd.Index(canonical_times).get_indexer(slot_rows['Time_str'])
+        daily_results_matrix[day_positions, time_positions] = slot_rows['Result'].to_numpy()
+    
+    # Score each distinct result once, then broadcast
+    result_codes, unique_results = pd.factorize(daily_results_matrix.ravel(), use_na_sentinel=False)
+    unique_scores = np.array([calculate_time_score(r) for r in unique_results], dtype=np.int64)
+    daily_scores_matrix = unique_scores[result_codes].reshape(daily_results_matrix.shape)
+    
+    # All canonical times advance rolling history every day; running sums replace per-day sum()
+    rolling_sums_matrix, final_histories = build_rolling_histories(
+        canonical_times, daily_scores_matrix, time_slot_histories
+    )
+    
+    # INVARIANT CHECK: all canonical histories must have the same length
+    if n_days > 0:
+        history_lengths = [min(len(time_slot_histories[t]) + 1, ROLLING_WINDOW_SIZE) for t in canonical_times]
+        if len(set(history_lengths)) != 1:
+            raise AssertionError(
+                f"Stream {stream_id} {trading_dates[0]}: History length mismatch: "
+                f"{dict(zip(canonical_times, history_lengths))}"
+            )
+    
+    # Row positions per trading day, in stream order (avoids a full boolean scan of the stream per day)
+    rows_by_day = np.argsort(row_day_positions, kind='stable')
+    day_bounds = np.searchsorted(row_day_positions[rows_by_day], np.arange(n_days + 1))
+    
+    # ============================================================================
+    # DAILY PROCESSING LOOP (time-change decision + trade selection only)
+    # ============================================================================
+    for day_idx, date in enumerate(trading_dates):
+        date_df = stream_df.iloc[rows_by_day[day_bounds[day_idx]:day_bounds[day_idx + 1]]]
         
-        for canonical_time in canonical_times:
-            canonical_time_normalized = normalize_time(str(canonical_time))
-            
-            # Determine result
-            if date_df.empty:
-                result = 'NoTrade'
-            else:
-                slot_trade = date_df[date_df['Time_str'] == canonical_time_normalized]
-                result = slot_trade.iloc[0]['Result'] if not slot_trade.empty else 'NoTrade'
-            
-            # Calculate score and update history
-            score = calculate_time_score(result)
-            update_time_slot_history(time_slot_histories, canonical_time_normalized, score)
-            
-            daily_results[canonical_time_normalized] = result
-            daily_scores[canonical_time_normalized] = score
+        daily_results = dict(zip(canonical_times, daily_results_matrix[day_idx]))
+        daily_scores = dict(zip(canonical_times, daily_scores_matrix[day_idx].tolist()))
+        rolling_sums = dict(zip(canonical_times, rolling_sums_matrix[day_idx].tolist()))
         
         # ============================================================================
         # TIME CHANGE DECISION (PURE FUNCTION)
         # ============================================================================
         current_time_normalized = normalize_time(str(current_time))
         current_time_result = daily_results.get(current_time_normalized, 'NoTrade')
-        current_sum_after = sum(time_slot_histories.get(current_time_normalized, []))
+        current_sum_after = rolling_sums.get(current_time_normalized, 0)
         
         next_time = decide_time_change(
             current_time,
@@ -424,7 +447,8 @@ def process_stream_daily(
             current_sum_after,
             time_slot_histories,
             selectable_times,
-            current_session
+            current_session,
+            rolling_sums=rolling_sums
         )
         
         old_time_for_today = str(current_time).strip()
@@ -520,7 +544,7 @@ def process_stream_daily(
         # Add rolling columns for ALL canonical times (from daily_scores)
         for canonical_time in canonical_times:
             canonical_time_normalized = normalize_time(str(canonical_time))
-            rolling_sum = sum(time_slot_histories.get(canonical_time_normalized, []))
+            rolling_sum = rolling_sums.get(canonical_time_normalized, 0)
             trade_dict[f"{canonical_time} Rolling"] = round(rolling_sum, 2)
             trade_dict[f"{canonical_time} Points"] = daily_scores.get(canonical_time_normalized, 0)
         
@@ -567,20 +591,13 @@ def process_stream_daily(
             current_session = get_session_for_time(current_time, SLOT_ENDS)
         
         previous_time = old_time_for_today
-        
-        # ============================================================================
-        # INVARIANT CHECK
-        # ============================================================================
-        history_lengths = [len(hist) for hist in time_slot_histories.values()]
-        if history_lengths and len(set(history_lengths)) != 1:
-            raise AssertionError(f"Stream {stream_id} {date}: History length mismatch: {dict(zip(canonical_times, history_lengths))}")
     
     # Return final state along with trades if requested
     if return_state:
         final_state = {
             "current_time": current_time,
             "current_session": current_session,
-            "time_slot_histories": {k: list(v) for k, v in time_slot_histories.items()}  # Copy lists
+            "time_slot_histories": final_histories  # Fresh lists of Python ints (JSON-serializable)
         }
         return chosen_trades, final_state
     
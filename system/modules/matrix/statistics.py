@@ -159,6 +159,35 @@ def _ensure_profit_column_inplace(df: pd.DataFrame) -> None:
     df["Profit"] = pd.to_numeric(df["Profit"], errors='coerce').fillna(0.0)
 
 
+# Complete contract value map (dollars per point)
+CONTRACT_VALUES = {
+    "ES": 50.0,
+    "MES": 5.0,
+    "NQ": 10.0,
+    "MNQ": 2.0,
+    "YM": 5.0,
+    "MYM": 0.5,
+    "RTY": 50.0,
+    "CL": 1000.0,  # Crude Oil
+    "NG": 10000.0,  # Natural Gas
+    "GC": 100.0,  # Gold
+}
+
+
+def _get_contract_value(instrument_str) -> float:
+    """Dollars per point of an instrument (stream-style names such as "ES2" map to "ES"; default ES)"""
+    if pd.isna(instrument_str) or instrument_str is None:
+        return 50.0  # Default to ES
+    inst_str = str(instrument_str).strip().upper()
+    # Remove trailing digits if present (e.g., "ES2" -> "ES", "NQ1" -> "NQ")
+    base_inst = inst_str.rstrip("0123456789")
+    contract_val = CONTRACT_VALUES.get(base_inst, 50.0)
+    # Debug logging for NQ streams to verify contract value
+    if base_inst == "NQ" and contract_val != 10.0:
+        logger.warning(f"NQ contract value mismatch: got {contract_val}, expected 10.0 for instrument {instrument_str}")
+    return contract_val
+
+
 def _ensure_profit_dollars_column(df: pd.DataFrame, contract_multiplier: float = 1.0) -> pd.DataFrame:
     """
     Ensure ProfitDollars column exists. ALWAYS recompute from Profit to ensure contract_multiplier is applied correctly.
@@ -169,37 +198,11 @@ def _ensure_profit_dollars_column(df: pd.DataFrame, contract_multiplier: float =
     """
     df = df.copy()
     
-    # Complete contract value map (dollars per point)
-    contract_values = {
-        "ES": 50.0,
-        "MES": 5.0,
-        "NQ": 10.0,
-        "MNQ": 2.0,
-        "YM": 5.0,
-        "MYM": 0.5,
-        "RTY": 50.0,
-        "CL": 1000.0,  # Crude Oil
-        "NG": 10000.0,  # Natural Gas
-        "GC": 100.0,  # Gold
-    }
-    
-    def get_contract_value(instrument_str):
-        if pd.isna(instrument_str) or instrument_str is None:
-            return 50.0  # Default to ES
-        inst_str = str(instrument_str).strip().upper()
-        # Remove trailing digits if present (e.g., "ES2" -> "ES", "NQ1" -> "NQ")
-        base_inst = inst_str.rstrip("0123456789")
-        contract_val = contract_values.get(base_inst, 50.0)
-        # Debug logging for NQ streams to verify contract value
-        if base_inst == "NQ" and contract_val != 10.0:
-            logger.warning(f"NQ contract value mismatch: got {contract_val}, expected 10.0 for instrument {instrument_str}")
-        return contract_val
-    
     # ALWAYS recompute ProfitDollars from Profit to ensure contract_multiplier is applied correctly
     # This ensures that even if ProfitDollars exists in the DataFrame (from previous calculations),
     # we always use the current multiplier value
     df["ProfitDollars"] = df.apply(
-        lambda row: (row.get("Profit", 0.0) or 0.0) * get_contract_value(row.get("Instrument")) * contract_multiplier,
+        lambda row: (row.get("Profit", 0.0) or 0.0) * _get_contract_value(row.get("Instrument")) * contract_multiplier,
         axis=1
     )
     
@@ -215,35 +218,9 @@ def _ensure_profit_dollars_column_inplace(df: pd.DataFrame, contract_multiplier:
         df: DataFrame to process (modified in-place)
         contract_multiplier: Multiplier for contract size (e.g., 2.0 for trading 2 contracts)
     """
-    # Complete contract value map (dollars per point)
-    contract_values = {
-        "ES": 50.0,
-        "MES": 5.0,
-        "NQ": 10.0,
-        "MNQ": 2.0,
-        "YM": 5.0,
-        "MYM": 0.5,
-        "RTY": 50.0,
-        "CL": 1000.0,  # Crude Oil
-        "NG": 10000.0,  # Natural Gas
-        "GC": 100.0,  # Gold
-    }
-    
-    def get_contract_value(instrument_str):
-        if pd.isna(instrument_str) or instrument_str is None:
-            return 50.0  # Default to ES
-        inst_str = str(instrument_str).strip().upper()
-        # Remove trailing digits if present (e.g., "ES2" -> "ES", "NQ1" -> "NQ")
-        base_inst = inst_str.rstrip("0123456789")
-        contract_val = contract_values.get(base_inst, 50.0)
-        # Debug logging for NQ streams to verify contract value
-        if base_inst == "NQ" and contract_val != 10.0:
-            logger.warning(f"NQ contract value mismatch: got {contract_val}, expected 10.0 for instrument {instrument_str}")
-        return contract_val
-    
     # ALWAYS recompute ProfitDollars from Profit to ensure contract_multiplier is applied correctly
     df["ProfitDollars"] = df.apply(
-        lambda row: (row.get("Profit", 0.0) or 0.0) * get_contract_value(row.get("Instrument")) * contract_multiplier,
+        lambda row: (row.get("Profit", 0.0) or 0.0) * _get_contract_value(row.get("Instrument")) * contract_multiplier,
         axis=1
     )
     
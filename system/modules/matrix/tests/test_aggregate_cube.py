@@ -0,0 +1,184 @@
+"""Aggregate cube: breakdowns and stream stats from the cube must equal those computed from matrix rows."""
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+SYSTEM_ROOT = REPO_ROOT / "system"
+sys.path.insert(0, str(SYSTEM_ROOT))
+
+from modules.matrix import aggregate_cube, api, statistics  # noqa: E402
+from modules.matrix.aggregate_cube import AggregateCube, get_matrix_cube, save_matrix_cube  # noqa: E402
+from modules.matrix.breakdown_service import calculate_breakdown, calculate_breakdown_from_cube  # noqa: E402
+
+BREAKDOWN_TYPES = ["day", "dom", "time", "month", "year"]
+
+
+def _matrix(rows: int = 600, seed: int = 5) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    trade_date = pd.Timestamp("2024-11-01") + pd.to_timedelta(rng.integers(0, 120, rows), unit="D")
+    streams = rng.choice(["ES1", "ES2", "NQ1", "CL2", "GC1"], rows)
+    profit = np.round(rng.normal(0, 4, rows), 2).astype(object)
+    profit[::37] = None
+    return pd.DataFrame({
+        "trade_date": trade_date,
+        "Stream": streams,
+        "Instrument": [s[:2] for s in streams],
+        "Time": rng.choice(["07:30", "08:00", "09:00", "10:30", "NA", "00:00", None], rows),
+        "Result": rng.choice(["Win", "LOSS", " be ", "NoTrade", "Time", None], rows),
+        "Profit": profit,
+        "final_allowed": rng.random(rows) > 0.2,
+        "dow_full": trade_date.day_name(),
+        "day_of_month": trade_date.day,
+    })
+
+
+def _row_breakdown(df, breakdown_type, stream_include, stream_filters, use_filtered, contract_multiplier):
+    """/breakdown before the cube: prepare the matrix rows, then filter and sum them"""
+    if stream_include:
+        df = df[df["Stream"].isin(stream_include)].reset_index(drop=True)
+    df = statistics._ensure_final_allowed(df)
+    df = statistics._normalize_results(df)
+    df = statistics._ensure_profit_column(df)
+    df = statistics._ensure_profit_dollars_column(df, contract_multiplier=contract_multiplier)
+    return calculate_breakdown(df, breakdown_type, stream_filters=stream_filters, use_filtered=use_filtered)
+
+
+def _assert_breakdowns_equal(actual, expected):
+    assert actual.keys() == expected.keys()
+    for key in expected:
+        assert actual[key] == pytest.approx(expected[key], abs=1e-6)
+
+
+@pytest.mark.parametrize("breakdown_type", BREAKDOWN_TYPES)
+def test_cube_breakdowns_match_row_breakdowns(breakdown_type):
+    df = _matrix()
+    cube = AggregateCube.from_matrix(df)
+    assert cube.source_rows == len(df)
+    assert len(cube.cells) < len(df)
+
+    master = api.StreamFilterConfig(exclude_days_of_week=["Friday"], exclude_times=["08:00"])
+    es2 = api.StreamFilterConfig(exclude_days_of_month=[1, 15, 30])
+    cases = [
+        (None, {}, False, 1.0),
+        (["ES1", "NQ1"], {}, False, 2.0),
+        (None, {"master": master, "ES2": es2}, True, 1.0),
+        (["ES2", "CL2"], {"ES2": es2}, True, 3.0),
+        (["GC1"], {"master": master}, False, 1.0),  # Filters off: ignored
+    ]
+    for stream_include, filters, use_filtered, multiplier in cases:
+        expected, expected_rows = _row_breakdown(df, breakdown_type, stream_include, filters, use_filtered, multiplier)
+        actual, total_rows = calculate_breakdown_from_cube(
+            cube, breakdown_type, stream_include=stream_include, stream_filters=filters,
+            use_filtered=use_filtered, contract_multiplier=multiplier
+        )
+        assert total_rows == expected_rows
+        _assert_breakdowns_equal(actual, expected)
+
+
+def test_cube_stream_stats_match_calculate_stream_stats():
+    df = _matrix()
+    cube = AggregateCube.from_matrix(df)
+    for include_filtered_executed in (True, False):
+        assert cube.stream_stats(include_filtered_executed) == statistics.calculate_stream_stats(
+            df, include_filtered_executed
+        )
+    subset = cube.stream_stats(stream_include=["NQ1"], contract_multiplier=2.0)
+    expected = statistics.calculate_stream_stats(df[df["Stream"] == "NQ1"])["NQ1"]
+    assert subset.keys() == {"NQ1"}
+    assert subset["NQ1"]["profit"] == pytest.approx(expected["profit"] * 2, abs=0.02)
+
+
+def test_saved_cube_is_served_and_stale_cube_rebuilt(tmp_path, monkeypatch):
+    df = _matrix(rows=200)
+    matrix_file = tmp_path / "master_matrix_20250301_120000_200n.parquet"
+    df.to_parquet(matrix_file, index=False)
+    mtime = matrix_file.stat().st_mtime
+    save_matrix_cube(df, matrix_file, mtime)
+
+    stored = tmp_path / "cubes" / matrix_file.name
+    assert stored.exists()
+    assert sorted(p.name for p in tmp_path.glob("master_matrix_*.parquet")) == [matrix_file.name]
+    pd.testing.assert_frame_equal(AggregateCube.load(stored).cells, AggregateCube.from_matrix(df).cells)
+
+    # Served from the stored file (not rebuilt) once the in-process entry is gone
+    aggregate_cube._cube_cache.clear()
+    builds = []
+    from_matrix = AggregateCube.from_matrix.__func__
+    monkeypatch.setattr(AggregateCube, "from_matrix",
+                        classmethod(lambda cls, frame: builds.append(len(frame)) or from_matrix(cls, frame)))
+    meta = {"matrix_file_id": matrix_file.name, "file_mtime": mtime, "matrix_source": "disk"}
+    assert get_matrix_cube(df, meta, tmp_path).source_rows == len(df)
+    assert builds == []
+
+    # The matrix file was overwritten after its cube: rebuild from the matrix
+    aggregate_cube._cube_cache.clear()
+    newer = _matrix(rows=150, seed=9)
+    time.sleep(0.01)
+    newer.to_parquet(matrix_file, index=False)
+    meta["file_mtime"] = matrix_file.stat().st_mtime + 1
+    assert get_matrix_cube(newer, meta, tmp_path).source_rows == 150
+    assert builds == [150]
+
+
+def test_breakdown_endpoint_serves_from_cube(monkeypatch):
+    api._invalidate_matrix_cache()
+    aggregate_cube._cube_cache.clear()
+    df = _matrix(rows=300)
+    meta = {"file_name": "mm_cube.parquet", "matrix_file_id": "mm_cube.parquet", "file_mtime": 1.0,
+            "matrix_source": "in_memory"}
+    monkeypatch.setattr(api, "_resolve_matrix_source", lambda file_path=None: (df, dict(meta)))
+
+    filters = {"master": api.StreamFilterConfig(exclude_days_of_week=["Monday"])}
+    for breakdown_type in ("day", "month"):
+        result = api.calculate_profit_breakdown(api.BreakdownRequest(
+            breakdown_type=breakdown_type, stream_filters=filters, use_filtered=True,
+            contract_multiplier=2.0, stream_include=["ES1", "CL2"],
+        ))
+        expected, expected_rows = _row_breakdown(df, breakdown_type, ["ES1", "CL2"], filters, True, 2.0)
+        assert result["total_rows"] == expected_rows
+        _assert_breakdowns_equal(result["breakdown"], expected)
+    # One cube for both breakdown types
+    assert aggregate_cube._cube_cache.stats()["entries"] == 1
+    api._invalidate_matrix_cache()
+    aggregate_cube._cube_cache.clear()
+
+
+def _row_summary_stats(df, stream_id, include_filtered_executed, contract_multiplier):
+    """/stream-stats before the cube: summary stats over every row of the stream"""
+    stream_df = df[df["Stream"] == stream_id]
+    return statistics.calculate_summary_stats(
+        stream_df, include_filtered_executed=include_filtered_executed, contract_multiplier=contract_multiplier
+    )
+
+
+def test_stream_stats_endpoint_counts_from_cube(monkeypatch):
+    api._invalidate_matrix_cache()
+    aggregate_cube._cube_cache.clear()
+    df = _matrix(rows=400)
+    meta = {"file_name": "mm_stats.parquet", "matrix_file_id": "mm_stats.parquet", "file_mtime": 1.0,
+            "matrix_source": "in_memory"}
+    monkeypatch.setattr(api, "_resolve_matrix_source", lambda file_path=None: (df, dict(meta)))
+
+    for include_filtered_executed, multiplier in ((False, 1.0), (True, 2.0)):
+        response = api.get_stream_stats(api.StreamStatsRequest(
+            stream_id="ES2", include_filtered_executed=include_filtered_executed, contract_multiplier=multiplier
+        ))
+        stats = json.loads(response.body)["stats"]
+        expected = json.loads(json.dumps(_row_summary_stats(df, "ES2", include_filtered_executed, multiplier)))
+        assert stats["sample_counts"] == expected["sample_counts"]
+        assert stats.get("day_counts") == expected.get("day_counts")
+        for section in ("performance_trade_metrics", "performance_daily_metrics"):
+            assert stats[section].keys() == expected[section].keys()
+            for key, value in expected[section].items():
+                assert stats[section][key] == pytest.approx(value, abs=0.011), (section, key)
+
+    missing = json.loads(api.get_stream_stats(api.StreamStatsRequest(stream_id="YM1")).body)
+    assert missing["stats"] is None
+    api._invalidate_matrix_cache()
+    aggregate_cube._cube_cache.clear()
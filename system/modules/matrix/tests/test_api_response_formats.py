@@ -0,0 +1,104 @@
+"""GET /api/matrix/data columnar formats must carry the same values as the records format."""
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+SYSTEM_ROOT = REPO_ROOT / "system"
+sys.path.insert(0, str(SYSTEM_ROOT))
+
+from modules.matrix import api  # noqa: E402
+from modules.matrix.response_encoding import METADATA_KEY, frame_to_columns  # noqa: E402
+
+
+def _matrix_frame(rows: int = 400) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    trade_date = pd.Timestamp("2024-01-02") + pd.to_timedelta(rng.integers(0, 700, rows), unit="D")
+    profit = rng.normal(0, 5, rows).round(2)
+    profit[::17] = np.nan
+    profit[5] = np.inf
+    rng_col = rng.normal(20, 3, rows)
+    rng_col[::11] = np.nan
+    df = pd.DataFrame({
+        "trade_date": trade_date,
+        "Date": trade_date.strftime("%Y-%m-%d"),
+        "Stream": rng.choice(["ES1", "ES2", "NQ1", "GC2"], rows),
+        "Instrument": rng.choice(["ES", "NQ", "GC"], rows),
+        "Profit": profit,
+        "Result": rng.choice(["Win", "Loss", "BE", None], rows),
+        "Time": rng.choice(["07:30", "09:00", "10:30"], rows),
+        "EntryTime": rng.choice(["07:31", None], rows),
+        "Session": rng.choice(["S1", "S2"], rows),
+        "Range": rng_col,
+        "Time Change": rng.choice(["", "07:30 -> 08:00", None], rows),
+        "final_allowed": rng.random(rows) > 0.2,
+        "day_of_month": trade_date.day.astype("int64"),
+        "dow": pd.Categorical(trade_date.strftime("%a")),
+        "year": trade_date.year.astype("int64"),
+    })
+    df.loc[3, "Stream"] = np.nan
+    return df
+
+
+def _call(monkeypatch, df, **kwargs):
+    monkeypatch.setattr(api, "_resolve_matrix_source", lambda file_path=None: (df, {
+        "file_name": "master_matrix_test.parquet",
+        "matrix_file_id": f"master_matrix_test_{id(df)}.parquet",
+        "file_mtime": 1.0,
+        "matrix_source": "test",
+    }))
+    return api.get_matrix_data(include_stats=False, nocache=True, **kwargs)
+
+
+def test_columns_and_arrow_formats_match_records(monkeypatch):
+    df = _matrix_frame()
+    for limit, essential in ((0, True), (50, False)):
+        records = json.loads(_call(monkeypatch, df, limit=limit, essential_columns_only=essential).body)
+        columns = json.loads(_call(monkeypatch, df, limit=limit, essential_columns_only=essential,
+                                   response_format="columns").body)
+
+        assert columns["format"] == "columns"
+        assert columns["loaded"] == records["loaded"] == len(records["data"])
+        assert set(columns["columns"]) == set(records["data"][0])
+        for key in ("total", "streams", "instruments", "years", "returned_min_trade_date"):
+            assert columns[key] == records[key]
+        rebuilt = [
+            {col: columns["data"][col][i] for col in columns["columns"]}
+            for i in range(columns["loaded"])
+        ]
+        assert rebuilt == records["data"]
+
+        arrow = _call(monkeypatch, df, limit=limit, essential_columns_only=essential, response_format="arrow")
+        assert arrow.media_type == "application/vnd.apache.arrow.stream"
+        table = pa.ipc.open_stream(arrow.body).read_all()
+        meta = json.loads(table.schema.metadata[METADATA_KEY])
+        assert meta["loaded"] == records["loaded"] and meta["columns"] == table.column_names
+        assert table.num_rows == records["loaded"]
+        profit = table.column("Profit").to_pylist()
+        assert profit == [r["Profit"] for r in records["data"]]
+        trade_dates = [ts.isoformat() for ts in table.column("trade_date").to_pylist()]
+        assert trade_dates == [r["trade_date"] for r in records["data"]]
+
+
+def test_frame_to_columns_handles_missing_and_non_finite_values():
+    df = pd.DataFrame({
+        "f": [1.5, np.nan, -np.inf],
+        "i": pd.array([1, None, 3], dtype="Int64"),
+        "t": pd.to_datetime(["2025-01-02 00:00:00", None, "2025-01-03 10:00:00.250"], format="ISO8601"),
+        "o": ["a", None, 2.0],
+    })
+    assert frame_to_columns(df) == {
+        "f": [1.5, None, None],
+        "i": [1, None, 3],
+        "t": ["2025-01-02T00:00:00", None, "2025-01-03T10:00:00.250000"],
+        "o": ["a", None, 2.0],
+    }
+
+
+def test_unknown_response_format_is_rejected(monkeypatch):
+    response = _call(monkeypatch, _matrix_frame(10), response_format="xml")
+    assert response.status_code == 400
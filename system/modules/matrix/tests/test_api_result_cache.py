@@ -0,0 +1,91 @@
+"""Matrix API result caches: byte-budget LRU, TTL, new-matrix invalidation and /performance metrics."""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+SYSTEM_ROOT = REPO_ROOT / "system"
+sys.path.insert(0, str(SYSTEM_ROOT))
+
+from modules.matrix import api  # noqa: E402
+from modules.matrix.cache import ResultCache, estimate_size  # noqa: E402
+
+
+def _frame(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({"a": np.arange(rows, dtype=np.float64), "b": ["x"] * rows})
+
+
+def test_result_cache_evicts_least_recently_used_over_budget():
+    one = estimate_size(_frame(1000))
+    cache = ResultCache("t", max_bytes=int(one * 2.5))
+    cache.put(("f", 1, "a"), _frame(1000))
+    cache.put(("f", 1, "b"), _frame(1000))
+    assert cache.get(("f", 1, "a")) is not None  # a is now most recently used
+    cache.put(("f", 1, "c"), _frame(1000))
+
+    assert ("f", 1, "b") not in cache
+    assert ("f", 1, "a") in cache and ("f", 1, "c") in cache
+    stats = cache.stats()
+    assert stats["entries"] == 2 and stats["evictions"] == 1
+    assert stats["bytes"] <= stats["max_bytes"]
+
+    cache.put(("f", 1, "huge"), _frame(100000))  # larger than the whole budget: not cached
+    assert ("f", 1, "huge") not in cache and len(cache) == 2
+
+
+def test_result_cache_ttl_and_retain_file():
+    cache = ResultCache("t", max_bytes=10_000_000, ttl_seconds=0.05)
+    cache.put(("mm.parquet", 1.0, "x"), {"v": 1})
+    cache.put(("mm.parquet", 2.0, "x"), {"v": 2})
+    cache.put(("other.parquet", 1.0, "x"), {"v": 3})
+    cache.retain_file("mm.parquet", 2.0)
+    # Older versions of the file are dropped, other files are kept
+    assert cache.get(("mm.parquet", 1.0, "x")) is None
+    assert cache.get(("mm.parquet", 2.0, "x")) == {"v": 2}
+    assert cache.get(("other.parquet", 1.0, "x")) == {"v": 3}
+    time.sleep(0.1)
+    # Membership is a pure lookup: an expired entry is not in the cache but stays until get/put
+    stats = cache.stats()
+    assert ("mm.parquet", 2.0, "x") not in cache
+    assert cache.stats() == stats and len(cache) == 2
+    assert cache.get(("mm.parquet", 2.0, "x")) is None
+    assert cache.stats()["hits"] == 2 and len(cache) == 1
+
+
+def test_matrix_data_cache_hits_and_new_matrix_invalidation(monkeypatch):
+    api._invalidate_matrix_cache()
+    df = pd.DataFrame({
+        "trade_date": pd.date_range("2025-01-02", periods=30, freq="D"),
+        "Stream": ["ES1", "NQ1", "GC1"] * 10,
+        "Instrument": ["ES", "NQ", "GC"] * 10,
+        "Profit": np.linspace(-5, 5, 30),
+        "Result": ["Win", "Loss", "BE"] * 10,
+    })
+    meta = {"file_name": "mm_a.parquet", "matrix_file_id": "mm_a.parquet", "file_mtime": 1.0, "matrix_source": "disk"}
+    monkeypatch.setattr(api, "_resolve_matrix_source", lambda file_path=None: (df, dict(meta)))
+
+    api.get_matrix_data(limit=0, include_stats=False)
+    api.get_matrix_data(limit=0, include_stats=False)
+    api.get_matrix_data(limit=0, include_stats=False, stream_include="ES1")
+    perf = api.get_matrix_performance()
+    assert (perf["api_cache_hits"], perf["api_cache_misses"]) == (1, 2)
+    assert perf["api_caches"]["matrix_data"]["entries"] == 2
+    assert perf["api_caches"]["matrix_data"]["bytes"] > 0
+
+    # Another matrix file is served: entries of both files are kept (LRU budget / TTL evict them)
+    meta.update(file_name="mm_b.parquet", matrix_file_id="mm_b.parquet", file_mtime=2.0)
+    api.get_matrix_data(limit=0, include_stats=False)
+    meta.update(file_name="mm_a.parquet", matrix_file_id="mm_a.parquet", file_mtime=1.0)
+    api.get_matrix_data(limit=0, include_stats=False)
+    stats = api.get_matrix_performance()["api_caches"]["matrix_data"]
+    assert stats["entries"] == 3 and stats["evictions"] == 0 and stats["hits"] == 2
+
+    # The matrix file is overwritten in place: entries of its previous version are dropped
+    meta.update(file_mtime=3.0)
+    api.get_matrix_data(limit=0, include_stats=False)
+    stats = api.get_matrix_performance()["api_caches"]["matrix_data"]
+    assert stats["entries"] == 2 and stats["evictions"] == 2
+    api._invalidate_matrix_cache()
@@ -0,0 +1,86 @@
+"""Date/column pushdown in data_loader must return exactly what a full read + apply_date_filters returns."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+QTSW2_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(QTSW2_ROOT))
+
+from modules.matrix import data_loader
+from modules.matrix.data_loader import _normalize_date_to_trade_date, apply_date_filters, load_stream_data
+
+TIMES = ["07:30", "08:00", "09:00"]
+
+
+def _write_monthly_files(root: Path, stream_id: str = "ES1", months: int = 5, string_dates_month: int = None):
+    """Write merger-style monthly files (Date stored as datetime, several row groups per file)."""
+    rng = np.random.default_rng(1)
+    days = pd.bdate_range("2024-01-01", periods=months * 22)
+    df = pd.DataFrame([
+        {"Date": d, "Time": t, "Session": "S1", "Instrument": "ES", "Stream": stream_id,
+         "Result": rng.choice(["Win", "Loss", "BE", "NoTrade"]), "Profit": float(rng.normal()),
+         "Target": 10.0, "Range": 20.0}
+        for d in days for t in TIMES
+    ])
+    for (year, month), month_df in df.groupby([df["Date"].dt.year, df["Date"].dt.month]):
+        year_dir = root / stream_id / str(year)
+        year_dir.mkdir(parents=True, exist_ok=True)
+        if month == string_dates_month:
+            month_df = month_df.assign(Date=month_df["Date"].dt.strftime("%Y-%m-%d"))
+        month_df.to_parquet(year_dir / f"{stream_id}_an_{year}_{month:02d}.parquet", index=False, row_group_size=15)
+    return df
+
+
+def _reference(root: Path, stream_id: str, **date_args) -> pd.DataFrame:
+    frames = []
+    for path in sorted((root / stream_id).glob("*/*.parquet")):
+        df = _normalize_date_to_trade_date(pd.read_parquet(path), stream_id)
+        df = apply_date_filters(df, **date_args)
+        if not df.empty:
+            frames.append(df)
+    return pd.concat(frames, ignore_index=True)
+
+
+def _loaded(root: Path, stream_id: str, **kwargs) -> pd.DataFrame:
+    success, frames, _ = load_stream_data(stream_id, root, **kwargs)
+    assert success
+    return pd.concat(frames, ignore_index=True)
+
+
+@pytest.mark.parametrize("date_args", [
+    {},
+    {"specific_date": "2024-03-14"},
+    {"start_date": "2024-02-15"},
+    {"end_date": "2024-02-01"},
+    {"start_date": "2024-01-31", "end_date": "2024-04-01"},
+])
+def test_pushdown_matches_full_read(tmp_path, date_args):
+    _write_monthly_files(tmp_path, string_dates_month=2)
+    expected = _reference(tmp_path, "ES1", **date_args)
+    pd.testing.assert_frame_equal(_loaded(tmp_path, "ES1", **date_args), expected)
+
+
+def test_files_outside_window_are_not_opened(tmp_path, monkeypatch):
+    _write_monthly_files(tmp_path)
+    opened = []
+    real_read_parquet = pd.read_parquet
+
+    def recording_read_parquet(path, *args, **kwargs):
+        opened.append(Path(path).name)
+        return real_read_parquet(path, *args, **kwargs)
+
+    monkeypatch.setattr(data_loader.pd, "read_parquet", recording_read_parquet)
+    _loaded(tmp_path, "ES1", specific_date="2024-03-14")
+    assert opened == ["ES1_an_2024_03.parquet"]
+
+
+def test_column_projection_keeps_required_columns(tmp_path):
+    _write_monthly_files(tmp_path)
+    df = _loaded(tmp_path, "ES1", start_date="2024-03-01", columns=["Time", "Result"])
+    assert list(df.columns) == ["Time", "Result", "Date", "Stream", "trade_date"]
+    assert df["trade_date"].min() == pd.Timestamp("2024-03-01")
+
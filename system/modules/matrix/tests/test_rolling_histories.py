@@ -0,0 +1,86 @@
+"""Vectorized rolling histories must match update_time_slot_history day by day (incl. checkpoint restore)."""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+QTSW2_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(QTSW2_ROOT))
+
+from modules.matrix.history_manager import (
+    ROLLING_WINDOW_SIZE, build_rolling_histories, update_time_slot_history
+)
+from modules.matrix.checkpoint_manager import CheckpointManager
+from modules.matrix.sequencer_logic import process_stream_daily
+
+TIMES = ["07:30", "08:00", "09:00"]
+
+
+def _reference(times, scores, initial):
+    histories = {t: list(initial.get(t, [])) for t in times}
+    sums = []
+    for day_scores in scores:
+        for t, score in zip(times, day_scores):
+            update_time_slot_history(histories, t, int(score))
+        sums.append([sum(histories[t]) for t in times])
+    return np.array(sums, dtype=np.int64).reshape(len(scores), len(times)), histories
+
+
+@pytest.mark.parametrize("initial", [
+    {},
+    {"07:30": [1, -2, 0], "08:00": [1, 1, 1], "09:00": [0, 0, -2]},
+    {"07:30": [1] * 20, "08:00": [-2] * ROLLING_WINDOW_SIZE, "09:00": [0] * 12},
+])
+@pytest.mark.parametrize("n_days", [0, 1, 5, 40])
+def test_matches_update_time_slot_history(initial, n_days):
+    rng = np.random.default_rng(n_days)
+    scores = rng.choice([1, -2, 0], size=(n_days, len(TIMES)))
+    expected_sums, expected_histories = _reference(TIMES, scores, initial)
+
+    sums, histories = build_rolling_histories(TIMES, scores, initial)
+
+    np.testing.assert_array_equal(sums, expected_sums)
+    assert histories == expected_histories
+    assert all(type(v) is int for hist in histories.values() for v in hist)
+
+
+def _stream_days(n_days, seed):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for d in pd.bdate_range("2025-01-01", periods=n_days):
+        for t in TIMES:
+            if rng.random() < 0.85:
+                rows.append({
+                    "Stream": "ES1", "trade_date": d, "Time": t, "Session": "S1",
+                    "Result": rng.choice(["Win", "Loss", "BE", "NoTrade"]),
+                })
+    return pd.DataFrame(rows)
+
+
+def test_checkpoint_restore_is_identical(tmp_path):
+    df = _stream_days(60, seed=3)
+    split = df["trade_date"].unique()[29]
+    filters = {"ES1": {"exclude_times": []}}
+
+    full_trades, full_state = process_stream_daily(df, "ES1", filters, return_state=True)
+
+    first = df[df["trade_date"] <= split].reset_index(drop=True)
+    second = df[df["trade_date"] > split].reset_index(drop=True)
+    _, mid_state = process_stream_daily(first, "ES1", filters, return_state=True)
+
+    manager = CheckpointManager(str(tmp_path))
+    checkpoint_id = manager.create_checkpoint(str(split)[:10], {"ES1": mid_state})
+    restored = manager.load_checkpoint(checkpoint_id)["streams"]["ES1"]
+    assert restored == json.loads(json.dumps(mid_state))
+
+    resumed_trades, resumed_state = process_stream_daily(second, "ES1", filters, initial_state=restored, return_state=True)
+
+    assert resumed_state == full_state
+    pd.testing.assert_frame_equal(
+        pd.DataFrame(resumed_trades).reset_index(drop=True),
+        pd.DataFrame(full_trades[-len(resumed_trades):]).reset_index(drop=True),
+    )
@@ -0,0 +1,74 @@
+"""Rolling resequence must load only the window it needs and pick the same start date as a full history load."""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+QTSW2_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(QTSW2_ROOT))
+
+from modules.matrix.master_matrix_rolling_resequence import _load_resequence_window
+from modules.matrix.trading_days import find_trading_days_back
+
+
+class _RecordingMatrix:
+    """Stands in for MasterMatrix: serves analyzer rows from a frame and records each load's start_date."""
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.loads = []
+
+    def _load_all_streams_with_sequencer_for_state(self, start_date=None):
+        self.loads.append(start_date)
+        if start_date is None:
+            return self.df.copy()
+        return self.df[self.df["trade_date"] >= pd.to_datetime(start_date)].reset_index(drop=True)
+
+
+def _analyzer_rows(days) -> pd.DataFrame:
+    return pd.DataFrame([
+        {"trade_date": d, "Time": t, "Stream": s, "Result": "Win"}
+        for d in days for t in ("07:30", "09:00") for s in ("ES1", "NQ1")
+    ])
+
+
+def _full_history_start(df: pd.DataFrame, resequence_days: int) -> str:
+    latest = df["trade_date"].max().strftime("%Y-%m-%d")
+    return find_trading_days_back(df, latest, resequence_days)
+
+
+def test_window_anchored_on_checkpoint_date():
+    df = _analyzer_rows(pd.bdate_range("2019-01-01", "2025-06-30"))
+    matrix = _RecordingMatrix(df)
+
+    data, start, latest = _load_resequence_window(matrix, "2025-06-20", 40)
+
+    assert start == _full_history_start(df, 40)
+    assert latest == "2025-06-30"
+    assert len(matrix.loads) == 1 and matrix.loads[0] is not None
+    assert matrix.loads[0] <= "2025-06-20"
+    assert data["trade_date"].min() >= pd.Timestamp("2025-01-01")  # Months, not years of history
+    assert (data["trade_date"] >= pd.Timestamp(start)).sum() == (df["trade_date"] >= pd.Timestamp(start)).sum()
+
+
+def test_window_widens_over_gaps_and_falls_back_to_full_history():
+    # A long gap: the first window holds fewer than 40 trading days
+    days = pd.bdate_range("2024-01-01", "2024-06-28").append(pd.bdate_range("2025-03-03", "2025-03-21"))
+    df = _analyzer_rows(days)
+    matrix = _RecordingMatrix(df)
+    _, start, _ = _load_resequence_window(matrix, "2025-03-21", 40)
+    assert start == _full_history_start(df, 40)
+    assert 1 < len(matrix.loads) and None not in matrix.loads
+
+    # Not enough history anywhere: every window, then the full history, then give up
+    short = _analyzer_rows(pd.bdate_range("2025-03-03", "2025-03-21"))
+    matrix = _RecordingMatrix(short)
+    _, start, latest = _load_resequence_window(matrix, "2025-03-21", 40)
+    assert start is None and latest == "2025-03-21"
+    assert matrix.loads[-1] is None
+
+    # No checkpoint date: a single full load
+    matrix = _RecordingMatrix(df)
+    _, start, _ = _load_resequence_window(matrix, None, 40)
+    assert matrix.loads == [None] and start == _full_history_start(df, 40)
@@ -0,0 +1,91 @@
+"""Timetable RS table: cached RS must equal a full reload, and only new/modified files are re-read."""
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+SYSTEM_ROOT = REPO_ROOT / "system"
+sys.path.insert(0, str(SYSTEM_ROOT))
+
+from modules.matrix.config import SLOT_ENDS  # noqa: E402
+from modules.timetable.rs_table import RsTable  # noqa: E402
+
+
+def _write_month(stream_dir: Path, stream: str, year: int, month: int, seed: int) -> Path:
+    rng = np.random.default_rng(seed)
+    days = pd.bdate_range(f"{year}-{month:02d}-01", periods=18)
+    rows = []
+    for session, slots in SLOT_ENDS.items():
+        for day in days:
+            for slot in slots:
+                rows.append({
+                    "trade_date": day,
+                    "Session": session,
+                    "Time": slot,
+                    "Result": rng.choice(["Win", "LOSS", " be ", None, "NoTrade"]),
+                    "Profit": float(rng.normal()),
+                })
+    path = stream_dir / str(year) / f"{stream}_an_{year}_{month:02d}.parquet"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame(rows).to_parquet(path, index=False)
+    return path
+
+
+def _reference_rs(stream_dir: Path, session: str, lookback: int = 13):
+    """Full reload, as TimetableEngine.calculate_rs_for_stream did before the RS table."""
+    files = sorted(stream_dir.rglob("*.parquet"), reverse=True)[:10]
+    df = pd.concat([pd.read_parquet(f) for f in files], ignore_index=True)
+    df = df[df["Session"] == session].copy().sort_values("trade_date").reset_index(drop=True)
+    df["_score"] = df["Result"].fillna("").astype(str).str.strip().str.upper().map({"WIN": 1, "LOSS": -2}).fillna(0)
+    out = {}
+    for slot in SLOT_ENDS[session]:
+        trades = df[df["Time"] == slot].tail(lookback)
+        out[slot] = 0.0 if trades.empty else float(trades["_score"].sum())
+    return out
+
+
+def test_rs_table_matches_full_reload_and_loads_incrementally(tmp_path):
+    stream_dir = tmp_path / "ES1"
+    for i, month in enumerate(range(1, 12)):
+        _write_month(stream_dir, "ES1", 2025, month, seed=i)
+
+    table = RsTable()
+    for session in SLOT_ENDS:
+        assert table.rolling_sums(stream_dir, "ES1", session, SLOT_ENDS[session]) == _reference_rs(stream_dir, session)
+    assert table.file_loads == 10  # the 10 most recent months, read once for both sessions
+
+    # Cached: no re-read
+    table.rolling_sums(stream_dir, "ES1", "S1", SLOT_ENDS["S1"])
+    assert table.file_loads == 10
+
+    # New month lands: only that file is read, the oldest drops out of the window
+    _write_month(stream_dir, "ES1", 2026, 1, seed=99)
+    for session in SLOT_ENDS:
+        assert table.rolling_sums(stream_dir, "ES1", session, SLOT_ENDS[session]) == _reference_rs(stream_dir, session)
+    assert table.file_loads == 11
+
+    # Modified file (new mtime): only that file is re-read
+    path = _write_month(stream_dir, "ES1", 2025, 12, seed=123)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    for session in SLOT_ENDS:
+        assert table.rolling_sums(stream_dir, "ES1", session, SLOT_ENDS[session]) == _reference_rs(stream_dir, session)
+    assert table.file_loads == 12
+
+
+def test_rs_table_skips_contract_violations(tmp_path):
+    stream_dir = tmp_path / "GC2"
+    _write_month(stream_dir, "GC2", 2025, 1, seed=1)
+    bad = stream_dir / "2025" / "GC2_an_2025_02.parquet"
+    pd.DataFrame({"Session": ["S1"], "Time": ["07:30"], "Result": ["Win"], "trade_date": ["2025-02-03"]}).to_parquet(bad)
+
+    table = RsTable()
+    rs = table.rolling_sums(stream_dir, "GC2", "S1", SLOT_ENDS["S1"])
+    bad.unlink()
+    assert rs == _reference_rs(stream_dir, "S1")
+    assert table.rolling_sums(tmp_path / "missing", "GC2", "S1", SLOT_ENDS["S1"]) == {}
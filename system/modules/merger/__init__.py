@@ -2,24 +2,13 @@
 Data Merger Module
 """
 
-from .merger import DataMerger
-
 __all__ = ['DataMerger']
 
 
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+def __getattr__(name):
+    # Imported on first use: merger.py configures logging on import, readers of the
+    # delta files (modules.merger.monthly_deltas) must not pick that up
+    if name == 'DataMerger':
+        from .merger import DataMerger
+        return DataMerger
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
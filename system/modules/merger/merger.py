@@ -58,7 +58,21 @@ Process:
    - Splits data by session automatically (S1 → CL1, S2 → CL2)
    - Prefers new data: when duplicate records exist, keeps the new one and removes the old one
    
-5. Idempotency semantics:
+5. Append mode (--append):
+   - A month that already has a monthly file gets the new rows as a delta file
+     (<year>/_deltas/<stream>_an_<year>_<month>.<seq>.parquet) instead of a rewrite
+   - Readers (matrix data loader, timetable engine) merge base + deltas on the fly,
+     last writer wins on the dedup key (see monthly_deltas.py)
+   - Months with many deltas are compacted into the monthly file on a background thread;
+     --compact folds all outstanding deltas
+
+6. Instrument scope (--instruments ES NQ):
+   - Only daily files whose Instrument values all belong to the scope are merged, so
+     per-instrument pipeline flows can merge as soon as their own analyzer run is done
+   - Merged files are deleted; the daily folder is removed only when it is empty and is
+     never marked processed (other instruments may still be writing into it)
+
+7. Idempotency semantics:
    - Folder processing is "best effort per instrument/session group"
    - If any group fails with schema error, folder is not marked processed and remains for remediation
    - Partial writes are safe to reprocess (atomic writes + deterministic dedup prevent double-writes)
@@ -68,15 +82,24 @@ Date: 2025
 """
 
 import os
+import re
 import sys
 import logging
 import shutil
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from typing import Iterable, List, Dict, Optional, Set, Tuple
 import pandas as pd
 import json
 
+try:
+    from . import monthly_deltas
+except ImportError:
+    # Run as a script (python system/modules/merger/merger.py)
+    import monthly_deltas
+
 # Base paths (must be defined before logging setup)
 # merger.py lives at system/modules/merger/merger.py, so repo root is parents[3].
 # Using the repo root keeps merger aligned with the rest of the pipeline, which
@@ -111,6 +134,9 @@ MANUAL_ANALYZER_RUNS_DIR = DATA_DIR / "manual_analyzer_runs"
 ANALYZER_RUNS_DIR = DATA_DIR / "analyzed"
 PROCESSED_LOG_FILE = DATA_DIR / "merger_processed.json"
 
+# Empty output of an analyzer run without trades (see analyzer/scripts/run_data_processed.py)
+NO_RESULTS_FILE_PATTERN = re.compile(r"^breakout_(?P<instrument>[A-Za-z0-9]+)_no_results_")
+
 
 class DataMerger:
     """
@@ -123,10 +149,23 @@ class DataMerger:
     # Required columns for analyzer output schema
     REQUIRED_COLUMNS = ["Date", "Time", "Session", "Instrument"]
     
-    def __init__(self):
-        """Initialize the data merger."""
+    def __init__(self, append_mode: bool = False, instruments: Optional[Iterable[str]] = None):
+        """
+        Initialize the data merger.
+        
+        Args:
+            append_mode: Write new rows of existing months as delta files instead of
+                rewriting the monthly file (see monthly_deltas.py)
+            instruments: Only merge daily files of these instruments (None = all files)
+        """
+        self.append_mode = append_mode
+        self.instruments: Optional[Set[str]] = (
+            {str(inst).upper().strip() for inst in instruments} if instruments is not None else None
+        )
         self.processed_log = self._load_processed_log()
         self._ensure_directories()
+        self._compactor: Optional[ThreadPoolExecutor] = None
+        self._compactions = []
     
     def _ensure_directories(self):
         """
@@ -324,8 +363,12 @@ class DataMerger:
                     month_df_clean = month_df.drop(columns=['Year', 'Month'])
                     monthly_file = self._get_monthly_file_path(instrument, session, year, month, "analyzer")
                     
-                    # Merge with existing monthly file
-                    combined_df = self._merge_with_existing_monthly_file(month_df_clean, monthly_file, "analyzer")
+                    # Merge with existing monthly file (append mode: the new rows only, written as a delta)
+                    append = self.append_mode and monthly_file.exists()
+                    if append:
+                        combined_df = month_df_clean
+                    else:
+                        combined_df = self._merge_with_existing_monthly_file(month_df_clean, monthly_file, "analyzer")
                     
                     # Validate combined data
                     if 'Instrument' in combined_df.columns:
@@ -337,9 +380,12 @@ class DataMerger:
                     
                     # Write monthly file
                     try:
-                        self._write_monthly_file(combined_df, monthly_file)
+                        if append:
+                            self._write_monthly_delta(combined_df, monthly_file)
+                        else:
+                            self._write_monthly_file(combined_df, monthly_file)
                         success_count += 1
-                        logger.info(f"Created monthly file for {instrument}{session[-1]} - {year}-{month:02d}: {len(combined_df)} rows (from manual run)")
+                        logger.info(f"{'Appended to' if append else 'Created'} monthly file for {instrument}{session[-1]} - {year}-{month:02d}: {len(combined_df)} rows (from manual run)")
                     except Exception as e:
                         logger.error(f"Error writing monthly file for {instrument}{session[-1]} {year}-{month:02d}: {e}")
             except ValueError:
@@ -384,6 +430,46 @@ class DataMerger:
         return sorted(folder.glob("*.parquet"))
     
     
+    def _file_instruments(self, file_path: Path) -> Optional[Set[str]]:
+        """Instrument values of a daily file (reads only the Instrument column; None if unreadable)."""
+        try:
+            values = pd.read_parquet(file_path, columns=["Instrument"])["Instrument"].dropna().unique()
+        except Exception:
+            return None
+        if len(values) == 0:
+            # No-results files carry no rows: the instrument is only in the file name
+            match = NO_RESULTS_FILE_PATTERN.match(file_path.name)
+            return {match.group("instrument").upper()} if match else set()
+        return {str(inst).upper().strip() for inst in values}
+    
+    def _remove_scoped_files(self, daily_folder: Path, parquet_files: List[Path]) -> bool:
+        """Delete a scoped merge's daily files and the folder if nothing else is left in it."""
+        for file_path in parquet_files:
+            try:
+                file_path.unlink()
+            except OSError as e:
+                logger.error(f"Error deleting merged file {file_path}: {e}")
+        # Other flows' analyzers may still be writing into the folder: remove it only if it
+        # is empty at that instant (os.rmdir is atomic) and never mark it processed
+        try:
+            os.rmdir(daily_folder)
+            logger.info(f"Deleted emptied analyzer folder: {daily_folder}")
+        except OSError:
+            pass  # Not empty: files of other instruments remain for their own merges
+        return True
+    
+    def _scope_files(self, parquet_files: List[Path]) -> List[Path]:
+        """Daily files belonging to the instrument scope (all files when unscoped)."""
+        if self.instruments is None:
+            return parquet_files
+        scoped = []
+        for file_path in parquet_files:
+            file_instruments = self._file_instruments(file_path)
+            # Unreadable files (e.g. still being written by another flow) are left for a later run
+            if file_instruments and file_instruments <= self.instruments:
+                scoped.append(file_path)
+        return scoped
+    
     def _get_monthly_file_path(self, instrument: str, session: str, year: int, month: int, file_type: str) -> Path:
         """Get the monthly file path for an instrument, session, year, and month."""
         # Validate session is S1 or S2
@@ -537,23 +623,15 @@ class DataMerger:
         updates = 0
         
         if available_update_cols:
-            # Group by dedup key and check if update fields differ
-            grouped = df.groupby(available_cols)
-            for key, group in grouped:
-                if len(group) > 1:
-                    # Check if update fields differ within this group
-                    is_update = False
-                    for update_col in available_update_cols:
-                        unique_values = group[update_col].dropna().unique()
-                        if len(unique_values) > 1:
-                            is_update = True
-                            updates += len(group) - 1
-                            logger.debug(f"Found update for {key}: {update_col} differs ({unique_values})")
-                            break
-                    
-                    if not is_update:
-                        # All update fields are the same - it's a true duplicate
-                        true_duplicates += len(group) - 1
+            # Only rows whose dedup key occurs more than once can be updates or duplicates
+            repeated = df[df.duplicated(subset=available_cols, keep=False)]
+            if not repeated.empty:
+                grouped = repeated.groupby(available_cols)
+                extra_rows = grouped.size() - 1
+                # An update when any update field has more than one distinct (non-null) value
+                is_update = (grouped[available_update_cols].nunique() > 1).any(axis=1)
+                updates = int(extra_rows[is_update].sum())
+                true_duplicates = int(extra_rows[~is_update].sum())
             
             if updates > 0:
                 logger.info(f"Found {updates} rows with same dedup key but different profit/ExitTime/ExitPrice - treating as updates (will replace old data)")
@@ -695,6 +773,8 @@ class DataMerger:
         """Merge new data with existing monthly file."""
         if monthly_file.exists():
             try:
+                # Deltas of an earlier append-mode run are folded in first
+                monthly_deltas.compact(monthly_file)
                 existing_df = pd.read_parquet(monthly_file)
                 logger.info(f"Loaded existing monthly file: {len(existing_df)} rows")
                 
@@ -747,6 +827,42 @@ class DataMerger:
                 temp_file.unlink()
             raise
     
+    def _write_monthly_delta(self, df: pd.DataFrame, monthly_file: Path):
+        """Write new rows of an existing month as a delta file; schedule compaction when deltas pile up."""
+        if df.empty:
+            logger.warning(f"Empty DataFrame. Not writing delta for {monthly_file}")
+            return
+        
+        with monthly_deltas.month_lock(monthly_file):
+            delta_path = monthly_deltas.write_delta(df, monthly_file)
+            pending = len(monthly_deltas.delta_files(monthly_file))
+        logger.info(f"Wrote {len(df)} rows to {delta_path} ({pending} pending delta(s))")
+        
+        if pending >= monthly_deltas.COMPACT_AFTER_DELTAS:
+            if self._compactor is None:
+                self._compactor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="merger-compact")
+            self._compactions.append(self._compactor.submit(monthly_deltas.compact, monthly_file))
+    
+    def wait_for_compactions(self):
+        """Block until scheduled compactions are done (failures are logged; deltas stay readable)."""
+        for future in self._compactions:
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Background compaction failed: {e}")
+        self._compactions = []
+    
+    def compact_all(self) -> int:
+        """Fold all outstanding deltas into their monthly files. Returns the number of months compacted."""
+        compacted = 0
+        for monthly_file in monthly_deltas.monthly_files_with_deltas(ANALYZER_RUNS_DIR):
+            try:
+                if monthly_deltas.compact(monthly_file):
+                    compacted += 1
+            except Exception as e:
+                logger.error(f"Error compacting {monthly_file}: {e}")
+        return compacted
+    
     def process_analyzer_folder(self, daily_folder: Path) -> bool:
         """Process a single analyzer daily folder."""
         folder_path_str = str(daily_folder)
@@ -781,6 +897,12 @@ class DataMerger:
             logger.warning(f"No Parquet files found in {daily_folder}")
             return False
         
+        if self.instruments is not None:
+            parquet_files = self._scope_files(parquet_files)
+            if not parquet_files:
+                logger.info(f"No files for {sorted(self.instruments)} in {daily_folder.name}")
+                return True
+        
         logger.info(f"Processing analyzer folder {daily_folder.name}: {len(parquet_files)} files")
         
         # Merge daily files by instrument
@@ -801,6 +923,10 @@ class DataMerger:
             return False
         
         if not merged_data:
+            if self.instruments is not None and all(
+                    NO_RESULTS_FILE_PATTERN.match(file_path.name) for file_path in parquet_files):
+                logger.info(f"Only no-results files for {sorted(self.instruments)} in {daily_folder.name}")
+                return self._remove_scoped_files(daily_folder, parquet_files)
             logger.warning(f"No valid data found in analyzer folder {daily_folder.name}")
             return False
         
@@ -867,8 +993,12 @@ class DataMerger:
                     
                     monthly_file = self._get_monthly_file_path(instrument, session, year, month, "analyzer")
                     
-                    # Merge with existing monthly file
-                    combined_df = self._merge_with_existing_monthly_file(month_df_clean, monthly_file, "analyzer")
+                    # Merge with existing monthly file (append mode: the new rows only, written as a delta)
+                    append = self.append_mode and monthly_file.exists()
+                    if append:
+                        combined_df = month_df_clean
+                    else:
+                        combined_df = self._merge_with_existing_monthly_file(month_df_clean, monthly_file, "analyzer")
                     
                     # Validate combined data AFTER merging (to catch corrupted existing files)
                     if 'Instrument' in combined_df.columns:
@@ -887,9 +1017,12 @@ class DataMerger:
                     
                     # Write monthly file
                     try:
-                        self._write_monthly_file(combined_df, monthly_file)
+                        if append:
+                            self._write_monthly_delta(combined_df, monthly_file)
+                        else:
+                            self._write_monthly_file(combined_df, monthly_file)
                         success_count += 1
-                        logger.info(f"Created monthly file for {instrument}{session[-1]} - {year}-{month:02d}: {len(combined_df)} rows")
+                        logger.info(f"{'Appended to' if append else 'Created'} monthly file for {instrument}{session[-1]} - {year}-{month:02d}: {len(combined_df)} rows")
                     except Exception as e:
                         logger.error(f"Error writing monthly file for {instrument}{session[-1]} {year}-{month:02d}: {e}")
             except ValueError:
@@ -904,6 +1037,10 @@ class DataMerger:
                 logger.error(error_msg)
                 raise ValueError(error_msg) from e
         
+        if success_count > 0 and self.instruments is not None:
+            # Scoped merge: remove only this scope's files (no-results files included)
+            return self._remove_scoped_files(daily_folder, parquet_files)
+        
         if success_count > 0:
             # Mark folder as processed
             self._mark_folder_processed("analyzer", folder_path_str)
@@ -936,6 +1073,8 @@ class DataMerger:
         
         logger.info(f"Processed {analyzer_success}/{len(analyzer_folders)} analyzer folders")
         
+        self.wait_for_compactions()
+        
         logger.info("=" * 60)
         logger.info("Data Merger / Consolidator completed")
         logger.info("=" * 60)
@@ -943,7 +1082,20 @@ class DataMerger:
 
 def main():
     """Main entry point."""
-    merger = DataMerger()
+    parser = argparse.ArgumentParser(description="Merge daily analyzer output into monthly files")
+    parser.add_argument('--append', action='store_true',
+                        help='Write new rows of existing months as delta files instead of rewriting them')
+    parser.add_argument('--compact', action='store_true',
+                        help='Only fold outstanding delta files into their monthly files')
+    parser.add_argument('--instruments', nargs='+', default=None,
+                        help='Only merge daily files of these instruments (e.g. --instruments ES NQ)')
+    args = parser.parse_args()
+    
+    merger = DataMerger(append_mode=args.append, instruments=args.instruments)
+    if args.compact:
+        compacted = merger.compact_all()
+        logger.info(f"Compacted deltas of {compacted} monthly file(s)")
+        return
     merger.run()
 
 
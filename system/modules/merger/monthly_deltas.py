@@ -0,0 +1,231 @@
+"""
+Merger - Monthly Delta Files
+
+Append mode of the merger: instead of reading the whole monthly file, deduplicating and
+rewriting it on every merge, each merge writes its new rows as a small delta file next to
+the monthly file. Readers see base + deltas resolved on the fly; compaction folds the
+deltas back into the base off the merge path.
+
+Layout (per monthly file {stream_dir}/{year}/{stream}_an_{year}_{month}.parquet):
+- {stream_dir}/{year}/_deltas/{stream}_an_{year}_{month}.{seq:06d}.parquet
+  seq increases with every delta of the month; deltas never match the monthly file glob
+  ({stream}_an_*.parquet in the year folder), so readers unaware of deltas only see the base
+
+Merged view (read_merged): base rows, then the rows of each delta in seq order; the last
+writer wins on (Date, Time, Session, Instrument, Stream) and rows are sorted by
+(Date, Time) - the rows a read-modify-write merge of the same inputs would have written.
+
+Compaction writes the merged view as the new base (atomic replace), then deletes the
+deltas it folded in. A reader between the two steps sees the new base plus deltas already
+contained in it, which resolves to the same rows; a reader whose deltas disappear while
+it reads starts over.
+"""
+
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+try:
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DELTA_DIR_NAME = "_deltas"
+
+# Last-writer-wins key (columns missing from a file are left out, as in the merger's dedup)
+DEDUP_KEY = ["Date", "Time", "Session", "Instrument", "Stream"]
+SORT_COLUMNS = ["Date", "Time"]
+
+# Deltas per month before the merger schedules a compaction
+COMPACT_AFTER_DELTAS = 8
+
+_READ_ATTEMPTS = 3
+
+_month_locks: Dict[Path, threading.Lock] = {}
+_month_locks_guard = threading.Lock()
+
+
+def month_lock(monthly_file: Path) -> threading.Lock:
+    """Lock serializing delta writes and compaction of one monthly file (per process)"""
+    key = Path(monthly_file).absolute()
+    with _month_locks_guard:
+        lock = _month_locks.get(key)
+        if lock is None:
+            lock = _month_locks[key] = threading.Lock()
+        return lock
+
+
+def is_delta_file(path: Path) -> bool:
+    """True for delta files (excluded when listing monthly files recursively)"""
+    return DELTA_DIR_NAME in Path(path).parts
+
+
+def _delta_pattern(monthly_file: Path) -> "re.Pattern":
+    return re.compile(rf"^{re.escape(Path(monthly_file).stem)}\.(\d+)\.parquet$")
+
+
+def delta_files(monthly_file: Path) -> List[Path]:
+    """Delta files of a monthly file in seq order"""
+    monthly_file = Path(monthly_file)
+    delta_dir = monthly_file.parent / DELTA_DIR_NAME
+    if not delta_dir.is_dir():
+        return []
+    pattern = _delta_pattern(monthly_file)
+    found = []
+    for path in delta_dir.iterdir():
+        match = pattern.match(path.name)
+        if match:
+            found.append((int(match.group(1)), path))
+    return [path for _, path in sorted(found)]
+
+
+def signature(monthly_file: Path) -> Optional[Tuple[int, int, Tuple[str, ...]]]:
+    """(mtime_ns, size, delta file names) of a monthly file; None when the base is gone"""
+    try:
+        stat = Path(monthly_file).stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, tuple(path.name for path in delta_files(monthly_file)))
+
+
+def write_delta(df: pd.DataFrame, monthly_file: Path) -> Path:
+    """Write new rows of a month as its next delta file (atomic)"""
+    monthly_file = Path(monthly_file)
+    existing = delta_files(monthly_file)
+    seq = int(_delta_pattern(monthly_file).match(existing[-1].name).group(1)) + 1 if existing else 1
+    delta_path = monthly_file.parent / DELTA_DIR_NAME / f"{monthly_file.stem}.{seq:06d}.parquet"
+    delta_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = delta_path.with_name(delta_path.name + ".tmp")
+    try:
+        df.to_parquet(temp_file, index=False, compression='snappy')
+        os.replace(temp_file, delta_path)
+    except Exception:
+        if temp_file.exists():
+            temp_file.unlink()
+        raise
+    return delta_path
+
+
+def last_writer_wins(df: pd.DataFrame) -> pd.DataFrame:
+    """Keep the last row per dedup key, sorted by (Date, Time)"""
+    key = [c for c in DEDUP_KEY if c in df.columns]
+    if key:
+        df = df.drop_duplicates(subset=key, keep='last')
+    sort_cols = [c for c in SORT_COLUMNS if c in df.columns]
+    if sort_cols:
+        df = df.sort_values(by=sort_cols, ascending=[True] * len(sort_cols))
+    return df.reset_index(drop=True)
+
+
+def _read_part(path: Path, columns: Optional[Sequence[str]], filters, date_type) -> pd.DataFrame:
+    if columns is None and filters is None:
+        return pd.read_parquet(path)
+    if not PYARROW_AVAILABLE:
+        df = pd.read_parquet(path)
+        return df if columns is None else df[[c for c in columns if c in df.columns]]
+    schema = pq.read_schema(path)
+    read_columns = None if columns is None else [c for c in columns if c in schema.names]
+    # Date predicates are built for the base file's Date type
+    if filters and ('Date' not in schema.names or schema.field('Date').type != date_type):
+        filters = None
+    return pd.read_parquet(path, columns=read_columns, filters=filters or None)
+
+
+def read_merged(monthly_file: Path, columns: Optional[Sequence[str]] = None,
+                filters: Optional[List[Tuple]] = None) -> pd.DataFrame:
+    """
+    Merged view of a monthly file and its deltas.
+
+    Without deltas this is a plain read of the monthly file.
+
+    Args:
+        monthly_file: Monthly (base) parquet file
+        columns: Column projection (None = all columns; names missing from a file are skipped)
+        filters: pyarrow filters on Date, pushed down to every file
+
+    Raises:
+        FileNotFoundError: neither the monthly file nor any delta exists
+    """
+    monthly_file = Path(monthly_file)
+    for attempt in range(_READ_ATTEMPTS):
+        deltas = delta_files(monthly_file)
+        if not deltas:
+            if filters:
+                return pd.read_parquet(monthly_file, columns=columns, filters=filters)
+            return pd.read_parquet(monthly_file, columns=columns)
+
+        wanted = None
+        if columns is not None:
+            wanted = list(dict.fromkeys(list(columns) + DEDUP_KEY + SORT_COLUMNS))
+        date_type = None
+        if filters and PYARROW_AVAILABLE and monthly_file.exists():
+            schema = pq.read_schema(monthly_file)
+            date_type = schema.field('Date').type if 'Date' in schema.names else None
+        try:
+            parts = []
+            if monthly_file.exists():
+                parts.append(_read_part(monthly_file, wanted, filters, date_type))
+            for path in deltas:
+                parts.append(_read_part(path, wanted, filters, date_type))
+        except FileNotFoundError:
+            # Compacted while reading: the base now contains the deltas
+            logger.debug(f"Deltas of {monthly_file.name} compacted during read, retrying ({attempt + 1})")
+            continue
+
+        parts = [part for part in parts if not part.empty] or parts[:1]
+        merged = last_writer_wins(pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0])
+        if columns is not None:
+            merged = merged[[c for c in columns if c in merged.columns]]
+        return merged
+    raise RuntimeError(f"Deltas of {monthly_file} kept changing during {_READ_ATTEMPTS} read attempts")
+
+
+def compact(monthly_file: Path) -> int:
+    """
+    Fold the deltas of a monthly file into its base.
+
+    Returns:
+        Number of deltas folded in (0 when there were none)
+    """
+    monthly_file = Path(monthly_file)
+    with month_lock(monthly_file):
+        deltas = delta_files(monthly_file)
+        if not deltas:
+            return 0
+        merged = read_merged(monthly_file)
+        temp_file = monthly_file.with_suffix('.tmp.parquet')
+        try:
+            merged.to_parquet(temp_file, index=False, compression='snappy')
+            os.replace(temp_file, monthly_file)
+        except Exception:
+            if temp_file.exists():
+                temp_file.unlink()
+            raise
+        for path in deltas:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+    logger.info(f"Compacted {len(deltas)} delta(s) into {monthly_file.name}: {len(merged)} rows")
+    return len(deltas)
+
+
+def monthly_files_with_deltas(analyzer_runs_dir: Path) -> List[Path]:
+    """Monthly files that have at least one delta"""
+    analyzer_runs_dir = Path(analyzer_runs_dir)
+    if not analyzer_runs_dir.is_dir():
+        return []
+    monthly = set()
+    for delta_dir in analyzer_runs_dir.glob(f"*/*/{DELTA_DIR_NAME}"):
+        for path in delta_dir.glob("*.parquet"):
+            stem = path.name.rsplit(".", 2)[0]
+            monthly.add(delta_dir.parent / f"{stem}.parquet")
+    return sorted(monthly)
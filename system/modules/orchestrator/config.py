@@ -45,6 +45,11 @@ class OrchestratorConfig:
     # Event bus
     event_buffer_size: int = 1000
     
+    # Pipelined mode: each instrument runs translator -> analyzer -> merger on its own
+    # (no global barrier between stages), at most max_instrument_concurrency at a time
+    pipelined: bool = False
+    max_instrument_concurrency: int = 3
+    
     @classmethod
     def from_environment(cls, qtsw2_root: Optional[Path] = None) -> 'OrchestratorConfig':
         """Create config from environment"""
@@ -87,7 +92,9 @@ class OrchestratorConfig:
             event_logs_dir=event_logs_dir,
             lock_dir=lock_dir,
             state_file=state_file,
-            stages=stages
+            stages=stages,
+            pipelined=os.getenv("ORCHESTRATOR_PIPELINED", "0").lower() in ("1", "true", "yes"),
+            max_instrument_concurrency=max(1, int(os.getenv("ORCHESTRATOR_MAX_INSTRUMENT_CONCURRENCY", "3")))
         )
 
 
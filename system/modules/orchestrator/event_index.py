@@ -0,0 +1,247 @@
+"""
+Event Index - sidecar time index for pipeline_*.jsonl event files
+
+EventBus.load_jsonl_events_since used to read and parse every line of up to 50 event
+files to serve a 1-24h WebSocket snapshot. The event files stay append-only JSONL (the
+authoritative historical store); this module keeps a small sidecar per file in
+``{event_logs_dir}/.index/`` listing fixed-size blocks of lines:
+
+    [byte_offset, line_count, max_timestamp_epoch]
+
+- A "since cutoff" query seeks straight to the blocks whose newest event is >= cutoff
+- A "last N lines" query (get_events_for_run) seeks to the block holding line total-N
+- Indexing is incremental: only bytes appended since the last query are read
+- A file that shrank or was replaced (rotation/archive) is re-indexed from scratch
+
+Events are not required to be appended in timestamp order; the per-block max timestamp
+keeps the seek correct for late/out-of-order writes.
+"""
+
+import json
+import logging
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+INDEX_DIR_NAME = ".index"
+INDEX_VERSION = 1
+BLOCK_LINES = 256  # Lines per index block
+HEAD_BYTES = 1024  # File prefix (spans whole events, timestamps included) kept to detect a replaced file
+
+NO_TIMESTAMP = float("-inf")
+
+
+def parse_event_timestamp(timestamp_str) -> Optional[datetime]:
+    """
+    Parse an event "timestamp" (ISO-8601; Z suffix and naive values are UTC).
+
+    Returns:
+        Timezone-aware datetime, or None when missing/unparseable
+    """
+    if not timestamp_str:
+        return None
+    try:
+        if timestamp_str.endswith("Z"):
+            timestamp_str = timestamp_str[:-1] + "+00:00"
+        event_time = datetime.fromisoformat(timestamp_str)
+    except (ValueError, AttributeError, TypeError):
+        return None
+    if event_time.tzinfo is None:
+        event_time = event_time.replace(tzinfo=timezone.utc)
+    return event_time
+
+
+class EventFileIndex:
+    """Block index of one pipeline_*.jsonl file (complete lines only)"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.indexed_size = 0
+        self.head = ""
+        self.blocks: List[List] = []  # [offset, line_count, max_ts]
+
+    @property
+    def line_count(self) -> int:
+        return sum(block[1] for block in self.blocks)
+
+    def to_dict(self) -> Dict:
+        return {
+            "version": INDEX_VERSION,
+            "indexed_size": self.indexed_size,
+            "head": self.head,
+            "blocks": [[b[0], b[1], None if b[2] == NO_TIMESTAMP else b[2]] for b in self.blocks],
+        }
+
+    @classmethod
+    def from_dict(cls, path: Path, payload: Dict) -> Optional["EventFileIndex"]:
+        if not isinstance(payload, dict) or payload.get("version") != INDEX_VERSION:
+            return None
+        index = cls(path)
+        index.indexed_size = int(payload.get("indexed_size", 0))
+        index.head = payload.get("head", "")
+        index.blocks = [
+            [int(b[0]), int(b[1]), NO_TIMESTAMP if b[2] is None else float(b[2])]
+            for b in payload.get("blocks", [])
+        ]
+        return index
+
+    def _reset(self) -> None:
+        self.indexed_size = 0
+        self.head = ""
+        self.blocks = []
+
+    def refresh(self) -> bool:
+        """
+        Index lines appended since the last refresh.
+
+        Returns:
+            True when the index changed
+        """
+        try:
+            size = self.path.stat().st_size
+        except OSError:
+            return False
+
+        with open(self.path, "rb") as f:
+            head = f.read(HEAD_BYTES).decode("latin-1")
+            common = min(len(head), len(self.head))
+            replaced = size < self.indexed_size or head[:common] != self.head[:common]
+            if replaced and self.indexed_size:
+                self._reset()
+            if size == self.indexed_size:
+                return replaced
+
+            # Re-scan a trailing partial block so blocks stay BLOCK_LINES long
+            if self.blocks and self.blocks[-1][1] < BLOCK_LINES:
+                self.indexed_size = self.blocks.pop()[0]
+
+            f.seek(self.indexed_size)
+            pos = self.indexed_size
+            block = None
+            for raw_line in f:
+                if not raw_line.endswith(b"\n"):
+                    break  # Partial line (still being written): left for the next refresh
+                if block is None or block[1] >= BLOCK_LINES:
+                    block = [pos, 0, NO_TIMESTAMP]
+                    self.blocks.append(block)
+                block[1] += 1
+                pos += len(raw_line)
+                ts = _line_timestamp(raw_line)
+                if ts is not None and ts > block[2]:
+                    block[2] = ts
+            self.indexed_size = pos
+            self.head = head if len(head) >= len(self.head) else self.head
+        return True
+
+    def read_lines_from(self, offset: int) -> List[bytes]:
+        """All raw lines from byte offset to end of file (including an unterminated last line)"""
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return f.readlines()
+
+    def lines_since(self, cutoff_epoch: float) -> Iterator[bytes]:
+        """Raw lines of blocks that may hold an event at or after cutoff_epoch, in file order"""
+        with open(self.path, "rb") as f:
+            for offset, line_count, max_ts in self.blocks:
+                if max_ts < cutoff_epoch:
+                    continue
+                f.seek(offset)
+                for _ in range(line_count):
+                    yield f.readline()
+            # Unindexed tail (partial last line)
+            f.seek(self.indexed_size)
+            for line in f:
+                yield line
+
+    def tail_lines(self, limit: int) -> List[bytes]:
+        """Same as readlines()[-limit:], reading only the last blocks"""
+        if limit <= 0:
+            return []
+        offset = self.indexed_size
+        needed = limit
+        for block_offset, line_count, _ in reversed(self.blocks):
+            if needed <= 0:
+                break
+            offset = block_offset
+            needed -= line_count
+        lines = self.read_lines_from(offset)
+        return lines[-limit:]
+
+
+def _line_timestamp(raw_line: bytes) -> Optional[float]:
+    try:
+        event = json.loads(raw_line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    if not isinstance(event, dict):
+        return None
+    event_time = parse_event_timestamp(event.get("timestamp"))
+    return event_time.timestamp() if event_time is not None else None
+
+
+class EventIndexStore:
+    """Sidecar indexes for every pipeline_*.jsonl in an event logs directory"""
+
+    def __init__(self, event_logs_dir: Path, logger: Optional[logging.Logger] = None):
+        self.event_logs_dir = Path(event_logs_dir)
+        self.index_dir = self.event_logs_dir / INDEX_DIR_NAME
+        self.logger = logger or logging.getLogger(__name__)
+        self._indexes: Dict[str, EventFileIndex] = {}
+        self._lock = threading.Lock()
+
+    def _sidecar_path(self, jsonl_file: Path) -> Path:
+        return self.index_dir / f"{jsonl_file.name}.idx.json"
+
+    def get(self, jsonl_file: Path) -> EventFileIndex:
+        """Up-to-date index of one event file (loaded from its sidecar when not in memory)"""
+        with self._lock:
+            index = self._indexes.get(jsonl_file.name)
+            if index is None:
+                index = self._load_sidecar(jsonl_file) or EventFileIndex(jsonl_file)
+                self._indexes[jsonl_file.name] = index
+            try:
+                changed = index.refresh()
+            except OSError as e:
+                self.logger.debug(f"[EventIndex] Could not index {jsonl_file.name}: {e}")
+                changed = False
+            if changed:
+                self._save_sidecar(index)
+            return index
+
+    def prune(self, live_files: List[Path]) -> None:
+        """Drop indexes (memory and sidecars) of files that were archived or deleted"""
+        live_names = {p.name for p in live_files}
+        with self._lock:
+            for name in [n for n in self._indexes if n not in live_names]:
+                del self._indexes[name]
+            if not self.index_dir.exists():
+                return
+            for sidecar in self.index_dir.glob("*.idx.json"):
+                if sidecar.name[:-len(".idx.json")] not in live_names:
+                    try:
+                        sidecar.unlink()
+                    except OSError:
+                        pass
+
+    def _load_sidecar(self, jsonl_file: Path) -> Optional[EventFileIndex]:
+        sidecar = self._sidecar_path(jsonl_file)
+        if not sidecar.exists():
+            return None
+        try:
+            with open(sidecar, "r", encoding="utf-8") as f:
+                return EventFileIndex.from_dict(jsonl_file, json.load(f))
+        except Exception as e:
+            self.logger.debug(f"[EventIndex] Ignoring unreadable sidecar {sidecar.name}: {e}")
+            return None
+
+    def _save_sidecar(self, index: EventFileIndex) -> None:
+        try:
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            sidecar = self._sidecar_path(index.path)
+            tmp = sidecar.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(index.to_dict(), f, separators=(",", ":"))
+            tmp.replace(sidecar)
+        except Exception as e:
+            self.logger.debug(f"[EventIndex] Failed to save sidecar for {index.path.name}: {e}")
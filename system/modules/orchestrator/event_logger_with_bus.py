@@ -27,10 +27,13 @@ class EventLoggerWithBus(EventLogger):
         event_bus: EventBus,
         timezone=pytz.timezone("America/Chicago"),
         logger: Optional[logging.Logger] = None,
-        event_loop: Optional[asyncio.AbstractEventLoop] = None
+        event_loop: Optional[asyncio.AbstractEventLoop] = None,
+        instrument: Optional[str] = None
     ):
         super().__init__(log_file, timezone, logger)
         self.event_bus = event_bus
+        # Pipelined runs give each instrument its own logger: every event is tagged with it
+        self.instrument = instrument
         # Store reference to event loop for cross-thread publishing
         # Services run in asyncio.to_thread(), so we need thread-safe scheduling
         # If event_loop is provided, use it; otherwise try to get it
@@ -57,6 +60,9 @@ class EventLoggerWithBus(EventLogger):
         Emit a structured event to the log file AND EventBus.
         Never raises exceptions - failures are logged but don't crash pipeline.
         """
+        if self.instrument:
+            data = {**(data or {}), "instrument": self.instrument}
+        
         # Call parent to write to JSONL first (this always works)
         super().emit(run_id, stage, event, msg, data)
         
@@ -78,6 +84,8 @@ class EventLoggerWithBus(EventLogger):
             event_obj["msg"] = msg
         if data is not None:
             event_obj["data"] = data
+        if self.instrument:
+            event_obj["instrument"] = self.instrument
 
         try:
             # Try to publish to EventBus for real-time updates
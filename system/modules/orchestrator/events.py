@@ -3,6 +3,7 @@ Event Bus - Centralized event publishing and subscription
 """
 
 import asyncio
+import heapq
 import json
 import logging
 import threading
@@ -12,6 +13,8 @@ from typing import Dict, List, Optional, AsyncIterator
 from datetime import datetime, timedelta, timezone
 from collections import deque
 
+from .event_index import EventIndexStore, parse_event_timestamp
+
 
 class EventBus:
     """
@@ -111,6 +114,9 @@ class EventBus:
         self.archive_dir = self.event_logs_dir / "archive"
         self.archive_dir.mkdir(parents=True, exist_ok=True)
 
+        # Sidecar time/line index of the JSONL files (snapshot and per-run reads seek, not scan)
+        self._event_index = EventIndexStore(self.event_logs_dir, self.logger)
+
         # Snapshot cache for past events (for WebSocket snapshot)
         self._snapshot_cache = {
             "data": [],
@@ -430,16 +436,14 @@ class EventBus:
         
         events = []
         try:
-            with open(event_log_file, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-                # Get last N lines
-                for line in lines[-limit:]:
-                    if line.strip():
-                        try:
-                            event = json.loads(line)
-                            events.append(event)
-                        except json.JSONDecodeError:
-                            continue
+            # Last N lines via the sidecar index (seeks to the last blocks only)
+            for line in self._event_index.get(event_log_file).tail_lines(limit):
+                if line.strip():
+                    try:
+                        event = json.loads(line)
+                        events.append(event)
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        continue
         except Exception as e:
             self.logger.error(f"Failed to read events for run {run_id}: {e}")
         
@@ -450,39 +454,43 @@ class EventBus:
         Utility method for reading JSONL history. Not part of live EventBus semantics.
         
         Load all events from JSONL files within the last N hours.
-        This scans all pipeline_*.jsonl files in event_logs_dir, parses timestamps,
-        filters by time window, and returns events sorted chronologically.
+        This reads the pipeline_*.jsonl files in event_logs_dir through their sidecar
+        index (only blocks that reach into the window), filters by time window, and
+        returns events sorted chronologically.
         
         This is a utility method for snapshot loading (e.g., WebSocket 24-hour snapshot).
         It does NOT interact with the live EventBus subscription system.
         
         Args:
             hours: Number of hours to look back (default: 24)
-            max_events: Maximum number of events to return (safety limit, default: 10000)
+            max_events: Maximum number of events to return, most recent kept (safety limit, default: 10000)
             exclude_verbose: If True, exclude verbose events (metric, progress, etc.) from snapshot (default: True)
         
         Returns:
             List of events sorted chronologically (oldest first)
         """
-        from datetime import datetime, timedelta, timezone
-        
         # Safety: snapshot loading must never allocate unbounded memory
-        # We cap at max_events and return early if limit is reached
+        # Matching events are capped at max_events (most recent kept)
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
-        all_events = []
+        # Block skip uses a 1s margin; the exact cutoff is applied per event below
+        cutoff_epoch = cutoff_time.timestamp() - 1.0
+        # Min-heap of (event_time, seq, event) holding the most recent max_events so far:
+        # files are not in event order, so the oldest kept event is evicted as newer ones arrive
+        recent: List = []
+        seq = 0
         
         # Scan all JSONL files matching pattern
-        jsonl_files = list(self.event_logs_dir.glob("pipeline_*.jsonl"))
+        all_jsonl_files = list(self.event_logs_dir.glob("pipeline_*.jsonl"))
+        self._event_index.prune(all_jsonl_files)
         
-        # Performance optimization: Sort by modification time (newest first) and limit file scanning
-        # This way we can stop early if we've found enough recent events
-        jsonl_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
+        # Sort by modification time (newest first) and limit file scanning
+        jsonl_files = sorted(all_jsonl_files, key=lambda f: f.stat().st_mtime, reverse=True)
         
         # Limit to checking most recent 50 files for performance (if there are many files)
         # Most recent events are in the newest files, so this is safe
         if len(jsonl_files) > 50:
             jsonl_files = jsonl_files[:50]
-            self.logger.debug(f"Loading events from last {hours} hours - scanning {len(jsonl_files)} most recent JSONL files (out of {len(list(self.event_logs_dir.glob('pipeline_*.jsonl')))})")
+            self.logger.debug(f"Loading events from last {hours} hours - scanning {len(jsonl_files)} most recent JSONL files (out of {len(all_jsonl_files)})")
         else:
             self.logger.debug(f"Loading events from last {hours} hours - scanning {len(jsonl_files)} JSONL files")
         
@@ -492,76 +500,44 @@ class EventBus:
                 if "archive" in str(jsonl_file):
                     continue
                 
-                # Read file line by line (handles large files efficiently)
-                # Read ALL events from each file - don't stop early based on old events
-                # because files may contain events from multiple runs spanning days/weeks
-                with open(jsonl_file, "r", encoding="utf-8") as f:
-                    for line_num, line in enumerate(f, start=1):
-                        if not line.strip():
-                            continue
-                        
-                        # Early exit if we've collected enough events
-                        if len(all_events) >= max_events:
-                            self.logger.debug(
-                                f"Event snapshot reached limit ({max_events} events) - stopping file scan"
-                            )
-                            break
+                # Only blocks whose newest event is inside the window are read
+                # (files may contain events from multiple runs spanning days/weeks)
+                for line in self._event_index.get(jsonl_file).lines_since(cutoff_epoch):
+                    if not line.strip():
+                        continue
+                    
+                    try:
+                        event = json.loads(line)
                         
-                        try:
-                            event = json.loads(line)
-                            
-                            # Skip verbose events in snapshots (makes UI cleaner)
-                            # These events are still available in live streaming
-                            if exclude_verbose and event.get("event") in self.VERBOSE_EVENTS:
-                                # Check if this is an important stage (always include scheduler/pipeline events)
-                                if event.get("stage") not in self.ALWAYS_LOG_STAGES:
-                                    continue
-                            
-                            # Parse timestamp
-                            timestamp_str = event.get("timestamp")
-                            if not timestamp_str:
-                                continue
-                            
-                            # Parse ISO timestamp (handle both with and without timezone)
-                            try:
-                                # Convert Z suffix to +00:00 for fromisoformat
-                                if timestamp_str.endswith("Z"):
-                                    timestamp_str = timestamp_str[:-1] + "+00:00"
-                                
-                                event_time = datetime.fromisoformat(timestamp_str)
-                                
-                                # Ensure timezone-aware
-                                if event_time.tzinfo is None:
-                                    # Assume UTC if no timezone
-                                    event_time = event_time.replace(tzinfo=timezone.utc)
-                                
-                                # Filter by time window - only include events within the window
-                                if event_time >= cutoff_time:
-                                    all_events.append(event)
-                                    
-                                    # Early exit when we have enough events (faster loading)
-                                    if len(all_events) >= max_events:
-                                        self.logger.debug(
-                                            f"Event snapshot reached limit ({max_events} events) - stopping file scan"
-                                        )
-                                        # Sort and return immediately (most recent events)
-                                        all_events.sort(key=lambda e: e.get("timestamp", ""))
-                                        return all_events[-max_events:]
-                                        
-                            except (ValueError, AttributeError) as e:
-                                # Skip events with unparseable timestamps
-                                self.logger.debug(f"Skipping event with invalid timestamp in {jsonl_file.name} line {line_num}: {e}")
+                        # Skip verbose events in snapshots (makes UI cleaner)
+                        # These events are still available in live streaming
+                        if exclude_verbose and event.get("event") in self.VERBOSE_EVENTS:
+                            # Check if this is an important stage (always include scheduler/pipeline events)
+                            if event.get("stage") not in self.ALWAYS_LOG_STAGES:
                                 continue
-                                
-                        except json.JSONDecodeError as e:
-                            # Skip malformed JSON lines (log warning, continue)
-                            self.logger.warning(f"Malformed JSON in {jsonl_file.name} line {line_num}: {e}")
-                            continue
-                        except Exception as e:
-                            # Skip other errors (file partially written, etc.)
-                            self.logger.debug(f"Error parsing event in {jsonl_file.name} line {line_num}: {e}")
+                        
+                        # Parse ISO timestamp (Z suffix / naive -> UTC); skip unparseable
+                        event_time = parse_event_timestamp(event.get("timestamp"))
+                        if event_time is None:
                             continue
+                        
+                        # Filter by time window - only include events within the window
+                        if event_time >= cutoff_time:
+                            seq += 1
+                            if len(recent) < max_events:
+                                heapq.heappush(recent, (event_time, seq, event))
+                            elif max_events > 0 and (event_time, seq) > recent[0][:2]:
+                                heapq.heapreplace(recent, (event_time, seq, event))
                             
+                    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                        # Skip malformed JSON lines (log warning, continue)
+                        self.logger.warning(f"Malformed JSON in {jsonl_file.name}: {e}")
+                        continue
+                    except Exception as e:
+                        # Skip other errors (file partially written, etc.)
+                        self.logger.debug(f"Error parsing event in {jsonl_file.name}: {e}")
+                        continue
+                        
             except FileNotFoundError:
                 # File was deleted/moved while reading - skip it
                 continue
@@ -571,7 +547,9 @@ class EventBus:
                 continue
         
         # Sort events chronologically (oldest first)
-        all_events.sort(key=lambda e: e.get("timestamp", ""))
+        if seq > len(recent):
+            self.logger.debug(f"Event snapshot reached limit ({max_events} events) - keeping most recent")
+        all_events = [event for _, _, event in sorted(recent, key=lambda item: item[:2])]
         
         # Log summary with time range info
         if all_events:
@@ -1,5 +1,11 @@
 """
 Pipeline Runner - Stage runners with retry logic
+
+Two execution modes:
+- Staged (default): TRANSLATOR -> ANALYZER -> MERGER, each stage over all instruments
+- Pipelined (OrchestratorConfig.pipelined): each instrument flows through the stages on
+  its own, at most max_instrument_concurrency instruments translating/analyzing at once.
+  Merges are serialized (the merger shares its processed log and the daily folders).
 """
 
 import asyncio
@@ -8,8 +14,9 @@ import os
 import sys
 import time
 from pathlib import Path
-from typing import Optional
-from datetime import datetime
+from dataclasses import dataclass
+from typing import List, Optional
+from datetime import datetime, timezone
 
 from .state import PipelineStage, PipelineRunState, RunContext
 from .config import OrchestratorConfig, StageConfig
@@ -62,6 +69,21 @@ def _import_pipeline_services():
 ) = _import_pipeline_services()
 
 
+# Stage order of a run (also the order of the run-level RUNNING_* states)
+STAGE_ORDER = (PipelineStage.TRANSLATOR, PipelineStage.ANALYZER, PipelineStage.MERGER)
+
+
+@dataclass
+class InstrumentFlow:
+    """One instrument of a pipelined run: its scoped services and outcome"""
+    instrument: str
+    translator_service: TranslatorService
+    analyzer_service: AnalyzerService
+    merger_service: MergerService
+    worker_budget: Optional[int] = None
+    failed_stage: Optional[PipelineStage] = None
+
+
 class PipelineRunner:
     """
     Runs pipeline stages with retry logic and validation.
@@ -86,19 +108,43 @@ class PipelineRunner:
         self.translator_service: Optional[TranslatorService] = None
         self.analyzer_service: Optional[AnalyzerService] = None
         self.merger_service: Optional[MergerService] = None
+        
+        # Pipelined runs: furthest stage any instrument has reached (drives the run-level state)
+        self._furthest_stage: Optional[PipelineStage] = None
+        self._state_lock = asyncio.Lock()
     
     async def _initialize_services(self, run_id: str):
         """Initialize pipeline services for a run"""
+        (
+            self.translator_service,
+            self.analyzer_service,
+            self.merger_service,
+        ) = self._create_services(run_id)
+    
+    def _create_services(self, run_id: str, instrument: Optional[str] = None):
+        """
+        Create the translator, analyzer and merger services of a run.
+        
+        Args:
+            run_id: Pipeline run ID
+            instrument: Instrument of a pipelined flow (own log file, events tagged with it)
+        
+        Returns:
+            Tuple of (TranslatorService, AnalyzerService, MergerService)
+        """
         # Setup logging
-        log_file = self.pipeline_config.logs_dir / f"pipeline_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-        service_logger = create_logger("PipelineRunner", log_file, level=logging.INFO)
+        suffix = f"_{instrument}" if instrument else ""
+        log_file = self.pipeline_config.logs_dir / f"pipeline_{datetime.now().strftime('%Y%m%d_%H%M%S')}{suffix}.log"
+        service_logger = create_logger(f"PipelineRunner{'.' + instrument if instrument else ''}", log_file, level=logging.INFO)
         
         # Setup event logger (writes to same file as event bus AND publishes to EventBus for real-time updates)
         # Capture event loop reference for cross-thread publishing (services run in asyncio.to_thread)
         event_log_file = self.config.event_logs_dir / f"pipeline_{run_id}.jsonl"
         # Get the running event loop (we're in async context via run_pipeline)
         event_loop = asyncio.get_running_loop()
-        event_logger = EventLoggerWithBus(event_log_file, self.event_bus, event_loop=event_loop, logger=service_logger)
+        event_logger = EventLoggerWithBus(
+            event_log_file, self.event_bus, event_loop=event_loop, logger=service_logger, instrument=instrument
+        )
         
         # Create services
         process_supervisor = ProcessSupervisor(
@@ -107,16 +153,10 @@ class PipelineRunner:
         )
         file_manager = FileManager(service_logger, lock_timeout=300)
         
-        self.translator_service = TranslatorService(
-            self.pipeline_config, service_logger, process_supervisor, file_manager, event_logger
-        )
-        
-        self.analyzer_service = AnalyzerService(
-            self.pipeline_config, service_logger, process_supervisor, file_manager, event_logger
-        )
-        
-        self.merger_service = MergerService(
-            self.pipeline_config, service_logger, process_supervisor, event_logger
+        return (
+            TranslatorService(self.pipeline_config, service_logger, process_supervisor, file_manager, event_logger),
+            AnalyzerService(self.pipeline_config, service_logger, process_supervisor, file_manager, event_logger),
+            MergerService(self.pipeline_config, service_logger, process_supervisor, event_logger),
         )
     
     async def run_pipeline(self, run_ctx: RunContext) -> RunContext:
@@ -129,14 +169,16 @@ class PipelineRunner:
         Returns:
             Updated run context
         """
+        if self.config.pipelined:
+            instruments = self._discover_instruments()
+            if instruments:
+                return await self._run_pipelined(run_ctx, instruments)
+            self.logger.info("Pipelined mode: no instruments found in raw or translated data, running staged")
+        
         await self._initialize_services(run_ctx.run_id)
         
         # Get ordered stages
-        stages = [
-            (PipelineStage.TRANSLATOR, self.config.stages["translator"]),
-            (PipelineStage.ANALYZER, self.config.stages["analyzer"]),
-            (PipelineStage.MERGER, self.config.stages["merger"]),
-        ]
+        stages = [(stage, self.config.stages[stage.value]) for stage in STAGE_ORDER]
         
         for stage, stage_config in stages:
             # Run stage with retry (handles state transitions internally)
@@ -156,11 +198,110 @@ class PipelineRunner:
         await self.state_manager.transition(PipelineRunState.SUCCESS)
         return run_ctx
     
+    def _discover_instruments(self) -> List[str]:
+        """
+        Instruments of a pipelined run: those with raw files ({instrument}_1m_{date}.csv)
+        or translated data ({translated_root}/{instrument}/).
+        """
+        instruments = set()
+        data_raw = Path(self.pipeline_config.data_raw)
+        if data_raw.exists():
+            for raw_file in data_raw.rglob("*.csv"):
+                parts = raw_file.stem.split("_")
+                if len(parts) >= 3 and parts[0].isalnum():
+                    instruments.add(parts[0].upper())
+        translated_root = Path(self.pipeline_config.data_translated)
+        if translated_root.exists():
+            for item in translated_root.iterdir():
+                # Skip internal directories such as _bar_store
+                if item.is_dir() and item.name.isalnum():
+                    instruments.add(item.name.upper())
+        return sorted(instruments)
+    
+    async def _run_pipelined(self, run_ctx: RunContext, instruments: List[str]) -> RunContext:
+        """
+        Run each instrument through translator -> analyzer -> merger independently.
+        
+        At most max_instrument_concurrency instruments translate/analyze at once, each analyzer
+        run getting an equal share of the analyzer worker budget. Merges run one at a time as
+        soon as an instrument is analyzed. The run-level state follows the furthest stage any
+        instrument has reached; per-instrument progress is in the instrument-tagged events.
+        
+        Args:
+            run_ctx: Run context
+            instruments: Instruments to run
+        
+        Returns:
+            Updated run context
+        """
+        from modules.analyzer.worker_budget import total_worker_budget
+        
+        concurrency = max(1, min(self.config.max_instrument_concurrency, len(instruments)))
+        worker_budget = max(1, total_worker_budget() // concurrency)
+        self.logger.info(
+            f"Pipelined run over {len(instruments)} instrument(s): {', '.join(instruments)} "
+            f"(concurrency {concurrency}, {worker_budget} analyzer worker(s) each)"
+        )
+        
+        flows = []
+        for instrument in instruments:
+            translator, analyzer, merger = self._create_services(run_ctx.run_id, instrument)
+            flows.append(InstrumentFlow(instrument, translator, analyzer, merger, worker_budget=worker_budget))
+        
+        self._furthest_stage = None
+        slots = asyncio.Semaphore(concurrency)
+        merge_lock = asyncio.Lock()
+        await asyncio.gather(*(self._run_instrument_flow(flow, run_ctx, slots, merge_lock) for flow in flows))
+        
+        failed = [f"{flow.failed_stage.value}:{flow.instrument}" for flow in flows if flow.failed_stage]
+        if failed:
+            await self.state_manager.transition(
+                PipelineRunState.FAILED,
+                error=f"Pipelined run failed for {', '.join(failed)} after retries",
+                metadata={"failed_instruments": failed}
+            )
+        else:
+            await self.state_manager.transition(PipelineRunState.SUCCESS)
+        return run_ctx
+    
+    async def _run_instrument_flow(
+        self,
+        flow: InstrumentFlow,
+        run_ctx: RunContext,
+        slots: asyncio.Semaphore,
+        merge_lock: asyncio.Lock
+    ) -> None:
+        """Run one instrument through all stages, stopping at its first permanently failed stage"""
+        for stage in STAGE_ORDER:
+            stage_config = self.config.stages[stage.value]
+            if stage == PipelineStage.MERGER:
+                async with merge_lock:
+                    success = await self._run_stage_with_retry(stage, stage_config, run_ctx, flow)
+            else:
+                async with slots:
+                    success = await self._run_stage_with_retry(stage, stage_config, run_ctx, flow)
+            if not success:
+                flow.failed_stage = stage
+                self.logger.error(f"Instrument {flow.instrument}: stage {stage.value} failed after {stage_config.max_retries} retries")
+                return
+    
+    async def _advance_run_state(self, stage: PipelineStage) -> None:
+        """Move the run-level state forward to stage (never backwards: flows run at different stages)"""
+        async with self._state_lock:
+            if self._furthest_stage is not None and STAGE_ORDER.index(stage) <= STAGE_ORDER.index(self._furthest_stage):
+                return
+            self._furthest_stage = stage
+            await self.state_manager.transition(
+                getattr(PipelineRunState, f"RUNNING_{stage.name}"),
+                stage=stage
+            )
+    
     async def _run_stage_with_retry(
         self,
         stage: PipelineStage,
         stage_config: StageConfig,
-        run_ctx: RunContext
+        run_ctx: RunContext,
+        flow: Optional[InstrumentFlow] = None
     ) -> bool:
         """
         Run a stage with retry logic.
@@ -169,17 +310,35 @@ class PipelineRunner:
         - Services emit operational events (start, success, failure, log, metric, error) via EventLoggerWithBus
         - Runner emits state transitions (via state_manager.transition()) and validation failures only
         - This prevents duplicate events and ensures clear separation of concerns
+        - Pipelined flows share the run-level state, so their retries are "retry" events
+          tagged with the instrument instead of RETRYING transitions
         
         Args:
             stage: Stage to run
             stage_config: Stage configuration
             run_ctx: Run context
+            flow: Instrument flow of a pipelined run (None = staged run over all instruments)
         
         Returns:
             True if stage succeeded, False if permanently failed
         """
         for attempt in range(stage_config.max_retries + 1):
-            if attempt > 0:
+            if flow is not None:
+                if attempt > 0:
+                    await self.event_bus.publish({
+                        "run_id": run_ctx.run_id,
+                        "stage": "pipeline",
+                        "event": "retry",
+                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "instrument": flow.instrument,
+                        "msg": f"Retrying {stage.value} for {flow.instrument} (attempt {attempt}/{stage_config.max_retries})",
+                        "data": {"stage": stage.value, "instrument": flow.instrument, "attempt": attempt, "max_retries": stage_config.max_retries}
+                    })
+                    delay = stage_config.retry_delay_sec * (self.config.retry_backoff_multiplier ** (attempt - 1))
+                    await asyncio.sleep(delay)
+                else:
+                    await self._advance_run_state(stage)
+            elif attempt > 0:
                 # Retry - transition to RETRYING first, then back to RUNNING
                 await self.state_manager.transition(
                     PipelineRunState.RETRYING,
@@ -208,18 +367,19 @@ class PipelineRunner:
             # Run stage
             # Note: Services emit operational events (start, success, failure) via EventLoggerWithBus.
             # Runner only emits state transitions (via state_manager.transition()) and validation failures.
-            success = await self._run_stage(stage, run_ctx)
+            success = await self._run_stage(stage, run_ctx, flow)
             
             if success:
                 # Validate output
-                if await self._validate_stage_output(stage, run_ctx):
+                if await self._validate_stage_output(stage, run_ctx, flow.instrument if flow else None):
                     # Service already emitted success event - no duplicate needed
                     return True
                 else:
                     # Validation failed (runner-level validation, not service-level)
                     # Service should emit error event for validation failures
                     # Runner just logs - no duplicate event publish needed
-                    self.logger.warning(f"Stage {stage.value} validation failed (attempt {attempt + 1})")
+                    scope = f" for {flow.instrument}" if flow else ""
+                    self.logger.warning(f"Stage {stage.value} validation failed{scope} (attempt {attempt + 1})")
             else:
                 # Stage execution failed
                 # Service already emitted failure event - no duplicate needed
@@ -228,7 +388,8 @@ class PipelineRunner:
         # All retries exhausted
         return False
     
-    async def _run_stage(self, stage: PipelineStage, run_ctx: RunContext) -> bool:
+    async def _run_stage(self, stage: PipelineStage, run_ctx: RunContext,
+                         flow: Optional[InstrumentFlow] = None) -> bool:
         """
         Run a single stage (no retry).
         Wraps synchronous service.run() calls in asyncio.to_thread() to avoid blocking.
@@ -237,6 +398,7 @@ class PipelineRunner:
         Args:
             stage: Stage to run
             run_ctx: Run context
+            flow: Instrument flow of a pipelined run (None = all instruments)
         
         Returns:
             True if stage succeeded, False otherwise
@@ -245,12 +407,16 @@ class PipelineRunner:
         stage_config = self.config.stages[stage.value]
         timeout_sec = stage_config.timeout_sec
         
+        # Staged runs use the run's services over all instruments, flows their own scoped services
+        services = flow or self
+        scope = {"instruments": {flow.instrument}} if flow else {}
+        
         try:
             # Run synchronous service methods in thread pool to avoid blocking event loop
             # Add timeout to prevent indefinite hangs
             if stage == PipelineStage.TRANSLATOR:
                 result = await asyncio.wait_for(
-                    asyncio.to_thread(self.translator_service.run, run_ctx.run_id),
+                    asyncio.to_thread(services.translator_service.run, run_ctx.run_id, **scope),
                     timeout=timeout_sec
                 )
                 # Translator can return "success", "skipped", or "failure"
@@ -263,8 +429,10 @@ class PipelineRunner:
                 return result.status in ("success", "skipped")  # Both are acceptable
             
             elif stage == PipelineStage.ANALYZER:
+                if flow is not None:
+                    scope["worker_budget"] = flow.worker_budget
                 result = await asyncio.wait_for(
-                    asyncio.to_thread(self.analyzer_service.run, run_ctx.run_id),
+                    asyncio.to_thread(services.analyzer_service.run, run_ctx.run_id, **scope),
                     timeout=timeout_sec
                 )
                 # Analyzer can return "success" or "skipped" (if no input files)
@@ -272,7 +440,7 @@ class PipelineRunner:
             
             elif stage == PipelineStage.MERGER:
                 result = await asyncio.wait_for(
-                    asyncio.to_thread(self.merger_service.run, run_ctx.run_id),
+                    asyncio.to_thread(services.merger_service.run, run_ctx.run_id, **scope),
                     timeout=timeout_sec
                 )
                 return result.status == "success"
@@ -292,17 +460,20 @@ class PipelineRunner:
             # No duplicate event publish needed
             return False
     
-    async def _validate_stage_output(self, stage: PipelineStage, run_ctx: RunContext) -> bool:
+    async def _validate_stage_output(self, stage: PipelineStage, run_ctx: RunContext,
+                                     instrument: Optional[str] = None) -> bool:
         """
         Validate stage output.
         
         Args:
             stage: Stage that just completed
             run_ctx: Run context
+            instrument: Instrument of a pipelined flow (validate only its output)
         
         Returns:
             True if output is valid, False otherwise
         """
+        scope = {instrument} if instrument else None
         try:
             if stage == PipelineStage.TRANSLATOR:
                 # Check for translated files (translator outputs to data_translated)
@@ -339,6 +510,9 @@ class PipelineRunner:
                         f"Investigate PipelineConfig initialization - data_translated is mandatory."
                     )
                 
+                if instrument:
+                    translated_root = Path(translated_root) / instrument
+                
                 try:
                     translated_files = list(Path(translated_root).rglob("*.parquet"))
                 except (AttributeError, TypeError) as e:
@@ -354,7 +528,7 @@ class PipelineRunner:
                 # Check for analyzer output specific to this run_id
                 # AnalyzerService writes a success marker file: .success_{run_id}.marker
                 # This ensures validation checks THIS run's output, not previous runs
-                marker_file = self.pipeline_config.analyzer_runs / f".success_{run_ctx.run_id}.marker"
+                marker_file = AnalyzerService.success_marker(self.pipeline_config.analyzer_runs, run_ctx.run_id, scope)
                 if marker_file.exists():
                     return True
                 
@@ -375,7 +549,7 @@ class PipelineRunner:
             elif stage == PipelineStage.MERGER:
                 # Check for merger completion marker (MergerService writes to logs_dir or analyzer_runs)
                 for base_dir in [self.pipeline_config.logs_dir, self.pipeline_config.analyzer_runs]:
-                    marker_file = base_dir / f".merge_complete_{run_ctx.run_id}.marker"
+                    marker_file = base_dir / MergerService.marker_name(run_ctx.run_id, scope)
                     if marker_file.exists():
                         return True
                 
@@ -11,6 +11,8 @@ from pathlib import Path
 from typing import Optional, List, Dict, Any
 import json
 
+from modules.merger import monthly_deltas
+
 
 class AnalyzerExtractor:
     """Extracts canonical records from Analyzer outputs for parity comparison."""
@@ -88,8 +90,11 @@ class AnalyzerExtractor:
                 run_output_dir = self.output_dir / "analyzer_output"
                 if run_output_dir.exists():
                     for parquet_file in run_output_dir.rglob("*.parquet"):
+                        if monthly_deltas.is_delta_file(parquet_file):
+                            continue  # Read below with their monthly file
                         try:
-                            df = pd.read_parquet(parquet_file)
+                            # Monthly file plus its not-yet-compacted append-mode deltas
+                            df = monthly_deltas.read_merged(parquet_file)
                             if self._is_relevant(df):
                                 analyzer_dfs.append(df)
                         except Exception as e:
@@ -108,8 +113,11 @@ class AnalyzerExtractor:
             
             # Find all parquet files in subdirectories
             for parquet_file in search_dir.rglob("*.parquet"):
+                if monthly_deltas.is_delta_file(parquet_file):
+                    continue  # Read below with their monthly file
                 try:
-                    df = pd.read_parquet(parquet_file)
+                    # Monthly file plus its not-yet-compacted append-mode deltas
+                    df = monthly_deltas.read_merged(parquet_file)
                     if self._is_relevant(df):
                         analyzer_dfs.append(df)
                 except Exception as e:
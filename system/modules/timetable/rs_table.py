@@ -0,0 +1,253 @@
+"""
+RS Table - cached per-stream Rolling Sum inputs for time slot selection
+
+TimetableEngine.calculate_rs_for_stream used to re-read the 10 most recent analyzer
+parquet files, re-validate the trade_date contract and recompute the rolling sums on
+every call (once per stream and session). The RS table keeps, per parquet file, the
+validated Session/Time/Result/trade_date columns keyed by the file's (mtime_ns, size) and
+its merger delta files, and memoizes the RS values per (stream, session, slot set, lookback).
+
+- Unchanged files are never re-read; a modified file is re-read on its own
+- A new month file only costs reading that file (the others stay cached)
+- Files that drop out of the most recent window are evicted
+
+One RS table is shared per process (get_rs_table), so every TimetableEngine instance
+(timetable generation, dashboard requests, pollers) hits the same cache.
+"""
+
+import logging
+import sys
+import threading
+import traceback
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+try:
+    from modules.matrix.data_loader import (
+        _validate_trade_date_dtype,
+        _validate_trade_date_presence
+    )
+    from modules.merger import monthly_deltas
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from modules.matrix.data_loader import (  # type: ignore
+        _validate_trade_date_dtype,
+        _validate_trade_date_presence
+    )
+    from modules.merger import monthly_deltas  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# Number of most recent parquet files per stream used for RS
+RS_MAX_FILES = 10
+
+# Columns the RS calculation reads (everything else is dropped from the cache)
+RS_COLUMNS = ('trade_date', 'Session', 'Time', 'Result')
+
+FileSignature = Tuple[int, int, Tuple[str, ...]]  # (mtime_ns, size, delta file names)
+
+
+def _file_signature(file_path: Path) -> Optional[FileSignature]:
+    return monthly_deltas.signature(file_path)
+
+
+def _load_rs_file(file_path: Path, stream_id: str) -> Optional[pd.DataFrame]:
+    """
+    Load and validate one analyzer parquet file for RS.
+
+    Returns:
+        RS columns of the file, or None when the file is empty or skipped
+        (contract violations and read errors are logged, not raised)
+    """
+    try:
+        df = monthly_deltas.read_merged(file_path)
+        if df.empty:
+            return None
+
+        # Validate required columns
+        if 'Result' not in df.columns:
+            logger.warning(f"File {file_path.name} missing 'Result' column, skipping")
+            return None
+
+        # CONTRACT ENFORCEMENT: Require trade_date column
+        if 'trade_date' not in df.columns:
+            raise ValueError(
+                f"File {file_path.name} missing trade_date column - "
+                f"analyzer output contract requires trade_date. "
+                f"Timetable Engine does not normalize dates. "
+                f"Fix analyzer output before proceeding."
+            )
+
+        # Validate dtype/presence only (no normalization)
+        _validate_trade_date_dtype(df, stream_id)
+        _validate_trade_date_presence(df, stream_id)
+
+        # CONTRACT ENFORCEMENT: Invalid trade_date values → ValueError
+        invalid_dates = df['trade_date'].isna()
+        if invalid_dates.any():
+            invalid_count = invalid_dates.sum()
+            raise ValueError(
+                f"File {file_path.name}: Found {invalid_count} rows with invalid trade_date. "
+                f"This violates analyzer output contract. Fix analyzer output before proceeding."
+            )
+
+        return df[[c for c in RS_COLUMNS if c in df.columns]]
+    except Exception as e:
+        # Log contract violations but continue (don't fail entire timetable generation)
+        if isinstance(e, ValueError):
+            logger.warning(
+                f"Contract violation in {file_path.name}: {e}. "
+                f"Skipping this file (timetable generation will continue with available data)."
+            )
+        else:
+            logger.warning(f"Error loading {file_path}: {e}")
+        logger.debug(f"Traceback: {traceback.format_exc()}")
+        return None
+
+
+def compute_slot_rs(trades: pd.DataFrame, session: str, time_slots: Sequence[str],
+                    lookback_days: int = 13) -> Dict[str, float]:
+    """
+    RS per time slot: Win = +1, Loss = -2, else 0, summed over the last lookback_days
+    trades of each slot in the session.
+
+    Args:
+        trades: Concatenated RS columns (most recent file first, as loaded)
+        session: Session ("S1" or "S2")
+        time_slots: Time slots of the session
+        lookback_days: Number of trades per slot in the rolling sum
+
+    Returns:
+        Dictionary mapping time slots to RS values
+    """
+    df = trades[trades['Session'] == session].copy()
+    if df.empty:
+        return {}
+
+    # Sort by trade_date (already datetime dtype)
+    df = df.sort_values('trade_date').reset_index(drop=True)
+
+    # Vectorized score mapping: WIN=+1, LOSS=-2, else 0
+    result_clean = df['Result'].fillna('').astype(str).str.strip().str.upper()
+    scores = result_clean.map({'WIN': 1, 'LOSS': -2}).fillna(0)
+
+    time_slot_rs = {}
+    for time_slot in time_slots:
+        slot_scores = scores[df['Time'] == time_slot].tail(lookback_days)
+        time_slot_rs[time_slot] = 0.0 if slot_scores.empty else float(slot_scores.sum())
+    return time_slot_rs
+
+
+class RsTable:
+    """Per-file cache of RS inputs plus memoized RS values per (stream, session, slots, lookback)"""
+
+    def __init__(self, max_files: int = RS_MAX_FILES):
+        self.max_files = max_files
+        self._lock = threading.RLock()
+        # parquet path -> (signature, RS columns or None when skipped)
+        self._files: Dict[Path, Tuple[FileSignature, Optional[pd.DataFrame]]] = {}
+        # stream_dir -> paths currently in its most recent window
+        self._stream_files: Dict[Path, List[Path]] = {}
+        # (stream_dir, session, slots, lookback) -> (window signature, RS values)
+        self._rs: Dict[tuple, Tuple[tuple, Dict[str, float]]] = {}
+        self.file_loads = 0
+
+    def recent_files(self, stream_dir: Path) -> List[Path]:
+        """Most recent parquet files of a stream (sorted by path, newest first; delta files excluded)"""
+        files = (p for p in stream_dir.rglob("*.parquet") if not monthly_deltas.is_delta_file(p))
+        return sorted(files, reverse=True)[:self.max_files]
+
+    def rolling_sums(self, stream_dir: Path, stream_id: str, session: str,
+                     time_slots: Sequence[str], lookback_days: int = 13) -> Dict[str, float]:
+        """
+        RS values for each time slot of a stream/session (same result as a full reload).
+
+        Args:
+            stream_dir: Analyzer output directory of the stream
+            stream_id: Stream identifier (for contract error messages)
+            session: Session ("S1" or "S2")
+            time_slots: Time slots of the session
+            lookback_days: Number of trades per slot in the rolling sum
+
+        Returns:
+            Dictionary mapping time slots to RS values ({} when there is no data)
+        """
+        stream_dir = Path(stream_dir).absolute()
+        if not stream_dir.exists():
+            return {}
+
+        with self._lock:
+            window = []
+            for file_path in self.recent_files(stream_dir):
+                signature = _file_signature(file_path)
+                if signature is not None:
+                    window.append((file_path, signature))
+            if not window:
+                return {}
+            window_signature = tuple(window)
+
+            rs_key = (stream_dir, session, tuple(time_slots), lookback_days)
+            cached = self._rs.get(rs_key)
+            if cached is not None and cached[0] == window_signature:
+                return dict(cached[1])
+
+            frames = []
+            for file_path, signature in window:
+                entry = self._files.get(file_path)
+                if entry is None or entry[0] != signature:
+                    entry = (signature, _load_rs_file(file_path, stream_id))
+                    self._files[file_path] = entry
+                    self.file_loads += 1
+                if entry[1] is not None:
+                    frames.append(entry[1])
+            self._evict_stale_files(stream_dir, [file_path for file_path, _ in window])
+
+            if not frames:
+                logger.warning(
+                    f"Stream {stream_id} session {session}: No valid trade data found for RS calculation. "
+                    f"Returning empty RS values (will use default time slot)."
+                )
+                rs_values: Dict[str, float] = {}
+            else:
+                trades = pd.concat(frames, ignore_index=True)
+                rs_values = compute_slot_rs(trades, session, time_slots, lookback_days)
+
+            self._rs[rs_key] = (window_signature, rs_values)
+            return dict(rs_values)
+
+    def _evict_stale_files(self, stream_dir: Path, window_paths: List[Path]) -> None:
+        previous = self._stream_files.get(stream_dir, [])
+        current = set(window_paths)
+        for file_path in previous:
+            if file_path not in current:
+                self._files.pop(file_path, None)
+        self._stream_files[stream_dir] = list(window_paths)
+
+    def invalidate(self, stream_dir: Optional[Path] = None) -> None:
+        """Drop cached files and RS values (all streams, or one stream directory)"""
+        with self._lock:
+            if stream_dir is None:
+                self._files.clear()
+                self._stream_files.clear()
+                self._rs.clear()
+                return
+            stream_dir = Path(stream_dir).absolute()
+            for file_path in self._stream_files.pop(stream_dir, []):
+                self._files.pop(file_path, None)
+            for key in [k for k in self._rs if k[0] == stream_dir]:
+                del self._rs[key]
+
+
+_rs_table: Optional[RsTable] = None
+_rs_table_lock = threading.Lock()
+
+
+def get_rs_table() -> RsTable:
+    """Process-wide RS table shared by all TimetableEngine instances"""
+    global _rs_table
+    with _rs_table_lock:
+        if _rs_table is None:
+            _rs_table = RsTable()
+        return _rs_table
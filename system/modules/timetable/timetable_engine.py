@@ -51,6 +51,8 @@ try:
         _validate_trade_date_presence
     )
     from modules.timetable.cme_session import get_cme_trading_date
+    from modules.timetable.rs_table import get_rs_table
+    from modules.merger import monthly_deltas
 except ImportError:
     # Fallback: add parent directory to path
     sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -59,6 +61,8 @@ except ImportError:
         _validate_trade_date_presence
     )
     from modules.timetable.cme_session import get_cme_trading_date
+    from modules.timetable.rs_table import get_rs_table
+    from modules.merger import monthly_deltas
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -1039,11 +1043,12 @@ class TimetableEngine:
             stream_dir: Stream directory path
             
         Returns:
-            Sorted list of parquet files (most recent first)
+            Sorted list of parquet files (most recent first; merger delta files excluded)
         """
         if stream_dir not in self._file_list_cache:
             self._file_list_cache[stream_dir] = sorted(
-                stream_dir.rglob("*.parquet"), reverse=True
+                (p for p in stream_dir.rglob("*.parquet") if not monthly_deltas.is_delta_file(p)),
+                reverse=True
             )
         return self._file_list_cache[stream_dir]
     
@@ -1071,99 +1076,11 @@ class TimetableEngine:
         if not stream_dir.exists():
             return {}
         
-        # Find most recent parquet files (using cache)
-        parquet_files = self._get_parquet_files(stream_dir)
-        
-        if not parquet_files:
-            return {}
-        
-        # Load recent data (last N files or last N days)
-        all_trades = []
-        for file_path in parquet_files[:10]:  # Load last 10 files
-            try:
-                df = pd.read_parquet(file_path)
-                if df.empty:
-                    continue
-                
-                # Validate required columns
-                if 'Result' not in df.columns:
-                    logger.warning(f"File {file_path.name} missing 'Result' column, skipping")
-                    continue
-                
-                # CONTRACT ENFORCEMENT: Require trade_date column
-                if 'trade_date' not in df.columns:
-                    raise ValueError(
-                        f"File {file_path.name} missing trade_date column - "
-                        f"analyzer output contract requires trade_date. "
-                        f"Timetable Engine does not normalize dates. "
-                        f"Fix analyzer output before proceeding."
-                    )
-                
-                # Validate dtype/presence only (no normalization)
-                _validate_trade_date_dtype(df, stream_id)
-                _validate_trade_date_presence(df, stream_id)
-                
-                # CONTRACT ENFORCEMENT: Invalid trade_date values → ValueError
-                invalid_dates = df['trade_date'].isna()
-                if invalid_dates.any():
-                    invalid_count = invalid_dates.sum()
-                    raise ValueError(
-                        f"File {file_path.name}: Found {invalid_count} rows with invalid trade_date. "
-                        f"This violates analyzer output contract. Fix analyzer output before proceeding."
-                    )
-                
-                all_trades.append(df)
-            except Exception as e:
-                # Log contract violations but continue (don't fail entire timetable generation)
-                # This allows timetable to be generated even if some files have issues
-                if isinstance(e, ValueError):
-                    logger.warning(
-                        f"Contract violation in {file_path.name}: {e}. "
-                        f"Skipping this file (timetable generation will continue with available data)."
-                    )
-                    import traceback
-                    logger.debug(f"Traceback: {traceback.format_exc()}")
-                    continue
-                # Log other errors but continue
-                logger.warning(f"Error loading {file_path}: {e}")
-                import traceback
-                logger.debug(f"Traceback: {traceback.format_exc()}")
-                continue
-        
-        # Handle missing data gracefully - return empty dict instead of raising error
-        # This allows timetable generation to continue even if some streams have no data
-        if not all_trades:
-            logger.warning(
-                f"Stream {stream_id} session {session}: No valid trade data found for RS calculation. "
-                f"Returning empty RS values (will use default time slot)."
-            )
-            return {}
-        
-        # Merge and filter by session
-        df = pd.concat(all_trades, ignore_index=True)
-        df = df[df['Session'] == session].copy()
-        
-        if df.empty:
-            return {}
-        
-        # Sort by trade_date (already datetime dtype)
-        df = df.sort_values('trade_date').reset_index(drop=True)
-        
-        # Vectorized score mapping: WIN=+1, LOSS=-2, else 0
-        result_clean = df['Result'].fillna('').astype(str).str.strip().str.upper()
-        df = df.copy()
-        df['_score'] = result_clean.map({'WIN': 1, 'LOSS': -2}).fillna(0)
-        
-        # Get last N trades per time slot and sum scores (vectorized)
-        time_slot_rs = {}
-        for time_slot in self.session_time_slots.get(session, []):
-            time_trades = df[df['Time'] == time_slot].tail(lookback_days)
-            if time_trades.empty:
-                time_slot_rs[time_slot] = 0.0
-            else:
-                time_slot_rs[time_slot] = float(time_trades['_score'].sum())
-        
-        return time_slot_rs
+        # Shared RS table: re-reads only new/modified parquet files among the last 10
+        return get_rs_table().rolling_sums(
+            stream_dir, stream_id, session,
+            self.session_time_slots.get(session, []), lookback_days,
+        )
     
     def select_best_time(self, stream_id: str, session: str) -> Tuple[Optional[str], str]:
         """
@@ -1265,7 +1182,7 @@ class TimetableEngine:
             parquet_files = self._get_parquet_files(stream_dir)
             for pf in parquet_files:
                 try:
-                    df = pd.read_parquet(pf)
+                    df = monthly_deltas.read_merged(pf)
                     if not df.empty:
                         # CONTRACT ENFORCEMENT: Require trade_date column
                         if 'trade_date' not in df.columns:
@@ -1286,7 +1203,7 @@ class TimetableEngine:
             return None, None
         
         try:
-            df = pd.read_parquet(file_path)
+            df = monthly_deltas.read_merged(file_path)
             
             # CONTRACT ENFORCEMENT: Require trade_date column
             if 'trade_date' not in df.columns:
@@ -6,9 +6,11 @@ to canonical Parquet.
 
 Public API:
 - translate_file: translate one raw file into one canonical file
+- translate_batch: translate many raw files over a process pool
 """
 
 from .core import translate_file
+from .batch import discover_raw_files, translate_batch, BatchResult
 from .schema import (
     enforce_schema,
     convert_timestamp_utc_to_chicago,
@@ -17,6 +19,9 @@ from .schema import (
 
 __all__ = [
     "translate_file",
+    "translate_batch",
+    "discover_raw_files",
+    "BatchResult",
     "enforce_schema",
     "convert_timestamp_utc_to_chicago",
     "SchemaValidationError",
@@ -0,0 +1,382 @@
+"""
+QTSW2 Translator — Bar Store
+
+One consolidated, append-only columnar file per instrument next to the translated day
+files, so readers (the analyzer) do not open and concat thousands of daily Parquet files.
+
+Layout ({translated_root}/_bar_store/):
+- {instrument}_1m.{generation}.arrows: Arrow IPC stream (schema message, one record batch
+  per translated day file in date order, end-of-stream marker)
+- {instrument}_1m.index.json: data file name, date -> (byte offset, rows) of every batch,
+  and the (size, mtime_ns) of the day file each batch came from
+
+Sync:
+- Day files unchanged and only newer days added (the daily translator run): the new
+  batches are written over the end-of-stream marker, then the index is replaced
+- Anything else (a day re-translated, removed or inserted before the last stored day):
+  a new generation file is written and the index switched to it; batches of unchanged
+  day files are copied from the previous generation, only changed days are re-read
+
+Readers memory-map the data file and decode only the batches of the requested dates.
+Offsets in an index always point at complete batches, so a reader holding an older index
+is never affected by a concurrent append or rebuild.
+
+The day files stay the source of truth: the store can be deleted at any time.
+"""
+
+import json
+import logging
+import os
+import re
+import time
+from datetime import date as Date
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+BAR_STORE_DIR_NAME = "_bar_store"
+BAR_STORE_VERSION = 1
+
+# Columns kept in the store (what the analyzer loads)
+BAR_COLUMNS = ["timestamp", "open", "high", "low", "close", "instrument"]
+
+_DAY_FILE_DATE = re.compile(r"_(\d{4})-(\d{2})-(\d{2})\.parquet$")
+_END_OF_STREAM = b"\xff\xff\xff\xff\x00\x00\x00\x00"
+
+_LOCK_TIMEOUT_SECONDS = 600
+_LOCK_STALE_SECONDS = 3600
+
+
+class BarStoreError(Exception):
+    """Store cannot be built or read from the current day files"""
+
+
+class BarStore:
+    """
+    Consolidated 1m bar file of one instrument.
+
+    Args:
+        translated_root: Translated output root ({root}/{instrument}/1m/YYYY/MM/*.parquet)
+        instrument: Instrument symbol
+    """
+
+    def __init__(self, translated_root: Path, instrument: str):
+        if not PYARROW_AVAILABLE:
+            raise BarStoreError("pyarrow is required for the bar store")
+        self.translated_root = Path(translated_root)
+        self.instrument = instrument.upper()
+        self.store_dir = self.translated_root / BAR_STORE_DIR_NAME
+        self.index_path = self.store_dir / f"{self.instrument}_1m.index.json"
+        self.lock_path = self.store_dir / f"{self.instrument}_1m.lock"
+
+    @property
+    def day_root(self) -> Path:
+        return self.translated_root / self.instrument / "1m"
+
+    # ------------------------------------------------------------------ sources
+
+    def day_files(self) -> List[Tuple[str, Path]]:
+        """
+        Translated day files in load order: (relative path, path), YYYY/MM/*.parquet sorted.
+
+        Raises:
+            BarStoreError: a file name carries no date (cannot be indexed by date)
+        """
+        files = []
+        if not self.day_root.is_dir():
+            return files
+        year_dirs = sorted(d for d in self.day_root.iterdir() if d.is_dir() and d.name.isdigit() and len(d.name) == 4)
+        for year_dir in year_dirs:
+            for month_dir in sorted(d for d in year_dir.iterdir() if d.is_dir()):
+                for path in sorted(month_dir.glob("*.parquet")):
+                    if not _DAY_FILE_DATE.search(path.name):
+                        raise BarStoreError(f"Day file without a date in its name: {path}")
+                    files.append((path.relative_to(self.day_root).as_posix(), path))
+        return files
+
+    @staticmethod
+    def _signature(path: Path) -> List[int]:
+        stat = path.stat()
+        return [stat.st_size, stat.st_mtime_ns]
+
+    @staticmethod
+    def _file_date(rel: str) -> str:
+        y, m, d = _DAY_FILE_DATE.search(rel).groups()
+        return f"{y}-{m}-{d}"
+
+    # ------------------------------------------------------------------ index
+
+    def load_index(self) -> Optional[Dict]:
+        """Current index, or None when there is no usable store"""
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable bar store index {self.index_path}: {e}")
+            return None
+        if not isinstance(index, dict) or index.get("version") != BAR_STORE_VERSION:
+            return None
+        data_path = self.store_dir / index.get("data_file", "")
+        if not data_path.is_file() or data_path.stat().st_size < index.get("end_offset", 0) + len(_END_OF_STREAM):
+            return None
+        return index
+
+    def _save_index(self, index: Dict) -> None:
+        tmp_path = self.index_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, separators=(",", ":"))
+        os.replace(tmp_path, self.index_path)
+
+    def is_current(self, index: Optional[Dict] = None) -> bool:
+        """True when the store holds exactly the current day files"""
+        index = index if index is not None else self.load_index()
+        if index is None:
+            return False
+        current = [[rel, *self._signature(path)] for rel, path in self.day_files()]
+        return current == [[b["source"], b["size"], b["mtime_ns"]] for b in index["batches"]]
+
+    # ------------------------------------------------------------------ writing
+
+    def _acquire_lock(self) -> None:
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        deadline = time.monotonic() + _LOCK_TIMEOUT_SECONDS
+        while True:
+            try:
+                fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, str(os.getpid()).encode("ascii"))
+                os.close(fd)
+                return
+            except FileExistsError:
+                try:
+                    if time.time() - self.lock_path.stat().st_mtime > _LOCK_STALE_SECONDS:
+                        logger.warning(f"Removing stale bar store lock {self.lock_path}")
+                        self.lock_path.unlink()
+                        continue
+                except FileNotFoundError:
+                    continue
+                if time.monotonic() > deadline:
+                    raise BarStoreError(f"Timed out waiting for bar store lock {self.lock_path}")
+                time.sleep(0.2)
+
+    def _release_lock(self) -> None:
+        try:
+            self.lock_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _store_metadata(schema: "pa.Schema") -> Optional[Dict[bytes, bytes]]:
+        """Pandas metadata of a day file without its index, so reads restore the same dtypes"""
+        pandas_meta = (schema.metadata or {}).get(b"pandas")
+        if pandas_meta is None:
+            return None
+        meta = json.loads(pandas_meta)
+        meta["index_columns"] = []
+        meta["columns"] = [c for c in meta.get("columns", []) if c.get("name") in BAR_COLUMNS]
+        return {b"pandas": json.dumps(meta).encode("utf-8")}
+
+    def _read_day(self, path: Path, schema: Optional["pa.Schema"]) -> "pa.RecordBatch":
+        try:
+            table = pq.read_table(path, columns=BAR_COLUMNS)
+        except (KeyError, ValueError, pa.ArrowInvalid) as e:
+            raise BarStoreError(f"{path.name}: missing bar columns ({e})") from e
+        if schema is None:
+            table = table.replace_schema_metadata(self._store_metadata(table.schema))
+        elif not table.schema.equals(schema, check_metadata=False):
+            try:
+                table = table.cast(schema)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+                raise BarStoreError(f"{path.name}: schema differs from the store ({e})") from e
+        batches = table.combine_chunks().to_batches()
+        return batches[0] if batches else pa.RecordBatch.from_pylist([], schema=table.schema)
+
+    def _write_batches(
+        self,
+        f,
+        files: List[Tuple[str, Path]],
+        schema: "pa.Schema",
+        reusable: Optional[Dict[Tuple[str, int, int], Tuple["pa.Buffer", int]]] = None,
+    ) -> List[Dict]:
+        entries = []
+        for rel, path in files:
+            signature = self._signature(path)
+            offset = f.tell()
+            reused = (reusable or {}).get((rel, *signature))
+            if reused is not None:
+                message, rows = reused
+                f.write(message)
+            else:
+                batch = self._read_day(path, schema)
+                rows = batch.num_rows
+                f.write(batch.serialize())
+            entries.append({
+                "date": self._file_date(rel),
+                "source": rel,
+                "offset": offset,
+                "rows": rows,
+                "size": signature[0],
+                "mtime_ns": signature[1],
+            })
+        return entries
+
+    def _rebuild(self, files: List[Tuple[str, Path]], previous: Optional[Dict]) -> Dict:
+        """Write a new generation; batches of unchanged day files are copied from the previous one"""
+        generation = (previous or {}).get("generation", 0) + 1
+        data_name = f"{self.instrument}_1m.{generation}.arrows"
+        data_path = self.store_dir / data_name
+        source = pa.memory_map(str(self.store_dir / previous["data_file"])) if previous else None
+        try:
+            reusable = {}
+            if source is not None:
+                schema = pa.ipc.read_schema(pa.ipc.read_message(source))
+                ends = [b["offset"] for b in previous["batches"][1:]] + [previous["end_offset"]]
+                for entry, end in zip(previous["batches"], ends):
+                    key = (entry["source"], entry["size"], entry["mtime_ns"])
+                    reusable[key] = (source.read_at(end - entry["offset"], entry["offset"]), entry["rows"])
+            else:
+                schema = self._read_day(files[0][1], None).schema
+            with open(data_path, "wb") as f:
+                f.write(schema.serialize())
+                batches = self._write_batches(f, files, schema, reusable)
+                end_offset = f.tell()
+                f.write(_END_OF_STREAM)
+        finally:
+            if source is not None:
+                source.close()
+        index = {
+            "version": BAR_STORE_VERSION,
+            "instrument": self.instrument,
+            "generation": generation,
+            "data_file": data_name,
+            "end_offset": end_offset,
+            "batches": batches,
+        }
+        self._save_index(index)
+        # Previous generations: readers still mapping them keep them alive on Windows, retry next sync
+        for old in self.store_dir.glob(f"{self.instrument}_1m.*.arrows"):
+            if old.name != data_name:
+                try:
+                    old.unlink()
+                except OSError:
+                    pass
+        return index
+
+    def _append(self, index: Dict, files: List[Tuple[str, Path]]) -> Dict:
+        data_path = self.store_dir / index["data_file"]
+        with pa.memory_map(str(data_path)) as source:
+            schema = pa.ipc.read_schema(pa.ipc.read_message(source))
+        with open(data_path, "r+b") as f:
+            f.seek(index["end_offset"])
+            batches = self._write_batches(f, files, schema)
+            end_offset = f.tell()
+            f.write(_END_OF_STREAM)
+            f.truncate()
+        index = dict(index, end_offset=end_offset, batches=index["batches"] + batches)
+        self._save_index(index)
+        return index
+
+    def sync(self) -> str:
+        """
+        Bring the store in line with the day files.
+
+        Returns:
+            "current", "appended", "rebuilt" or "empty" (no day files)
+
+        Raises:
+            BarStoreError: day files cannot be stored (undated name, missing columns, schema drift)
+        """
+        self._acquire_lock()
+        try:
+            files = self.day_files()
+            if not files:
+                return "empty"
+            index = self.load_index()
+            if index is not None:
+                stored = [[b["source"], b["size"], b["mtime_ns"]] for b in index["batches"]]
+                current = [[rel, *self._signature(path)] for rel, path in files]
+                if current == stored:
+                    return "current"
+                if stored and current[:len(stored)] == stored:
+                    self._append(index, files[len(stored):])
+                    logger.info(f"Bar store {self.instrument}: appended {len(files) - len(stored)} day(s)")
+                    return "appended"
+            self._rebuild(files, index)
+            logger.info(f"Bar store {self.instrument}: rebuilt from {len(files)} day file(s)")
+            return "rebuilt"
+        finally:
+            self._release_lock()
+
+    # ------------------------------------------------------------------ reading
+
+    def dates(self) -> List[str]:
+        index = self.load_index()
+        return [b["date"] for b in index["batches"]] if index else []
+
+    def read(
+        self,
+        years: Optional[Iterable[int]] = None,
+        start_date: Optional[Date] = None,
+        end_date: Optional[Date] = None,
+        index: Optional[Dict] = None,
+    ) -> pd.DataFrame:
+        """
+        Bars of the selected days, in store (date) order.
+
+        Args:
+            years: Keep only these year folders
+            start_date / end_date: Inclusive day bounds (each optional)
+            index: Index to read with (default: current index)
+
+        Raises:
+            BarStoreError: no store (call sync first)
+        """
+        index = index if index is not None else self.load_index()
+        if index is None:
+            raise BarStoreError(f"No bar store for {self.instrument} under {self.store_dir}")
+        years = {int(y) for y in years} if years else None
+        start = start_date.isoformat() if start_date else None
+        end = end_date.isoformat() if end_date else None
+        selected = [
+            b for b in index["batches"]
+            if (years is None or int(b["source"].split("/", 1)[0]) in years)
+            and (start is None or b["date"] >= start)
+            and (end is None or b["date"] <= end)
+        ]
+        with pa.memory_map(str(self.store_dir / index["data_file"])) as source:
+            schema = pa.ipc.read_schema(pa.ipc.read_message(source))
+            batches = []
+            for entry in selected:
+                source.seek(entry["offset"])
+                batches.append(pa.ipc.read_record_batch(pa.ipc.read_message(source), schema))
+            table = pa.Table.from_batches(batches, schema=schema)
+            # to_pandas copies out of the mapping, so the file can be closed (and replaced) afterwards
+            return table.to_pandas()
+
+
+def sync_bar_stores(translated_root: Path, instruments: Iterable[str]) -> Dict[str, str]:
+    """
+    Sync the stores of several instruments; a failing instrument is logged, not raised.
+
+    Returns:
+        instrument -> sync outcome ("error: ..." on failure)
+    """
+    outcomes = {}
+    for instrument in sorted({i.upper() for i in instruments}):
+        try:
+            outcomes[instrument] = BarStore(translated_root, instrument).sync()
+        except Exception as e:
+            logger.warning(f"Bar store sync failed for {instrument}: {e}")
+            outcomes[instrument] = f"error: {e}"
+    return outcomes
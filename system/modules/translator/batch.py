@@ -0,0 +1,302 @@
+"""
+QTSW2 Translator — Batch
+
+Translate many raw exporter CSVs at once (backfills, catch-up after outages).
+
+Responsibilities:
+- Discover raw files: raw/{instrument}/1m/YYYY/MM/{instrument}_1m_{YYYY-MM-DD}.csv
+- Skip files already translated (output exists, or content hash unchanged since the
+  last batch translation, tracked in {output_root}/_translator_manifest.json)
+- Fan the per-file work (pyarrow CSV read, UTC->Chicago, schema, date filter, Parquet
+  write) out over a process pool
+
+Determinism:
+- Each file's own output is written by its worker (one output path per raw file)
+- Auto-corrected files (all rows belong to the previous Chicago date) merge into another
+  day's output, so their frames come back to the parent and are merged serially in raw
+  file order after the pool finishes, as translate_file would have done in a serial run
+"""
+
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import date as Date
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .bar_store import sync_bar_stores
+from .core import (
+    TranslatedDay,
+    translate_frame,
+    translated_output_dir,
+    write_translated_day,
+    _infer_date_from_filename,
+)
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE_NAME = "_translator_manifest.json"
+MANIFEST_VERSION = 1
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class BatchResult:
+    """Outcome of a translate_batch run"""
+    written: List[Path] = field(default_factory=list)
+    skipped: int = 0
+    failed: Dict[str, str] = field(default_factory=dict)  # raw path -> error
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+
+def file_sha256(path: Path) -> str:
+    """Content hash of a raw file"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class TranslationManifest:
+    """
+    Raw file -> (size, mtime_ns, sha256, output) of its last successful batch translation.
+
+    Size and mtime are only a shortcut: when they changed, the content hash decides,
+    so a re-exported file with identical bytes is still skipped.
+    """
+
+    def __init__(self, output_root: Path):
+        self.path = Path(output_root) / MANIFEST_FILE_NAME
+        self.entries: Dict[str, Dict] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            if isinstance(payload, dict) and payload.get("version") == MANIFEST_VERSION:
+                self.entries = dict(payload.get("files") or {})
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable translator manifest {self.path}: {e}")
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": MANIFEST_VERSION, "files": self.entries}, f, indent=1, sort_keys=True)
+        tmp_path.replace(self.path)
+
+    @staticmethod
+    def key(raw_path: Path) -> str:
+        return Path(raw_path).resolve().as_posix()
+
+    def is_unchanged(self, raw_path: Path) -> bool:
+        """True when the raw file matches its last translation and that output still exists"""
+        entry = self.entries.get(self.key(raw_path))
+        if not entry or not Path(entry.get("output", "")).exists():
+            return False
+        stat = raw_path.stat()
+        if entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+            return True
+        if entry.get("size") != stat.st_size:
+            return False
+        if file_sha256(raw_path) != entry.get("sha256"):
+            return False
+        entry["mtime_ns"] = stat.st_mtime_ns  # Touched but identical: refresh the shortcut
+        return True
+
+    def has_entry(self, raw_path: Path) -> bool:
+        return self.key(raw_path) in self.entries
+
+    def record(self, raw_path: Path, sha256: str, size: int, mtime_ns: int, output: Path) -> None:
+        self.entries[self.key(raw_path)] = {
+            "sha256": sha256,
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "output": Path(output).resolve().as_posix(),
+        }
+
+
+def discover_raw_files(
+    raw_root: Path,
+    instruments: Optional[Iterable[str]] = None,
+    start: Optional[Date] = None,
+    end: Optional[Date] = None,
+) -> List[Path]:
+    """
+    Raw exporter CSVs under raw_root, sorted by instrument then date.
+
+    Args:
+        raw_root: Root of raw/{instrument}/1m/YYYY/MM/
+        instruments: Instruments to include (None = every instrument folder)
+        start, end: Optional inclusive date bounds (from the filename date)
+    """
+    raw_root = Path(raw_root)
+    if not raw_root.exists():
+        return []
+    if instruments is None:
+        instrument_dirs = sorted(p for p in raw_root.iterdir() if p.is_dir())
+    else:
+        instrument_dirs = [raw_root / inst.upper() for inst in instruments]
+
+    found: List[Tuple[str, Date, Path]] = []
+    for instrument_dir in instrument_dirs:
+        instrument = instrument_dir.name.upper()
+        for raw_csv in instrument_dir.glob(f"1m/*/*/{instrument}_1m_*.csv"):
+            try:
+                day = _infer_date_from_filename(raw_csv)
+            except ValueError:
+                logger.warning(f"Skipping raw file with unparseable date: {raw_csv}")
+                continue
+            if (start and day < start) or (end and day > end):
+                continue
+            found.append((instrument, day, raw_csv))
+    found.sort(key=lambda item: (item[0], item[1], item[2].name))
+    return [raw_csv for _, _, raw_csv in found]
+
+
+def select_pending(
+    raw_files: List[Path],
+    output_root: Path,
+    manifest: Optional[TranslationManifest] = None,
+    overwrite: bool = False,
+) -> List[Path]:
+    """
+    Raw files that need translation.
+
+    A file is skipped when its manifest entry proves the content unchanged, or - when it
+    has no manifest entry and overwrite is False - when its output already exists
+    (rebuild-missing semantics, same as translate_day).
+    """
+    pending = []
+    for raw_csv in raw_files:
+        if manifest is not None:
+            if manifest.is_unchanged(raw_csv):
+                continue
+            if manifest.has_entry(raw_csv):
+                pending.append(raw_csv)  # Content changed since the last translation
+                continue
+        if not overwrite:
+            instrument = raw_csv.name.split("_")[0].upper()
+            day = _infer_date_from_filename(raw_csv)
+            out_file = translated_output_dir(output_root, instrument, day) / f"{instrument}_1m_{day.isoformat()}.parquet"
+            if out_file.exists():
+                continue
+        pending.append(raw_csv)
+    return pending
+
+
+def _translate_one(raw_csv: str, output_root: str) -> Tuple[str, Optional[str], Optional[TranslatedDay], str, int, int]:
+    """
+    Pool worker: translate one raw file.
+
+    Returns:
+        (raw path, written output or None, TranslatedDay to merge in the parent or None,
+         sha256, size, mtime_ns)
+    """
+    raw_path = Path(raw_csv)
+    stat = raw_path.stat()
+    sha256 = file_sha256(raw_path)
+    day = translate_frame(raw_path, use_arrow_reader=True)
+    if day.date_was_auto_corrected:
+        return raw_csv, None, day, sha256, stat.st_size, stat.st_mtime_ns
+    out_path = write_translated_day(day, Path(output_root), raw_path)
+    return raw_csv, str(out_path), None, sha256, stat.st_size, stat.st_mtime_ns
+
+
+def default_workers() -> int:
+    """75% of CPU cores, leaving some free for system operations"""
+    return max(1, int((os.cpu_count() or 1) * 0.75))
+
+
+def translate_batch(
+    raw_files: List[Path],
+    output_root: Path,
+    workers: Optional[int] = None,
+    overwrite: bool = False,
+    use_manifest: bool = True,
+    sync_bar_store: bool = True,
+) -> BatchResult:
+    """
+    Translate pending raw files, fanning out over a process pool.
+
+    Args:
+        raw_files: Candidate raw CSVs (e.g. from discover_raw_files)
+        output_root: Translated output root
+        workers: Process count (None = default_workers(); 1 = in-process, no pool)
+        overwrite: Re-translate files whose output exists but have no manifest entry
+        use_manifest: Skip files whose content hash is unchanged since the last batch run
+        sync_bar_store: Bring the consolidated bar store of every written instrument up to date
+
+    Returns:
+        BatchResult (a failing file never stops the batch)
+    """
+    output_root = Path(output_root)
+    manifest = TranslationManifest(output_root) if use_manifest else None
+    raw_files = [Path(p) for p in raw_files]
+    pending = select_pending(raw_files, output_root, manifest, overwrite)
+    result = BatchResult(skipped=len(raw_files) - len(pending))
+    if not pending:
+        if manifest is not None:
+            manifest.save()  # Persist refreshed mtimes
+        return result
+
+    workers = min(workers or default_workers(), len(pending))
+    outcomes: Dict[str, Tuple[Optional[str], Optional[TranslatedDay], str, int, int]] = {}
+
+    def _collect(raw_csv, outcome=None, error=None):
+        if error is not None:
+            result.failed[raw_csv] = str(error)
+            logger.error(f"Translation failed for {raw_csv}: {error}")
+        else:
+            outcomes[raw_csv] = outcome
+
+    if workers <= 1:
+        for raw_csv in pending:
+            try:
+                _collect(str(raw_csv), _translate_one(str(raw_csv), str(output_root))[1:])
+            except Exception as e:
+                _collect(str(raw_csv), error=e)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(_translate_one, str(raw_csv), str(output_root)): str(raw_csv)
+                for raw_csv in pending
+            }
+            for future in as_completed(futures):
+                raw_csv = futures[future]
+                try:
+                    _collect(raw_csv, future.result()[1:])
+                except Exception as e:
+                    _collect(raw_csv, error=e)
+
+    # Merge auto-corrected days serially, in raw file order (same as a serial run)
+    for raw_csv in (str(p) for p in pending):
+        if raw_csv not in outcomes:
+            continue
+        out_path, day, sha256, size, mtime_ns = outcomes[raw_csv]
+        if day is not None:
+            try:
+                out_path = str(write_translated_day(day, output_root, Path(raw_csv)))
+            except Exception as e:
+                _collect(raw_csv, error=e)
+                continue
+        result.written.append(Path(out_path))
+        if manifest is not None:
+            manifest.record(Path(raw_csv), sha256, size, mtime_ns, Path(out_path))
+
+    if manifest is not None:
+        manifest.save()
+    if sync_bar_store and result.written:
+        sync_bar_stores(output_root, {p.relative_to(output_root).parts[0] for p in result.written})
+    return result
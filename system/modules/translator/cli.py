@@ -18,8 +18,9 @@ import argparse
 from pathlib import Path
 from datetime import datetime, timedelta, date as Date
 
-# Correct import: CLI talks ONLY to translate_day
+# Correct import: CLI talks ONLY to translate_day (single days) and the batch API
 from .core import translate_day
+from .batch import discover_raw_files, translate_batch
 
 
 # ============================================================
@@ -90,6 +91,43 @@ def cmd_rebuild_missing(args: argparse.Namespace) -> int:
     return 0
 
 
+def cmd_batch(args: argparse.Namespace) -> int:
+    """
+    Translate every pending raw file under --raw-root with a process pool.
+
+    Exit codes:
+        0 -> success
+        2 -> partial or total failure
+    """
+    raw_files = discover_raw_files(
+        Path(args.raw_root),
+        instruments=args.instrument or None,
+        start=args.from_date,
+        end=args.to_date,
+    )
+    result = translate_batch(
+        raw_files,
+        Path(args.output_root),
+        workers=args.workers,
+        overwrite=args.overwrite,
+        sync_bar_store=not args.no_bar_store,
+    )
+
+    for raw_csv, error in sorted(result.failed.items()):
+        print(f"[ERROR] {raw_csv}: {error}", file=sys.stderr)
+
+    if result.failed:
+        print(
+            f"[FAILED] {len(result.failed)} file(s) failed, {len(result.written)} translated, "
+            f"{result.skipped} unchanged",
+            file=sys.stderr,
+        )
+        return 2
+
+    print(f"[OK] {len(result.written)} file(s) translated, {result.skipped} unchanged")
+    return 0
+
+
 # ============================================================
 # Main
 # ============================================================
@@ -113,6 +151,20 @@ def main() -> int:
     rebuild.add_argument("--output-root", required=True)
     rebuild.set_defaults(func=cmd_rebuild_missing)
 
+    batch = subparsers.add_parser(
+        "batch",
+        help="Translate all pending raw files in parallel (skips unchanged content)",
+    )
+    batch.add_argument("--instrument", action="append", help="Instrument symbol (repeatable; default: all)")
+    batch.add_argument("--from", dest="from_date", type=parse_date, default=None)
+    batch.add_argument("--to", dest="to_date", type=parse_date, default=None)
+    batch.add_argument("--raw-root", required=True)
+    batch.add_argument("--output-root", required=True)
+    batch.add_argument("--workers", type=int, default=None, help="Worker processes (default: 75%% of cores)")
+    batch.add_argument("--overwrite", action="store_true", help="Re-translate days whose output already exists")
+    batch.add_argument("--no-bar-store", action="store_true", help="Do not update the consolidated per-instrument bar stores")
+    batch.set_defaults(func=cmd_batch)
+
     args = parser.parse_args()
     return args.func(args)
 
@@ -11,7 +11,7 @@ Non-responsibilities:
 - No merging
 - No rollover
 - No frequency detection
-- No batching
+- No batching (see batch.py, which fans translate_file's steps out over a process pool)
 - No UI logic
 
 Folder Structure Contract:
@@ -40,11 +40,29 @@ Empty File Contract:
   as an indicator of processed days, regardless of whether data exists for that day.
 """
 
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import date as Date
+import numpy as np
 import pandas as pd
 import logging
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    from pandas._libs.parsers import STR_NA_VALUES
+    _PANDAS_NA_STRINGS = sorted(STR_NA_VALUES)  # pd.read_csv default na_values
+except ImportError:
+    _PANDAS_NA_STRINGS = [
+        "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+        "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+    ]
+
 from .schema import (
     convert_timestamp_utc_to_chicago,
     enforce_schema,
@@ -53,6 +71,30 @@ from .schema import (
 
 logger = logging.getLogger(__name__)
 
+# Parquet row group size for translated files (a daily 1m file always fits in one group)
+ROW_GROUP_SIZE = 65536
+
+# Explicit raw exporter dtypes for the pyarrow CSV reader. Timestamps stay strings so
+# convert_timestamp_utc_to_chicago parses them exactly as it does for pd.read_csv output.
+RAW_CSV_COLUMN_TYPES = {
+    "timestamp_utc": "string",
+    "open": "float64",
+    "high": "float64",
+    "low": "float64",
+    "close": "float64",
+    "volume": "float64",
+}
+
+
+@dataclass
+class TranslatedDay:
+    """Schema-enforced rows of one raw CSV and the trading day they belong to"""
+    instrument: str
+    trade_date: Date
+    df: pd.DataFrame
+    date_was_auto_corrected: bool = False
+
+
 # ======================================================================
 # FILE-LEVEL TRANSLATOR (primitive)
 # ======================================================================
@@ -60,6 +102,7 @@ logger = logging.getLogger(__name__)
 def translate_file(
     raw_csv_path: Path,
     translated_root: Path,
+    use_arrow_reader: bool = False,
 ) -> Path:
     """
     Translate a single raw exporter CSV into canonical Parquet.
@@ -70,10 +113,22 @@ def translate_file(
     - Only data belonging to the trading day specified in the filename is kept
     - This ensures determinism and prevents data from being written to wrong folders
     - Warnings are logged when timestamps are filtered (common in trading data due to timezone boundaries)
+
+    use_arrow_reader reads the CSV with pyarrow and explicit dtypes (same output as pd.read_csv).
+    """
+    day = translate_frame(raw_csv_path, use_arrow_reader=use_arrow_reader)
+    return write_translated_day(day, translated_root, raw_csv_path)
+
+
+def translate_frame(raw_csv_path: Path, use_arrow_reader: bool = False) -> TranslatedDay:
     """
+    Read, convert, enforce and date-filter one raw CSV without writing anything.
 
+    Returns:
+        TranslatedDay; date_was_auto_corrected means every row belongs to another
+        (Chicago) date and must be merged into that day's file by write_translated_day.
+    """
     raw_csv_path = Path(raw_csv_path)
-    translated_root = Path(translated_root)
 
     if not raw_csv_path.exists():
         raise ValueError(f"Raw CSV does not exist: {raw_csv_path}")
@@ -91,7 +146,7 @@ def translate_file(
 
     # Read CSV file with error handling
     try:
-        df_raw = pd.read_csv(raw_csv_path)
+        df_raw = read_raw_csv(raw_csv_path, use_arrow_reader=use_arrow_reader)
     except Exception as e:
         raise IOError(
             f"Failed to read CSV file {raw_csv_path}: {e}. "
@@ -122,12 +177,14 @@ def translate_file(
     date_was_auto_corrected = False
 
     if not df.empty:
-        timestamp_dates = df["timestamp"].dt.date
-        mismatched = timestamp_dates != trade_date
+        # Chicago calendar day of each row as datetime64[D] (no per-row Python date objects)
+        timestamp_days = df["timestamp"].dt.tz_localize(None).to_numpy().astype("datetime64[D]")
+        mismatched = timestamp_days != np.datetime64(trade_date, "D")
         if mismatched.any():
-            mismatched_count = mismatched.sum()
+            mismatched_count = int(mismatched.sum())
             total_count = len(df)
-            mismatched_dates = timestamp_dates[mismatched].unique()
+            timestamp_dates = pd.Series(timestamp_days[mismatched]).dt.date
+            mismatched_dates = timestamp_dates.unique()
             
             # Special case: If ALL rows are mismatched, this indicates a filename date error
             # Exporter uses UTC date in filename, but data converts to previous Chicago date
@@ -155,11 +212,30 @@ def translate_file(
                     f"Filtered out {mismatched_count} row(s) to keep only data for trading day {trade_date}."
                 )
 
-    yyyy = f"{trade_date.year:04d}"
-    mm = f"{trade_date.month:02d}"
-    date_str = trade_date.isoformat()
+    return TranslatedDay(
+        instrument=instrument,
+        trade_date=trade_date,
+        df=df,
+        date_was_auto_corrected=date_was_auto_corrected,
+    )
+
 
-    out_dir = translated_root / instrument / "1m" / yyyy / mm
+def write_translated_day(day: TranslatedDay, translated_root: Path, raw_csv_path: Path) -> Path:
+    """
+    Write a TranslatedDay to {translated_root}/{instrument}/1m/YYYY/MM/ (merging when auto-corrected).
+
+    Returns:
+        Path of the written Parquet file
+    """
+    translated_root = Path(translated_root)
+    raw_csv_path = Path(raw_csv_path)
+    instrument = day.instrument
+    trade_date = day.trade_date
+    date_was_auto_corrected = day.date_was_auto_corrected
+    df = day.df
+
+    out_dir = translated_output_dir(translated_root, instrument, trade_date)
+    date_str = trade_date.isoformat()
     
     # Create output directory with error handling
     try:
@@ -194,7 +270,7 @@ def translate_file(
     # Translator SHALL fail loudly on write failure, never silently skip
     # Empty DataFrames are intentionally written (see Empty File Contract in module docstring)
     try:
-        df.to_parquet(out_path, index=False)
+        df.to_parquet(out_path, index=False, row_group_size=ROW_GROUP_SIZE)
     except Exception as e:
         raise IOError(
             f"Failed to write Parquet file {out_path}: {e}. "
@@ -259,6 +335,36 @@ def translate_day(
 # INTERNAL HELPERS
 # ======================================================================
 
+def translated_output_dir(translated_root: Path, instrument: str, day: Date) -> Path:
+    """Output folder of one instrument-day: {translated_root}/{instrument}/1m/YYYY/MM"""
+    return Path(translated_root) / instrument / "1m" / f"{day.year:04d}" / f"{day.month:02d}"
+
+
+def read_raw_csv(raw_csv_path: Path, use_arrow_reader: bool = False) -> pd.DataFrame:
+    """
+    Read a raw exporter CSV.
+
+    The pyarrow reader uses RAW_CSV_COLUMN_TYPES (multi-threaded, no type inference) and
+    falls back to pd.read_csv when pyarrow is missing or the file does not fit those
+    dtypes, so malformed files fail exactly as they always did.
+    """
+    if use_arrow_reader and PYARROW_AVAILABLE:
+        try:
+            column_types = {name: pa.type_for_alias(alias) for name, alias in RAW_CSV_COLUMN_TYPES.items()}
+            table = pa_csv.read_csv(
+                raw_csv_path,
+                convert_options=pa_csv.ConvertOptions(
+                    column_types=column_types,
+                    null_values=_PANDAS_NA_STRINGS,
+                    strings_can_be_null=True,
+                ),
+            )
+            return table.to_pandas()
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+            logger.debug(f"pyarrow CSV reader rejected {raw_csv_path.name} ({e}); using pd.read_csv")
+    return pd.read_csv(raw_csv_path)
+
+
 def _infer_instrument_from_filename(path: Path) -> str:
     """
     Extract instrument symbol from filename.
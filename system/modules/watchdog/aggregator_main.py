@@ -22,6 +22,8 @@ from collections import Counter, defaultdict, deque
 import pytz
 
 from .event_feed import EventFeedGenerator
+from .event_hub import get_event_hub
+from .feed_event_index import FeedEventIndex
 from .event_processor import EventProcessor, get_flatten_lookup_reason_counts, stream_session_flatten_fields
 from modules.watchdog.aggregator.session_flatten_state import SessionFlattenStateTracker
 from .state_manager import (
@@ -1146,6 +1148,8 @@ class WatchdogAggregator:
         # Buffer size: 1000 events (was 200; increase to reduce overflow under anomaly spikes)
         self._important_events_buffer: deque = deque(maxlen=1000)
         self._event_seq_counter: int = 0  # Monotonic sequence ID counter
+        # Push fan-out of ring buffer appends to WebSocket connections
+        self._event_hub = get_event_hub()
         self._last_hydrate_utc: Optional[datetime] = None  # Throttle journal hydrate in get_active_intents
         self._last_slot_journal_hydrate_utc: Optional[datetime] = None  # Throttle slot journal hydrate in get_stream_states
 
@@ -1155,7 +1159,10 @@ class WatchdogAggregator:
         self._ingestion_degraded_entered_at: Optional[datetime] = None
 
         # INGESTION: /events cache - keyed by feed file to avoid cross-run leakage.
+        # Only used for run-scoped peeks and before the first ingestion cycle indexed the run.
         self._events_cache: Optional[Tuple[Path, List[Dict], datetime]] = None
+        # INGESTION: Live Event Feed events by (run_id, event_seq), filled from the cycle's tail read
+        self._feed_event_index = FeedEventIndex()
 
         # Opt-in CPU/load diagnostics (WATCHDOG_CPU_DIAG=1)
         self._last_cpu_diag_utc: Optional[datetime] = None
@@ -2667,6 +2674,9 @@ class WatchdogAggregator:
                 except json.JSONDecodeError:
                     parse_errors += 1
 
+            # /events reads from the index (bisect on since_seq) instead of re-reading the tail
+            self._feed_event_index.add(self._filter_events_for_live_feed(parsed_events))
+
             # Cursor empty/invalid: safe init to prevent replay inflation (e.g. cursor file deleted mid-run)
             if not cursor and parsed_events:
                 logger.warning("Cursor empty mid-run - safe init: rebuild connection with skip_session_metrics, advance cursor")
@@ -3280,18 +3290,41 @@ class WatchdogAggregator:
         context: Optional[WatchdogRunContext] = None,
     ) -> List[Dict]:
         """
-        Get most recent events for Live Events feed.
+        Get Live Events feed events of a run with event_seq > since_seq (the newest 300).
         
-        INGESTION: Cached for EVENTS_CACHE_TTL_SECONDS. Multiple clients within TTL
-        share one disk read to avoid linear I/O scaling.
+        INGESTION: Active run events come from the seq index maintained by the ingestion
+        cycle (bisect + slice, no disk read). Run-scoped peeks, and runs the index has not
+        seen yet, read the feed tail (cached for EVENTS_CACHE_TTL_SECONDS so clients within
+        the TTL share one disk read).
         
-        Merges feed tail + ring buffer so derived anomalies (ORDER_STUCK_DETECTED,
+        Merges feed events + ring buffer so derived anomalies (ORDER_STUCK_DETECTED,
         EXECUTION_LATENCY_SPIKE_DETECTED, RECOVERY_LOOP_DETECTED) appear in REST
         for CLI tools, debugging scripts, and fallback clients.
         
         Filters out noisy event types (tick heartbeats, bar heartbeats, diagnostics)
         to reduce verbosity - same philosophy as WebSocket important_events buffer.
         """
+        active = self._context_is_active(context)
+        if active and run_id and self._feed_event_index.has_run(run_id):
+            filtered = self._feed_event_index.since(run_id, since_seq, limit=300)
+        else:
+            filtered = self._read_live_feed_events_tail(run_id, context)
+            filtered = [e for e in filtered if self._event_seq_after(e, since_seq)]
+
+        # Merge ring buffer (derived anomalies) so REST clients see ORDER_STUCK_DETECTED,
+        # EXECUTION_LATENCY_SPIKE_DETECTED, RECOVERY_LOOP_DETECTED
+        ring_events = self._ring_buffer_events_for_rest() if active else []
+        merged = filtered + ring_events
+        merged.sort(key=lambda e: e.get("timestamp_utc", "") or e.get("ts_utc", "") or e.get("timestamp_chicago", ""))
+        return merged[-300:] if len(merged) > 300 else merged
+
+    @staticmethod
+    def _event_seq_after(event: Dict, since_seq: int) -> bool:
+        seq = event.get("event_seq", 0)
+        return isinstance(seq, (int, float)) and seq > since_seq
+
+    def _read_live_feed_events_tail(self, run_id: str, context: Optional[WatchdogRunContext]) -> List[Dict]:
+        """Live Event Feed events of a run from the last 1000 feed lines (TTL-cached tail read)."""
         now = datetime.now(timezone.utc)
         feed_file = self._feed_file_for_context(context)
         if self._events_cache:
@@ -3312,13 +3345,7 @@ class WatchdogAggregator:
         # events from the primary run (most recent by timestamp)
         if run_id:
             filtered = [e for e in filtered if e.get("run_id") == run_id]
-
-        # Merge ring buffer (derived anomalies) so REST clients see ORDER_STUCK_DETECTED,
-        # EXECUTION_LATENCY_SPIKE_DETECTED, RECOVERY_LOOP_DETECTED
-        ring_events = self._ring_buffer_events_for_rest() if self._context_is_active(context) else []
-        merged = filtered + ring_events
-        merged.sort(key=lambda e: e.get("timestamp_utc", "") or e.get("ts_utc", "") or e.get("timestamp_chicago", ""))
-        return merged[-300:] if len(merged) > 300 else merged
+        return filtered
 
     def _ring_buffer_events_for_rest(self) -> List[Dict]:
         """Convert ring buffer DERIVED events only to REST-compatible format.
@@ -4413,7 +4440,7 @@ class WatchdogAggregator:
         self._append_to_ring_buffer(ws_event)
 
     def _append_to_ring_buffer(self, ws_event: Dict) -> None:
-        """Append to ring buffer; log when buffer is full and evicting oldest event."""
+        """Append to ring buffer (log when evicting oldest event) and push to WebSocket subscribers."""
         buf = self._important_events_buffer
         if len(buf) == buf.maxlen:
             evicted = buf[0]
@@ -4422,6 +4449,7 @@ class WatchdogAggregator:
                 f"seq={evicted.get('seq', 0)} (buffer_size={buf.maxlen})"
             )
         buf.append(ws_event)
+        self._event_hub.publish(ws_event)
 
     def _record_anomaly_timestamp(self, event_type: str, ts: datetime) -> None:
         """Record anomaly for rate guardrail with dedupe. Skips if _skip_anomaly_counting or duplicate."""
@@ -247,10 +247,12 @@ async def get_events(
         if tick_callsite_events:
             logger.debug(f"API returning {len(tick_callsite_events)} ENGINE_TICK_CALLSITE event(s) to frontend")
         
-        # Get next_seq (highest event_seq in response, or since_seq if no events)
+        # Get next_seq (highest event_seq of the run's events, or since_seq if none).
+        # Watchdog-derived events carry their own counter and must not move the run cursor.
         next_seq = since_seq
-        if events:
-            next_seq = max(e.get("event_seq", 0) for e in events)
+        run_seqs = [e.get("event_seq", 0) for e in events if e.get("run_id") == current_run_id]
+        if run_seqs:
+            next_seq = max(run_seqs)
 
         # Phase 4: Add event_id for REST/WS dedupe consistency
         events_with_id = [
@@ -7,6 +7,7 @@ REST provides authoritative state.
 No snapshots, no file IO, no history replay.
 """
 import asyncio
+import json
 import logging
 from typing import Optional
 from datetime import datetime, timezone
@@ -23,6 +24,7 @@ from modules.watchdog.config import (
     WS_HEARTBEAT_INTERVAL_SECONDS,
     WS_MAX_SEND_FAILURES,
 )
+from modules.watchdog.event_hub import get_event_hub
 from modules.watchdog.websocket_tracker import get_tracker
 from modules.watchdog.backend.websocket_utils import (
     is_connection_closed_error,
@@ -50,13 +52,25 @@ router = APIRouter(tags=["websocket"])
 logger = logging.getLogger(__name__)
 
 
+async def _wait_for_disconnect(websocket: WebSocket) -> None:
+    """Return once the client disconnects (clients send nothing on this socket)."""
+    try:
+        while True:
+            message = await websocket.receive()
+            if message.get("type") == "websocket.disconnect":
+                return
+    except Exception:
+        return
+
+
 @router.websocket("/ws/events")
 async def websocket_events(websocket: WebSocket, run_id: Optional[str] = None):
     """
     WebSocket endpoint for real-time watchdog event streaming.
     
-    Live-signal only: Sends heartbeat and important events from in-memory ring buffer.
-    No snapshots, no file IO, no history replay.
+    Live-signal only: Sends the important events in the in-memory ring buffer, then the
+    events the aggregator pushes through the event hub as they arrive, and a heartbeat
+    when idle. No snapshots, no file IO, no history replay.
     
     Lifecycle:
     - WS_CONNECT_ATTEMPT: Route handler invoked (proves route match)
@@ -116,24 +130,73 @@ async def websocket_events(websocket: WebSocket, run_id: Optional[str] = None):
         logger.warning(f"WS_CONNECTION_NOT_READY client={client_host}:{client_port} state={websocket.client_state}")
         return
     
+    # Subscribe before reading the ring buffer so nothing published in between is missed
+    hub = get_event_hub()
+    subscription = hub.subscribe(run_id)
+    disconnect_task = asyncio.create_task(_wait_for_disconnect(websocket))
+    get_task: Optional[asyncio.Task] = None
+    
     # Get aggregator instance (lazy import to avoid circular dependency)
-    # Note: We allow connections even if aggregator isn't ready yet - we just won't send events
+    # Note: We allow connections even if aggregator isn't ready yet - live events still arrive
+    # through the hub once it starts publishing
     aggregator = get_aggregator_instance()
     if not aggregator:
         logger.warning(
             f"WS_WARNING: Aggregator not available yet connection_id={connection_id_short} "
-            f"client={client_host}:{client_port} - connection will only send heartbeats"
+            f"client={client_host}:{client_port} - connection will only send heartbeats until it starts"
         )
-        # Don't close connection - allow it to stay open and just send heartbeats
-        # The aggregator might become available later
     
     # Track last message sent time for heartbeat
     last_message_sent_utc = datetime.now(timezone.utc)
     
+    async def send_text(text: str, phase: str) -> bool:
+        """Send one message; False when the connection is gone and the loop should stop."""
+        nonlocal send_fail_count, last_message_sent_utc
+        # Check connection state before sending
+        if websocket.client_state != WebSocketState.CONNECTED or not websocket.client:
+            return False
+        try:
+            await asyncio.wait_for(websocket.send_text(text), timeout=WS_SEND_TIMEOUT_SECONDS)
+            await tracker.record_message_sent()
+            send_fail_count = 0  # Reset on successful send
+            last_message_sent_utc = datetime.now(timezone.utc)
+            return True
+        except Exception as send_err:
+            # Use utility to determine if we should break
+            if should_break_on_error(send_err, phase):
+                return False
+            
+            # Log error using utility (never crashes)
+            log_websocket_error(send_err, phase, f"{client_host}:{client_port}", connection_id_short)
+            
+            # Increment failure count and continue
+            send_fail_count += 1
+            await tracker.record_dropped_events(1)
+            await tracker.record_error(f"Error sending {phase} message: {send_err}")
+            return True
+    
     try:
         logger.info("WS_LOOP_ENTER")
-        # Main loop: Send heartbeat and important events
-        while True:
+        # Catch up on the important events already in the ring buffer
+        backlog = []
+        if aggregator:
+            try:
+                backlog = aggregator.get_important_events_since(last_sent_seq)
+                # Filter by run_id if specified
+                if run_id:
+                    backlog = [e for e in backlog if e.get("run_id") == run_id]
+            except Exception as get_events_err:
+                logger.warning(f"Error getting events from aggregator: {get_events_err}")
+        connected = True
+        for event in backlog:
+            connected = await send_text(json.dumps(event, default=str), "send")
+            if not connected:
+                break
+            events_sent += 1
+            last_sent_seq = max(last_sent_seq, event.get("seq", 0))
+        
+        # Main loop: forward pushed events as they arrive, heartbeat when idle
+        while connected:
             # Check connection state
             if websocket.client_state != WebSocketState.CONNECTED:
                 break
@@ -147,99 +210,44 @@ async def websocket_events(websocket: WebSocket, run_id: Optional[str] = None):
                 await websocket.close(code=1008, reason="Max send failures exceeded")
                 break
             
-            # Get new important events since last_sent_seq from ring buffer (if aggregator available)
-            new_events = []
-            if aggregator:
-                try:
-                    new_events = aggregator.get_important_events_since(last_sent_seq)
-                    # Filter by run_id if specified
-                    if run_id:
-                        new_events = [e for e in new_events if e.get("run_id") == run_id]
-                except Exception as get_events_err:
-                    logger.warning(f"Error getting events from aggregator: {get_events_err}")
-                    # Try to get aggregator again in case it became available
-                    aggregator = get_aggregator_instance()
-            
-            # Send new events if any
-            if new_events:
-                for event in new_events:
-                    # Check connection state before sending
-                    if websocket.client_state != WebSocketState.CONNECTED:
-                        break
-                    
-                    if not websocket.client:
-                        break
-                    
-                    try:
-                        await asyncio.wait_for(
-                            websocket.send_json(event),
-                            timeout=WS_SEND_TIMEOUT_SECONDS
-                        )
-                        await tracker.record_message_sent()
-                        events_sent += 1
-                        send_fail_count = 0  # Reset on successful send
-                        last_message_sent_utc = datetime.now(timezone.utc)
-                        
-                        # Update last_sent_seq
-                        event_seq = event.get("seq", 0)
-                        if event_seq > last_sent_seq:
-                            last_sent_seq = event_seq
-                        
-                        if events_sent <= 5 or events_sent % 100 == 0:
-                            logger.debug(f"Sent event #{events_sent} seq={event_seq} to {client_host}:{client_port}")
-                    except Exception as send_err:
-                        # Use utility to determine if we should break
-                        if should_break_on_error(send_err, "send"):
-                            break
-                        
-                        # Log error using utility (never crashes)
-                        log_websocket_error(send_err, "send", f"{client_host}:{client_port}", connection_id_short)
-                        
-                        # Increment failure count and continue to next event
-                        send_fail_count += 1
-                        await tracker.record_dropped_events(1)
-                        await tracker.record_error(f"Error sending event: {send_err}")
-                        # Continue to next event
+            # Events evicted from this connection's queue (slow client)
+            dropped = subscription.take_dropped()
+            if dropped:
+                await tracker.record_dropped_events(dropped)
             
-            # Check for heartbeat (if no events sent for interval)
-            now_utc = datetime.now(timezone.utc)
-            time_since_last_message = (now_utc - last_message_sent_utc).total_seconds()
+            time_since_last_message = (datetime.now(timezone.utc) - last_message_sent_utc).total_seconds()
+            if get_task is None:
+                get_task = asyncio.ensure_future(subscription.queue.get())
+            done, _ = await asyncio.wait(
+                {get_task, disconnect_task},
+                timeout=max(0.0, WS_HEARTBEAT_INTERVAL_SECONDS - time_since_last_message),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if disconnect_task in done:
+                break
             
-            if time_since_last_message >= WS_HEARTBEAT_INTERVAL_SECONDS:
-                # Send heartbeat
-                try:
-                    # Double-check connection state before sending
-                    if websocket.client_state != WebSocketState.CONNECTED:
-                        break
-                    
-                    if not websocket.client:
-                        break
-                    
-                    await asyncio.wait_for(
-                        websocket.send_json({
-                            "type": "heartbeat",
-                            "server_time_utc": now_utc.isoformat(),
-                        }),
-                        timeout=WS_SEND_TIMEOUT_SECONDS
-                    )
-                    await tracker.record_message_sent()
-                    last_message_sent_utc = now_utc
-                    logger.debug(f"Heartbeat sent to {client_host}:{client_port}")
-                except Exception as heartbeat_err:
-                    # Use utility to determine if we should break
-                    if should_break_on_error(heartbeat_err, "heartbeat"):
-                        break
-                    
-                    # Log error using utility (never crashes)
-                    log_websocket_error(heartbeat_err, "heartbeat", f"{client_host}:{client_port}", connection_id_short)
-                    
-                    # Increment failure count
-                    send_fail_count += 1
-                    await tracker.record_dropped_events(1)
-                    await tracker.record_error(f"Heartbeat send failed: {heartbeat_err}")
+            if get_task in done:
+                event_seq, text = get_task.result()
+                get_task = None
+                # Already sent from the ring buffer backlog
+                if event_seq <= last_sent_seq:
+                    continue
+                connected = await send_text(text, "send")
+                if connected:
+                    events_sent += 1
+                    last_sent_seq = event_seq
+                    if events_sent <= 5 or events_sent % 100 == 0:
+                        logger.debug(f"Sent event #{events_sent} seq={event_seq} to {client_host}:{client_port}")
+                continue
             
-            # Sleep before next poll (poll every second)
-            await asyncio.sleep(1)
+            # No message for the heartbeat interval: send heartbeat
+            now_utc = datetime.now(timezone.utc)
+            connected = await send_text(
+                json.dumps({"type": "heartbeat", "server_time_utc": now_utc.isoformat()}),
+                "heartbeat",
+            )
+            if connected:
+                logger.debug(f"Heartbeat sent to {client_host}:{client_port}")
     
     except Exception as stream_err:
         logger.exception("WS_FATAL")
@@ -253,6 +261,10 @@ async def websocket_events(websocket: WebSocket, run_id: Optional[str] = None):
             await tracker.record_error(f"Unexpected error in streaming loop: {stream_err}")
     finally:
         logger.info("WS_CLEANUP")
+        hub.unsubscribe(subscription)
+        for task in (get_task, disconnect_task):
+            if task is not None and not task.done():
+                task.cancel()
         # Unregister connection
         if connection_id:
             await tracker.unregister_connection(connection_id)
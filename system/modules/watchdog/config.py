@@ -17,6 +17,8 @@ FRONTEND_FEED_FILE = ROBOT_LOGS_DIR / "frontend_feed.jsonl"
 FRONTEND_CURSOR_FILE = QTSW2_ROOT / "data" / "frontend_cursor.json"
 # Persisted read positions for robot log files (survives watchdog restarts)
 ROBOT_LOG_READ_POSITIONS_FILE = QTSW2_ROOT / "data" / "robot_log_read_positions.json"
+# P&L fill index: per (trading_date, stream) EXECUTION_* fill records built incrementally from robot logs
+FILL_INDEX_DIR = QTSW2_ROOT / "data" / "watchdog" / "fill_index"
 
 # Phase 1: Alert ledger and notification config
 ALERT_LEDGER_PATH = QTSW2_ROOT / "data" / "watchdog" / "alert_ledger.jsonl"
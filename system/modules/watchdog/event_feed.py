@@ -6,13 +6,14 @@ and writes to frontend_feed.jsonl.
 
 Automatically rotates frontend_feed.jsonl when it exceeds 100 MB to prevent disk space issues.
 """
+import heapq
 import json
 import logging
 import re
 import shutil
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 from datetime import datetime, timezone
 import pytz
 from collections import Counter, defaultdict
@@ -408,6 +409,40 @@ class EventFeedGenerator:
         
         return events
     
+    @staticmethod
+    def _event_sort_timestamp(event: Dict) -> Any:
+        """Primary merge key: RobotLogEvent uses "ts_utc"; converted format uses "timestamp_utc"."""
+        return event.get("timestamp_utc") or event.get("ts_utc") or event.get("timestamp") or ""
+
+    def _merge_log_events(self, events_by_file: List[Tuple[str, List[Dict]]]) -> Tuple[List[Dict], int]:
+        """
+        K-way merge of per-file event lists into (timestamp, file_path, index) order.
+
+        Each file tail is nearly time-ordered already: an ordered tail is used as-is,
+        and a tail with out-of-order lines is fixed with a stable sort on timestamp
+        (Timsort is linear on nearly-sorted runs). The sorted tails are then merged
+        with a heap in file-path order, so timestamp ties resolve by file path and
+        then by line index - the same total order as a full sort of all events.
+
+        Returns:
+            Tuple of (merged events, number of files that needed reordering)
+        """
+        runs = []
+        reordered_files = 0
+        for path, events in sorted(events_by_file, key=lambda item: item[0]):
+            if not events:
+                continue
+            keyed = [(self._event_sort_timestamp(ev), ev) for ev in events]
+            if any(keyed[i][0] > keyed[i + 1][0] for i in range(len(keyed) - 1)):
+                keyed.sort(key=lambda item: item[0])  # stable: ties keep line order
+                reordered_files += 1
+            runs.append(keyed)
+        if len(runs) == 1:
+            return [ev for _, ev in runs[0]], reordered_files
+        # heapq.merge breaks key ties by iterable order (= file path order), then position
+        merged = heapq.merge(*runs, key=lambda item: item[0])
+        return [ev for _, ev in merged], reordered_files
+
     def _load_read_positions(self) -> None:
         """Load persisted read positions from disk (survives watchdog restarts)."""
         if not ROBOT_LOG_READ_POSITIONS_FILE.exists():
@@ -505,6 +540,8 @@ class EventFeedGenerator:
             logger.debug("No robot log files found")
             self.last_cycle_metrics = {
                 "duration_ms": round((time.perf_counter() - cycle_t0) * 1000, 2),
+                "merge_ms": 0.0,
+                "merge_reordered_files": 0,
                 "raw_events_read": 0,
                 "events_written_to_feed": 0,
                 "robot_log_files": 0,
@@ -520,23 +557,16 @@ class EventFeedGenerator:
         
         processed_count = 0
         
-        # Read new events from all log files (attach file path for deterministic secondary sort)
-        all_events = []
-        for log_file in log_files:
-            events = self._read_log_file_incremental(log_file)
-            for i, ev in enumerate(events):
-                all_events.append((ev, str(log_file), i))
+        # Read new events from all log files (file path is the secondary merge key)
+        events_by_file = [
+            (str(log_file), self._read_log_file_incremental(log_file))
+            for log_file in log_files
+        ]
         
-        # Sort by (timestamp, file_path, index) for strict ordering across multi-file merge
-        # RobotLogEvent uses "ts_utc"; converted format uses "timestamp_utc"
-        # event_seq in raw events used as tertiary when present (replay)
-        def _sort_key(item):
-            ev, path, idx = item
-            ts = ev.get("timestamp_utc") or ev.get("ts_utc") or ev.get("timestamp") or ""
-            seq = ev.get("event_seq", 0) if isinstance(ev.get("event_seq"), (int, float)) else 0
-            return (ts, path, idx, seq)
-        all_events.sort(key=_sort_key)
-        all_events = [ev for ev, _, _ in all_events]
+        # Merge by (timestamp, file_path, index) for strict ordering across files
+        merge_t0 = time.perf_counter()
+        all_events, reordered_files = self._merge_log_events(events_by_file)
+        merge_ms = round((time.perf_counter() - merge_t0) * 1000, 2)
 
         type_counts: Counter = Counter()
         order_related_raw = 0
@@ -593,6 +623,8 @@ class EventFeedGenerator:
         duration_ms = round((time.perf_counter() - cycle_t0) * 1000, 2)
         self.last_cycle_metrics = {
             "duration_ms": duration_ms,
+            "merge_ms": merge_ms,
+            "merge_reordered_files": reordered_files,
             "raw_events_read": len(all_events),
             "events_written_to_feed": processed_count,
             "robot_log_files": len(log_files),
@@ -0,0 +1,121 @@
+"""
+WebSocket Event Hub
+
+Push-based fan-out of important watchdog events to WebSocket connections.
+
+The aggregator publishes each important event once (from the ring buffer append, on the
+event loop or the ingestion thread); the hub serializes it once and hands the same JSON
+text to every subscriber's bounded asyncio queue. Connections block on their queue
+instead of polling the aggregator, so an event reaches the browser as soon as it is
+ingested and idle tabs cost nothing.
+
+Backpressure: a subscriber whose queue is full loses its oldest queued event; the
+connection reports the count to WebSocketTracker.record_dropped_events.
+"""
+import asyncio
+import json
+import logging
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+from .config import WS_MAX_BUFFER_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """One WebSocket connection's queue of (seq, json_text) events."""
+
+    def __init__(self, run_id: Optional[str] = None, maxsize: int = WS_MAX_BUFFER_SIZE):
+        self.run_id = run_id
+        self.queue: "asyncio.Queue[Tuple[int, str]]" = asyncio.Queue(maxsize=maxsize)
+        self._dropped = 0
+
+    def _offer(self, item: Tuple[int, str]) -> None:
+        """Enqueue, evicting the oldest queued event when full (event loop thread only)."""
+        if self.queue.full():
+            try:
+                self.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            self._dropped += 1
+        self.queue.put_nowait(item)
+
+    def take_dropped(self) -> int:
+        """Events dropped since the last call."""
+        dropped, self._dropped = self._dropped, 0
+        return dropped
+
+
+class EventHub:
+    """Thread-safe publisher to per-connection asyncio queues."""
+
+    def __init__(self):
+        self._subscribers: Set[Subscription] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: List[Tuple[int, Optional[str], str]] = []
+        self._flush_scheduled = False
+        self._lock = threading.Lock()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self, run_id: Optional[str] = None, maxsize: int = WS_MAX_BUFFER_SIZE) -> Subscription:
+        """Register a connection (call from the event loop)."""
+        self._loop = asyncio.get_running_loop()
+        subscription = Subscription(run_id, maxsize)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscribers.discard(subscription)
+
+    def publish(self, ws_event: Dict) -> None:
+        """
+        Publish an important event to all subscribers.
+
+        Safe to call from any thread; a no-op while nobody is subscribed.
+        """
+        loop = self._loop
+        if not self._subscribers or loop is None:
+            return
+        try:
+            text = json.dumps(ws_event, default=str)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"WS_HUB_SERIALIZE_FAILED type={ws_event.get('type')} error={e}")
+            return
+        with self._lock:
+            self._pending.append((int(ws_event.get("seq") or 0), ws_event.get("run_id"), text))
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        try:
+            loop.call_soon_threadsafe(self._flush)
+        except RuntimeError:
+            # Loop closed (shutdown)
+            with self._lock:
+                self._pending.clear()
+                self._flush_scheduled = False
+
+    def _flush(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._flush_scheduled = False
+        for subscription in list(self._subscribers):
+            for seq, run_id, text in pending:
+                if subscription.run_id and run_id != subscription.run_id:
+                    continue
+                subscription._offer((seq, text))
+
+
+# Global hub instance
+_hub_instance: Optional[EventHub] = None
+
+
+def get_event_hub() -> EventHub:
+    """Get global event hub instance."""
+    global _hub_instance
+    if _hub_instance is None:
+        _hub_instance = EventHub()
+    return _hub_instance
@@ -0,0 +1,106 @@
+"""
+Seq-ordered index of Live Event Feed events.
+
+Maintained by the ingestion cycle (_process_feed_events_sync) from the tail it already
+reads, so GET /events?since_seq=N is a bisect and a slice instead of re-reading and
+re-filtering the feed tail on every poll.
+
+- One seq-sorted list per run_id (event_seq is monotonic per run)
+- Bounded: the oldest events of a run are dropped beyond max_events_per_run, and the
+  runs not written to for the longest time beyond max_runs
+- Events at or below a run's dropped boundary are never re-added (the next tail read
+  still contains them)
+"""
+
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+# Events kept per run (the ingestion tail is TAIL_LINE_COUNT lines, across runs)
+EVENT_INDEX_MAX_EVENTS = 5000
+EVENT_INDEX_MAX_RUNS = 4
+
+
+class _RunEvents:
+    __slots__ = ("seqs", "events", "floor")
+
+    def __init__(self) -> None:
+        self.seqs: List[int] = []
+        self.events: List[Dict] = []
+        self.floor: Optional[int] = None  # Highest seq dropped by the bound
+
+
+class FeedEventIndex:
+    """Bounded per-run index of feed events ordered by event_seq (thread-safe)."""
+
+    def __init__(self, max_events_per_run: int = EVENT_INDEX_MAX_EVENTS, max_runs: int = EVENT_INDEX_MAX_RUNS):
+        self.max_events_per_run = max_events_per_run
+        self.max_runs = max_runs
+        self._runs: "OrderedDict[str, _RunEvents]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, events: Iterable[Dict]) -> int:
+        """
+        Index events not seen yet (events without run_id or integer event_seq are ignored).
+
+        Returns:
+            Number of events added
+        """
+        added = 0
+        with self._lock:
+            for ev in events:
+                run_id = ev.get("run_id")
+                seq = ev.get("event_seq")
+                if not run_id or isinstance(seq, bool) or not isinstance(seq, (int, float)):
+                    continue
+                seq = int(seq)
+                run = self._runs.get(run_id)
+                if run is None:
+                    run = self._runs[run_id] = _RunEvents()
+                if run.floor is not None and seq <= run.floor:
+                    continue
+                if not run.seqs or seq > run.seqs[-1]:
+                    run.seqs.append(seq)
+                    run.events.append(ev)
+                else:
+                    pos = bisect_left(run.seqs, seq)
+                    if pos < len(run.seqs) and run.seqs[pos] == seq:
+                        continue  # Already indexed
+                    run.seqs.insert(pos, seq)
+                    run.events.insert(pos, ev)
+                self._runs.move_to_end(run_id)
+                added += 1
+                # Trim in chunks so the list shift is amortized
+                if len(run.seqs) > self.max_events_per_run + self.max_events_per_run // 4:
+                    drop = len(run.seqs) - self.max_events_per_run
+                    run.floor = run.seqs[drop - 1]
+                    del run.seqs[:drop]
+                    del run.events[:drop]
+            while len(self._runs) > self.max_runs:
+                self._runs.popitem(last=False)
+        return added
+
+    def has_run(self, run_id: str) -> bool:
+        with self._lock:
+            return run_id in self._runs
+
+    def since(self, run_id: str, since_seq: int, limit: Optional[int] = None) -> List[Dict]:
+        """Events of a run with event_seq > since_seq in seq order (the newest `limit` when capped)."""
+        with self._lock:
+            run = self._runs.get(run_id)
+            if run is None:
+                return []
+            start = bisect_right(run.seqs, since_seq)
+            if limit is not None:
+                start = max(start, len(run.seqs) - limit)
+            return run.events[start:]
+
+    def last_seq(self, run_id: str) -> Optional[int]:
+        with self._lock:
+            run = self._runs.get(run_id)
+            return run.seqs[-1] if run is not None and run.seqs else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._runs.clear()
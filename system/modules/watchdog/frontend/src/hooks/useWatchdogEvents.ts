@@ -66,7 +66,8 @@ export function useWatchdogEvents(runRoot?: string | null) {
     
     if (data) {
       if (data.run_id && data.run_id !== cursor.runId) {
-        setCursor(prev => ({ ...prev, runId: data.run_id }))
+        // event_seq restarts with every run: a new run starts from the beginning
+        setCursor(prev => ({ runId: data.run_id, lastEventSeq: prev.runId ? 0 : prev.lastEventSeq }))
       }
       
       // Deduplicate new events (guard against missing or invalid events array)
@@ -103,8 +104,10 @@ export function useWatchdogEvents(runRoot?: string | null) {
           }
         })
         
-        // Update cursor
-        const maxSeq = Math.max(...unseenEvents.map(e => e.event_seq))
+        // Update cursor (run events only: the backend returns events after since_seq, and
+        // watchdog-derived events carry their own counter)
+        const runSeqs = unseenEvents.filter(e => e.run_id === data.run_id).map(e => e.event_seq)
+        const maxSeq = runSeqs.length > 0 ? Math.max(...runSeqs) : data.next_seq
         setCursor(prev => ({
           runId: data.run_id || prev.runId,
           lastEventSeq: Math.max(prev.lastEventSeq, maxSeq)
@@ -15,6 +15,7 @@ from typing import Dict, List, Optional, Set
 from uuid import uuid4
 
 from .config import ACTIVE_INCIDENTS_FILE, INCIDENTS_FILE
+from .incident_store import get_incident_store
 
 logger = logging.getLogger(__name__)
 
@@ -319,39 +320,17 @@ class IncidentRecorder:
             return {}
 
     def get_incident_by_id(self, incident_id: str) -> Optional[Dict]:
-        """Find incident by id. Returns None if not found (Phase 7)."""
+        """Find incident by id through the store's offset index. Returns None if not found (Phase 7)."""
         try:
-            if not self._incidents_path.exists():
-                return None
-            lines = self._incidents_path.read_text(encoding="utf-8").strip().split("\n")
-            for line in lines:
-                if not line.strip():
-                    continue
-                try:
-                    rec = json.loads(line)
-                    if rec.get("incident_id") == incident_id:
-                        return rec
-                except json.JSONDecodeError:
-                    continue
-            return None
+            return get_incident_store(self._incidents_path).get(incident_id)
         except Exception as e:
             logger.debug(f"IncidentRecorder.get_incident_by_id failed: {e}")
             return None
 
     def get_recent_incidents(self, limit: int = 50) -> List[Dict]:
-        """Read last N incidents from file. Returns empty list on error."""
+        """Read last N incidents from the end of the file, newest first. Returns empty list on error."""
         try:
-            if not self._incidents_path.exists():
-                return []
-            lines = self._incidents_path.read_text(encoding="utf-8").strip().split("\n")
-            lines = [ln for ln in lines if ln.strip()]
-            records = []
-            for line in reversed(lines[-limit:]):
-                try:
-                    records.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
-            return records
+            return get_incident_store(self._incidents_path).recent(limit)
         except Exception as e:
             logger.debug(f"IncidentRecorder.get_recent_incidents failed: {e}")
             return []
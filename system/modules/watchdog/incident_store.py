@@ -0,0 +1,273 @@
+"""
+Incident Store
+
+Indexed read side of incidents.jsonl (IncidentRecorder only ever appends to it).
+
+The incident endpoints used to read and json.loads the whole file on every call, which
+grows without bound. The store instead keeps a byte-offset cursor into the file (same
+scheme as the fill index: size < cursor means the file was replaced) and, for the lines
+appended since, maintains:
+
+- offsets: incident_id -> byte offset of its line (get is one seek + one line)
+- weeks / months: incident counts per week (Monday UTC) / month of start_ts
+
+persisted next to the file ({stem}.index.json) so a restart does not rescan months of
+history. Recent incidents are read backwards from the end of the file.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .config import INCIDENTS_FILE
+
+logger = logging.getLogger(__name__)
+
+# Bump when the index layout changes: a version mismatch rebuilds the index from scratch
+INDEX_VERSION = 1
+# Bytes at the start of the file fingerprinted to detect a replaced file
+_HEAD_BYTES = 4096
+_TAIL_BLOCK_BYTES = 64 * 1024
+
+# Incident type -> rollup counter
+_ROLLUP_COUNTERS = {
+    "CONNECTION_LOST": "disconnect_incidents",
+    "ENGINE_STALLED": "engine_stalls",
+    "DATA_STALL": "data_stalls",
+    "FORCED_FLATTEN": "forced_flatten_count",
+    "RECONCILIATION_QTY_MISMATCH": "reconciliation_mismatch_count",
+}
+
+
+def _parse_ts(s: str) -> Optional[datetime]:
+    try:
+        dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt
+    except Exception:
+        return None
+
+
+def _week_start(dt: datetime) -> datetime:
+    """Monday 00:00 UTC."""
+    return (dt - timedelta(days=dt.weekday())).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _month_start(dt: datetime) -> datetime:
+    """First of month 00:00 UTC."""
+    return dt.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _empty_rollup(key_name: str, key: str) -> Dict:
+    return {
+        key_name: key,
+        "disconnect_incidents": 0,
+        "engine_stalls": 0,
+        "data_stalls": 0,
+        "forced_flatten_count": 0,
+        "reconciliation_mismatch_count": 0,
+        "total_disconnect_duration_sec": 0,
+    }
+
+
+def _add_to_rollup(bucket: Dict, rec: Dict) -> None:
+    counter = _ROLLUP_COUNTERS.get(rec.get("type", ""))
+    if counter is None:
+        return
+    bucket[counter] += 1
+    if counter == "disconnect_incidents":
+        bucket["total_disconnect_duration_sec"] += rec.get("duration_sec", 0) or 0
+
+
+def read_tail_lines(path: Path, limit: int) -> List[bytes]:
+    """Last `limit` non-empty lines of a file, oldest first, reading backwards from the end."""
+    if limit <= 0 or not path.exists():
+        return []
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        buf = b""
+        lines: List[bytes] = []
+        while pos > 0:
+            read = min(_TAIL_BLOCK_BYTES, pos)
+            pos -= read
+            f.seek(pos)
+            buf = f.read(read) + buf
+            lines = [ln for ln in buf.split(b"\n") if ln.strip()]
+            # The first piece may be a partial line unless the file start was reached
+            if len(lines) > limit:
+                break
+    return lines[-limit:]
+
+
+class IncidentStore:
+    """Offset index and weekly/monthly rollups of one incidents.jsonl file (thread-safe)."""
+
+    def __init__(self, incidents_path: Path, index_path: Optional[Path] = None) -> None:
+        self._path = Path(incidents_path)
+        self._index_path = Path(index_path) if index_path else self._path.with_name(f"{self._path.stem}.index.json")
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._reset()
+
+    def _reset(self) -> None:
+        self._position = 0
+        self._head = ""
+        self._offsets: Dict[str, int] = {}
+        self._weeks: Dict[str, Dict] = {}
+        self._months: Dict[str, Dict] = {}
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def get(self, incident_id: str) -> Optional[Dict]:
+        """Incident record by id (first line with that id), None if not found."""
+        with self._lock:
+            if not self._refresh_locked():
+                return None
+            offset = self._offsets.get(incident_id)
+            if offset is None:
+                return None
+            with open(self._path, "rb") as f:
+                f.seek(offset)
+                line = f.readline()
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError:
+            return None
+
+    def recent(self, limit: int = 50) -> List[Dict]:
+        """Last `limit` incident lines, newest first (unparseable lines are skipped)."""
+        records = []
+        for line in reversed(read_tail_lines(self._path, limit)):
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        return records
+
+    def weekly(self) -> List[Dict]:
+        """Incident counts per week, oldest first."""
+        with self._lock:
+            self._refresh_locked()
+            return [dict(self._weeks[k]) for k in sorted(self._weeks)]
+
+    def monthly(self) -> List[Dict]:
+        """Incident counts per month, oldest first."""
+        with self._lock:
+            self._refresh_locked()
+            return [dict(self._months[k]) for k in sorted(self._months)]
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def _head_hash(self, f, length: int) -> str:
+        f.seek(0)
+        return hashlib.sha1(f.read(min(length, _HEAD_BYTES))).hexdigest()
+
+    def _refresh_locked(self) -> bool:
+        """Index lines appended since the last refresh. False when the file does not exist."""
+        if not self._loaded:
+            self._load_index()
+            self._loaded = True
+        try:
+            size = self._path.stat().st_size
+        except OSError:
+            if self._position:
+                self._reset()
+            return False
+        if size == self._position:
+            return True
+        with open(self._path, "rb") as f:
+            if size < self._position or (
+                self._position and self._head_hash(f, self._position) != self._head
+            ):
+                logger.info(f"IncidentStore: {self._path.name} was replaced, rebuilding index")
+                self._reset()
+            f.seek(self._position)
+            chunk = f.read(size - self._position)
+            # Only complete lines; a partially written last line is picked up next time
+            end = chunk.rfind(b"\n") + 1
+            if end == 0:
+                return True
+            offset = self._position
+            for line in chunk[:end].split(b"\n")[:-1]:
+                self._index_line(line, offset)
+                offset += len(line) + 1
+            self._position += end
+            self._head = self._head_hash(f, self._position)
+        self._save_index()
+        return True
+
+    def _index_line(self, line: bytes, offset: int) -> None:
+        if not line.strip():
+            return
+        try:
+            rec = json.loads(line)
+        except json.JSONDecodeError:
+            return
+        if not isinstance(rec, dict):
+            return
+        incident_id = rec.get("incident_id")
+        if incident_id and incident_id not in self._offsets:
+            self._offsets[str(incident_id)] = offset
+        start_dt = _parse_ts(rec["start_ts"]) if rec.get("start_ts") else None
+        if start_dt is None:
+            return
+        week = _week_start(start_dt).strftime("%Y-%m-%d")
+        month = _month_start(start_dt).strftime("%Y-%m")
+        _add_to_rollup(self._weeks.setdefault(week, _empty_rollup("week_start", week)), rec)
+        _add_to_rollup(self._months.setdefault(month, _empty_rollup("month_start", month)), rec)
+
+    def _load_index(self) -> None:
+        try:
+            data = json.loads(self._index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return
+        try:
+            self._position = int(data["position"])
+            self._head = str(data["head"])
+            self._offsets = {str(k): int(v) for k, v in data["offsets"].items()}
+            self._weeks = dict(data["weeks"])
+            self._months = dict(data["months"])
+        except (KeyError, TypeError, ValueError, AttributeError):
+            self._reset()
+
+    def _save_index(self) -> None:
+        """Persist the index atomically. Never throws (the in-memory index stays valid)."""
+        try:
+            data = {
+                "version": INDEX_VERSION,
+                "position": self._position,
+                "head": self._head,
+                "offsets": self._offsets,
+                "weeks": self._weeks,
+                "months": self._months,
+            }
+            tmp = self._index_path.with_suffix(".json.tmp")
+            tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            tmp.replace(self._index_path)
+        except Exception as e:
+            logger.debug(f"IncidentStore._save_index failed: {e}")
+
+
+_stores: Dict[Path, IncidentStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_incident_store(incidents_path: Optional[Path] = None) -> IncidentStore:
+    """Get or create the store of an incidents file (one per path per process)."""
+    path = Path(incidents_path or INCIDENTS_FILE).absolute()
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = _stores[path] = IncidentStore(path)
+        return store
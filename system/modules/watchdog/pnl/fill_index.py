@@ -0,0 +1,299 @@
+"""
+Fill Index
+
+Incremental on-disk index of EXECUTION_FILLED / EXECUTION_PARTIAL_FILL / EXECUTION_EXIT_FILL
+events from raw robot logs (robot_*.jsonl in ROBOT_LOGS_DIR).
+
+LedgerBuilder and compute_fill_metrics used to json.loads every line of every robot log on
+every request. The index instead keeps a byte-offset cursor per log file (same scheme as the
+EventFeedGenerator read positions: seek to the last position, size < position means rotation)
+and appends only the new fill records, already normalized, to one compact JSONL file per
+(trading_date, stream):
+
+    FILL_INDEX_DIR/<scope>/<trading_date>/<stream>.jsonl
+
+A request then reads only the few records of its trading date. Each record keeps its source
+file name and byte offset so readers can restore exact log order and drop duplicates left by
+an interrupted update.
+"""
+import hashlib
+import json
+import logging
+import re
+import shutil
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .schema import normalize_execution_filled
+from ..config import FILL_INDEX_DIR
+
+logger = logging.getLogger(__name__)
+
+FILL_EVENT_TYPES = frozenset(("EXECUTION_FILLED", "EXECUTION_PARTIAL_FILL", "EXECUTION_EXIT_FILL"))
+
+# Bump when the record layout changes: a version mismatch rebuilds the index from scratch
+INDEX_VERSION = 1
+CURSORS_FILE_NAME = "cursors.json"
+UNKNOWN_STREAM = "_unknown"
+
+# Cheap byte pre-filter so json.loads only runs on candidate fill lines
+_FILL_LINE_MARKER = b"EXECUTION_"
+_UNSAFE_NAME_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def _partition_name(value: str) -> str:
+    """File-system safe partition name (records keep the exact value for filtering)."""
+    return _UNSAFE_NAME_CHARS.sub("_", value) if value else UNKNOWN_STREAM
+
+
+class FillIndex:
+    """Per-(trading_date, stream) fill records for one robot logs directory."""
+
+    def __init__(self, robot_logs_dir: Path, index_dir: Optional[Path] = None) -> None:
+        self._robot_logs_dir = Path(robot_logs_dir)
+        if index_dir is None:
+            # Scope per logs directory (run contexts use different robot log roots)
+            scope = hashlib.sha1(str(self._robot_logs_dir.resolve()).encode("utf-8")).hexdigest()[:12]
+            index_dir = FILL_INDEX_DIR / scope
+        self._index_dir = Path(index_dir)
+        self._cursors_file = self._index_dir / CURSORS_FILE_NAME
+        self._positions: Dict[str, int] = {}  # Log file name -> byte position
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._stream_cache: Dict[Tuple[str, str], str] = {}
+
+    @property
+    def index_dir(self) -> Path:
+        return self._index_dir
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def load(self, trading_date: str, stream: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Bring the index up to date, then return the fill records of trading_date.
+
+        Args:
+            trading_date: Trading date (YYYY-MM-DD). Includes records without a trading_date
+                whose ts_utc falls on that date (flagged by an empty fill["trading_date"]).
+            stream: Optional canonical stream; None returns all streams.
+
+        Returns:
+            Records in robot log order (source file name, then byte offset):
+            {"source", "offset", "event_type", "ts_utc", "stream", "metrics_stream", "fill"}
+        """
+        with self._lock:
+            self._update_locked()
+            date_dir = self._index_dir / _partition_name(trading_date)
+            if not date_dir.is_dir():
+                return []
+            if stream:
+                partition_files = [date_dir / f"{_partition_name(stream)}.jsonl"]
+            else:
+                partition_files = sorted(date_dir.glob("*.jsonl"))
+            records: Dict[Tuple[str, int], Dict[str, Any]] = {}
+            for partition_file in partition_files:
+                if not partition_file.exists():
+                    continue
+                with open(partition_file, "r", encoding="utf-8") as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            record = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue
+                        records[(record["source"], record["offset"])] = record
+        ordered = [records[key] for key in sorted(records)]
+        if stream:
+            ordered = [r for r in ordered if r.get("stream") == stream]
+        return ordered
+
+    def update(self) -> int:
+        """Index new log lines since the last update. Returns number of fill records added."""
+        with self._lock:
+            return self._update_locked()
+
+    def rebuild(self) -> int:
+        """Drop the index and re-read all robot logs from the start."""
+        with self._lock:
+            self._clear_locked()
+            return self._update_locked()
+
+    # ------------------------------------------------------------------
+    # Incremental update
+    # ------------------------------------------------------------------
+
+    def _update_locked(self) -> int:
+        if not self._loaded:
+            self._load_cursors()
+        if not self._robot_logs_dir.exists():
+            return 0
+        log_files = sorted(self._robot_logs_dir.glob("robot_*.jsonl"))
+        sizes = {}
+        for log_file in log_files:
+            try:
+                sizes[log_file.name] = log_file.stat().st_size
+            except OSError:
+                continue
+
+        # Rotated/truncated or removed files invalidate records already appended from them
+        rotated = [name for name, pos in self._positions.items() if sizes.get(name, -1) < pos]
+        if rotated:
+            logger.info(f"Fill index: log rotation detected for {', '.join(sorted(rotated))}, rebuilding")
+            self._clear_locked()
+
+        previous_positions = dict(self._positions)
+        pending: Dict[Tuple[str, str], List[Dict[str, Any]]] = defaultdict(list)
+        added = 0
+        for log_file in log_files:
+            name = log_file.name
+            if name not in sizes or sizes[name] == self._positions.get(name, 0):
+                continue
+            added += self._read_new_fills(log_file, pending)
+
+        if pending:
+            for (date_part, stream_part), records in pending.items():
+                partition_file = self._index_dir / date_part / f"{stream_part}.jsonl"
+                partition_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(partition_file, "a", encoding="utf-8") as f:
+                    for record in records:
+                        f.write(json.dumps(record, separators=(",", ":")) + "\n")
+        if rotated or self._positions != previous_positions:
+            self._save_cursors()
+        return added
+
+    def _read_new_fills(self, log_file: Path, pending: Dict[Tuple[str, str], List[Dict[str, Any]]]) -> int:
+        """Read lines past the cursor; a trailing line that is not valid JSON yet is left for the next update."""
+        name = log_file.name
+        pos = self._positions.get(name, 0)
+        added = 0
+        try:
+            with open(log_file, "rb") as f:
+                f.seek(pos)
+                for raw_line in f:
+                    if not raw_line.endswith(b"\n"):
+                        try:
+                            json.loads(raw_line)
+                        except ValueError:
+                            break  # Line still being written
+                    offset = pos
+                    pos += len(raw_line)
+                    if _FILL_LINE_MARKER not in raw_line:
+                        continue
+                    record = self._build_record(raw_line, name, offset)
+                    if record is None:
+                        continue
+                    pending[self._partition_key(record)].append(record)
+                    added += 1
+        except Exception as e:
+            logger.warning(f"Fill index: failed to read {log_file}: {e}")
+        self._positions[name] = pos
+        return added
+
+    def _build_record(self, raw_line: bytes, source: str, offset: int) -> Optional[Dict[str, Any]]:
+        try:
+            event = json.loads(raw_line)  # bytes: UTF-8 BOM is detected like utf-8-sig
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return None
+        if not isinstance(event, dict):
+            return None
+        event_type = event.get("event_type") or event.get("event")
+        if event_type not in FILL_EVENT_TYPES:
+            return None
+        data = event.get("data") or event
+        try:
+            fill = normalize_execution_filled(event)
+        except Exception as e:
+            logger.debug(f"Fill index: skipping malformed {event_type} in {source}@{offset}: {e}")
+            return None
+        ts_utc = event.get("ts_utc") or event.get("timestamp_utc") or data.get("timestamp_utc") or ""
+        return {
+            "source": source,
+            "offset": offset,
+            "event_type": event_type,
+            "ts_utc": ts_utc if isinstance(ts_utc, str) else "",
+            # LedgerBuilder stream rule (top-level stream + instrument)
+            "stream": self._canonical_stream(
+                event.get("stream"), event.get("instrument") or event.get("execution_instrument")
+            ),
+            # compute_fill_metrics stream rule (falls back to data fields)
+            "metrics_stream": self._canonical_stream(
+                event.get("stream") or data.get("stream"),
+                event.get("instrument") or data.get("instrument") or data.get("execution_instrument_key"),
+            ),
+            "fill": fill,
+        }
+
+    def _canonical_stream(self, stream: Optional[str], instrument: Optional[str]) -> str:
+        if not (stream and instrument):
+            return stream or ""
+        key = (stream, instrument)
+        cached = self._stream_cache.get(key)
+        if cached is None:
+            from .ledger_builder import canonicalize_stream
+            cached = canonicalize_stream(stream, instrument)
+            self._stream_cache[key] = cached
+        return cached
+
+    @staticmethod
+    def _partition_key(record: Dict[str, Any]) -> Tuple[str, str]:
+        trading_date = record["fill"].get("trading_date") or ""
+        if not isinstance(trading_date, str) or not trading_date.strip():
+            # No trading_date: file under the ts_utc date (fill metrics infers it from there)
+            trading_date = record["ts_utc"][:10] or UNKNOWN_STREAM
+        return _partition_name(trading_date), _partition_name(record["stream"])
+
+    # ------------------------------------------------------------------
+    # Cursor persistence
+    # ------------------------------------------------------------------
+
+    def _load_cursors(self) -> None:
+        self._loaded = True
+        if not self._cursors_file.exists():
+            if self._index_dir.exists():
+                self._clear_locked()  # Partitions without cursors cannot be trusted
+            return
+        try:
+            with open(self._cursors_file, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            if isinstance(payload, dict) and payload.get("version") == INDEX_VERSION:
+                self._positions = {k: int(v) for k, v in (payload.get("positions") or {}).items()}
+                return
+            logger.info("Fill index: format version changed, rebuilding")
+        except Exception as e:
+            logger.warning(f"Fill index: failed to load cursors, rebuilding: {e}")
+        self._clear_locked()
+
+    def _save_cursors(self) -> None:
+        try:
+            self._index_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = self._cursors_file.with_suffix(".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump({"version": INDEX_VERSION, "positions": self._positions}, f, indent=0)
+            tmp_file.replace(self._cursors_file)
+        except Exception as e:
+            logger.warning(f"Fill index: failed to save cursors: {e}")
+
+    def _clear_locked(self) -> None:
+        self._positions = {}
+        if self._index_dir.exists():
+            shutil.rmtree(self._index_dir, ignore_errors=True)
+
+
+_indexes: Dict[str, FillIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_fill_index(robot_logs_dir: Path, index_dir: Optional[Path] = None) -> FillIndex:
+    """Shared FillIndex per (robot logs dir, index dir) so cursors stay in memory between requests."""
+    key = f"{Path(robot_logs_dir).resolve()}|{index_dir or ''}"
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = FillIndex(robot_logs_dir, index_dir)
+            _indexes[key] = index
+        return index
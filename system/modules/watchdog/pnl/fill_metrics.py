@@ -6,18 +6,26 @@ Daily metrics for execution logging hygiene:
 - unmapped_rate (target 0)
 - null_trading_date_rate (target 0)
 
-Data source: Raw robot logs (robot_*.jsonl in ROBOT_LOGS_DIR).
-Scans for EXECUTION_FILLED and EXECUTION_PARTIAL_FILL events.
+Data source: Raw robot logs (robot_*.jsonl in ROBOT_LOGS_DIR), read through the incremental
+fill index (fill_index.py); a full scan is the fallback when the index is unavailable.
+Counts EXECUTION_FILLED and EXECUTION_PARTIAL_FILL events.
 Event-based anomaly counts (BROKER_FLATTEN_FILL_RECOGNIZED, EXECUTION_UPDATE_UNKNOWN_ORDER_CRITICAL,
 EXECUTION_FILL_BLOCKED_TRADING_DATE_NULL, EXECUTION_FILL_UNMAPPED) are aggregated separately
 by EventProcessor and merged into fill_health in the aggregator.
 """
 import json
+import logging
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
+from .fill_index import get_fill_index
 from ..config import ROBOT_LOGS_DIR
 
+logger = logging.getLogger(__name__)
+
+# Scan only the most recent log files (by mtime) to reduce I/O on large deployments
+RECENT_LOG_FILES = 15
+
 
 def compute_fill_metrics(trading_date: str, stream: Optional[str] = None) -> Dict[str, Any]:
     """
@@ -45,9 +53,13 @@ def compute_fill_metrics(trading_date: str, stream: Optional[str] = None) -> Dic
     if not ROBOT_LOGS_DIR.exists():
         return _metrics_result(trading_date, 0, 0, 0, 0, 0, 0)
 
-    # Scan only 15 most recent log files (by mtime) to reduce I/O on large deployments
     all_logs = list(ROBOT_LOGS_DIR.glob("robot_*.jsonl"))
-    log_files = sorted(all_logs, key=lambda p: p.stat().st_mtime, reverse=True)[:15]
+    log_files = sorted(all_logs, key=lambda p: p.stat().st_mtime, reverse=True)[:RECENT_LOG_FILES]
+    try:
+        return _compute_from_index(trading_date, stream, log_files)
+    except Exception as e:
+        logger.warning(f"Fill index unavailable, scanning robot logs: {e}")
+
     for log_file in log_files:
         with open(log_file, "r", encoding="utf-8-sig") as f:
             for line in f:
@@ -98,6 +110,46 @@ def compute_fill_metrics(trading_date: str, stream: Optional[str] = None) -> Dic
     return _metrics_result(trading_date, total, mapped, unmapped, null_td, missing_execution_sequence, missing_fill_group_id)
 
 
+def _compute_from_index(trading_date: str, stream: Optional[str], log_files: List[Path]) -> Dict[str, Any]:
+    """Same counts as the log scan, from fill index records of the same log files."""
+    total = 0
+    mapped = 0
+    unmapped = 0
+    null_td = 0
+    missing_execution_sequence = 0
+    missing_fill_group_id = 0
+
+    sources = {p.name for p in log_files}
+    for record in get_fill_index(ROBOT_LOGS_DIR).load(trading_date):
+        if record["event_type"] not in ("EXECUTION_FILLED", "EXECUTION_PARTIAL_FILL"):
+            continue
+        if record["source"] not in sources:
+            continue
+        fill = record["fill"]
+        td_val = fill.get("trading_date")
+        has_td = bool(td_val) and not (isinstance(td_val, str) and not td_val.strip())
+        # Match by trading_date, or infer from ts_utc when trading_date empty
+        if has_td and td_val != trading_date:
+            continue
+        if not has_td and not record["ts_utc"].startswith(trading_date):
+            continue
+        if stream and record["metrics_stream"] != stream:
+            continue
+        total += 1
+        if fill.get("mapped", True) is False:
+            unmapped += 1
+        else:
+            mapped += 1
+        if not has_td:
+            null_td += 1
+        if fill.get("execution_sequence") is None:
+            missing_execution_sequence += 1
+        if not fill.get("fill_group_id"):
+            missing_fill_group_id += 1
+
+    return _metrics_result(trading_date, total, mapped, unmapped, null_td, missing_execution_sequence, missing_fill_group_id)
+
+
 def _metrics_result(
     trading_date: str,
     total: int,
@@ -16,6 +16,7 @@ from .schema import (
     normalize_execution_filled,
     normalize_intent_exit_fill,
 )
+from .fill_index import get_fill_index
 from ..config import EXECUTION_JOURNALS_DIR, ROBOT_LOGS_DIR
 
 logger = logging.getLogger(__name__)
@@ -65,9 +66,14 @@ class LedgerBuilder:
         self,
         execution_journals_dir: Optional[Path] = None,
         robot_logs_dir: Optional[Path] = None,
+        use_fill_index: bool = True,
+        fill_index_dir: Optional[Path] = None,
     ) -> None:
         self._execution_journals_dir = execution_journals_dir or EXECUTION_JOURNALS_DIR
         self._robot_logs_dir = robot_logs_dir or ROBOT_LOGS_DIR
+        # Incremental on-disk fill index (falls back to a full robot log scan on failure)
+        self._use_fill_index = use_fill_index
+        self._fill_index_dir = fill_index_dir
     
     def build_ledger_rows(
         self,
@@ -404,19 +410,10 @@ class LedgerBuilder:
                             event_canonical_stream = event_stream
                         if stream and event_canonical_stream != stream:
                             continue
-                        if event_type == "EXECUTION_EXIT_FILL":
-                            normalized = normalize_execution_filled(event)
-                            order_id = normalized.get("order_id") or normalized.get("broker_order_id") or ""
-                            if order_id:
-                                exit_fill_by_order_id[order_id] = normalized
-                            continue
-                        normalized = normalize_execution_filled(event)
-                        intent_id = normalized.get("intent_id") or ""
-                        order_type = (normalized.get("order_type") or "").upper()
-                        if not intent_id or normalized.get("mapped") is False:
-                            continue
-                        if order_type == self.ENTRY_ORDER_TYPE or order_type in self.EXIT_ORDER_TYPES:
-                            execution_fills[intent_id].append(normalized)
+                        self._collect_fill(
+                            event_type, normalize_execution_filled(event),
+                            execution_fills, exit_fill_by_order_id,
+                        )
                     except json.JSONDecodeError:
                         continue
                     except Exception as e:
@@ -425,11 +422,48 @@ class LedgerBuilder:
         except Exception as e:
             logger.warning(f"Failed to read {log_file}: {e}")
 
+    def _collect_fill(
+        self,
+        event_type: str,
+        normalized: Dict[str, Any],
+        execution_fills: Dict[str, List[Dict]],
+        exit_fill_by_order_id: Dict[str, Dict],
+    ) -> None:
+        """Route one normalized fill: EXIT_FILL to the backfill map, mapped entry/exit fills per intent."""
+        if event_type == "EXECUTION_EXIT_FILL":
+            order_id = normalized.get("order_id") or normalized.get("broker_order_id") or ""
+            if order_id:
+                exit_fill_by_order_id[order_id] = normalized
+            return
+        intent_id = normalized.get("intent_id") or ""
+        order_type = (normalized.get("order_type") or "").upper()
+        if not intent_id or normalized.get("mapped") is False:
+            return
+        if order_type == self.ENTRY_ORDER_TYPE or order_type in self.EXIT_ORDER_TYPES:
+            execution_fills[intent_id].append(normalized)
+
+    def _read_fills_from_index(
+        self,
+        trading_date: str,
+        stream: Optional[str],
+        execution_fills: Dict[str, List[Dict]],
+        exit_fill_by_order_id: Dict[str, Dict],
+    ) -> None:
+        """Read EXECUTION_FILLED/PARTIAL/EXIT_FILL for trading_date from the fill index."""
+        fill_index = get_fill_index(self._robot_logs_dir, self._fill_index_dir)
+        for record in fill_index.load(trading_date, stream):
+            normalized = record["fill"]
+            # Records filed under their ts_utc date (no trading_date) are fill-metrics only
+            if normalized.get("trading_date") != trading_date:
+                continue
+            self._collect_fill(record["event_type"], normalized, execution_fills, exit_fill_by_order_id)
+
     def _load_execution_fills(self, trading_date: str, stream: Optional[str] = None) -> Dict[str, List[Dict]]:
         """
         Load EXECUTION_FILLED events from raw robot logs (Phase 3.1).
         
-        Source: robot_<instrument>.jsonl in ROBOT_LOGS_DIR (canonical; feed is UI-only).
+        Source: robot_<instrument>.jsonl in ROBOT_LOGS_DIR (canonical; feed is UI-only),
+        read through the incremental fill index when enabled (full scan as fallback).
         UNIFY FILL EVENTS: Canonical source for both entry and exit fills.
         - Includes EXECUTION_FILLED and EXECUTION_PARTIAL_FILL
         - Backfill: Converts EXECUTION_EXIT_FILL to synthetic EXECUTION_FILLED when no EXECUTION_FILLED exists for that order
@@ -450,11 +484,21 @@ class LedgerBuilder:
             return execution_fills
         
         try:
-            for log_file in log_files:
-                self._read_fills_from_log_file(
-                    log_file, trading_date, stream,
-                    execution_fills, exit_fill_by_order_id,
-                )
+            indexed = False
+            if self._use_fill_index:
+                try:
+                    self._read_fills_from_index(trading_date, stream, execution_fills, exit_fill_by_order_id)
+                    indexed = True
+                except Exception as e:
+                    logger.warning(f"Fill index unavailable, scanning robot logs: {e}")
+                    execution_fills.clear()
+                    exit_fill_by_order_id.clear()
+            if not indexed:
+                for log_file in log_files:
+                    self._read_fills_from_log_file(
+                        log_file, trading_date, stream,
+                        execution_fills, exit_fill_by_order_id,
+                    )
             
             # Backfill: Convert EXECUTION_EXIT_FILL to synthetic EXECUTION_FILLED when no EXECUTION_FILLED for that order
             filled_order_ids = set()
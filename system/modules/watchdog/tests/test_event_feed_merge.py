@@ -0,0 +1,70 @@
+"""event_feed: k-way merge of robot log tails must keep the full-sort (timestamp, file, line) order."""
+from __future__ import annotations
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from modules.watchdog import event_feed
+from modules.watchdog.event_feed import EventFeedGenerator
+
+
+def _full_sort(events_by_file):
+    """Reference: the previous single-list sort over (timestamp, file_path, index)."""
+    items = [(ev, path, i) for path, events in events_by_file for i, ev in enumerate(events)]
+    items.sort(key=lambda item: (
+        item[0].get("timestamp_utc") or item[0].get("ts_utc") or item[0].get("timestamp") or "",
+        item[1],
+        item[2],
+    ))
+    return [ev for ev, _, _ in items]
+
+
+def _tail(rng: random.Random, name: str, n: int, disorder: float):
+    events = []
+    for i in range(n):
+        second = i // 3 if rng.random() >= disorder else max(0, i // 3 - rng.randint(1, 5))
+        ts_key = rng.choice(["timestamp_utc", "ts_utc", "timestamp"])
+        events.append({ts_key: f"2026-03-24T16:{second // 60:02d}:{second % 60:02d}Z", "file": name, "line": i})
+    return events
+
+
+def _generator() -> EventFeedGenerator:
+    return EventFeedGenerator.__new__(EventFeedGenerator)  # merge needs no persisted state
+
+
+def test_merge_matches_full_sort_with_ties_and_out_of_order_lines():
+    rng = random.Random(7)
+    gen = _generator()
+    for disorder in (0.0, 0.05, 0.5):
+        events_by_file = [
+            (f"/logs/robot_{name}.jsonl", _tail(rng, name, rng.randint(0, 300), disorder))
+            for name in ("NQ", "ENGINE", "ES", "CL")
+        ]
+        # Files arrive in arbitrary order; missing timestamps sort first
+        rng.shuffle(events_by_file)
+        events_by_file[0][1].insert(0, {"file": "no-ts"})
+        merged, reordered = gen._merge_log_events(events_by_file)
+        assert merged == _full_sort(events_by_file)
+        if disorder == 0.0:
+            assert reordered == 0  # ordered tails are merged without re-sorting
+
+
+def test_merge_single_and_empty_files():
+    gen = _generator()
+    events = [{"ts_utc": "2026-03-24T16:00:02Z"}, {"ts_utc": "2026-03-24T16:00:01Z"}]
+    merged, reordered = gen._merge_log_events([("/logs/robot_ES.jsonl", events), ("/logs/robot_NQ.jsonl", [])])
+    assert merged == [events[1], events[0]]
+    assert reordered == 1
+    assert gen._merge_log_events([]) == ([], 0)
+
+
+def test_cycle_metrics_without_log_files_report_no_reordering(monkeypatch):
+    gen = _generator()
+    monkeypatch.setattr(event_feed, "resolve_active_run_context", lambda: None)
+    monkeypatch.setattr(gen, "_find_robot_log_files", lambda context: [], raising=False)
+    assert gen.process_new_events() == 0
+    assert gen.last_cycle_metrics["merge_reordered_files"] == 0
+    assert gen.last_cycle_metrics["robot_log_files"] == 0
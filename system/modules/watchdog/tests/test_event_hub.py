@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from modules.watchdog import event_hub as event_hub_module
+from modules.watchdog.backend.routers import watchdog as watchdog_router
+from modules.watchdog.backend.routers import websocket as websocket_router
+from modules.watchdog.event_hub import EventHub
+
+
+def _event(seq: int, run_id: str = "run-a") -> dict:
+    return {"seq": seq, "event_id": f"{run_id}:{seq}", "type": "KILL_SWITCH_ACTIVE", "run_id": run_id}
+
+
+def test_publish_fans_out_serialized_once_and_filters_by_run():
+    async def scenario():
+        hub = EventHub()
+        all_runs = hub.subscribe()
+        run_b = hub.subscribe("run-b")
+        hub.publish(_event(1))
+        hub.publish(_event(2, "run-b"))
+        await asyncio.sleep(0)
+
+        first = [all_runs.queue.get_nowait() for _ in range(all_runs.queue.qsize())]
+        assert [seq for seq, _ in first] == [1, 2]
+        assert json.loads(first[1][1]) == _event(2, "run-b")
+        only_b = [run_b.queue.get_nowait() for _ in range(run_b.queue.qsize())]
+        assert only_b == [first[1]]
+        assert only_b[0][1] is first[1][1]  # Same text object for every subscriber
+
+        hub.unsubscribe(run_b)
+        assert hub.subscriber_count == 1
+
+    asyncio.run(scenario())
+
+
+def test_full_queue_drops_oldest_and_counts_it():
+    async def scenario():
+        hub = EventHub()
+        slow = hub.subscribe(maxsize=3)
+        for seq in range(1, 6):
+            hub.publish(_event(seq))
+        await asyncio.sleep(0)
+
+        assert [slow.queue.get_nowait()[0] for _ in range(slow.queue.qsize())] == [3, 4, 5]
+        assert slow.take_dropped() == 2
+        assert slow.take_dropped() == 0
+
+    asyncio.run(scenario())
+
+
+def test_publish_without_subscribers_is_a_noop():
+    hub = EventHub()
+    hub.publish({"seq": 1, "unserializable": object()})
+    assert hub.subscriber_count == 0
+
+
+class _AggregatorStub:
+    def __init__(self, events) -> None:
+        self.events = events
+
+    def get_important_events_since(self, seq_id):
+        return [e for e in self.events if e["seq"] > seq_id]
+
+
+def test_websocket_sends_ring_buffer_backlog_then_pushed_events(monkeypatch):
+    hub = EventHub()
+    monkeypatch.setattr(event_hub_module, "_hub_instance", hub)
+    monkeypatch.setattr(watchdog_router, "aggregator_instance", _AggregatorStub([_event(1), _event(2, "run-b")]))
+    app = FastAPI()
+    app.include_router(websocket_router.router)
+
+    with TestClient(app) as client:
+        with client.websocket_connect("/ws/events?run_id=run-a") as ws:
+            assert ws.receive_json() == _event(1)
+            # Published from another thread (the ingestion executor) after the handler subscribed
+            hub.publish(_event(1))  # Already sent in the backlog
+            hub.publish(_event(3, "run-b"))
+            hub.publish(_event(4))
+            assert ws.receive_json() == _event(4)
+    assert hub.subscriber_count == 0
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from modules.watchdog.feed_event_index import FeedEventIndex
+
+
+def _events(run_id: str, seqs):
+    return [{"run_id": run_id, "event_seq": seq, "event_id": f"{run_id}:{seq}"} for seq in seqs]
+
+
+def test_since_returns_events_after_cursor_in_seq_order():
+    index = FeedEventIndex()
+    assert index.add(_events("run-a", range(1, 11))) == 10
+    # The next ingestion cycle re-reads the same tail plus new lines
+    assert index.add(_events("run-a", range(5, 14))) == 3
+    # Late line written out of order
+    assert index.add(_events("run-a", [20, 17])) == 2
+
+    assert [e["event_seq"] for e in index.since("run-a", 11)] == [12, 13, 17, 20]
+    assert [e["event_seq"] for e in index.since("run-a", 0, limit=3)] == [13, 17, 20]
+    assert index.since("run-a", 20) == []
+    assert index.since("run-b", 0) == []
+    assert index.last_seq("run-a") == 20
+
+
+def test_events_without_run_or_seq_are_ignored():
+    index = FeedEventIndex()
+    added = index.add([
+        {"run_id": "run-a", "event_seq": None},
+        {"run_id": "", "event_seq": 1},
+        {"run_id": "run-a", "event_seq": True},
+        {"run_id": "run-a", "event_seq": 2.0},
+    ])
+    assert added == 1
+    assert [e["event_seq"] for e in index.since("run-a", 0)] == [2.0]
+
+
+def test_trimmed_events_are_not_re_added():
+    index = FeedEventIndex(max_events_per_run=8)
+    index.add(_events("run-a", range(1, 12)))  # Above 8 + 8 // 4 -> trimmed to the newest 8
+    assert [e["event_seq"] for e in index.since("run-a", 0)] == list(range(4, 12))
+
+    # The tail still contains the dropped events
+    assert index.add(_events("run-a", range(1, 13))) == 1
+    assert [e["event_seq"] for e in index.since("run-a", 0)] == list(range(4, 13))
+
+
+def test_least_recently_written_run_is_evicted():
+    index = FeedEventIndex(max_runs=2)
+    index.add(_events("run-a", [1]))
+    index.add(_events("run-b", [1]))
+    index.add(_events("run-a", [2]))
+    index.add(_events("run-c", [1]))
+
+    assert index.has_run("run-a") and index.has_run("run-c")
+    assert not index.has_run("run-b")
+
+    index.clear()
+    assert not index.has_run("run-a")
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+import sys
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from modules.watchdog import incident_store as incident_store_module
+from modules.watchdog.incident_recorder import IncidentRecorder
+from modules.watchdog.incident_store import IncidentStore
+from modules.watchdog.metrics_history import aggregate_incidents_by_month, aggregate_incidents_by_week
+
+
+def _workspace_temp_dir() -> Path:
+    base = Path.cwd() / "tmp" / "pytest_watchdog"
+    base.mkdir(parents=True, exist_ok=True)
+    path = base / uuid.uuid4().hex
+    path.mkdir(parents=True, exist_ok=False)
+    return path
+
+
+def _record(n: int, incident_type: str, start_ts: str, duration_sec: int = 30) -> dict:
+    return {
+        "incident_id": f"inc-{n}",
+        "type": incident_type,
+        "severity": "WARNING",
+        "start_ts": start_ts,
+        "end_ts": start_ts,
+        "duration_sec": duration_sec,
+        "instruments": [],
+    }
+
+
+def test_recorder_reads_through_the_index():
+    temp_dir = _workspace_temp_dir()
+    incidents_path = temp_dir / "incidents.jsonl"
+    recorder = IncidentRecorder(incidents_path=incidents_path, active_incidents_path=temp_dir / "active.json")
+    for n in range(120):
+        recorder._write_incident(_record(n, "DATA_STALL", f"2026-03-{1 + n % 28:02d}T10:00:00Z"), notify=False)
+
+    assert recorder.get_incident_by_id("inc-7") == _record(7, "DATA_STALL", "2026-03-08T10:00:00Z")
+    assert recorder.get_incident_by_id("missing") is None
+    recent = recorder.get_recent_incidents(limit=3)
+    assert [r["incident_id"] for r in recent] == ["inc-119", "inc-118", "inc-117"]
+
+    # Appended after the index was built
+    recorder._write_incident(_record(120, "ENGINE_STALLED", "2026-04-01T00:00:00Z"), notify=False)
+    assert recorder.get_incident_by_id("inc-120")["type"] == "ENGINE_STALLED"
+    assert recorder.get_recent_incidents(limit=1)[0]["incident_id"] == "inc-120"
+    assert len(recorder.get_recent_incidents(limit=500)) == 121
+
+
+def test_rollups_match_a_full_scan_and_survive_restart(monkeypatch):
+    temp_dir = _workspace_temp_dir()
+    incidents_path = temp_dir / "incidents.jsonl"
+    lines = [
+        _record(1, "CONNECTION_LOST", "2026-02-27T23:00:00Z", 40),
+        _record(2, "CONNECTION_LOST", "2026-03-02T01:00:00Z", 60),
+        _record(3, "ENGINE_STALLED", "2026-03-03T01:00:00Z"),
+        _record(4, "FORCED_FLATTEN", "2026-03-03T02:00:00Z"),
+        _record(5, "RECONCILIATION_QTY_MISMATCH", "2026-03-10T02:00:00Z"),
+        _record(6, "EXECUTION_JOURNAL_ERROR", "2026-03-10T03:00:00Z"),
+    ]
+    incidents_path.write_text(
+        "\n".join(json.dumps(r) for r in lines) + "\nnot json\n" + json.dumps({"type": "DATA_STALL"}) + "\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(incident_store_module, "_stores", {})
+
+    weeks = aggregate_incidents_by_week(incidents_path)
+    assert [w["week_start"] for w in weeks] == ["2026-02-23", "2026-03-02", "2026-03-09"]
+    assert weeks[0]["disconnect_incidents"] == 1 and weeks[0]["total_disconnect_duration_sec"] == 40
+    assert weeks[1] == {
+        "week_start": "2026-03-02",
+        "disconnect_incidents": 1,
+        "engine_stalls": 1,
+        "data_stalls": 0,
+        "forced_flatten_count": 1,
+        "reconciliation_mismatch_count": 0,
+        "total_disconnect_duration_sec": 60,
+    }
+    months = aggregate_incidents_by_month(incidents_path)
+    assert [(m["month_start"], m["disconnect_incidents"]) for m in months] == [("2026-02", 1), ("2026-03", 1)]
+
+    # A new process loads the persisted index instead of rescanning
+    scans = []
+    store = IncidentStore(incidents_path)
+    monkeypatch.setattr(store, "_index_line", lambda *args: scans.append(args))
+    assert store.weekly() == weeks
+    assert scans == []
+
+
+def test_partial_line_and_replaced_file():
+    temp_dir = _workspace_temp_dir()
+    incidents_path = temp_dir / "incidents.jsonl"
+    full = json.dumps(_record(1, "DATA_STALL", "2026-03-02T00:00:00Z")) + "\n"
+    partial = json.dumps(_record(2, "DATA_STALL", "2026-03-02T00:00:00Z"))
+    incidents_path.write_text(full + partial[:20], encoding="utf-8")
+
+    store = IncidentStore(incidents_path)
+    assert store.weekly()[0]["data_stalls"] == 1
+    with open(incidents_path, "a", encoding="utf-8") as f:
+        f.write(partial[20:] + "\n")
+    assert store.weekly()[0]["data_stalls"] == 2
+    assert store.get("inc-2")["incident_id"] == "inc-2"
+
+    # Rewritten with different content of a larger size
+    incidents_path.write_text(
+        "".join(json.dumps(_record(n, "ENGINE_STALLED", "2026-05-04T00:00:00Z")) + "\n" for n in range(10, 14)),
+        encoding="utf-8",
+    )
+    assert [(w["week_start"], w["engine_stalls"], w["data_stalls"]) for w in store.weekly()] == [("2026-05-04", 4, 0)]
+    assert store.get("inc-1") is None
+    assert store.get("inc-13")["incident_id"] == "inc-13"
@@ -0,0 +1,146 @@
+"""pnl fill index: indexed fills must match the full robot log scan, and stay correct as logs grow."""
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from modules.watchdog.pnl import fill_index as fill_index_mod
+from modules.watchdog.pnl import fill_metrics as fill_metrics_mod
+from modules.watchdog.pnl.fill_index import FillIndex
+from modules.watchdog.pnl.ledger_builder import LedgerBuilder
+
+TD = "2026-05-12"
+
+
+def _fill(event_type, intent, order_id, seq, *, td=TD, stream="ES1", instrument="ES",
+          order_type="ENTRY", mapped=True, ts="2026-05-12T14:00:00Z"):
+    data = {
+        "intent_id": intent,
+        "order_id": order_id,
+        "order_type": order_type,
+        "fill_price": 5000.25 + seq,
+        "fill_quantity": 1,
+        "execution_sequence": seq,
+        "fill_group_id": f"g{seq}",
+        "mapped": mapped,
+        "side": "BUY" if order_type == "ENTRY" else "SELL",
+    }
+    return {"event": event_type, "ts_utc": ts, "trading_date": td, "stream": stream,
+            "instrument": instrument, "data": data}
+
+
+def _write(path: Path, events, mode="w"):
+    with open(path, mode, encoding="utf-8") as f:
+        for ev in events:
+            f.write(json.dumps(ev) + "\n")
+
+
+def _noise(n):
+    return [{"event": "BAR_RECEIVED", "ts_utc": "2026-05-12T14:00:00Z", "data": {"i": i}} for i in range(n)]
+
+
+@pytest.fixture
+def logs(tmp_path):
+    logs_dir = tmp_path / "robot"
+    logs_dir.mkdir()
+    _write(logs_dir / "robot_ES.jsonl", _noise(5) + [
+        _fill("EXECUTION_FILLED", "i1", "o1", 1),
+        _fill("EXECUTION_PARTIAL_FILL", "i1", "o2", 2, order_type="TARGET"),
+        _fill("EXECUTION_EXIT_FILL", "i1", "o3", 3, order_type="STOP"),  # backfilled
+        _fill("EXECUTION_EXIT_FILL", "i1", "o2", 4, order_type="TARGET"),  # has EXECUTION_FILLED
+        _fill("EXECUTION_FILLED", "i9", "o9", 9, td="2026-05-11"),
+        _fill("EXECUTION_FILLED", "", "o10", 10, mapped=False),
+        _fill("EXECUTION_FILLED", "i5", "o11", 11, td="", ts="2026-05-12T20:00:00Z"),
+    ] + _noise(3))
+    _write(logs_dir / "robot_MES.jsonl", [
+        _fill("EXECUTION_FILLED", "i2", "m1", 1, stream="MES2", instrument="MES"),
+        _fill("EXECUTION_FILLED", "i3", "m2", 2, stream="NQ1", instrument="NQ"),
+    ])
+    return logs_dir
+
+
+def _builders(logs_dir, index_dir):
+    scan = LedgerBuilder(robot_logs_dir=logs_dir, use_fill_index=False)
+    indexed = LedgerBuilder(robot_logs_dir=logs_dir, fill_index_dir=index_dir)
+    return scan, indexed
+
+
+def _assert_same_fills(scan, indexed, trading_date=TD):
+    for stream in (None, "ES1", "ES2", "NQ1", "CL1"):
+        expected = scan._load_execution_fills(trading_date, stream)
+        assert indexed._load_execution_fills(trading_date, stream) == expected
+
+
+def test_indexed_fills_match_full_scan(logs, tmp_path):
+    scan, indexed = _builders(logs, tmp_path / "index")
+    _assert_same_fills(scan, indexed)
+    _assert_same_fills(scan, indexed, "2026-05-11")
+
+    fills = indexed._load_execution_fills(TD, "ES1")
+    assert [f["order_id"] for f in fills["i1"]] == ["o1", "o2", "o3"]
+    assert fills["i1"][-1]["synthetic"] is True
+    assert set(indexed._load_execution_fills(TD, "ES2")) == {"i2"}  # MES2 canonicalized
+    assert sorted(p.name for p in (tmp_path / "index" / TD).iterdir()) == ["ES1.jsonl", "ES2.jsonl", "NQ1.jsonl"]
+
+
+def test_index_is_incremental_and_survives_restart(logs, tmp_path):
+    index_dir = tmp_path / "index"
+    scan, indexed = _builders(logs, index_dir)
+    index = FillIndex(logs, index_dir)
+    assert index.update() == 9
+    assert index.update() == 0
+
+    # Partial trailing line is not consumed until it is complete
+    new_fill = json.dumps(_fill("EXECUTION_FILLED", "i4", "o20", 20, order_type="FLATTEN"))
+    with open(logs / "robot_ES.jsonl", "a", encoding="utf-8") as f:
+        f.write(new_fill[:25])
+    assert index.update() == 0
+    with open(logs / "robot_ES.jsonl", "a", encoding="utf-8") as f:
+        f.write(new_fill[25:] + "\n")
+    assert index.update() == 1
+
+    # A fresh instance resumes from the persisted cursors
+    restarted = FillIndex(logs, index_dir)
+    _write(logs / "robot_NQ.jsonl", [_fill("EXECUTION_FILLED", "i6", "n1", 1, stream="NQ2", instrument="NQ")])
+    assert restarted.update() == 1
+    _assert_same_fills(scan, indexed)
+
+
+def test_rotation_rebuilds_index(logs, tmp_path):
+    index_dir = tmp_path / "index"
+    scan, indexed = _builders(logs, index_dir)
+    _assert_same_fills(scan, indexed)
+
+    _write(logs / "robot_ES.jsonl", [_fill("EXECUTION_FILLED", "i7", "r1", 1)])  # truncated + rewritten
+    _assert_same_fills(scan, indexed)
+    assert set(indexed._load_execution_fills(TD, "ES1")) == {"i7"}
+
+    (logs / "robot_MES.jsonl").unlink()
+    _assert_same_fills(scan, indexed)
+    assert indexed._load_execution_fills(TD, "ES2") == {}
+
+
+def test_fill_metrics_match_full_scan(logs, tmp_path, monkeypatch):
+    monkeypatch.setattr(fill_metrics_mod, "ROBOT_LOGS_DIR", logs)
+    monkeypatch.setattr(fill_index_mod, "FILL_INDEX_DIR", tmp_path / "index")
+    monkeypatch.setattr(fill_index_mod, "_indexes", {})
+
+    def scan_only(*args, **kwargs):
+        raise RuntimeError("index disabled")
+
+    for stream in (None, "ES1", "ES2"):
+        indexed = fill_metrics_mod.compute_fill_metrics(TD, stream)
+        with monkeypatch.context() as m:
+            m.setattr(fill_metrics_mod, "_compute_from_index", scan_only)
+            expected = fill_metrics_mod.compute_fill_metrics(TD, stream)
+        assert indexed == expected
+
+    metrics = fill_metrics_mod.compute_fill_metrics(TD)
+    assert metrics["total_fills"] == 6
+    assert metrics["unmapped_fills"] == 1
+    assert metrics["null_trading_date_fills"] == 1
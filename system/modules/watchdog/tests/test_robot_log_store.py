@@ -0,0 +1,184 @@
+"""Columnar robot log store: incremental ingest, rotation, compaction and parity with the JSONL scan."""
+from __future__ import annotations
+
+import json
+import sys
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+import pyarrow.parquet as pq
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "tools"))
+
+import daily_audit  # noqa: E402
+import diagnose_execution_burst  # noqa: E402
+import robot_log_store  # noqa: E402
+from robot_log_store import RobotLogStore  # noqa: E402
+
+DAY = date(2026, 3, 24)
+T0 = datetime(2026, 3, 24, 14, 0, tzinfo=timezone.utc)
+
+
+def _line(minute: int, event: str = "ENGINE_TICK", instrument: str = "ES", **data) -> str:
+    obj = {
+        "ts_utc": (T0 + timedelta(minutes=minute)).isoformat().replace("+00:00", "Z"),
+        "level": "info",
+        "source": "RobotEngine",
+        "instrument": instrument,
+        "event": event,
+        "data": {"run_id": "r1", "seq": minute, **data},
+    }
+    return json.dumps(obj) + "\n"
+
+
+def _write(path: Path, lines, mode: str = "w") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open(mode, encoding="utf-8") as f:
+        f.writelines(lines)
+
+
+def _store(log_dir: Path) -> RobotLogStore:
+    return RobotLogStore(log_dir, log_dir / ".columnar")
+
+
+def _rows(store: RobotLogStore):
+    df = store.read_frame(DAY, columns=["event"])
+    return list(zip(df["src"], df["offset"]))
+
+
+def _part_files(store: RobotLogStore):
+    return sorted(store.store_dir.glob("day=*/instrument=*/part-*.parquet"))
+
+
+def _count_normalized(monkeypatch):
+    calls = []
+    normalize = robot_log_store.normalize_event
+    monkeypatch.setattr(robot_log_store, "normalize_event",
+                        lambda obj, name: calls.append(obj["data"]["seq"]) or normalize(obj, name))
+    return calls
+
+
+def test_update_ingests_only_appended_lines(tmp_path, monkeypatch):
+    log = tmp_path / "robot_ES.jsonl"
+    _write(log, [_line(m) for m in range(5)])
+    store = _store(tmp_path)
+    calls = _count_normalized(monkeypatch)
+    assert store.update() == 5
+    assert calls == [0, 1, 2, 3, 4]
+
+    # Appended lines only; a partial last line waits for the writer to finish it
+    _write(log, [_line(5), _line(6), _line(7)[:20]], mode="a")
+    calls.clear()
+    assert store.update() == 2
+    assert calls == [5, 6]
+    assert store.manifest["sources"]["robot_ES.jsonl"]["offset"] == log.stat().st_size - 20
+
+    _write(log, [_line(7)[20:]], mode="a")
+    calls.clear()
+    assert _store(tmp_path).update() == 1  # Cursor persisted in the manifest
+    assert calls == [7]
+    assert _store(tmp_path).update() == 0
+
+    rows = _rows(_store(tmp_path))
+    assert len(rows) == len(set(rows)) == 8
+
+
+def test_rotated_and_truncated_logs_are_not_duplicated(tmp_path):
+    log = tmp_path / "robot_ES.jsonl"
+    _write(log, [_line(m) for m in range(4)])
+    store = _store(tmp_path)
+    store.update()
+
+    # Rotation: the log moves to archive/ under a new name, a fresh log starts
+    (tmp_path / "archive").mkdir()
+    log.rename(tmp_path / "archive" / "robot_ES_20260324.jsonl")
+    _write(log, [_line(m, event="AFTER_ROTATION") for m in range(10, 13)])
+    assert store.update() == 7
+    df = store.read_frame(DAY)
+    assert sorted(df["src"].unique()) == ["archive/robot_ES_20260324.jsonl", "robot_ES.jsonl"]
+    assert (df["src"] == "robot_ES.jsonl").sum() == 3
+    assert len(df) == len(df.drop_duplicates(subset=["src", "offset"])) == 7
+
+    # Truncation: the log shrank, its rows are replaced by the new content from offset 0
+    _write(log, [_line(20, event="AFTER_TRUNCATE")])
+    assert store.update() == 1
+    assert store.manifest["sources"]["robot_ES.jsonl"]["offset"] == log.stat().st_size
+    current = store.read_frame(DAY).query("src == 'robot_ES.jsonl'")
+    assert current["event"].tolist() == ["AFTER_TRUNCATE"]
+    assert current["offset"].tolist() == [0]
+
+    # Replaced in place by a same-size or larger file with a different head
+    _write(log, [_line(30, event="REPLACED"), _line(31, event="REPLACED")])
+    assert store.update() == 2
+    current = store.read_frame(DAY).query("src == 'robot_ES.jsonl'")
+    assert current["event"].tolist() == ["REPLACED", "REPLACED"]
+    assert len(store.read_frame(DAY)) == 6
+
+
+def test_compaction_merges_parts_and_removed_logs_are_dropped(tmp_path, monkeypatch):
+    monkeypatch.setattr(robot_log_store, "COMPACT_PARTS", 3)
+    log = tmp_path / "robot_ES.jsonl"
+    store = _store(tmp_path)
+    for m in range(6):
+        _write(log, [_line(m)], mode="a")
+        assert store.update() == 1
+        assert len(_part_files(store)) <= 3
+    assert len(_rows(store)) == 6
+    assert store.read_frame(DAY)["offset"].is_monotonic_increasing
+    assert pq.read_table(_part_files(store)[0]).num_rows >= 3  # Merged part
+
+    # Retention: logs deleted from the log dir (and archive) leave the store
+    _write(tmp_path / "robot_NQ.jsonl", [_line(0, instrument="NQ"), _line(1, instrument="NQ")])
+    store.update()
+    assert (store.store_dir / f"day={DAY.isoformat()}" / "instrument=NQ").is_dir()
+    (tmp_path / "robot_NQ.jsonl").unlink()
+    assert store.update() == 0
+    assert "robot_NQ.jsonl" not in store.manifest["sources"]
+    assert not (store.store_dir / f"day={DAY.isoformat()}" / "instrument=NQ").exists()
+    assert set(store.read_frame(DAY)["instrument"]) == {"ES"}
+
+
+def _audit_logs(log_dir: Path) -> None:
+    _write(log_dir / "robot_ENGINE.jsonl", [
+        _line(0, event="ENGINE_START", instrument=""),
+        "not json\n",
+        "\n",
+        json.dumps({"event": "NO_TIMESTAMP"}) + "\n",
+        _line(3, event="RECONCILIATION_PASS_SUMMARY", instrument=""),
+        _line(60 * 20, event="NEXT_DAY", instrument=""),
+    ])
+    _write(log_dir / "robot_ES.jsonl", [
+        _line(1, event="EXECUTION_FILLED", fill_qty=1),
+        _line(2, event="ORDER_SUBMITTED", note={"nested": [1, 2]}),
+        _line(-60 * 12, event="PREVIOUS_DAY"),
+    ])
+    _write(log_dir / "archive" / "robot_ENGINE_20260323.jsonl", [
+        _line(-1, event="ENGINE_STOP", instrument=""),
+    ])
+    _write(log_dir / "robot_NQ.jsonl", [_line(4, event="EXECUTION_FILLED", instrument="NQ")])
+
+
+def test_daily_audit_log_store_matches_jsonl_scan(tmp_path):
+    _audit_logs(tmp_path)
+    paths = daily_audit.collect_robot_jsonl_paths(tmp_path)
+    day_start, day_end = daily_audit.day_window_utc(DAY, "chicago")
+
+    jsonl_stats, store_stats = {}, {}
+    expected = []
+    for path in paths:
+        expected.extend(daily_audit.ingest_jsonl_file(path, day_start, day_end, jsonl_stats))
+    actual = daily_audit.ingest_log_store(tmp_path, paths, day_start, day_end, store_stats)
+
+    assert len(expected) == 6
+    assert actual == expected
+    assert store_stats == jsonl_stats
+    # Second audit: nothing new to ingest, same answer
+    assert daily_audit.ingest_log_store(tmp_path, paths, day_start, day_end, {}) == expected
+
+
+def test_diagnose_execution_burst_log_store_matches_jsonl_scan(tmp_path):
+    _audit_logs(tmp_path)
+    expected = diagnose_execution_burst._load_day_events(tmp_path, DAY, "chicago")
+    actual = diagnose_execution_burst._load_day_events(tmp_path, DAY, "chicago", use_store=True)
+    assert len(expected) == 6
+    assert actual == expected
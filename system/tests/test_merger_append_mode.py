@@ -0,0 +1,132 @@
+"""Merger append mode: base + delta files must read like a read-modify-write merge, before and after compaction."""
+from pathlib import Path
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+SYSTEM_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SYSTEM_ROOT))
+
+from modules.merger import merger, monthly_deltas  # noqa: E402
+from modules.matrix.data_loader import load_stream_data  # noqa: E402
+from modules.timetable.rs_table import RsTable  # noqa: E402
+
+TIMES = ["07:30", "08:00", "09:00"]
+
+
+def _daily_rows(day: str, seed: int, profit_shift: float = 0.0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    results = rng.choice(["Win", "Loss", "BE"], len(TIMES))
+    return pd.DataFrame({
+        "Date": [day] * len(TIMES),
+        "Time": TIMES,
+        "Session": "S1",
+        "Instrument": "ES",
+        "Stream": "ES1",
+        "Result": results,
+        "Profit": np.round(rng.normal(0, 5, len(TIMES)), 2) + profit_shift,
+        "trade_date": pd.to_datetime([day] * len(TIMES)),
+    })
+
+
+def _run_merger(root: Path, monkeypatch, batches, append_mode: bool) -> merger.DataMerger:
+    data_dir = root / "data"
+    monkeypatch.setattr(merger, "ANALYZER_TEMP_DIR", data_dir / "analyzer_temp")
+    monkeypatch.setattr(merger, "MANUAL_ANALYZER_RUNS_DIR", data_dir / "manual_analyzer_runs")
+    monkeypatch.setattr(merger, "ANALYZER_RUNS_DIR", data_dir / "analyzed")
+    monkeypatch.setattr(merger, "PROCESSED_LOG_FILE", data_dir / "merger_processed.json")
+    data_merger = merger.DataMerger(append_mode=append_mode)
+    for folder_name, rows in batches:
+        folder = data_dir / "analyzer_temp" / folder_name
+        folder.mkdir(parents=True)
+        rows.to_parquet(folder / "ES1.parquet", index=False)
+        data_merger.run()
+    return data_merger
+
+
+def _batches():
+    # Daily runs, the last ones re-emitting earlier days with changed outcomes (updates)
+    return [
+        ("2025-03-03", _daily_rows("2025-03-03", 1)),
+        ("2025-03-04", _daily_rows("2025-03-04", 2)),
+        ("2025-03-05", pd.concat([_daily_rows("2025-03-04", 2, 1.0), _daily_rows("2025-03-05", 3)])),
+        ("2025-03-06", _daily_rows("2025-03-06", 4)),
+        ("2025-03-07", pd.concat([_daily_rows("2025-03-06", 4), _daily_rows("2025-03-07", 5)])),
+    ]
+
+
+def test_append_mode_reads_like_rewrite_mode(tmp_path, monkeypatch):
+    _run_merger(tmp_path / "rewrite", monkeypatch, _batches(), append_mode=False)
+    rewrite_dir = tmp_path / "rewrite" / "data" / "analyzed"
+    appended = _run_merger(tmp_path / "append", monkeypatch, _batches(), append_mode=True)
+    append_dir = tmp_path / "append" / "data" / "analyzed"
+
+    monthly = append_dir / "ES1" / "2025" / "ES1_an_2025_03.parquet"
+    expected = pd.read_parquet(rewrite_dir / "ES1" / "2025" / "ES1_an_2025_03.parquet")
+    assert len(monthly_deltas.delta_files(monthly)) == 4
+    assert len(pd.read_parquet(monthly)) == len(TIMES)  # Base untouched since the first day
+    pd.testing.assert_frame_equal(monthly_deltas.read_merged(monthly), expected)
+
+    # Readers: matrix data loader (with projection and date window) and the RS table
+    for kwargs in ({}, {"start_date": "2025-03-04", "end_date": "2025-03-06", "columns": ["Profit"]}):
+        ok, frames, _ = load_stream_data("ES1", append_dir, **kwargs)
+        ok_expected, frames_expected, _ = load_stream_data("ES1", rewrite_dir, **kwargs)
+        assert ok and ok_expected
+        pd.testing.assert_frame_equal(pd.concat(frames, ignore_index=True),
+                                      pd.concat(frames_expected, ignore_index=True))
+    rs = RsTable()
+    assert rs.rolling_sums(append_dir / "ES1", "ES1", "S1", TIMES) == \
+        RsTable().rolling_sums(rewrite_dir / "ES1", "ES1", "S1", TIMES)
+
+    # Compaction folds the deltas into the base
+    assert appended.compact_all() == 1
+    assert monthly_deltas.delta_files(monthly) == []
+    pd.testing.assert_frame_equal(pd.read_parquet(monthly), expected)
+
+    # A new delta invalidates the cached RS inputs
+    loads = rs.file_loads
+    _run_merger(tmp_path / "append", monkeypatch, [("2025-03-10", _daily_rows("2025-03-10", 6))], append_mode=True)
+    rs.rolling_sums(append_dir / "ES1", "ES1", "S1", TIMES)
+    assert rs.file_loads == loads + 1
+
+
+def test_deltas_pile_up_into_background_compaction(tmp_path, monkeypatch):
+    monkeypatch.setattr(monthly_deltas, "COMPACT_AFTER_DELTAS", 3)
+    days = pd.bdate_range("2025-04-01", periods=6).strftime("%Y-%m-%d")
+    batches = [(day, _daily_rows(day, i)) for i, day in enumerate(days)]
+    _run_merger(tmp_path, monkeypatch, batches, append_mode=True)
+
+    monthly = tmp_path / "data" / "analyzed" / "ES1" / "2025" / "ES1_an_2025_04.parquet"
+    # Day 1 creates the base, days 2-4 trigger a compaction, days 5-6 are pending deltas
+    assert len(monthly_deltas.delta_files(monthly)) == 2
+    assert len(pd.read_parquet(monthly)) == 4 * len(TIMES)
+    merged = monthly_deltas.read_merged(monthly)
+    assert len(merged) == len(days) * len(TIMES)
+    assert merged["Date"].is_monotonic_increasing
+
+
+def test_read_merged_retries_when_deltas_are_compacted(tmp_path, monkeypatch):
+    monthly = tmp_path / "ES1_an_2025_05.parquet"
+    _daily_rows("2025-05-01", 1).to_parquet(monthly, index=False)
+    monthly_deltas.write_delta(_daily_rows("2025-05-02", 2), monthly)
+
+    read_part = monthly_deltas._read_part
+    calls = []
+
+    def compact_during_first_read(path, *args):
+        if not calls:
+            calls.append(path)
+            monthly_deltas.compact(monthly)
+        return read_part(path, *args)
+
+    monkeypatch.setattr(monthly_deltas, "_read_part", compact_during_first_read)
+    merged = monthly_deltas.read_merged(monthly, columns=["Profit"])
+    assert len(merged) == 2 * len(TIMES) and list(merged.columns) == ["Profit"]
+
+
+def test_missing_month_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        monthly_deltas.read_merged(tmp_path / "ES1_an_2025_06.parquet")
@@ -0,0 +1,112 @@
+"""Merger instrument scope: a scoped run merges only its instruments' daily files and leaves the rest in place."""
+from pathlib import Path
+import sys
+
+import pandas as pd
+
+
+SYSTEM_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SYSTEM_ROOT))
+
+from modules.merger import merger  # noqa: E402
+
+DAY = "2025-03-03"
+
+
+def _daily_rows(instrument: str) -> pd.DataFrame:
+    return pd.DataFrame({
+        "Date": [DAY, DAY],
+        "Time": ["07:30", "09:00"],
+        "Session": "S1",
+        "Instrument": instrument,
+        "Stream": f"{instrument}1",
+        "Result": ["Win", "Loss"],
+        "Profit": [5.0, -3.0],
+    })
+
+
+def _data_dir(tmp_path, monkeypatch) -> Path:
+    data_dir = tmp_path / "data"
+    monkeypatch.setattr(merger, "ANALYZER_TEMP_DIR", data_dir / "analyzer_temp")
+    monkeypatch.setattr(merger, "MANUAL_ANALYZER_RUNS_DIR", data_dir / "manual_analyzer_runs")
+    monkeypatch.setattr(merger, "ANALYZER_RUNS_DIR", data_dir / "analyzed")
+    monkeypatch.setattr(merger, "PROCESSED_LOG_FILE", data_dir / "merger_processed.json")
+    return data_dir
+
+
+def test_scoped_runs_merge_their_instruments_only(tmp_path, monkeypatch):
+    data_dir = _data_dir(tmp_path, monkeypatch)
+
+    folder = data_dir / "analyzer_temp" / DAY
+    folder.mkdir(parents=True)
+    _daily_rows("ES").to_parquet(folder / "ES1.parquet", index=False)
+    _daily_rows("NQ").to_parquet(folder / "NQ1.parquet", index=False)
+    (folder / "CL1.parquet").write_bytes(b"PAR1")  # Still being written by another flow
+
+    merger.DataMerger(instruments=["es"]).run()
+    analyzed = data_dir / "analyzed"
+    assert (analyzed / "ES1" / "2025" / "ES1_an_2025_03.parquet").exists()
+    assert not (analyzed / "NQ1").exists()
+    assert sorted(p.name for p in folder.iterdir()) == ["CL1.parquet", "NQ1.parquet"]
+
+    # Nothing of a scope in the folder is not a failure
+    assert merger.DataMerger(instruments=["GC"]).process_analyzer_folder(folder)
+
+    (folder / "CL1.parquet").unlink()
+    merger.DataMerger(instruments=["NQ"]).run()
+    assert len(pd.read_parquet(analyzed / "NQ1" / "2025" / "NQ1_an_2025_03.parquet")) == 2
+    # Last files merged: the emptied folder is removed
+    assert not folder.exists()
+
+
+def test_scoped_run_keeps_files_written_after_its_merge(tmp_path, monkeypatch):
+    data_dir = _data_dir(tmp_path, monkeypatch)
+    folder = data_dir / "analyzer_temp" / DAY
+    folder.mkdir(parents=True)
+    _daily_rows("ES").to_parquet(folder / "ES1.parquet", index=False)
+
+    # Another flow's analyzer writes its file between the merge and the folder removal
+    rmdir = merger.os.rmdir
+
+    def rmdir_after_foreign_write(path):
+        _daily_rows("YM").to_parquet(Path(path) / "YM1.parquet", index=False)
+        rmdir(path)
+
+    monkeypatch.setattr(merger.os, "rmdir", rmdir_after_foreign_write)
+    assert merger.DataMerger(instruments=["ES"]).process_analyzer_folder(folder)
+
+    assert sorted(p.name for p in folder.iterdir()) == ["YM1.parquet"]
+    assert (data_dir / "analyzed" / "ES1" / "2025" / "ES1_an_2025_03.parquet").exists()
+    # Not marked processed: the unscoped / YM merge still picks the folder up
+    monkeypatch.undo()
+    _data_dir(tmp_path, monkeypatch)
+    merger.DataMerger(instruments=["YM"]).run()
+    assert (data_dir / "analyzed" / "YM1" / "2025" / "YM1_an_2025_03.parquet").exists()
+    assert not folder.exists()
+
+
+def test_scoped_run_clears_no_results_files(tmp_path, monkeypatch):
+    data_dir = _data_dir(tmp_path, monkeypatch)
+    folder = data_dir / "analyzer_temp" / DAY
+    folder.mkdir(parents=True)
+    # An instrument without trades leaves an empty file; its instrument is only in the name
+    _daily_rows("GC").iloc[0:0].to_parquet(folder / "breakout_GC_no_results_20250303_070000.parquet", index=False)
+
+    assert merger.DataMerger(instruments=["ES"]).process_analyzer_folder(folder)
+    assert folder.exists()
+
+    assert merger.DataMerger(instruments=["GC"]).process_analyzer_folder(folder)
+    assert not folder.exists()
+    assert not (data_dir / "analyzed" / "GC1").exists()
+
+
+def test_scoped_run_removes_no_results_file_with_merged_files(tmp_path, monkeypatch):
+    data_dir = _data_dir(tmp_path, monkeypatch)
+    folder = data_dir / "analyzer_temp" / DAY
+    folder.mkdir(parents=True)
+    _daily_rows("ES").to_parquet(folder / "ES1.parquet", index=False)
+    _daily_rows("ES").iloc[0:0].to_parquet(folder / "breakout_ES_no_results_20250303_070000.parquet", index=False)
+
+    merger.DataMerger(instruments=["ES"]).run()
+    assert (data_dir / "analyzed" / "ES1" / "2025" / "ES1_an_2025_03.parquet").exists()
+    assert not folder.exists()
@@ -0,0 +1,209 @@
+"""Pipelined PipelineRunner: per-instrument flows with bounded concurrency, serialized merges and a forward-only run state."""
+import asyncio
+import logging
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+
+SYSTEM_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SYSTEM_ROOT))
+sys.path.insert(0, str(SYSTEM_ROOT.parent / "tools"))  # automation package
+
+from modules.orchestrator import runner  # noqa: E402
+from modules.orchestrator.config import OrchestratorConfig, StageConfig  # noqa: E402
+from modules.orchestrator.state import PipelineRunState, PipelineStage, RunContext  # noqa: E402
+
+
+class _Calls:
+    """Service calls of a run, with the peak number of concurrent calls per group"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.active = {"slots": 0, "merge": 0}
+        self.peak = {"slots": 0, "merge": 0}
+        self.log = []
+
+    def run(self, group, stage, instrument, result):
+        with self._lock:
+            self.active[group] += 1
+            self.peak[group] = max(self.peak[group], self.active[group])
+            self.log.append((stage, instrument))
+        time.sleep(0.05)
+        with self._lock:
+            self.active[group] -= 1
+        return SimpleNamespace(status=result)
+
+
+class _StubService:
+    def __init__(self, calls, stage, group, failures=0, always_fail=False):
+        self.calls = calls
+        self.stage = stage
+        self.group = group
+        self.failures = failures
+        self.always_fail = always_fail
+        self.kwargs = []
+
+    def run(self, run_id, instruments=None, **kwargs):
+        self.kwargs.append(dict(kwargs, instruments=instruments))
+        instrument = next(iter(instruments)) if instruments else None
+        failed = self.always_fail or self.failures > 0
+        self.failures -= 1
+        return self.calls.run(self.group, self.stage, instrument, "failure" if failed else "success")
+
+
+class _StateManager:
+    def __init__(self):
+        self.transitions = []
+
+    async def transition(self, new_state, *, stage=None, error=None, metadata=None):
+        self.transitions.append((new_state, stage, metadata))
+
+
+class _EventBus:
+    def __init__(self):
+        self.events = []
+
+    async def publish(self, event):
+        self.events.append(event)
+
+
+def _runner(tmp_path, concurrency=2, max_retries=1, analyzer_failures=None, analyzer_broken=()):
+    stages = {
+        stage.value: StageConfig(stage.value, order, timeout_sec=30, max_retries=max_retries, retry_delay_sec=0)
+        for order, stage in enumerate(runner.STAGE_ORDER, 1)
+    }
+    config = OrchestratorConfig(
+        qtsw2_root=tmp_path, event_logs_dir=tmp_path, lock_dir=tmp_path, stages=stages,
+        pipelined=True, max_instrument_concurrency=concurrency,
+    )
+    pipeline_runner = runner.PipelineRunner(config, _EventBus(), _StateManager(), logging.getLogger("test"))
+    pipeline_runner.pipeline_config = SimpleNamespace(
+        data_raw=tmp_path / "raw", data_translated=tmp_path / "translated"
+    )
+
+    calls = _Calls()
+    services = {}
+
+    def create_services(run_id, instrument=None):
+        services[instrument] = (
+            _StubService(calls, "translator", "slots"),
+            _StubService(calls, "analyzer", "slots", failures=(analyzer_failures or {}).get(instrument, 0),
+                         always_fail=instrument in analyzer_broken),
+            _StubService(calls, "merger", "merge"),
+        )
+        return services[instrument]
+
+    async def validate(stage, run_ctx, instrument=None):
+        return True
+
+    pipeline_runner._create_services = create_services
+    pipeline_runner._validate_stage_output = validate
+    return pipeline_runner, calls, services
+
+
+def _raw_files(tmp_path, *instruments):
+    raw = tmp_path / "raw"
+    raw.mkdir(exist_ok=True)
+    for instrument in instruments:
+        (raw / f"{instrument}_1m_2025-03-03.csv").write_text("", encoding="utf-8")
+
+
+def _run(pipeline_runner):
+    return asyncio.run(pipeline_runner.run_pipeline(RunContext(run_id="run-1")))
+
+
+def _states(pipeline_runner):
+    return [state for state, _, _ in pipeline_runner.state_manager.transitions]
+
+
+def test_flows_respect_concurrency_and_serialize_merges(tmp_path):
+    _raw_files(tmp_path, "ES", "NQ", "CL", "GC", "YM")
+    pipeline_runner, calls, services = _runner(tmp_path, concurrency=2)
+    _run(pipeline_runner)
+
+    assert calls.peak["slots"] <= 2
+    assert calls.peak["merge"] == 1
+    assert sorted(instrument for stage, instrument in calls.log if stage == "merger") == ["CL", "ES", "GC", "NQ", "YM"]
+    # Each flow's services are scoped to its instrument; analyzers share the worker budget
+    translator, analyzer, merger = services["ES"]
+    assert translator.kwargs == [{"instruments": {"ES"}}]
+    assert merger.kwargs == [{"instruments": {"ES"}}]
+    assert analyzer.kwargs[0]["worker_budget"] >= 1
+
+
+def test_run_state_only_moves_forward(tmp_path):
+    _raw_files(tmp_path, "ES", "NQ", "CL")
+    pipeline_runner, _, _ = _runner(tmp_path, concurrency=3, analyzer_failures={"NQ": 1})
+    _run(pipeline_runner)
+
+    assert _states(pipeline_runner) == [
+        PipelineRunState.RUNNING_TRANSLATOR,
+        PipelineRunState.RUNNING_ANALYZER,
+        PipelineRunState.RUNNING_MERGER,
+        PipelineRunState.SUCCESS,
+    ]
+
+
+def test_flow_retries_publish_instrument_events(tmp_path):
+    _raw_files(tmp_path, "ES", "NQ")
+    pipeline_runner, calls, _ = _runner(tmp_path, max_retries=2, analyzer_failures={"NQ": 2})
+    _run(pipeline_runner)
+
+    retries = [event for event in pipeline_runner.event_bus.events if event["event"] == "retry"]
+    assert [(event["stage"], event["instrument"], event["data"]["attempt"]) for event in retries] == [
+        ("pipeline", "NQ", 1), ("pipeline", "NQ", 2),
+    ]
+    assert all(event["data"]["stage"] == "analyzer" for event in retries)
+    assert PipelineRunState.RETRYING not in _states(pipeline_runner)
+    assert _states(pipeline_runner)[-1] == PipelineRunState.SUCCESS
+    assert calls.log.count(("analyzer", "NQ")) == 3
+
+
+def test_failed_flow_fails_run_while_others_merge(tmp_path):
+    _raw_files(tmp_path, "ES", "NQ", "CL")
+    pipeline_runner, calls, _ = _runner(tmp_path, analyzer_broken={"NQ"})
+    _run(pipeline_runner)
+
+    state, _, metadata = pipeline_runner.state_manager.transitions[-1]
+    assert state == PipelineRunState.FAILED
+    assert metadata["failed_instruments"] == ["analyzer:NQ"]
+    assert sorted(instrument for stage, instrument in calls.log if stage == "merger") == ["CL", "ES"]
+    assert ("merger", "NQ") not in calls.log
+
+
+def test_discover_instruments_skips_internal_directories(tmp_path):
+    _raw_files(tmp_path, "es")
+    translated = tmp_path / "translated"
+    for name in ("NQ", "_bar_store"):
+        (translated / name).mkdir(parents=True)
+    pipeline_runner, _, _ = _runner(tmp_path)
+
+    assert pipeline_runner._discover_instruments() == ["ES", "NQ"]
+
+
+def test_no_instruments_falls_back_to_staged_run(tmp_path):
+    (tmp_path / "translated" / "_bar_store").mkdir(parents=True)
+    pipeline_runner, calls, services = _runner(tmp_path)
+
+    async def initialize_services(run_id):
+        (
+            pipeline_runner.translator_service,
+            pipeline_runner.analyzer_service,
+            pipeline_runner.merger_service,
+        ) = pipeline_runner._create_services(run_id)
+
+    pipeline_runner._initialize_services = initialize_services
+    _run(pipeline_runner)
+
+    # One unscoped service set, each stage run once over all instruments
+    assert list(services) == [None]
+    assert calls.log == [("translator", None), ("analyzer", None), ("merger", None)]
+    assert _states(pipeline_runner) == [
+        PipelineRunState.RUNNING_TRANSLATOR,
+        PipelineRunState.RUNNING_ANALYZER,
+        PipelineRunState.RUNNING_MERGER,
+        PipelineRunState.SUCCESS,
+    ]
@@ -0,0 +1,180 @@
+"""Pipeline event index: indexed snapshot/run reads must equal a full JSONL scan."""
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import importlib.util
+import json
+import os
+import sys
+import types
+
+
+SYSTEM_ROOT = Path(__file__).resolve().parent.parent
+ORCHESTRATOR_DIR = SYSTEM_ROOT / "modules" / "orchestrator"
+
+# Load events.py/event_index.py without the orchestrator package __init__ (pulls in the runner)
+_pkg = types.ModuleType("_orchestrator_events")
+_pkg.__path__ = [str(ORCHESTRATOR_DIR)]
+sys.modules.setdefault("_orchestrator_events", _pkg)
+
+
+def _load(name):
+    full_name = f"_orchestrator_events.{name}"
+    if full_name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(full_name, ORCHESTRATOR_DIR / f"{name}.py")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[full_name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[full_name]
+
+
+event_index = _load("event_index")
+EventBus = _load("events").EventBus
+
+
+def _event(ts: datetime, i: int, event="log", stage="analyzer", fmt="z"):
+    if fmt == "z":
+        stamp = ts.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    elif fmt == "naive":
+        stamp = ts.astimezone(timezone.utc).replace(tzinfo=None).isoformat()
+    else:
+        stamp = ts.isoformat()
+    return json.dumps({"run_id": "r", "stage": stage, "event": event, "timestamp": stamp, "data": {"i": i}})
+
+
+def _write_run(path: Path, start: datetime, count: int, step: timedelta, offset: int = 0):
+    fmts = ["z", "naive", "offset"]
+    lines = []
+    for i in range(count):
+        ts = start + step * i
+        if i % 97 == 0:
+            ts -= timedelta(hours=30)  # Late/out-of-order write
+        event = "metric" if i % 11 == 0 else "log"
+        stage = "pipeline" if i % 22 == 0 else "analyzer"
+        lines.append(_event(ts, offset + i, event, stage, fmts[i % 3]))
+        if i % 50 == 0:
+            lines.append("")
+        if i % 173 == 0:
+            lines.append("{not json")
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def _reference_snapshot(logs_dir: Path, hours: int, exclude_verbose: bool = True):
+    """Full scan of every line, as load_jsonl_events_since did before the index."""
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+    events = []
+    for path in logs_dir.glob("pipeline_*.jsonl"):
+        for line in path.read_text(encoding="utf-8").splitlines():
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if exclude_verbose and event["event"] in EventBus.VERBOSE_EVENTS and event["stage"] not in EventBus.ALWAYS_LOG_STAGES:
+                continue
+            if event_index.parse_event_timestamp(event["timestamp"]) >= cutoff:
+                events.append(event)
+    events.sort(key=lambda e: e.get("timestamp", ""))
+    return events
+
+
+def _key(events):
+    return sorted((e["data"]["i"], e["timestamp"]) for e in events)
+
+
+def test_snapshot_matches_full_scan_and_indexes_incrementally(tmp_path):
+    now = datetime.now(timezone.utc)
+    _write_run(tmp_path / "pipeline_old.jsonl", now - timedelta(days=5), 1200, timedelta(minutes=3))
+    _write_run(tmp_path / "pipeline_recent.jsonl", now - timedelta(hours=20), 900, timedelta(minutes=1), offset=10_000)
+
+    bus = EventBus(event_logs_dir=tmp_path)
+    for hours in (1, 4, 24, 200):
+        assert _key(bus.load_jsonl_events_since(hours=hours)) == _key(_reference_snapshot(tmp_path, hours))
+    assert _key(bus.load_jsonl_events_since(hours=24, exclude_verbose=False)) == _key(
+        _reference_snapshot(tmp_path, 24, exclude_verbose=False))
+
+    # Blocks older than the window are skipped, not read (old run spans -120h..-60h)
+    index = bus._event_index.get(tmp_path / "pipeline_old.jsonl")
+    assert sum(1 for _ in index.lines_since((now - timedelta(hours=24)).timestamp())) == 0
+    read = sum(1 for _ in index.lines_since((now - timedelta(hours=75)).timestamp()))
+    assert 0 < read < index.line_count / 2
+
+    # Appends (including a partial last line) are picked up without re-indexing the file
+    recent = tmp_path / "pipeline_recent.jsonl"
+    size_before = bus._event_index.get(recent).indexed_size
+    _write_run(recent, now - timedelta(minutes=30), 40, timedelta(seconds=30), offset=20_000)
+    with open(recent, "a", encoding="utf-8") as f:
+        f.write(_event(now - timedelta(minutes=1), 30_000))  # Still being written
+    assert _key(bus.load_jsonl_events_since(hours=24)) == _key(_reference_snapshot(tmp_path, 24))
+    assert bus._event_index.get(recent).blocks[0][0] == 0
+    assert bus._event_index.get(recent).indexed_size > size_before
+
+    # Max events keeps the most recent ones
+    capped = bus.load_jsonl_events_since(hours=24, max_events=100)
+    assert capped == _reference_snapshot(tmp_path, 24)[-100:]
+
+    # A fresh EventBus reuses the sidecars
+    assert (tmp_path / ".index" / "pipeline_recent.jsonl.idx.json").exists()
+    other = EventBus(event_logs_dir=tmp_path)
+    assert _key(other.load_jsonl_events_since(hours=24)) == _key(_reference_snapshot(tmp_path, 24))
+
+
+def test_capped_snapshot_keeps_newest_events_across_files(tmp_path):
+    now = datetime.now(timezone.utc)
+    older = tmp_path / "pipeline_a.jsonl"
+    newer = tmp_path / "pipeline_b.jsonl"
+    _write_run(newer, now - timedelta(hours=2), 300, timedelta(seconds=10), offset=1_000)
+    _write_run(older, now - timedelta(hours=10), 300, timedelta(seconds=10))
+    # Older events in the most recently modified file: scan order is not event order
+    os.utime(newer, (now.timestamp() - 60, now.timestamp() - 60))
+
+    bus = EventBus(event_logs_dir=tmp_path)
+    reference = _reference_snapshot(tmp_path, 24)
+    for cap in (1, 50, 250, len(reference), len(reference) + 10):
+        capped = bus.load_jsonl_events_since(hours=24, max_events=cap)
+        assert _key(capped) == _key(reference[-cap:])
+        assert len(capped) == min(cap, len(reference))
+    assert bus.load_jsonl_events_since(hours=24, max_events=0) == []
+
+
+def test_replaced_and_rotated_files_are_reindexed(tmp_path):
+    now = datetime.now(timezone.utc)
+    path = tmp_path / "pipeline_run1.jsonl"
+    _write_run(path, now - timedelta(hours=2), 600, timedelta(seconds=10))
+    bus = EventBus(event_logs_dir=tmp_path)
+    assert _key(bus.load_jsonl_events_since(hours=24)) == _key(_reference_snapshot(tmp_path, 24))
+
+    # Replaced by a larger file with different content (rotation + new run)
+    path.unlink()
+    _write_run(path, now - timedelta(hours=1), 900, timedelta(seconds=3), offset=50_000)
+    assert _key(bus.load_jsonl_events_since(hours=24)) == _key(_reference_snapshot(tmp_path, 24))
+
+    # Archived file: its index and sidecar are dropped
+    path.rename(tmp_path / "archive" / path.name)
+    assert bus.load_jsonl_events_since(hours=24) == []
+    assert not (tmp_path / ".index" / "pipeline_run1.jsonl.idx.json").exists()
+
+
+def test_get_events_for_run_matches_readlines_tail(tmp_path):
+    now = datetime.now(timezone.utc)
+    path = tmp_path / "pipeline_abc.jsonl"
+    _write_run(path, now - timedelta(hours=3), 1000, timedelta(seconds=5))
+    bus = EventBus(event_logs_dir=tmp_path)
+
+    def reference(limit):
+        with open(path, "r", encoding="utf-8") as f:
+            lines = f.readlines()[-limit:]
+        events = []
+        for line in lines:
+            if line.strip():
+                try:
+                    events.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return events
+
+    for limit in (1, 10, 255, 256, 257, 1000, 5000):
+        assert bus.get_events_for_run("abc", limit=limit) == reference(limit)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(_event(now, 99_999))  # Unterminated last line
+    assert bus.get_events_for_run("abc", limit=300) == reference(300)
+    assert bus.get_events_for_run("missing") == []
@@ -0,0 +1,106 @@
+"""Bar store: reads must equal the analyzer's day-file load, across appends and rebuilds."""
+from datetime import date
+from pathlib import Path
+import importlib.util
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+
+SYSTEM_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SYSTEM_ROOT))
+
+from modules.translator import translate_batch, discover_raw_files  # noqa: E402
+from modules.translator.bar_store import BarStore  # noqa: E402
+
+_spec = importlib.util.spec_from_file_location(
+    "_run_data_processed", SYSTEM_ROOT / "modules" / "analyzer" / "scripts" / "run_data_processed.py")
+run_data_processed = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(run_data_processed)
+
+
+def _write_raw(raw_root: Path, instrument: str, day: str, minutes: int, seed: int) -> Path:
+    rng = np.random.default_rng(seed)
+    ts = pd.date_range(f"{day}T13:00:00Z", periods=minutes, freq="1min", tz="UTC")
+    close = 5000 + np.cumsum(rng.normal(0, 0.25, minutes)).round(2)
+    df = pd.DataFrame({
+        "timestamp_utc": ts.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "open": close - 0.25,
+        "high": close + rng.random(minutes).round(2),
+        "low": close - rng.random(minutes).round(2),
+        "close": close,
+        "volume": rng.integers(0, 500, minutes),
+    })
+    path = raw_root / instrument / "1m" / day[:4] / day[5:7] / f"{instrument}_1m_{day}.csv"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_csv(path, index=False)
+    return path
+
+
+def _translate(tmp_path: Path, days, seed: int = 0):
+    raw_root = tmp_path / f"export_{seed}" / "raw"
+    for i, day in enumerate(days):
+        _write_raw(raw_root, "ES", day, 120 + i, seed + i)
+    return translate_batch(discover_raw_files(raw_root), tmp_path / "translated", workers=1,
+                           overwrite=True, use_manifest=False, sync_bar_store=False)
+
+
+def _assert_parity(root: Path, **kwargs):
+    expected = run_data_processed.load_folder(str(root), "ES", use_bar_store=False, **kwargs)
+    actual = run_data_processed.load_folder(str(root), "ES", **kwargs)
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_store_reads_match_day_files_and_appends_new_days(tmp_path):
+    days = ["2025-12-29", "2025-12-30", "2026-01-02", "2026-01-05", "2026-02-02"]
+    _translate(tmp_path, days[:3])
+    root = tmp_path / "translated"
+    store = BarStore(root, "ES")
+
+    assert store.sync() == "rebuilt"
+    assert store.sync() == "current"
+    assert store.dates() == days[:3]
+    _assert_parity(root)
+
+    # Daily translator run: new days are appended to the same data file
+    data_file = store.load_index()["data_file"]
+    _translate(tmp_path, days[3:], seed=10)
+    assert store.sync() == "appended"
+    assert store.load_index()["data_file"] == data_file
+    assert store.dates() == days
+
+    _assert_parity(root)
+    _assert_parity(root, years=[2026])
+    _assert_parity(root, start_date=date(2025, 12, 30), end_date=date(2026, 1, 5))
+    _assert_parity(root, start_date=date(2026, 1, 1))  # One bound only: no date filter (day-file semantics)
+    window = store.read(start_date=date(2026, 1, 2), end_date=date(2026, 1, 5))
+    assert sorted(window["timestamp"].dt.date.astype(str).unique()) == ["2026-01-02", "2026-01-05"]
+
+
+def test_changed_or_inserted_days_rebuild_the_store(tmp_path):
+    _translate(tmp_path, ["2026-03-02", "2026-03-04"])
+    root = tmp_path / "translated"
+    store = BarStore(root, "ES")
+    store.sync()
+
+    # Day inserted before the last stored day
+    _translate(tmp_path, ["2026-03-03"], seed=20)
+    assert store.sync() == "rebuilt"
+    _assert_parity(root)
+
+    # Re-translated day with different bars
+    day_file = root / "ES" / "1m" / "2026" / "03" / "ES_1m_2026-03-02.parquet"
+    df = pd.read_parquet(day_file).iloc[:50]
+    df.to_parquet(day_file, index=False)
+    os.utime(day_file, ns=(day_file.stat().st_atime_ns, day_file.stat().st_mtime_ns + 1_000_000))
+    assert store.sync() == "rebuilt"
+    assert [b["rows"] for b in store.load_index()["batches"]][0] == 50
+    _assert_parity(root)
+    assert len(list((root / "_bar_store").glob("ES_1m.*.arrows"))) == 1
+
+    # Unusable store: the analyzer falls back to the day files
+    (root / "ES" / "1m" / "2026" / "03" / "ES_1m_undated.parquet").write_bytes(day_file.read_bytes())
+    expected = run_data_processed.load_folder(str(root), "ES", use_bar_store=False)
+    pd.testing.assert_frame_equal(run_data_processed.load_folder(str(root), "ES"), expected)
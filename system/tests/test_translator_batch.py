@@ -0,0 +1,104 @@
+"""Translator batch mode: pooled output must equal serial translate_file, and unchanged files are skipped."""
+from pathlib import Path
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+
+SYSTEM_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SYSTEM_ROOT))
+
+from modules.translator import translate_batch, translate_file, discover_raw_files  # noqa: E402
+from modules.translator.core import read_raw_csv  # noqa: E402
+
+
+def _write_raw(raw_root: Path, instrument: str, day: str, start_utc: str, minutes: int, seed: int) -> Path:
+    rng = np.random.default_rng(seed)
+    ts = pd.date_range(start_utc, periods=minutes, freq="1min", tz="UTC")
+    close = 5000 + np.cumsum(rng.normal(0, 0.25, minutes)).round(2)
+    df = pd.DataFrame({
+        "timestamp_utc": ts.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "open": close - 0.25,
+        "high": close + rng.random(minutes).round(2),
+        "low": close - rng.random(minutes).round(2),
+        "close": close,
+        "volume": rng.integers(0, 500, minutes),
+    })
+    path = raw_root / instrument / "1m" / day[:4] / day[5:7] / f"{instrument}_1m_{day}.csv"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_csv(path, index=False)
+    return path
+
+
+def _make_raw_tree(raw_root: Path):
+    _write_raw(raw_root, "ES", "2026-03-09", "2026-03-09T12:00:00Z", 600, 1)  # partial mismatch (spans Chicago midnight)
+    _write_raw(raw_root, "ES", "2026-03-10", "2026-03-10T00:00:00Z", 140, 2)  # all rows belong to Mar 9 (auto-correct)
+    _write_raw(raw_root, "ES", "2026-03-11", "2026-03-11T13:00:00Z", 300, 3)
+    _write_raw(raw_root, "NQ", "2026-03-11", "2026-03-11T13:00:00Z", 0, 4)  # header only (empty day)
+    _write_raw(raw_root, "NQ", "2026-03-12", "2026-03-12T13:00:00Z", 390, 5)
+
+
+def _read_tree(root: Path):
+    return {p.relative_to(root).as_posix(): pd.read_parquet(p) for p in sorted(root.rglob("*.parquet"))}
+
+
+def test_batch_matches_serial_translation(tmp_path):
+    raw_root = tmp_path / "raw"
+    _make_raw_tree(raw_root)
+    raw_files = discover_raw_files(raw_root)
+    assert [p.name for p in raw_files] == [
+        "ES_1m_2026-03-09.csv", "ES_1m_2026-03-10.csv", "ES_1m_2026-03-11.csv",
+        "NQ_1m_2026-03-11.csv", "NQ_1m_2026-03-12.csv",
+    ]
+
+    serial_root = tmp_path / "serial"
+    for raw_csv in raw_files:
+        translate_file(raw_csv, serial_root)
+
+    batch_root = tmp_path / "batch"
+    result = translate_batch(raw_files, batch_root, workers=2)
+    assert result.ok and result.skipped == 0 and len(result.written) == 5
+
+    expected, actual = _read_tree(serial_root), _read_tree(batch_root)
+    assert list(actual) == list(expected)
+    for name in expected:
+        pd.testing.assert_frame_equal(actual[name], expected[name])
+
+
+def test_arrow_reader_matches_pandas_reader(tmp_path):
+    raw_root = tmp_path / "raw"
+    _make_raw_tree(raw_root)
+    for raw_csv in discover_raw_files(raw_root):
+        arrow_root, pandas_root = tmp_path / "arrow", tmp_path / "pandas"
+        translate_file(raw_csv, arrow_root, use_arrow_reader=True)
+        translate_file(raw_csv, pandas_root)
+    expected, actual = _read_tree(pandas_root), _read_tree(arrow_root)
+    for name in expected:
+        pd.testing.assert_frame_equal(actual[name], expected[name])
+
+    bad = raw_root / "ES" / "1m" / "2026" / "03" / "ES_1m_2026-03-13.csv"
+    bad.write_text("timestamp_utc,open,high,low,close,volume\n2026-03-13T14:00:00Z,1,2,0.5,1.5,abc\n")
+    assert read_raw_csv(bad, use_arrow_reader=True)["volume"].tolist() == ["abc"]  # falls back to pd.read_csv
+
+
+def test_batch_skips_unchanged_content(tmp_path):
+    raw_root = tmp_path / "raw"
+    _make_raw_tree(raw_root)
+    out_root = tmp_path / "out"
+    raw_files = discover_raw_files(raw_root, instruments=["ES"])
+    assert len(translate_batch(raw_files, out_root, workers=1).written) == 3
+
+    # Nothing changed; touched-but-identical files are skipped via the content hash
+    touched = raw_files[2]
+    stat = touched.stat()
+    os.utime(touched, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    again = translate_batch(raw_files, out_root, workers=1)
+    assert again.written == [] and again.skipped == 3
+
+    # Re-exported with new content: only that file is translated again
+    _write_raw(raw_root, "ES", "2026-03-11", "2026-03-11T13:00:00Z", 320, 33)
+    changed = translate_batch(raw_files, out_root, workers=1)
+    assert [p.name for p in changed.written] == ["ES_1m_2026-03-11.parquet"]
+    assert len(pd.read_parquet(changed.written[0])) == 320
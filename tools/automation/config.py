@@ -57,6 +57,12 @@ class PipelineConfig:
     analyzer_timeout: int = 21600  # 6 hours
     merger_timeout: int = 1800  # 30 minutes
     
+    # Analyzer: only recompute new/still-open ranges (full run when history or params changed)
+    analyzer_incremental: bool = True
+    
+    # Merger: write new rows of existing months as delta files (compacted in the background)
+    merger_append_mode: bool = True
+    
     @classmethod
     def from_environment(cls, qtsw2_root: Optional[Path] = None) -> 'PipelineConfig':
         """
@@ -116,6 +122,8 @@ class PipelineConfig:
             translator_timeout=int(os.getenv("TRANSLATOR_TIMEOUT", "3600")),
             analyzer_timeout=int(os.getenv("ANALYZER_TIMEOUT", "21600")),
             merger_timeout=int(os.getenv("MERGER_TIMEOUT", "1800")),
+            analyzer_incremental=os.getenv("ANALYZER_INCREMENTAL", "1").lower() not in ("0", "false", "no"),
+            merger_append_mode=os.getenv("MERGER_APPEND_MODE", "1").lower() not in ("0", "false", "no"),
         )
 
 
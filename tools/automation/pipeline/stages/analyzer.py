@@ -7,7 +7,7 @@ Single Responsibility: Invoke parallel analyzer to process translated Parquet fi
 import sys
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set
 from dataclasses import dataclass
 
 from automation.services.process_supervisor import ProcessSupervisor, ProcessResult
@@ -42,6 +42,15 @@ class AnalyzerService:
     - Report metrics (instruments processed, etc.)
     """
     
+    # Instruments supported by the parallel analyzer runner CLI
+    SUPPORTED_INSTRUMENTS = frozenset({"ES", "NQ", "YM", "CL", "NG", "GC", "RTY"})
+    
+    @staticmethod
+    def success_marker(analyzer_runs: Path, run_id: str, instruments: Optional[Set[str]] = None) -> Path:
+        """Success marker of a run (per instrument scope when the run was scoped)"""
+        scope = "".join(f"_{i}" for i in sorted(instruments)) if instruments else ""
+        return analyzer_runs / f".success_{run_id}{scope}.marker"
+    
     def __init__(
         self,
         config: PipelineConfig,
@@ -56,17 +65,22 @@ class AnalyzerService:
         self.file_manager = file_manager
         self.event_logger = event_logger
     
-    def run(self, run_id: str) -> AnalyzerResult:
+    def run(self, run_id: str, instruments: Optional[Set[str]] = None,
+            worker_budget: Optional[int] = None) -> AnalyzerResult:
         """
         Run the analyzer stage.
         
         Args:
             run_id: Pipeline run ID
+            instruments: Only analyze these instruments (None = all translated instruments)
+            worker_budget: ANALYZER_WORKER_BUDGET for the analyzer run (None = inherit), so
+                concurrent scoped runs share the CPUs instead of each taking all of them
         
         Returns:
             AnalyzerResult with stage outcome
         """
         result = AnalyzerResult()
+        scope = {i.upper() for i in instruments} if instruments is not None else None
         
         self.logger.info("Starting analyzer stage")
         self.event_logger.emit(run_id, "analyzer", "start", "Starting analyzer stage")
@@ -123,6 +137,9 @@ class AnalyzerService:
             except Exception:
                 continue
         
+        if scope is not None:
+            instruments = instruments & scope
+        
         if not instruments:
             result.status = "skipped"
             result.error_message = "Could not determine instruments from file paths"
@@ -134,7 +151,7 @@ class AnalyzerService:
         # Without this, adding new instruments to data/translated (e.g., RTY) can cause
         # the analyzer runner to exit immediately (argparse "invalid choice" → exit code 2),
         # which then cascades into "unstable health" and policy-gated runs.
-        supported_instruments = {"ES", "NQ", "YM", "CL", "NG", "GC", "RTY"}
+        supported_instruments = self.SUPPORTED_INSTRUMENTS
         unsupported = sorted(i for i in instruments if i not in supported_instruments)
         if unsupported:
             self.logger.warning(
@@ -169,6 +186,8 @@ class AnalyzerService:
             "--folder", str(input_folder),
             "--instruments"
         ] + instruments_list
+        if self.config.analyzer_incremental:
+            analyzer_cmd.append("--incremental")
         
         def on_stdout_line(line: str):
             """Handle stdout lines"""
@@ -189,6 +208,8 @@ class AnalyzerService:
         env["PIPELINE_RUN"] = "1"  # Tell analyzer to write to analyzer_temp (not manual_analyzer_runs)
         env["PIPELINE_RUN_ID"] = run_id  # Pass run_id for tracking
         env["PIPELINE_EVENT_LOG"] = str(self.config.event_logs_dir / f"pipeline_{run_id}.jsonl")
+        if worker_budget is not None:
+            env["ANALYZER_WORKER_BUDGET"] = str(max(1, worker_budget))
         
         # Execute analyzer
         process_result = self.process_supervisor.execute(
@@ -213,7 +234,7 @@ class AnalyzerService:
             
             # Write success marker file for run_id-specific validation
             # This ensures validation can check that THIS run produced output, not a previous run
-            marker_file = self.config.analyzer_runs / f".success_{run_id}.marker"
+            marker_file = self.success_marker(self.config.analyzer_runs, run_id, scope)
             try:
                 marker_file.parent.mkdir(parents=True, exist_ok=True)
                 marker_file.write_text(f"run_id={run_id}\nstatus=success\ninstruments={','.join(instruments_list)}\n")
@@ -35,6 +35,12 @@ class MergerService:
     - Report metrics (merged file counts, etc.)
     """
     
+    @staticmethod
+    def marker_name(run_id: str, instruments: Optional[Set[str]] = None) -> str:
+        """Completion marker file name of a run (per instrument scope when the run was scoped)"""
+        scope = "".join(f"_{i}" for i in sorted(instruments)) if instruments else ""
+        return f".merge_complete_{run_id}{scope}.marker"
+    
     def __init__(
         self,
         config: PipelineConfig,
@@ -47,12 +53,13 @@ class MergerService:
         self.process_supervisor = process_supervisor
         self.event_logger = event_logger
     
-    def run(self, run_id: str) -> MergerResult:
+    def run(self, run_id: str, instruments: Optional[Set[str]] = None) -> MergerResult:
         """
         Run the merger stage.
         
         Args:
             run_id: Pipeline run ID
+            instruments: Only merge analyzer output of these instruments (None = everything)
         
         Returns:
             MergerResult with stage outcome
@@ -67,6 +74,10 @@ class MergerService:
             sys.executable,
             str(self.config.merger_script)
         ]
+        if self.config.merger_append_mode:
+            merger_cmd.append("--append")
+        if instruments:
+            merger_cmd += ["--instruments"] + sorted(instruments)
         
         def on_stdout_line(line: str):
             """Handle stdout lines"""
@@ -102,7 +113,7 @@ class MergerService:
             from datetime import datetime
             marker_content = f"run_id={run_id}\nstatus=success\ntimestamp={datetime.now().isoformat()}\n"
             for base_dir in [self.config.logs_dir, self.config.analyzer_runs]:
-                marker_file = base_dir / f".merge_complete_{run_id}.marker"
+                marker_file = base_dir / self.marker_name(run_id, instruments)
                 try:
                     marker_file.parent.mkdir(parents=True, exist_ok=True)
                     marker_file.write_text(marker_content)
@@ -23,6 +23,7 @@ except ImportError:
 
 # Import the new translator module
 from modules.translator.core import translate_day
+from modules.translator.bar_store import sync_bar_stores
 
 
 @dataclass
@@ -62,12 +63,13 @@ class TranslatorService:
         self.file_manager = file_manager
         self.event_logger = event_logger
     
-    def run(self, run_id: str) -> TranslatorResult:
+    def run(self, run_id: str, instruments: Optional[Set[str]] = None) -> TranslatorResult:
         """
         Run the translator stage.
         
         Args:
             run_id: Pipeline run ID
+            instruments: Only translate these instruments (None = all raw files)
         
         Returns:
             TranslatorResult with stage outcome
@@ -105,6 +107,8 @@ class TranslatorService:
                     if len(parts) >= 3:
                         instrument = parts[0].upper()
                         date_str = parts[-1]  # Last part should be YYYY-MM-DD
+                        if instruments is not None and instrument not in instruments:
+                            continue
                         try:
                             trade_date = Date.fromisoformat(date_str)
                             instrument_date_groups[(instrument, trade_date)].add(raw_file)
@@ -121,6 +125,7 @@ class TranslatorService:
             files_written = 0
             files_skipped = 0
             files_failed = 0
+            written_instruments = set()
             total = len(instrument_date_groups)
             current = 0
             # Don't emit progress metric events - too verbose for live feed
@@ -144,6 +149,7 @@ class TranslatorService:
                     
                     if success:
                         files_written += 1
+                        written_instruments.add(instrument)
                         self.logger.info(f"  [OK] Translated {instrument} {trade_date}")
                         # Don't emit event for every successful file - too verbose for live events
                     else:
@@ -157,6 +163,12 @@ class TranslatorService:
                     # Only emit error events - these are important and should be visible
                     self.event_logger.emit(run_id, "translator", "error", error_msg)
             
+            # Append the new days to the consolidated bar stores the analyzer reads
+            # (a failed sync is logged only: the analyzer falls back to the day files)
+            if written_instruments:
+                for instrument, outcome in sync_bar_stores(self.config.data_translated, written_instruments).items():
+                    self.logger.info(f"  Bar store {instrument}: {outcome}")
+
             # Determine overall status
             if files_failed > 0 and files_written == 0:
                 result.status = "failure"
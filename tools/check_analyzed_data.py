@@ -11,6 +11,14 @@ from collections import defaultdict
 qtsw2_root = Path(__file__).parent.parent
 if str(qtsw2_root) not in sys.path:
     sys.path.insert(0, str(qtsw2_root))
+system_root = qtsw2_root / "system"
+if str(system_root) not in sys.path:
+    sys.path.insert(0, str(system_root))
+
+from modules.merger.monthly_deltas import delta_files, is_delta_file, read_merged
+
+def _fmt_date(value) -> str:
+    return str(value)[:10]
 
 def main():
     print("="*80)
@@ -23,8 +31,8 @@ def main():
         print(f"\n[ERROR] Analyzed directory not found: {analyzed_dir}")
         return
     
-    # Find all parquet files
-    files = list(analyzed_dir.rglob("*.parquet"))
+    # Find all monthly files (append-mode delta files are read with their monthly file)
+    files = [f for f in analyzed_dir.rglob("*.parquet") if not is_delta_file(f)]
     print(f"\n[OVERVIEW]")
     print(f"  Total analyzed files: {len(files)}")
     
@@ -66,7 +74,10 @@ def main():
                             year_part = year
                             month_part = "??"
                         
-                        mtime = datetime.fromtimestamp(file.stat().st_mtime)
+                        # Appended rows live in delta files until compaction
+                        deltas = delta_files(file)
+                        mtime = datetime.fromtimestamp(max(p.stat().st_mtime for p in [file] + deltas))
+                        dates = read_merged(file, columns=["Date"])["Date"]
                         
                         instrument_data[instrument][session].append({
                             "file": file,
@@ -74,6 +85,10 @@ def main():
                             "month": month_part,
                             "filename": file.name,
                             "mtime": mtime,
+                            "rows": len(dates),
+                            "first_date": dates.min() if len(dates) else None,
+                            "last_date": dates.max() if len(dates) else None,
+                            "deltas": len(deltas),
                             "path": str(file.relative_to(qtsw2_root))
                         })
                         break
@@ -105,8 +120,12 @@ def main():
                 months = sorted(set([f["month"] for f in year_files]))
                 latest = max(year_files, key=lambda x: x["mtime"])
                 
-                print(f"    {year}: {len(year_files)} file(s)")
+                print(f"    {year}: {len(year_files)} file(s), {sum(f['rows'] for f in year_files):,} rows")
                 print(f"      Months available: {', '.join(months)}")
+                last_dates = [f["last_date"] for f in year_files if f["last_date"] is not None]
+                if last_dates:
+                    first_dates = [f["first_date"] for f in year_files if f["first_date"] is not None]
+                    print(f"      Dates: {_fmt_date(min(first_dates))} to {_fmt_date(max(last_dates))}")
                 print(f"      Latest file: {latest['filename']}")
                 print(f"      Last modified: {latest['mtime'].strftime('%Y-%m-%d %H:%M:%S')}")
     
@@ -128,7 +147,8 @@ def main():
         
         print(f"\nMost recently modified files:")
         for latest, instrument, session in all_latest[:10]:
-            print(f"  {instrument}{session}: {latest['filename']}")
+            pending = f" (+{latest['deltas']} delta file(s))" if latest["deltas"] else ""
+            print(f"  {instrument}{session}: {latest['filename']}{pending}, {latest['rows']:,} rows")
             print(f"    Modified: {latest['mtime'].strftime('%Y-%m-%d %H:%M:%S')}")
             print(f"    Path: {latest['path']}")
         
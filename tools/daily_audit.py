@@ -269,6 +269,24 @@ def ingest_jsonl_file(
     return out
 
 
+def ingest_log_store(
+    log_dir: Path,
+    paths: Sequence[Path],
+    day_start: datetime,
+    day_end: datetime,
+    stats: Dict[str, Any],
+) -> List[NormEvent]:
+    """Same events/stats as ingest_jsonl_file over paths, read from the columnar robot log store."""
+    from robot_log_store import open_store
+
+    store = open_store(log_dir)
+    out = list(store.iter_events(window=(day_start, day_end), sources=paths))
+    stats["lines_read"] = stats.get("lines_read", 0) + len(out)
+    stats["parse_errors_count"] = stats.get("parse_errors_count", 0) + store.parse_errors(paths)
+    stats["files_read"] = stats.get("files_read", 0) + len(paths)
+    return out
+
+
 def ingest_journal_snapshots(
     log_dir: Path,
     audit_date: date,
@@ -1588,8 +1606,12 @@ def run_audit(args: argparse.Namespace) -> int:
     }
     raw_events: List[NormEvent] = []
 
-    for path in collect_robot_jsonl_paths(log_dir):
-        raw_events.extend(ingest_jsonl_file(path, day_start, day_end, stats))
+    robot_paths = collect_robot_jsonl_paths(log_dir)
+    if args.log_store:
+        raw_events.extend(ingest_log_store(log_dir, robot_paths, day_start, day_end, stats))
+    else:
+        for path in robot_paths:
+            raw_events.extend(ingest_jsonl_file(path, day_start, day_end, stats))
 
     feed_path: Optional[Path] = None
     wd = collect_watchdog_paths(log_dir)
@@ -2127,6 +2149,12 @@ def build_arg_parser() -> argparse.ArgumentParser:
         help="Include only events on --date at or after this wall clock time (24h). "
         "With --tz chicago uses America/Chicago; with --tz utc uses UTC. Example: 06:00",
     )
+    p.add_argument(
+        "--log-store",
+        action="store_true",
+        help="Read robot events from the columnar store (tools/robot_log_store.py, updated first) "
+        "instead of re-parsing every robot_*.jsonl",
+    )
     return p
 
 
@@ -597,12 +597,18 @@ def severity_score(m: BurstMetrics) -> int:
     return min(100, raw)
 
 
-def _load_day_events(log_dir: Path, audit_date: date, tz_name: str) -> List[NormEvent]:
+def _load_day_events(log_dir: Path, audit_date: date, tz_name: str, use_store: bool = False) -> List[NormEvent]:
     day_start, day_end = day_window_utc(audit_date, tz_name)
     stats: Dict[str, Any] = {}
     raw: List[NormEvent] = []
-    for path in collect_robot_jsonl_paths(log_dir):
-        raw.extend(ingest_jsonl_file(path, day_start, day_end, stats))
+    if use_store:
+        from robot_log_store import open_store
+
+        store = open_store(log_dir)
+        raw.extend(store.iter_events(window=(day_start, day_end), sources=collect_robot_jsonl_paths(log_dir)))
+    else:
+        for path in collect_robot_jsonl_paths(log_dir):
+            raw.extend(ingest_jsonl_file(path, day_start, day_end, stats))
     raw.sort(key=lambda e: e.ts_utc)
     return raw
 
@@ -803,6 +809,11 @@ def main() -> int:
         default=0,
         help="Cap CONTROL TIMELINE lines after the [+0ms] anchor (0 = no cap)",
     )
+    ap.add_argument(
+        "--log-store",
+        action="store_true",
+        help="Read robot events from the columnar store (tools/robot_log_store.py) instead of the JSONL files",
+    )
     ap.add_argument(
         "--allow-missing-cpu-profile",
         action="store_true",
@@ -841,7 +852,7 @@ def main() -> int:
         return 2
 
     window = timedelta(seconds=max(1, args.window_seconds))
-    events = _load_day_events(log_dir, audit_date, ingest_tz)
+    events = _load_day_events(log_dir, audit_date, ingest_tz, use_store=args.log_store)
 
     cpu_day_count = sum(1 for e in events if (e.event or "").strip() == CPU_EVENT)
     if cpu_day_count == 0 and not args.allow_missing_cpu_profile:
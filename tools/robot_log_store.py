@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+Columnar robot-log event store shared by the tools/ audit suite.
+
+Audits used to re-open every robot_*.jsonl, json.loads every line and run
+log_audit.normalize_event on it; a multi-day sweep parsed the same files dozens of
+times. The store converts robot logs once, incrementally, into Parquet partitions of
+NormEvent columns:
+
+    {store_dir}/day=YYYY-MM-DD/instrument=<inst>/part-NNNNNN.parquet
+
+- day is the Chicago trading day of ts_utc (log_audit.to_day), instrument "" -> "_"
+- data is kept as a JSON string (decoded only for rows a query returns)
+- src/offset (log file relative to log_dir, byte offset of the line) keep the raw
+  scan order and make re-ingested rows idempotent
+
+Compaction is incremental: a manifest keeps a byte cursor per source log, only
+appended complete lines are parsed. A log that shrank or was replaced (rotation) has
+its rows dropped from the partitions it touched and is re-ingested.
+
+Query: iter_events(day, instruments, event_names, window) reads only the partitions
+of the day(s), only the filtered row groups (pyarrow filters), and yields NormEvent.
+
+Example:
+  python tools/robot_log_store.py                 # compact new log lines
+  python tools/robot_log_store.py --rebuild       # rebuild from scratch
+  python tools/robot_log_store.py --date 2026-03-24 --event ENGINE_CPU_PROFILE
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+from datetime import date, datetime, time, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import quote, unquote
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from log_audit import NormEvent, normalize_event, resolve_log_dir, to_day
+
+try:
+    from zoneinfo import ZoneInfo
+except Exception:  # pragma: no cover
+    ZoneInfo = None  # type: ignore
+
+
+STORE_VERSION = 1
+MANIFEST_NAME = "_manifest.json"
+PARTITION_TZ = "chicago"
+ROW_GROUP_SIZE = 32768
+COMPACT_PARTS = 16  # Merge a partition's part files once it has more than this
+NO_INSTRUMENT = "_"
+HEAD_BYTES = 1024  # Log prefix kept to detect a replaced (rotated) file
+
+SCHEMA = pa.schema([
+    ("ts_utc", pa.timestamp("us", tz="UTC")),
+    ("level", pa.string()),
+    ("source", pa.string()),
+    ("instrument", pa.string()),
+    ("event", pa.string()),
+    ("message", pa.string()),
+    ("data", pa.string()),
+    ("file", pa.string()),
+    ("src", pa.string()),
+    ("offset", pa.int64()),
+])
+
+EVENT_COLUMNS = ["ts_utc", "level", "source", "instrument", "event", "message", "data", "file"]
+
+
+def resolve_store_dir(cli_store_dir: Optional[str], log_dir: Path) -> Path:
+    if cli_store_dir:
+        return Path(cli_store_dir)
+    env_store_dir = os.environ.get("QTSW2_ROBOT_LOG_STORE")
+    if env_store_dir:
+        return Path(env_store_dir)
+    return log_dir / ".columnar"
+
+
+def collect_source_logs(log_dir: Path) -> List[Path]:
+    """robot_*.jsonl in log_dir and log_dir/archive (everything an audit may read)"""
+    files = sorted(log_dir.glob("robot_*.jsonl"))
+    arch = log_dir / "archive"
+    if arch.is_dir():
+        files.extend(sorted(arch.glob("robot_*.jsonl")))
+    return files
+
+
+def source_key(log_dir: Path, path: Path) -> str:
+    """Source id of a log file: its path relative to log_dir (posix)"""
+    try:
+        return Path(path).resolve().relative_to(Path(log_dir).resolve()).as_posix()
+    except ValueError:
+        return Path(path).resolve().as_posix()
+
+
+def _partition_dir(store_dir: Path, day: str, instrument: str) -> Path:
+    inst = quote(instrument, safe="") if instrument else NO_INSTRUMENT
+    return store_dir / f"day={day}" / f"instrument={inst}"
+
+
+def _partition_instrument(name: str) -> str:
+    value = name[len("instrument="):]
+    return "" if value == NO_INSTRUMENT else unquote(value)
+
+
+def _trading_days(start_utc: datetime, end_utc: datetime) -> List[str]:
+    """Partition days overlapping [start_utc, end_utc)"""
+    first = to_day(start_utc, PARTITION_TZ)
+    last = to_day(end_utc - timedelta(microseconds=1), PARTITION_TZ)
+    out = []
+    d = first
+    while d <= last:
+        out.append(d.isoformat())
+        d += timedelta(days=1)
+    return out
+
+
+def trading_day_window(day: date) -> Tuple[datetime, datetime]:
+    """[start, end) in UTC of a Chicago trading day (UTC day when zoneinfo is missing)"""
+    if ZoneInfo is None:
+        start = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+        return start, start + timedelta(days=1)
+    tz = ZoneInfo("America/Chicago")
+    start = datetime.combine(day, time(0, 0), tzinfo=tz)
+    end = datetime.combine(day + timedelta(days=1), time(0, 0), tzinfo=tz)
+    return start.astimezone(timezone.utc), end.astimezone(timezone.utc)
+
+
+class RobotLogStore:
+    """Incremental Parquet store of normalized robot log events"""
+
+    def __init__(self, log_dir: Path, store_dir: Optional[Path] = None):
+        self.log_dir = Path(log_dir)
+        self.store_dir = Path(store_dir) if store_dir else resolve_store_dir(None, self.log_dir)
+        self.manifest_path = self.store_dir / MANIFEST_NAME
+        self.manifest = self._load_manifest()
+
+    # --- manifest ---
+
+    def _empty_manifest(self) -> Dict[str, Any]:
+        return {"version": STORE_VERSION, "next_part": 0, "sources": {}}
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        if not self.manifest_path.is_file():
+            return self._empty_manifest()
+        try:
+            with self.manifest_path.open("r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if isinstance(manifest, dict) and manifest.get("version") == STORE_VERSION:
+                return manifest
+        except Exception:
+            pass
+        return self._empty_manifest()
+
+    def _save_manifest(self) -> None:
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.manifest_path.with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, indent=1, sort_keys=True)
+        tmp.replace(self.manifest_path)
+
+    # --- compaction ---
+
+    def rebuild(self) -> int:
+        """Drop the store and ingest every log from the start"""
+        if self.store_dir.exists():
+            shutil.rmtree(self.store_dir)
+        self.manifest = self._empty_manifest()
+        return self.update()
+
+    def update(self) -> int:
+        """
+        Ingest lines appended to the robot logs since the last update.
+
+        Returns:
+            Number of events added
+        """
+        sources = self.manifest["sources"]
+        live = {source_key(self.log_dir, p): p for p in collect_source_logs(self.log_dir)}
+
+        # Logs that disappeared are dropped (a rotated log reappears under its new name,
+        # e.g. archive/robot_ES_<ts>.jsonl, and is ingested as a new source)
+        for key in [k for k in sources if k not in live]:
+            self._drop_source(key)
+
+        added = 0
+        for key, path in live.items():
+            added += self._ingest(key, path)
+        self._compact()
+        self._save_manifest()
+        return added
+
+    def _ingest(self, key: str, path: Path) -> int:
+        entry = self.manifest["sources"].get(key)
+        try:
+            size = path.stat().st_size
+            with path.open("rb") as f:
+                head = f.read(HEAD_BYTES).decode("latin-1")
+                if entry is not None:
+                    common = min(len(head), len(entry["head"]))
+                    if size < entry["offset"] or head[:common] != entry["head"][:common]:
+                        self._drop_source(key)
+                        entry = None
+                if entry is None:
+                    entry = {"offset": 0, "head": "", "parse_errors": 0, "partitions": []}
+                    self.manifest["sources"][key] = entry
+                if size == entry["offset"]:
+                    return 0
+                f.seek(entry["offset"])
+                pos = entry["offset"]
+                rows: List[Dict[str, Any]] = []
+                for raw_line in f:
+                    if not raw_line.endswith(b"\n"):
+                        break  # Partial line: left for the next update
+                    line_offset = pos
+                    pos += len(raw_line)
+                    line = raw_line.decode("utf-8", errors="replace").strip()
+                    if not line:
+                        continue
+                    try:
+                        obj = json.loads(line)
+                    except Exception:
+                        obj = None
+                    ev = normalize_event(obj, path.name) if isinstance(obj, dict) else None
+                    if ev is None:
+                        entry["parse_errors"] += 1
+                        continue
+                    rows.append(_event_row(ev, key, line_offset))
+        except OSError:
+            return 0
+
+        self._write_rows(rows, entry)
+        entry["offset"] = pos
+        entry["head"] = head if len(head) >= len(entry["head"]) else entry["head"]
+        return len(rows)
+
+    def _write_rows(self, rows: List[Dict[str, Any]], entry: Dict[str, Any]) -> None:
+        if not rows:
+            return
+        df = pd.DataFrame(rows, columns=SCHEMA.names)
+        df["_day"] = [to_day(ts, PARTITION_TZ).isoformat() for ts in df["ts_utc"]]
+        for (day, instrument), part in df.groupby(["_day", "instrument"], sort=True):
+            part_dir = _partition_dir(self.store_dir, day, instrument)
+            part_dir.mkdir(parents=True, exist_ok=True)
+            table = pa.Table.from_pandas(part.drop(columns=["_day"]), schema=SCHEMA, preserve_index=False)
+            pq.write_table(table, part_dir / f"part-{self.manifest['next_part']:06d}.parquet",
+                           row_group_size=ROW_GROUP_SIZE)
+            self.manifest["next_part"] += 1
+            rel = part_dir.relative_to(self.store_dir).as_posix()
+            if rel not in entry["partitions"]:
+                entry["partitions"].append(rel)
+
+    def _drop_source(self, key: str) -> None:
+        """Remove a source's rows from every partition it wrote to"""
+        entry = self.manifest["sources"].pop(key, None)
+        if not entry:
+            return
+        for rel in entry.get("partitions", []):
+            part_dir = self.store_dir / rel
+            if not part_dir.is_dir():
+                continue
+            table = pq.read_table(part_dir, schema=SCHEMA)
+            keep = table.filter(pc.not_equal(table["src"], key))
+            self._replace_partition(part_dir, keep)
+
+    def _compact(self) -> None:
+        """Merge partitions that accumulated too many small part files"""
+        if not self.store_dir.exists():
+            return
+        for part_dir in self.store_dir.glob("day=*/instrument=*"):
+            if len(list(part_dir.glob("part-*.parquet"))) > COMPACT_PARTS:
+                self._replace_partition(part_dir, pq.read_table(part_dir, schema=SCHEMA))
+
+    def _replace_partition(self, part_dir: Path, table: pa.Table) -> None:
+        old_parts = list(part_dir.glob("part-*.parquet"))
+        if table.num_rows:
+            table = table.sort_by([("src", "ascending"), ("offset", "ascending")])
+            pq.write_table(table, part_dir / f"part-{self.manifest['next_part']:06d}.parquet",
+                           row_group_size=ROW_GROUP_SIZE)
+            self.manifest["next_part"] += 1
+        for p in old_parts:
+            p.unlink()
+        if not table.num_rows:
+            shutil.rmtree(part_dir, ignore_errors=True)
+
+    # --- query ---
+
+    def parse_errors(self, sources: Optional[Sequence[Path]] = None) -> int:
+        """Unparseable lines seen in the given logs (all logs when None)"""
+        entries = self.manifest["sources"]
+        if sources is None:
+            return sum(e.get("parse_errors", 0) for e in entries.values())
+        keys = {source_key(self.log_dir, p) for p in sources}
+        return sum(e.get("parse_errors", 0) for k, e in entries.items() if k in keys)
+
+    def read_frame(
+        self,
+        day: Optional[date] = None,
+        instruments: Optional[Iterable[str]] = None,
+        event_names: Optional[Iterable[str]] = None,
+        window: Optional[Tuple[datetime, datetime]] = None,
+        sources: Optional[Sequence[Path]] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Matching events as a DataFrame, in raw scan order (sources order, then line order).
+
+        Args:
+            day: Chicago trading day (ignored when window is given)
+            instruments: Instruments to include (None = all, "" = events without one)
+            event_names: Event names to include (None = all)
+            window: [start, end) in UTC
+            sources: Log files to include, in scan order (None = all, sorted by path)
+            columns: Columns to read (None = every NormEvent column)
+        """
+        if window is None:
+            if day is None:
+                raise ValueError("iter_events needs a day or a window")
+            window = trading_day_window(day)
+        start, end = window
+        wanted = set(instruments) if instruments is not None else None
+
+        part_dirs: List[Path] = []
+        for d in _trading_days(start, end):
+            day_dir = self.store_dir / f"day={d}"
+            if not day_dir.is_dir():
+                continue
+            for part_dir in sorted(day_dir.glob("instrument=*")):
+                if wanted is None or _partition_instrument(part_dir.name) in wanted:
+                    part_dirs.append(part_dir)
+
+        read_columns = list(dict.fromkeys(list(columns or EVENT_COLUMNS) + ["ts_utc", "src", "offset"]))
+        filters = [("ts_utc", ">=", pd.Timestamp(start)), ("ts_utc", "<", pd.Timestamp(end))]
+        if event_names is not None:
+            filters.append(("event", "in", sorted(set(event_names))))
+        source_rank: Optional[Dict[str, int]] = None
+        if sources is not None:
+            source_rank = {}
+            for p in sources:
+                source_rank.setdefault(source_key(self.log_dir, p), len(source_rank))
+            filters.append(("src", "in", sorted(source_rank)))
+
+        tables = []
+        for part_dir in part_dirs:
+            for part in sorted(part_dir.glob("part-*.parquet")):
+                tables.append(pq.read_table(part, columns=read_columns, filters=filters, schema=SCHEMA))
+        if not tables:
+            return pd.DataFrame(columns=read_columns)
+        df = pa.concat_tables(tables).to_pandas()
+
+        # Interrupted updates may have written a batch twice; (src, offset) is unique per line
+        df = df.drop_duplicates(subset=["src", "offset"])
+        if source_rank is not None:
+            df["_rank"] = df["src"].map(source_rank)
+            df = df.sort_values(["_rank", "offset"], kind="mergesort").drop(columns=["_rank"])
+        else:
+            df = df.sort_values(["src", "offset"], kind="mergesort")
+        return df.reset_index(drop=True)
+
+    def iter_events(
+        self,
+        day: Optional[date] = None,
+        instruments: Optional[Iterable[str]] = None,
+        event_names: Optional[Iterable[str]] = None,
+        window: Optional[Tuple[datetime, datetime]] = None,
+        sources: Optional[Sequence[Path]] = None,
+    ) -> Iterator[NormEvent]:
+        """NormEvents of a day/window (same as normalize_event over the raw lines)"""
+        df = self.read_frame(day, instruments, event_names, window, sources)
+        for row in df.itertuples(index=False):
+            yield NormEvent(
+                ts_utc=row.ts_utc.to_pydatetime(),
+                level=row.level,
+                source=row.source,
+                instrument=row.instrument,
+                event=row.event,
+                message=row.message,
+                data=json.loads(row.data),
+                file=row.file,
+            )
+
+
+def _event_row(ev: NormEvent, src: str, offset: int) -> Dict[str, Any]:
+    return {
+        "ts_utc": ev.ts_utc,
+        "level": ev.level,
+        "source": ev.source,
+        "instrument": ev.instrument,
+        "event": ev.event,
+        "message": ev.message,
+        "data": json.dumps(ev.data, ensure_ascii=False, default=str),
+        "file": ev.file,
+        "src": src,
+        "offset": offset,
+    }
+
+
+def open_store(log_dir: Path, store_dir: Optional[Path] = None, update: bool = True) -> RobotLogStore:
+    """Store for a log dir, brought up to date with the logs unless update=False"""
+    store = RobotLogStore(log_dir, store_dir)
+    if update:
+        store.update()
+    return store
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Compact robot JSONL logs into the columnar event store")
+    p.add_argument("--log-dir", default=None, help="Override robot log directory")
+    p.add_argument("--store-dir", default=None, help="Override store directory (default: <log-dir>/.columnar)")
+    p.add_argument("--rebuild", action="store_true", help="Drop the store and re-ingest every log")
+    p.add_argument("--date", default=None, help="Print event counts for a trading day YYYY-MM-DD")
+    p.add_argument("--event", action="append", default=None, help="Event name filter for --date (repeatable)")
+    args = p.parse_args()
+
+    log_dir = resolve_log_dir(args.log_dir)
+    store = RobotLogStore(log_dir, resolve_store_dir(args.store_dir, log_dir))
+    added = store.rebuild() if args.rebuild else store.update()
+    print(f"store={store.store_dir} sources={len(store.manifest['sources'])} added={added}")
+
+    if args.date:
+        day = date.fromisoformat(args.date)
+        df = store.read_frame(day, event_names=args.event, columns=["event", "instrument"])
+        print(f"{day.isoformat()}: {len(df)} events")
+        if not df.empty:
+            print(df.groupby(["event"]).size().sort_values(ascending=False).head(30).to_string())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
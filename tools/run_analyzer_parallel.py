@@ -6,7 +6,6 @@ Processes multiple instruments in parallel to speed up analyzer execution
 
 import sys
 import subprocess
-import multiprocessing
 import os
 import json
 from pathlib import Path
@@ -74,12 +73,23 @@ elif _DEFAULT_ANALYZER_LEGACY.is_file():
 else:
     ANALYZER_SCRIPT = _DEFAULT_ANALYZER_SYSTEM
 DATA_PROCESSED = QTSW2_ROOT / "data" / "data_processed"
+
+# Process-wide worker budget shared with the analyzer's inner per-range fan-out
+_ANALYZER_ROOT = QTSW2_ROOT / "system" / "modules" / "analyzer"
+if str(_ANALYZER_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ANALYZER_ROOT))
+from worker_budget import INNER_WORKERS_ENV, split_worker_budget, total_worker_budget
 EVENT_LOGS_DIR = QTSW2_ROOT / "automation" / "logs" / "events"
 
-def run_analyzer_instrument(instrument: str, data_folder: Path, analyzer_script: Path, run_id: Optional[str] = None) -> Tuple[str, bool, str]:
+def run_analyzer_instrument(instrument: str, data_folder: Path, analyzer_script: Path, run_id: Optional[str] = None,
+                            inner_workers: Optional[int] = None, incremental: bool = False) -> Tuple[str, bool, str]:
     """
     Run analyzer for a single instrument.
     
+    Args:
+        inner_workers: This instrument's share of the worker budget for range processing
+        incremental: Only recompute new/still-open ranges and write just the changed rows
+    
     Returns:
         Tuple of (instrument, success, output_message)
     """
@@ -99,6 +109,8 @@ def run_analyzer_instrument(instrument: str, data_folder: Path, analyzer_script:
         "S2:09:30", "S2:10:00", "S2:10:30", "S2:11:00",  # All S2 slots
         "--days", "Mon", "Tue", "Wed", "Thu", "Fri",  # Explicitly include all trading days including Friday
     ]
+    if incremental:
+        analyzer_cmd.append("--incremental")
     
     try:
         logger.info(f"Starting analyzer for {instrument}...")
@@ -114,6 +126,8 @@ def run_analyzer_instrument(instrument: str, data_folder: Path, analyzer_script:
         process_env = os.environ.copy()
         if run_id:
             process_env["PIPELINE_RUN_ID"] = run_id
+        if inner_workers is not None:
+            process_env[INNER_WORKERS_ENV] = str(inner_workers)
         
         process = subprocess.Popen(
             analyzer_cmd,
@@ -229,15 +243,17 @@ def run_analyzer_instrument(instrument: str, data_folder: Path, analyzer_script:
         return (instrument, False, f"Exception: {str(e)}")
 
 
-def run_parallel(instruments: List[str], max_workers: int = None, data_folder: Path = None, analyzer_script: Path = None, run_id: Optional[str] = None):
+def run_parallel(instruments: List[str], max_workers: int = None, data_folder: Path = None, analyzer_script: Path = None, run_id: Optional[str] = None,
+                 incremental: bool = False):
     """
     Run analyzer for multiple instruments in parallel.
     
     Args:
         instruments: List of instrument symbols (e.g., ["ES", "NQ", "CL"])
-        max_workers: Maximum number of parallel processes (None = auto-detect)
+        max_workers: Maximum number of parallel processes (None = split the worker budget)
         data_folder: Path to data_processed folder (default: QTSW2_ROOT/data/data_processed)
         analyzer_script: Path to analyzer script (default: auto-detect)
+        incremental: Pass --incremental to every instrument run
     """
     if data_folder is None:
         data_folder = DATA_PROCESSED
@@ -258,17 +274,16 @@ def run_parallel(instruments: List[str], max_workers: int = None, data_folder: P
         logger.error(f"Data folder not found: {data_folder}")
         return False
     
-    # Auto-detect max_workers if not specified
-    if max_workers is None:
-        cpu_count = multiprocessing.cpu_count()
-        # Use 50% of CPU cores, but at least 2 and at most number of instruments
-        max_workers = max(2, min(int(cpu_count * 0.5), len(instruments)))
+    # Split the worker budget: one process per instrument (up to the budget), and the
+    # remainder goes to each instrument's inner range processing
+    max_workers, inner_workers = split_worker_budget(len(instruments), max_workers)
     
     logger.info("=" * 60)
     logger.info(f"Parallel Analyzer Runner")
     logger.info("=" * 60)
     logger.info(f"Instruments: {', '.join(instruments)}")
-    logger.info(f"Parallel workers: {max_workers}")
+    logger.info(f"Worker budget: {total_worker_budget()}")
+    logger.info(f"Parallel workers: {max_workers} (x {inner_workers} range workers each)")
     logger.info(f"Data folder: {data_folder}")
     logger.info(f"Analyzer script: {analyzer_script}")
     logger.info("=" * 60)
@@ -284,7 +299,7 @@ def run_parallel(instruments: List[str], max_workers: int = None, data_folder: P
     with ProcessPoolExecutor(max_workers=max_workers) as executor:
         # Submit all tasks
         future_to_instrument = {
-            executor.submit(run_analyzer_instrument, inst, data_folder, analyzer_script, run_id): inst
+            executor.submit(run_analyzer_instrument, inst, data_folder, analyzer_script, run_id, inner_workers, incremental): inst
             for inst in instruments
         }
         
@@ -352,13 +367,15 @@ def main():
                        choices=["ES", "NQ", "YM", "CL", "NG", "GC", "RTY"],
                        help="List of instruments to process")
     parser.add_argument("--workers", type=int, default=None,
-                       help="Number of parallel workers (default: auto-detect)")
+                       help="Number of parallel instrument workers (default: split ANALYZER_WORKER_BUDGET)")
     parser.add_argument("--folder", type=str, default=None,
                        help="Path to data_processed folder (default: auto-detect)")
     parser.add_argument("--analyzer-script", type=str, default=None,
                        help="Path to analyzer script (default: auto-detect)")
     parser.add_argument("--run-id", type=str, default=None,
                        help="Pipeline run ID for event logging")
+    parser.add_argument("--incremental", action="store_true",
+                       help="Only recompute new/still-open ranges per instrument and write just the changed rows")
     
     args = parser.parse_args()
     
@@ -371,7 +388,8 @@ def main():
         max_workers=args.workers,
         data_folder=data_folder,
         analyzer_script=analyzer_script,
-        run_id=run_id
+        run_id=run_id,
+        incremental=args.incremental
     )
     
     sys.exit(0 if success else 1)
@@ -6,7 +6,8 @@ Usage:
   python scripts/rollback_data_to_date.py --cutoff 2026-03-06
 
 What it does:
-  1. Filters analyzed parquet files to keep only rows with Date <= cutoff
+  1. Filters analyzed parquet files (monthly files and their append-mode delta files) to keep
+     only rows with Date <= cutoff; delta files left without rows are deleted
   2. Updates merger_processed.json to remove entries after cutoff (so re-merge won't re-add them)
   3. Rebuilds the master matrix from the rolled-back analyzed data
 
@@ -25,6 +26,12 @@ ANALYZED_DIR = BASE / "data" / "analyzed"
 MATRIX_DIR = BASE / "data" / "master_matrix"
 PROCESSED_LOG = BASE / "data" / "merger_processed.json"
 
+SYSTEM_ROOT = Path(__file__).resolve().parents[2] / "system"
+if str(SYSTEM_ROOT) not in sys.path:
+    sys.path.insert(0, str(SYSTEM_ROOT))
+
+from modules.merger import monthly_deltas  # noqa: E402
+
 
 def rollback_analyzed(cutoff_date: str) -> int:
     """Filter analyzed parquet files to keep only rows with Date <= cutoff_date. Returns count of files modified."""
@@ -32,27 +39,42 @@ def rollback_analyzed(cutoff_date: str) -> int:
     modified = 0
 
     for parquet_path in ANALYZED_DIR.rglob("*.parquet"):
-        try:
-            df = pd.read_parquet(parquet_path)
-            if df.empty or "Date" not in df.columns:
-                continue
-
-            # Normalize Date for comparison
-            df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-            before = len(df)
-            df = df[df["Date"] <= cutoff].copy()
-            after = len(df)
-
-            if after < before:
-                df.to_parquet(parquet_path, index=False)
-                modified += 1
-                print(f"  Rolled back {parquet_path.relative_to(BASE)}: {before} -> {after} rows")
-        except Exception as e:
-            print(f"  ERROR {parquet_path}: {e}", file=sys.stderr)
+        # Delta files are rolled back with their monthly file
+        if monthly_deltas.is_delta_file(parquet_path):
+            continue
+        modified += _rollback_file(parquet_path, cutoff)
+        for delta_path in monthly_deltas.delta_files(parquet_path):
+            modified += _rollback_file(delta_path, cutoff, delete_empty=True)
 
     return modified
 
 
+def _rollback_file(parquet_path: Path, cutoff: pd.Timestamp, delete_empty: bool = False) -> int:
+    """Keep only rows with Date <= cutoff in one file. Returns 1 if the file was modified."""
+    try:
+        df = pd.read_parquet(parquet_path)
+        if df.empty or "Date" not in df.columns:
+            return 0
+
+        # Normalize Date for comparison
+        df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
+        before = len(df)
+        df = df[df["Date"] <= cutoff].copy()
+        after = len(df)
+
+        if after == 0 and delete_empty:
+            parquet_path.unlink()
+            print(f"  Deleted {parquet_path.relative_to(BASE)}: all {before} rows after cutoff")
+            return 1
+        if after < before:
+            df.to_parquet(parquet_path, index=False)
+            print(f"  Rolled back {parquet_path.relative_to(BASE)}: {before} -> {after} rows")
+            return 1
+    except Exception as e:
+        print(f"  ERROR {parquet_path}: {e}", file=sys.stderr)
+    return 0
+
+
 def rollback_merger_log(cutoff_date: str) -> None:
     """Remove merger_processed entries for dates after cutoff."""
     if not PROCESSED_LOG.exists():